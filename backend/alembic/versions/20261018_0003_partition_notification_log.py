@@ -0,0 +1,145 @@
+"""Partition notification_log by lesson_date (PostgreSQL).
+
+Revision ID: 20261018_0003
+Revises: 20261018_0002
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0003"
+down_revision: str | None = "20261018_0002"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+_COLUMNS = "id, created_at, account_id, lesson_id, lesson_date, notification_type, sent_at"
+# Сколько месяцев вперёд создать сразу; дальше партиции ведёт воркер обслуживания.
+_MONTHS_AHEAD = 2
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        # SQLite: партиций нет, retention удаляет строки пачками.
+        return
+
+    # Уникальность и PK секционированной таблицы обязаны включать ключ секции,
+    # поэтому таблица пересоздаётся; старые имена освобождаем под новую.
+    op.execute("ALTER TABLE notification_log RENAME TO notification_log_legacy")
+    op.execute(
+        "ALTER TABLE notification_log_legacy "
+        "RENAME CONSTRAINT notification_log_pkey TO notification_log_legacy_pkey"
+    )
+    op.execute(
+        "ALTER TABLE notification_log_legacy "
+        "RENAME CONSTRAINT uq_notification_once TO uq_notification_once_legacy"
+    )
+    op.execute(
+        "ALTER INDEX ix_notification_log_account_id RENAME TO ix_notification_log_legacy_account_id"
+    )
+    op.execute("ALTER SEQUENCE notification_log_id_seq RENAME TO notification_log_legacy_id_seq")
+
+    op.execute(
+        """
+        CREATE TABLE notification_log (
+            id BIGSERIAL NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            account_id BIGINT NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            lesson_id BIGINT NOT NULL,
+            lesson_date DATE NOT NULL,
+            notification_type VARCHAR(32) NOT NULL,
+            sent_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            CONSTRAINT notification_log_pkey PRIMARY KEY (id, lesson_date),
+            CONSTRAINT uq_notification_once
+                UNIQUE (account_id, lesson_id, lesson_date, notification_type)
+        ) PARTITION BY RANGE (lesson_date)
+        """
+    )
+    op.create_index("ix_notification_log_account_id", "notification_log", ["account_id"])
+
+    first = bind.execute(sa.text("SELECT min(lesson_date) FROM notification_log_legacy")).scalar()
+    today = date.today()
+    month = (first or today).replace(day=1)
+    last = today.replace(day=1)
+    for _ in range(_MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE notification_log_p{month:%Y%m} PARTITION OF notification_log "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+        )
+        month = _next_month(month)
+
+    op.execute(
+        f"INSERT INTO notification_log ({_COLUMNS}) SELECT {_COLUMNS} FROM notification_log_legacy"
+    )
+    op.execute(
+        "SELECT setval('notification_log_id_seq', "
+        "(SELECT coalesce(max(id), 0) + 1 FROM notification_log), false)"
+    )
+    op.execute("DROP TABLE notification_log_legacy")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute("ALTER TABLE notification_log RENAME TO notification_log_partitioned")
+    op.execute(
+        "ALTER TABLE notification_log_partitioned "
+        "RENAME CONSTRAINT notification_log_pkey TO notification_log_partitioned_pkey"
+    )
+    op.execute(
+        "ALTER TABLE notification_log_partitioned "
+        "RENAME CONSTRAINT uq_notification_once TO uq_notification_once_partitioned"
+    )
+    op.execute(
+        "ALTER INDEX ix_notification_log_account_id "
+        "RENAME TO ix_notification_log_partitioned_account_id"
+    )
+    op.execute(
+        "ALTER SEQUENCE notification_log_id_seq RENAME TO notification_log_partitioned_id_seq"
+    )
+
+    op.create_table(
+        "notification_log",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "account_id",
+            sa.BigInteger(),
+            sa.ForeignKey("accounts.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("lesson_id", sa.BigInteger(), nullable=False),
+        sa.Column("lesson_date", sa.Date(), nullable=False),
+        sa.Column("notification_type", sa.String(length=32), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "account_id",
+            "lesson_id",
+            "lesson_date",
+            "notification_type",
+            name="uq_notification_once",
+        ),
+    )
+    op.create_index("ix_notification_log_account_id", "notification_log", ["account_id"])
+    op.execute(
+        f"INSERT INTO notification_log ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM notification_log_partitioned"
+    )
+    op.execute(
+        "SELECT setval('notification_log_id_seq', "
+        "(SELECT coalesce(max(id), 0) + 1 FROM notification_log), false)"
+    )
+    op.execute("DROP TABLE notification_log_partitioned CASCADE")
@@ -0,0 +1,68 @@
+"""Admin broadcasts and outbox priority.
+
+Revision ID: 20261018_0004
+Revises: 20261018_0003
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0004"
+down_revision: str | None = "20261018_0003"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "admin_broadcasts",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            primary_key=True,
+            autoincrement=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+    )
+    # batch: SQLite не умеет добавлять внешний ключ через ALTER TABLE.
+    with op.batch_alter_table("telegram_outbox") as batch:
+        batch.add_column(
+            sa.Column("priority", sa.SmallInteger(), nullable=False, server_default="0")
+        )
+        batch.add_column(sa.Column("broadcast_id", sa.BigInteger(), nullable=True))
+        batch.create_foreign_key(
+            "fk_telegram_outbox_broadcast_id",
+            "admin_broadcasts",
+            ["broadcast_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+        batch.drop_index("ix_telegram_outbox_status_available_at")
+        batch.create_index(
+            "ix_telegram_outbox_status_priority_available_at",
+            ["status", "priority", "available_at"],
+        )
+        batch.create_index(
+            "ix_telegram_outbox_broadcast_id_status",
+            ["broadcast_id", "status"],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("telegram_outbox") as batch:
+        batch.drop_index("ix_telegram_outbox_broadcast_id_status")
+        batch.drop_index("ix_telegram_outbox_status_priority_available_at")
+        batch.create_index(
+            "ix_telegram_outbox_status_available_at",
+            ["status", "available_at"],
+        )
+        batch.drop_constraint("fk_telegram_outbox_broadcast_id", type_="foreignkey")
+        batch.drop_column("broadcast_id")
+        batch.drop_column("priority")
+    op.drop_table("admin_broadcasts")
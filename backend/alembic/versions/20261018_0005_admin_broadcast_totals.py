@@ -0,0 +1,29 @@
+"""Final delivery counters of admin broadcasts.
+
+Revision ID: 20261018_0005
+Revises: 20261018_0004
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261018_0005"
+down_revision: str | None = "20261018_0004"
+branch_labels: Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("admin_broadcasts") as batch:
+        batch.add_column(sa.Column("sent", sa.Integer(), nullable=True))
+        batch.add_column(sa.Column("failed", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("admin_broadcasts") as batch:
+        batch.drop_column("failed")
+        batch.drop_column("sent")
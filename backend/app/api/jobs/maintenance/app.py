@@ -0,0 +1,27 @@
+from datetime import UTC, datetime
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.api.jobs.maintenance.job import purge_notification_log, purge_outbox
+from app.settings.config import settings
+
+
+def register(scheduler: AsyncIOScheduler) -> None:
+    # Первый прогон сразу при старте: партиции на ближайшие месяцы должны
+    # существовать до первой отметки об отправке.
+    scheduler.add_job(
+        purge_notification_log,
+        id="notification_log_maintenance",
+        trigger=IntervalTrigger(hours=settings.workers.notification_log_maintenance_interval_hours),
+        next_run_time=datetime.now(UTC),
+        max_instances=1,
+        coalesce=True,
+    )
+    scheduler.add_job(
+        purge_outbox,
+        id="outbox_maintenance",
+        trigger=IntervalTrigger(hours=settings.workers.outbox_purge_interval_hours),
+        max_instances=1,
+        coalesce=True,
+    )
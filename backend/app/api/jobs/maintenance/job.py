@@ -0,0 +1,72 @@
+from dependency_injector.wiring import Provide, inject
+
+from app.app_layer.interfaces.use_cases.purge_notification_log.dto import (
+    PurgeNotificationLogUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.purge_notification_log.interface import (
+    IPurgeNotificationLogUseCase,
+)
+from app.app_layer.interfaces.use_cases.purge_outbox.dto import PurgeOutboxUseCaseInputDTO
+from app.app_layer.interfaces.use_cases.purge_outbox.interface import IPurgeOutboxUseCase
+from app.di.container import Container
+from app.infra.observability.metrics.interface import IMetricsService
+from app.logging.config import get_logger
+from app.logging.context import reset_request_id, set_request_id
+from app.settings.config import settings
+
+logger = get_logger(__name__)
+
+
+@inject
+async def purge_notification_log(
+    use_case: IPurgeNotificationLogUseCase = Provide[
+        Container.usecases.purge_notification_log_use_case
+    ],
+    metrics: IMetricsService = Provide[Container.metrics.metrics_service],
+) -> None:
+    token = set_request_id("worker-maintenance")
+    try:
+        result = await use_case.execute(
+            PurgeNotificationLogUseCaseInputDTO(
+                retention_days=settings.workers.notification_log_retention_days,
+                batch_size=settings.workers.notification_log_purge_batch_size,
+            )
+        )
+        logger.info(
+            "Notification log maintained: cutoff=%s created_partitions=%s "
+            "dropped_partitions=%s deleted_rows=%s",
+            result.cutoff,
+            result.created_partitions,
+            result.dropped_partitions,
+            result.deleted_rows,
+        )
+    except Exception:
+        logger.exception("Notification log maintenance failed.")
+        metrics.observe_worker_error("maintenance")
+    finally:
+        reset_request_id(token)
+
+
+@inject
+async def purge_outbox(
+    use_case: IPurgeOutboxUseCase = Provide[Container.usecases.purge_outbox_use_case],
+    metrics: IMetricsService = Provide[Container.metrics.metrics_service],
+) -> None:
+    token = set_request_id("worker-maintenance")
+    try:
+        result = await use_case.execute(
+            PurgeOutboxUseCaseInputDTO(
+                retention_days=settings.workers.outbox_retention_days,
+                batch_size=settings.workers.outbox_purge_batch_size,
+            )
+        )
+        logger.info(
+            "Outbox purged: cutoff=%s deleted_rows=%s",
+            result.cutoff,
+            result.deleted_rows,
+        )
+    except Exception:
+        logger.exception("Outbox maintenance failed.")
+        metrics.observe_worker_error("maintenance")
+    finally:
+        reset_request_id(token)
@@ -1,18 +1,30 @@
 from datetime import UTC, datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from app.api.jobs.notification.job import run
+from app.api.jobs.notification.job import refresh, run
 from app.settings.config import settings
 
+REFRESH_JOB_ID = "notification_refresh"
+
 
 def register(scheduler: AsyncIOScheduler) -> None:
+    now = datetime.now(UTC)
     scheduler.add_job(
-        run,
-        id="notification",
-        trigger=IntervalTrigger(seconds=settings.workers.notification_poll_interval_seconds),
-        next_run_time=datetime.now(UTC),
+        refresh,
+        id=REFRESH_JOB_ID,
+        trigger=IntervalTrigger(seconds=settings.workers.notification_refresh_interval_seconds),
+        next_run_time=now,
         max_instances=1,
         coalesce=True,
     )
+    # Долгоживущий цикл таймера: запускается один раз и работает до остановки воркера.
+    scheduler.add_job(
+        run,
+        id="notification_timer",
+        trigger=DateTrigger(run_date=now),
+        max_instances=1,
+        misfire_grace_time=None,
+    )
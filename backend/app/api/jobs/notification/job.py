@@ -1,17 +1,26 @@
 from collections.abc import Callable
+from datetime import timedelta
 
 from dependency_injector.wiring import Provide, inject
 
 from app.api.jobs.utils import send_alert
 from app.app_layer.interfaces.notifications.notifier.interface import INotifier
 from app.app_layer.interfaces.repos.account.interface import IAccountRepository
+from app.app_layer.interfaces.services.notifications.notification_planner.dto import (
+    NotificationPlannerCollectUpcomingInputDTO,
+)
+from app.app_layer.interfaces.services.notifications.notification_planner.interface import (
+    INotificationPlannerService,
+)
 from app.app_layer.interfaces.services.notifications.notification_service.dto import (
-    NotificationServiceInputDTO,
+    NotificationServiceSendInputDTO,
 )
 from app.app_layer.interfaces.services.notifications.notification_service.interface import (
     INotificationService,
 )
+from app.app_layer.interfaces.time.clock.interface import IClock
 from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
+from app.app_layer.services.notifications.notification_timer import NotificationTimer
 from app.di.container import Container
 from app.infra.observability.metrics.interface import IMetricsService
 from app.logging.config import get_logger
@@ -20,35 +29,93 @@ from app.settings.config import settings
 
 logger = get_logger(__name__)
 
+# Верхняя граница сна таймера: страховка от скачков системных часов.
+_MAX_SLEEP_SECONDS = 60.0
+# Через сколько повторить уведомления, которые не удалось поставить в outbox.
+_RETRY_DELAY = timedelta(seconds=15)
+
 
 @inject
-async def run(
+async def refresh(
     uow_factory: Callable[[], IUnitOfWork] = Provide[Container.db.uow_factory],
     account_repo: IAccountRepository = Provide[Container.repositories.account_repo],
+    planner: INotificationPlannerService = Provide[Container.services.notification_planner],
+    timer: NotificationTimer = Provide[Container.services.notification_timer],
+    clock: IClock = Provide[Container.core.clock],
     notifier: INotifier = Provide[Container.telegram.notifier],
-    service: INotificationService = Provide[Container.services.notification_service],
     metrics: IMetricsService = Provide[Container.metrics.metrics_service],
 ) -> None:
+    """Пересчитывает моменты отправки; перестраиваются только изменившиеся аккаунты.
+
+    Запускается планировщиком после каждого синка расписания и раз в
+    ``WORKERS__NOTIFICATION_REFRESH_INTERVAL_SECONDS`` (смена настроек, новый день).
+    """
     alert_notifier = notifier if settings.alerts.enabled else None
     admin_chat_id = settings.alerts.admin_chat_id if settings.alerts.enabled else None
 
+    token = set_request_id("worker-notify-refresh")
     try:
+        now = clock.now()
+        seen: set[int] = set()
+        rebuilt = 0
         async with uow_factory():
-            accounts = await account_repo.list_notifiable()
-
-        for account in accounts:
-            token = set_request_id(f"worker-notify-{account.chat_id}")
-            try:
-                async with uow_factory():
-                    await service.process_user(NotificationServiceInputDTO(account=account))
-            except Exception:
-                logger.exception(
-                    "Notification processing failed for account %s.",
-                    account.account_id,
+            async for accounts in account_repo.iter_notifiable(settings.workers.account_batch_size):
+                upcoming = await planner.collect_upcoming(
+                    NotificationPlannerCollectUpcomingInputDTO(accounts=accounts, now=now)
                 )
-            finally:
-                reset_request_id(token)
+                for plan in upcoming.plans:
+                    seen.add(plan.account_id)
+                    if timer.fingerprint(plan.account_id) != plan.fingerprint:
+                        timer.replace_account(plan.account_id, plan.fingerprint, plan.notifications)
+                        rebuilt += 1
+        timer.retain_accounts(seen)
+        logger.info(
+            "Notification timer refreshed: accounts=%s rebuilt=%s pending=%s",
+            len(seen),
+            rebuilt,
+            len(timer),
+        )
     except Exception:
-        logger.exception("Notification job failed.")
+        logger.exception("Notification refresh failed.")
         metrics.observe_worker_error("notification")
         await send_alert(alert_notifier, admin_chat_id, "Ошибка воркера уведомлений")
+    finally:
+        reset_request_id(token)
+
+
+@inject
+async def fire(
+    uow_factory: Callable[[], IUnitOfWork] = Provide[Container.db.uow_factory],
+    service: INotificationService = Provide[Container.services.notification_service],
+    timer: NotificationTimer = Provide[Container.services.notification_timer],
+    clock: IClock = Provide[Container.core.clock],
+    metrics: IMetricsService = Provide[Container.metrics.metrics_service],
+) -> None:
+    due = timer.pop_due(clock.now())
+    if not due:
+        return
+    token = set_request_id("worker-notify")
+    try:
+        async with uow_factory():
+            await service.send_notifications(
+                NotificationServiceSendInputDTO(
+                    notifications=[scheduled.notification for scheduled in due]
+                )
+            )
+    except Exception:
+        logger.exception("Notification send batch failed, retrying in %s.", _RETRY_DELAY)
+        metrics.observe_worker_error("notification")
+        timer.requeue(due, retry_at=clock.now() + _RETRY_DELAY)
+    finally:
+        reset_request_id(token)
+
+
+@inject
+async def run(
+    timer: NotificationTimer = Provide[Container.services.notification_timer],
+    clock: IClock = Provide[Container.core.clock],
+) -> None:
+    """Цикл таймера: спит до ближайшего момента отправки и отправляет сработавшее."""
+    while True:
+        await timer.wait(clock.now(), _MAX_SLEEP_SECONDS)
+        await fire()
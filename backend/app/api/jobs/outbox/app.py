@@ -0,0 +1,18 @@
+from datetime import UTC, datetime
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
+
+from app.api.jobs.outbox.job import run
+
+
+def register(scheduler: AsyncIOScheduler) -> None:
+    # Долгоживущий цикл потребителя outbox: по одному на процесс воркера;
+    # процессы масштабируются горизонтально (захват через SKIP LOCKED).
+    scheduler.add_job(
+        run,
+        id="outbox_consumer",
+        trigger=DateTrigger(run_date=datetime.now(UTC)),
+        max_instances=1,
+        misfire_grace_time=None,
+    )
@@ -0,0 +1,54 @@
+import asyncio
+
+from dependency_injector.wiring import Provide, inject
+
+from app.app_layer.interfaces.use_cases.dispatch_outbox.dto import DispatchOutboxUseCaseInputDTO
+from app.app_layer.interfaces.use_cases.dispatch_outbox.interface import IDispatchOutboxUseCase
+from app.di.container import Container
+from app.infra.observability.metrics.interface import IMetricsService
+from app.logging.config import get_logger
+from app.logging.context import reset_request_id, set_request_id
+from app.settings.config import settings
+
+logger = get_logger(__name__)
+
+
+@inject
+async def dispatch(
+    use_case: IDispatchOutboxUseCase = Provide[Container.usecases.dispatch_outbox_use_case],
+    metrics: IMetricsService = Provide[Container.metrics.metrics_service],
+) -> int:
+    """Один проход по очереди; возвращает число захваченных сообщений."""
+    token = set_request_id("worker-outbox")
+    try:
+        result = await use_case.execute(
+            DispatchOutboxUseCaseInputDTO(limit=settings.workers.outbox_batch_size)
+        )
+        if result.claimed:
+            metrics.observe_outbox_dispatch(
+                sent=result.sent,
+                retried=result.retried,
+                dead=result.dead,
+            )
+            logger.info(
+                "Outbox dispatched: claimed=%s sent=%s retried=%s dead=%s",
+                result.claimed,
+                result.sent,
+                result.retried,
+                result.dead,
+            )
+        return result.claimed
+    except Exception:
+        logger.exception("Outbox dispatch failed.")
+        metrics.observe_worker_error("outbox")
+        return 0
+    finally:
+        reset_request_id(token)
+
+
+async def run() -> None:
+    """Цикл потребителя: пока очередь отдаёт полные пачки — без пауз, иначе спит."""
+    while True:
+        claimed = await dispatch()
+        if claimed < settings.workers.outbox_batch_size:
+            await asyncio.sleep(settings.workers.outbox_poll_interval_seconds)
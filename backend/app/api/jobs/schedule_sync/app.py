@@ -1,9 +1,12 @@
 from datetime import UTC, datetime
+from functools import partial
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.api.jobs.notification.app import REFRESH_JOB_ID as NOTIFICATION_REFRESH_JOB_ID
 from app.api.jobs.schedule_sync.job import run
+from app.api.jobs.utils import wake_job
 from app.settings.config import settings
 
 
@@ -15,4 +18,7 @@ def register(scheduler: AsyncIOScheduler) -> None:
         next_run_time=datetime.now(UTC),
         max_instances=1,
         coalesce=True,
+        # После синка пересчёт таймера уведомлений запускается через планировщик,
+        # чтобы не обходить max_instances задачи notification_refresh.
+        kwargs={"on_synced": partial(wake_job, scheduler, NOTIFICATION_REFRESH_JOB_ID)},
     )
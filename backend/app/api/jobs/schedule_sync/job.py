@@ -1,26 +1,43 @@
-from collections.abc import Callable
-from datetime import datetime, timedelta
+import asyncio
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
 
 from dependency_injector.wiring import Provide, inject
 
 from app.api.jobs.utils import send_alert
+from app.app_layer.interfaces.cache.schedule.dto import ScheduleGroupKeyDTO
 from app.app_layer.interfaces.notifications.notifier.interface import INotifier
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
 from app.app_layer.interfaces.repos.account.interface import IAccountRepository
+from app.app_layer.interfaces.services.notifications.schedule_change.dto import (
+    ScheduleChangeNotifyInputDTO,
+)
+from app.app_layer.interfaces.services.notifications.schedule_change.interface import (
+    IScheduleChangeNotificationService,
+)
 from app.app_layer.interfaces.services.schedule.schedule_sync.dto import (
-    ScheduleSyncForUserInputDTO,
+    PendingScheduleChangeDTO,
+    ScheduleSyncRestoreChangesInputDTO,
+    ScheduleSyncTakeChangesInputDTO,
+    ScheduleSyncUnitInputDTO,
 )
 from app.app_layer.interfaces.services.schedule.schedule_sync.interface import (
     IScheduleSyncService,
 )
-from app.app_layer.interfaces.services.schedule.week_calculator.dto import (
-    WeekCalculatorServiceInputDTO,
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.dto import (
+    ScheduleSyncPlanInputDTO,
+    ScheduleSyncPlanOutputDTO,
+    ScheduleSyncUnitDTO,
 )
-from app.app_layer.interfaces.services.schedule.week_calculator.interface import (
-    IWeekCalculatorService,
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.interface import (
+    IScheduleSyncPlannerService,
 )
 from app.app_layer.interfaces.time.clock.interface import IClock
 from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
 from app.di.container import Container
+from app.domain.services.schedule_diff import ScheduleDiff
 from app.domain.value_objects.timezone import Timezone
 from app.infra.observability.metrics.interface import IMetricsService
 from app.logging.config import get_logger
@@ -30,17 +47,131 @@ from app.settings.config import settings
 logger = get_logger(__name__)
 
 
+@dataclass
+class _RunStats:
+    fetched: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+
 def _user_now(now_utc: datetime, timezone: Timezone) -> datetime:
     zone = timezone.tzinfo()
     return now_utc.astimezone(zone)
 
 
+async def _sync_units(
+    units: Iterator[ScheduleSyncUnitDTO],
+    sync_service: IScheduleSyncService,
+    metrics: IMetricsService,
+    stats: _RunStats,
+) -> None:
+    # Воркеры пула разбирают общий итератор: next() не уступает управление,
+    # поэтому одна единица никогда не достаётся двум воркерам.
+    for unit in units:
+        token = set_request_id(f"worker-sync-{unit.key.group_id}-{unit.week_number}")
+        try:
+            result = await sync_service.sync_unit(ScheduleSyncUnitInputDTO(unit=unit))
+            stats.fetched += 1
+            if result.unchanged:
+                stats.unchanged += 1
+            metrics.observe_schedule_sync("unchanged" if result.unchanged else "success")
+        except Exception:
+            logger.exception(
+                "Schedule sync failed for group %s week %s.",
+                unit.key.group_id,
+                unit.week_number,
+            )
+            stats.failed += 1
+            metrics.observe_schedule_sync("error")
+        finally:
+            reset_request_id(token)
+
+
+async def _plan(
+    uow_factory: Callable[[], IUnitOfWork],
+    account_repo: IAccountRepository,
+    planner: IScheduleSyncPlannerService,
+    today: date,
+) -> tuple[ScheduleSyncPlanOutputDTO, int]:
+    # Аккаунты читаются пачками: в памяти остаётся только план (до max_holders на единицу).
+    plan = planner.plan(ScheduleSyncPlanInputDTO(accounts=[], today=today))
+    total = 0
+    async with uow_factory():
+        async for accounts in account_repo.iter_notifiable(settings.workers.account_batch_size):
+            total += len(accounts)
+            plan = planner.plan(
+                ScheduleSyncPlanInputDTO(accounts=accounts, today=today, previous=plan)
+            )
+    return plan, total
+
+
+async def _notify_changes(
+    units: list[ScheduleSyncUnitDTO],
+    sync_service: IScheduleSyncService,
+    uow_factory: Callable[[], IUnitOfWork],
+    account_repo: IAccountRepository,
+    change_notifier: IScheduleChangeNotificationService,
+) -> int:
+    # Изменения забираются по всем неделям плана: их мог заметить и бот, и этот прогон.
+    pending = (
+        await sync_service.take_changes(
+            ScheduleSyncTakeChangesInputDTO(
+                requests=[(unit.key, unit.week_number) for unit in units]
+            )
+        )
+    ).changes
+    if not pending:
+        return 0
+    changes: dict[ScheduleGroupKeyDTO, dict[int, ScheduleDiff]] = {}
+    for item in pending:
+        changes.setdefault(item.key, {})[item.week_number] = item.changes
+    # Получатели собираются повторным проходом и только для изменившихся групп.
+    recipients: dict[ScheduleGroupKeyDTO, list[AccountViewDTO]] = {}
+    async with uow_factory():
+        async for accounts in account_repo.iter_notifiable(settings.workers.account_batch_size):
+            for account in accounts:
+                if account.ssau_profile is None:
+                    continue
+                key = ScheduleGroupKeyDTO.from_profile(account.ssau_profile)
+                if key in changes:
+                    recipients.setdefault(key, []).append(account)
+
+    sent = 0
+    for key, weeks in changes.items():
+        try:
+            # Сообщения группы — одной транзакцией в outbox: либо все в очереди, либо
+            # база изменений возвращается и их пошлёт следующий прогон.
+            async with uow_factory():
+                result = await change_notifier.notify(
+                    ScheduleChangeNotifyInputDTO(weeks=weeks, recipients=recipients.get(key, []))
+                )
+            sent += result.sent_count
+        except Exception:
+            logger.exception("Schedule change notification failed for group %s.", key.group_id)
+            await _restore_changes(sync_service, [item for item in pending if item.key == key])
+    return sent
+
+
+async def _restore_changes(
+    sync_service: IScheduleSyncService,
+    pending: list[PendingScheduleChangeDTO],
+) -> None:
+    try:
+        await sync_service.restore_changes(ScheduleSyncRestoreChangesInputDTO(changes=pending))
+    except Exception:
+        logger.exception("Failed to restore pending schedule changes.")
+
+
 @inject
 async def run(
+    on_synced: Callable[[], None] | None = None,
     uow_factory: Callable[[], IUnitOfWork] = Provide[Container.db.uow_factory],
     account_repo: IAccountRepository = Provide[Container.repositories.account_repo],
     sync_service: IScheduleSyncService = Provide[Container.services.schedule_sync_service],
-    week_calculator: IWeekCalculatorService = Provide[Container.services.week_calculator_service],
+    planner: IScheduleSyncPlannerService = Provide[Container.services.schedule_sync_planner],
+    change_notifier: IScheduleChangeNotificationService = Provide[
+        Container.services.schedule_change_notification_service
+    ],
     clock: IClock = Provide[Container.core.clock],
     timezone: Timezone = Provide[Container.core.default_timezone],
     notifier: INotifier = Provide[Container.telegram.notifier],
@@ -50,46 +181,41 @@ async def run(
     admin_chat_id = settings.alerts.admin_chat_id if settings.alerts.enabled else None
 
     try:
-        async with uow_factory():
-            accounts = await account_repo.list_notifiable()
-
-        now_utc = clock.now()
-        for account in accounts:
-            profile = account.ssau_profile
-            if profile is None:
-                continue
-            token = set_request_id(f"worker-sync-{account.chat_id}")
-            try:
-                now_local = _user_now(now_utc, timezone)
-                await sync_service.sync_for_user(
-                    ScheduleSyncForUserInputDTO(account=account, target_date=now_local.date())
-                )
-                tomorrow = now_local.date() + timedelta(days=1)
-                tomorrow_week = week_calculator.get_week_number(
-                    WeekCalculatorServiceInputDTO(
-                        start_date=profile.academic_year_start,
-                        target_date=tomorrow,
-                    )
-                ).week_number
-                current_week = week_calculator.get_week_number(
-                    WeekCalculatorServiceInputDTO(
-                        start_date=profile.academic_year_start,
-                        target_date=now_local.date(),
-                    )
-                ).week_number
-                if tomorrow_week != current_week:
-                    await sync_service.sync_for_user(
-                        ScheduleSyncForUserInputDTO(account=account, target_date=tomorrow)
-                    )
-                metrics.observe_schedule_sync("success")
-            except ValueError:
-                logger.warning("Invalid timezone in settings.")
-                metrics.observe_schedule_sync("error")
-            except Exception:
-                logger.exception("Schedule sync failed for account %s.", account.account_id)
-                metrics.observe_schedule_sync("error")
-            finally:
-                reset_request_id(token)
+        started = time.monotonic()
+        now_local = _user_now(clock.now(), timezone)
+        plan, accounts_total = await _plan(uow_factory, account_repo, planner, now_local.date())
+        stats = _RunStats()
+        units = iter(plan.units)
+        workers = max(1, min(settings.workers.schedule_sync_concurrency, len(plan.units)))
+        await asyncio.gather(
+            *(_sync_units(units, sync_service, metrics, stats) for _ in range(workers))
+        )
+        notified = await _notify_changes(
+            plan.units, sync_service, uow_factory, account_repo, change_notifier
+        )
+        if on_synced is not None:
+            on_synced()
+
+        duration = time.monotonic() - started
+        metrics.observe_schedule_sync_run(
+            units=len(plan.units),
+            fetched=stats.fetched,
+            skipped=plan.skipped_accounts,
+            failed=stats.failed,
+            duration=duration,
+        )
+        logger.info(
+            "Schedule sync run: accounts=%s units=%s fetched=%s unchanged=%s skipped=%s "
+            "failed=%s notified=%s in %.1fs",
+            accounts_total,
+            len(plan.units),
+            stats.fetched,
+            stats.unchanged,
+            plan.skipped_accounts,
+            stats.failed,
+            notified,
+            duration,
+        )
     except Exception:
         logger.exception("Schedule sync job failed.")
         metrics.observe_worker_error("schedule_sync")
@@ -2,7 +2,9 @@ from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+from app.api.jobs.maintenance.app import register as register_maintenance
 from app.api.jobs.notification.app import register as register_notifications
+from app.api.jobs.outbox.app import register as register_outbox
 from app.api.jobs.schedule_sync.app import register as register_schedule_sync
 from app.settings.config import settings
 
@@ -18,4 +20,6 @@ def build_scheduler() -> AsyncIOScheduler:
     )
     register_schedule_sync(scheduler)
     register_notifications(scheduler)
+    register_outbox(scheduler)
+    register_maintenance(scheduler)
     return scheduler
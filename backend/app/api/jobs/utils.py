@@ -1,3 +1,8 @@
+from datetime import UTC, datetime
+
+from apscheduler.jobstores.base import JobLookupError
+from apscheduler.schedulers.base import BaseScheduler
+
 from app.app_layer.interfaces.notifications.notifier.interface import INotifier
 from app.domain.messages.base import TelegramMessage
 from app.domain.messages.error import ErrorMessage
@@ -21,3 +26,15 @@ async def send_alert(
         await notifier.send(admin_chat_id, payload)
     except Exception:
         logger.exception("Failed to send worker alert.")
+
+
+def wake_job(scheduler: BaseScheduler, job_id: str) -> None:
+    """Переносит ближайший запуск задачи на текущий момент.
+
+    Запуск идёт через планировщик, поэтому ``max_instances`` и ``coalesce`` задачи
+    соблюдаются: параллельно с уже работающим экземпляром она не стартует.
+    """
+    try:
+        scheduler.modify_job(job_id, next_run_time=datetime.now(UTC))
+    except JobLookupError:
+        logger.warning("Job %s is not scheduled, skipping wake-up.", job_id)
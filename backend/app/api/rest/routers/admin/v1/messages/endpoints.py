@@ -1,11 +1,20 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.rest.routers.admin.v1.messages.schemas import (
+    V1BroadcastOutputSchema,
     V1SendMessageInputSchema,
     V1SendMessageOutputSchema,
+    V1SubmitBroadcastInputSchema,
+    V1SubmitBroadcastOutputSchema,
+)
+from app.app_layer.interfaces.use_cases.get_admin_broadcast.dto import (
+    GetAdminBroadcastUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.get_admin_broadcast.interface import (
+    IGetAdminBroadcastUseCase,
 )
 from app.app_layer.interfaces.use_cases.send_admin_message.dto import (
     SendAdminMessageUseCaseInputDTO,
@@ -13,6 +22,12 @@ from app.app_layer.interfaces.use_cases.send_admin_message.dto import (
 from app.app_layer.interfaces.use_cases.send_admin_message.interface import (
     ISendAdminMessageUseCase,
 )
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.dto import (
+    SubmitAdminBroadcastUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.interface import (
+    ISubmitAdminBroadcastUseCase,
+)
 from app.di.container import Container
 
 router = APIRouter(prefix="/messages", tags=["Admin"])
@@ -32,3 +47,39 @@ async def send_message(
         SendAdminMessageUseCaseInputDTO(chat_ids=body.chat_ids, text=body.text)
     )
     return V1SendMessageOutputSchema.from_use_case_dto(result)
+
+
+@router.post(
+    "/broadcasts",
+    response_model=V1SubmitBroadcastOutputSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@inject
+async def submit_broadcast(
+    body: V1SubmitBroadcastInputSchema,
+    use_case: Annotated[
+        ISubmitAdminBroadcastUseCase,
+        Depends(Provide[Container.usecases.submit_admin_broadcast_use_case]),
+    ],
+) -> V1SubmitBroadcastOutputSchema:
+    """Поставить рассылку в очередь воркера; прогресс — ``GET /broadcasts/{broadcast_id}``."""
+    result = await use_case.execute(
+        SubmitAdminBroadcastUseCaseInputDTO(chat_ids=body.chat_ids, text=body.text)
+    )
+    return V1SubmitBroadcastOutputSchema.from_use_case_dto(result)
+
+
+@router.get("/broadcasts/{broadcast_id}", response_model=V1BroadcastOutputSchema)
+@inject
+async def get_broadcast(
+    broadcast_id: int,
+    use_case: Annotated[
+        IGetAdminBroadcastUseCase,
+        Depends(Provide[Container.usecases.get_admin_broadcast_use_case]),
+    ],
+) -> V1BroadcastOutputSchema:
+    """Счётчики рассылки: отправлено, не доставлено, ещё в очереди."""
+    result = await use_case.execute(GetAdminBroadcastUseCaseInputDTO(broadcast_id=broadcast_id))
+    if result.progress is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Broadcast not found.")
+    return V1BroadcastOutputSchema.from_progress(result.progress)
@@ -1,8 +1,15 @@
-from pydantic import BaseModel
+from datetime import datetime
 
+from pydantic import BaseModel, Field
+
+from app.app_layer.interfaces.repos.broadcast.dto import BroadcastProgressDTO
+from app.app_layer.interfaces.repos.broadcast.enums import BroadcastStatusEnum
 from app.app_layer.interfaces.use_cases.send_admin_message.dto import (
     SendAdminMessageUseCaseOutputDTO,
 )
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.dto import (
+    SubmitAdminBroadcastUseCaseOutputDTO,
+)
 
 
 class V1SendMessageInputSchema(BaseModel):
@@ -19,3 +26,43 @@ class V1SendMessageOutputSchema(BaseModel):
         cls, dto: SendAdminMessageUseCaseOutputDTO
     ) -> "V1SendMessageOutputSchema":
         return cls(sent=dto.sent, failed=dto.failed)
+
+
+class V1SubmitBroadcastInputSchema(BaseModel):
+    """``chat_ids`` не задан — рассылка всем пользователям."""
+
+    chat_ids: list[int] | None = Field(default=None, min_length=1)
+    text: str = Field(min_length=1)
+
+
+class V1SubmitBroadcastOutputSchema(BaseModel):
+    broadcast_id: int
+    total: int
+
+    @classmethod
+    def from_use_case_dto(
+        cls, dto: SubmitAdminBroadcastUseCaseOutputDTO
+    ) -> "V1SubmitBroadcastOutputSchema":
+        return cls(broadcast_id=dto.broadcast_id, total=dto.total)
+
+
+class V1BroadcastOutputSchema(BaseModel):
+    broadcast_id: int
+    status: BroadcastStatusEnum
+    total: int
+    sent: int
+    failed: int
+    pending: int
+    created_at: datetime
+
+    @classmethod
+    def from_progress(cls, progress: BroadcastProgressDTO) -> "V1BroadcastOutputSchema":
+        return cls(
+            broadcast_id=progress.broadcast.id,
+            status=progress.status,
+            total=progress.broadcast.total,
+            sent=progress.sent,
+            failed=progress.failed,
+            pending=progress.pending,
+            created_at=progress.broadcast.created_at,
+        )
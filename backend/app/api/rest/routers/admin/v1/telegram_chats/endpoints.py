@@ -1,11 +1,13 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.rest.routers.admin.v1.telegram_chats.schemas import (
     V1CheckTelegramChatsInputSchema,
     V1CheckTelegramChatsOutputSchema,
+    V1StartTelegramChatsCheckOutputSchema,
+    V1TelegramChatsCheckJobOutputSchema,
 )
 from app.app_layer.interfaces.use_cases.check_telegram_chats.dto import (
     CheckTelegramChatsUseCaseInputDTO,
@@ -13,6 +15,15 @@ from app.app_layer.interfaces.use_cases.check_telegram_chats.dto import (
 from app.app_layer.interfaces.use_cases.check_telegram_chats.interface import (
     ICheckTelegramChatsUseCase,
 )
+from app.app_layer.interfaces.use_cases.get_telegram_chats_check.dto import (
+    GetTelegramChatsCheckUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.get_telegram_chats_check.interface import (
+    IGetTelegramChatsCheckUseCase,
+)
+from app.app_layer.interfaces.use_cases.start_telegram_chats_check.interface import (
+    IStartTelegramChatsCheckUseCase,
+)
 from app.di.container import Container
 
 router = APIRouter(prefix="/telegram-chats", tags=["Admin"])
@@ -30,3 +41,37 @@ async def check_telegram_chats(
     """Тихо проверить доступность Telegram-чатов через getChat."""
     result = await use_case.execute(CheckTelegramChatsUseCaseInputDTO(chat_ids=body.chat_ids))
     return V1CheckTelegramChatsOutputSchema.from_use_case_dto(result)
+
+
+@router.post(
+    "/check-jobs",
+    response_model=V1StartTelegramChatsCheckOutputSchema,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@inject
+async def start_telegram_chats_check(
+    body: V1CheckTelegramChatsInputSchema,
+    use_case: Annotated[
+        IStartTelegramChatsCheckUseCase,
+        Depends(Provide[Container.usecases.start_telegram_chats_check_use_case]),
+    ],
+) -> V1StartTelegramChatsCheckOutputSchema:
+    """Запустить проверку чатов в фоне; прогресс — ``GET /check-jobs/{job_id}``."""
+    result = await use_case.execute(CheckTelegramChatsUseCaseInputDTO(chat_ids=body.chat_ids))
+    return V1StartTelegramChatsCheckOutputSchema.from_use_case_dto(result)
+
+
+@router.get("/check-jobs/{job_id}", response_model=V1TelegramChatsCheckJobOutputSchema)
+@inject
+async def get_telegram_chats_check(
+    job_id: str,
+    use_case: Annotated[
+        IGetTelegramChatsCheckUseCase,
+        Depends(Provide[Container.usecases.get_telegram_chats_check_use_case]),
+    ],
+) -> V1TelegramChatsCheckJobOutputSchema:
+    """Прогресс фоновой проверки чатов и её результат, когда она завершена."""
+    result = await use_case.execute(GetTelegramChatsCheckUseCaseInputDTO(job_id=job_id))
+    if result.job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Check job not found.")
+    return V1TelegramChatsCheckJobOutputSchema.from_job(result.job)
@@ -1,10 +1,19 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
+from app.app_layer.interfaces.cache.telegram_chats_check.dto import TelegramChatsCheckJobDTO
+from app.app_layer.interfaces.cache.telegram_chats_check.enums import (
+    TelegramChatsCheckJobStatusEnum,
+)
 from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheckResultDTO
 from app.app_layer.interfaces.telegram.chat_checker.enums import TelegramChatCheckStatusEnum
 from app.app_layer.interfaces.use_cases.check_telegram_chats.dto import (
     CheckTelegramChatsUseCaseOutputDTO,
 )
+from app.app_layer.interfaces.use_cases.start_telegram_chats_check.dto import (
+    StartTelegramChatsCheckUseCaseOutputDTO,
+)
 
 
 class V1CheckTelegramChatsInputSchema(BaseModel):
@@ -44,3 +53,47 @@ class V1CheckTelegramChatsOutputSchema(BaseModel):
             failed=dto.failed,
             skipped=dto.skipped,
         )
+
+
+class V1StartTelegramChatsCheckOutputSchema(BaseModel):
+    job_id: str
+    total: int
+    skipped: int
+
+    @classmethod
+    def from_use_case_dto(
+        cls,
+        dto: StartTelegramChatsCheckUseCaseOutputDTO,
+    ) -> "V1StartTelegramChatsCheckOutputSchema":
+        return cls(job_id=dto.job_id, total=dto.total, skipped=dto.skipped)
+
+
+class V1TelegramChatsCheckJobOutputSchema(BaseModel):
+    """Прогресс — ``progress`` из ``total``; ``result`` заполнен, когда задача завершена."""
+
+    job_id: str
+    status: TelegramChatsCheckJobStatusEnum
+    progress: int
+    total: int
+    started_at: datetime
+    finished_at: datetime | None
+    error: str | None
+    result: V1CheckTelegramChatsOutputSchema | None
+
+    @classmethod
+    def from_job(cls, job: TelegramChatsCheckJobDTO) -> "V1TelegramChatsCheckJobOutputSchema":
+        result = None
+        if job.status != TelegramChatsCheckJobStatusEnum.RUNNING:
+            result = V1CheckTelegramChatsOutputSchema.from_use_case_dto(
+                CheckTelegramChatsUseCaseOutputDTO.from_results(job.checked, skipped=job.skipped)
+            )
+        return cls(
+            job_id=job.job_id,
+            status=job.status,
+            progress=len(job.checked),
+            total=job.total,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error=job.error,
+            result=result,
+        )
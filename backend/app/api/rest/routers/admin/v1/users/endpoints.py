@@ -1,9 +1,10 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 
 from app.api.rest.routers.admin.v1.users.schemas import V1ListAccountsOutputSchema
+from app.app_layer.interfaces.use_cases.list_accounts.dto import ListAccountsUseCaseInputDTO
 from app.app_layer.interfaces.use_cases.list_accounts.interface import IListAccountsUseCase
 from app.di.container import Container
 
@@ -17,7 +18,12 @@ async def list_users(
         IListAccountsUseCase,
         Depends(Provide[Container.usecases.list_accounts_use_case]),
     ],
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
 ) -> V1ListAccountsOutputSchema:
-    """Список пользователей системы (без критичных данных)."""
-    result = await use_case.execute()
+    """Список пользователей системы (без критичных данных), постранично.
+
+    Следующая страница — запрос с ``cursor`` из ``next_cursor`` ответа.
+    """
+    result = await use_case.execute(ListAccountsUseCaseInputDTO(cursor=cursor, limit=limit))
     return V1ListAccountsOutputSchema.from_use_case_dto(result)
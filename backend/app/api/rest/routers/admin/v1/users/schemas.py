@@ -2,7 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.repos.account.dto import AccountSummaryDTO
 from app.app_layer.interfaces.use_cases.list_accounts.dto import (
     ListAccountsUseCaseOutputDTO,
 )
@@ -21,25 +21,28 @@ class V1AccountOutputSchema(BaseModel):
     subgroup: str | None
 
     @classmethod
-    def from_view(cls, view: AccountViewDTO) -> "V1AccountOutputSchema":
-        profile = view.ssau_profile
+    def from_summary(cls, summary: AccountSummaryDTO) -> "V1AccountOutputSchema":
         return cls(
-            id=view.account_id,
-            chat_id=view.chat_id,
-            display_name=view.telegram.display_name,
-            created_at=view.account.created_at,
-            notifications_enabled=view.settings.schedule_notifications_enabled,
-            is_authed=view.is_authed,
-            is_provisioned=view.is_provisioned,
-            group_name=profile.group_name if profile else None,
-            user_type=profile.user_type if profile else None,
-            subgroup=str(profile.subgroup) if profile else None,
+            id=summary.account_id,
+            chat_id=summary.chat_id,
+            display_name=summary.display_name,
+            created_at=summary.created_at,
+            notifications_enabled=summary.notifications_enabled,
+            is_authed=summary.is_authed,
+            is_provisioned=summary.is_provisioned,
+            group_name=summary.group_name,
+            user_type=summary.user_type,
+            subgroup=str(summary.subgroup) if summary.subgroup else None,
         )
 
 
 class V1ListAccountsOutputSchema(BaseModel):
     accounts: list[V1AccountOutputSchema]
+    next_cursor: int | None
 
     @classmethod
     def from_use_case_dto(cls, dto: ListAccountsUseCaseOutputDTO) -> "V1ListAccountsOutputSchema":
-        return cls(accounts=[V1AccountOutputSchema.from_view(a) for a in dto.accounts])
+        return cls(
+            accounts=[V1AccountOutputSchema.from_summary(a) for a in dto.accounts],
+            next_cursor=dto.next_cursor,
+        )
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+
+
+class IAccountViewCache(ABC):
+    """Кэш составного чтения аккаунта по ``chat_id``.
+
+    Ошибки хранилища не пробрасываются: промах кэша означает чтение из БД.
+    """
+
+    @abstractmethod
+    async def get(self, chat_id: int) -> AccountViewDTO | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, view: AccountViewDTO) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, chat_id: int) -> None:
+        raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 
@@ -19,6 +20,11 @@ class ICacheClient(ABC):
     async def get(self, key: str) -> Any | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def mget(self, keys: Sequence[str]) -> list[Any | None]:
+        """Значения ``keys`` одним запросом, в том же порядке (``None`` — нет ключа)."""
+        raise NotImplementedError
+
     @abstractmethod
     async def exists(self, key: str) -> bool:
         raise NotImplementedError
@@ -30,3 +36,26 @@ class ICacheClient(ABC):
     @abstractmethod
     async def delete(self, key: str) -> int:
         raise NotImplementedError
+
+    @abstractmethod
+    async def delete_if_equals(self, key: str, value: Any) -> bool:
+        """Атомарно удаляет ключ, только если его значение равно ``value``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_range_if_prefix(
+        self,
+        key: str,
+        offset: int,
+        value: bytes,
+        *,
+        prefix: bytes,
+        ttl: int | None = None,
+    ) -> bool:
+        """Атомарно перезаписывает байты с ``offset`` и продлевает TTL,
+        только если значение ключа начинается с ``prefix``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> int:
+        raise NotImplementedError
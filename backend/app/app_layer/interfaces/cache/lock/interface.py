@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+
+class IDistributedLock(ABC):
+    """Порт межпроцессной блокировки (бот, API и воркер делят один Valkey).
+
+    ``acquire`` не ждёт: возвращает токен владельца или ``None``, если блокировка
+    занята. Блокировка живёт не дольше ``ttl_seconds`` — упавший владелец не
+    держит её вечно. ``release`` снимает только свою блокировку (по токену).
+    """
+
+    @abstractmethod
+    async def acquire(self, name: str, ttl_seconds: int) -> str | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self, name: str, token: str) -> None:
+        raise NotImplementedError
@@ -1,14 +1,97 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from app.domain.entities.account.ssau_profile import SsauProfileEntity
 from app.domain.entities.lesson import Lesson
+from app.domain.services.lesson_index import WeekdayLessonIndex
+from app.domain.services.schedule_diff import lessons_content_hash
+from app.domain.services.semester_schedule import lessons_in_week, merge_week_lessons
 
 
-class CachedWeekDTO(BaseModel):
-    """Значение кэша расписания на неделю (хранится в Valkey под TTL)."""
+class ScheduleGroupKeyDTO(BaseModel):
+    """Ключ кэша расписания: расписание общее для всей группы, а не для аккаунта.
+
+    Подгруппа в ключ не входит — в кэше лежит полное расписание группы, фильтрация
+    по подгруппе выполняется ниже (``DailyScheduleService`` и др.).
+    """
 
     model_config = ConfigDict(frozen=True)
 
+    year_id: int
+    group_id: int
+    user_type: str
+
+    @classmethod
+    def from_profile(cls, profile: SsauProfileEntity) -> "ScheduleGroupKeyDTO":
+        return cls(
+            year_id=profile.year_id.value,
+            group_id=profile.group_id.value,
+            user_type=profile.user_type,
+        )
+
+
+class CachedWeekDTO(BaseModel):
+    """Значение кэша расписания на неделю (хранится в Valkey под TTL).
+
+    ``index`` — производный индекс занятий по дням; строится при создании DTO и
+    не сериализуется (после чтения из кэша собирается заново).
+    ``content_hash`` — хэш занятий (см. ``lessons_content_hash``): по нему синк
+    понимает, что СНИУ вернул ту же неделю, и не перезаписывает её.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
     fetched_at: datetime
     lessons: list[Lesson]
+    content_hash: str | None = None
+    index: WeekdayLessonIndex | None = Field(default=None, exclude=True, repr=False)
+
+    @model_validator(mode="after")
+    def _build_derived(self) -> "CachedWeekDTO":
+        if self.content_hash is None:
+            self.__dict__["content_hash"] = lessons_content_hash(self.lessons)
+        if self.index is None:
+            self.__dict__["index"] = WeekdayLessonIndex(self.lessons)
+        return self
+
+    @property
+    def lesson_index(self) -> WeekdayLessonIndex:
+        """Индекс занятий; для экземпляров из ``model_construct`` строится лениво."""
+        if self.index is None:
+            self.__dict__["index"] = WeekdayLessonIndex(self.lessons)
+        assert self.index is not None
+        return self.index
+
+
+class CachedSemesterDTO(BaseModel):
+    """Расписание группы на семестр, собранное из всех полученных недель.
+
+    ``weeks_fetched_at`` — какие недели были получены из СНИУ и когда: только для
+    них представление недели достоверно (ответ СНИУ содержит лишь занятия
+    запрошенной недели, поэтому неполученная неделя может скрывать новые пары).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    lessons: list[Lesson]
+    weeks_fetched_at: dict[int, datetime]
+
+    @classmethod
+    def empty(cls) -> "CachedSemesterDTO":
+        return cls(lessons=[], weeks_fetched_at={})
+
+    def merge_week(self, week_number: int, week: CachedWeekDTO) -> "CachedSemesterDTO":
+        return CachedSemesterDTO(
+            lessons=merge_week_lessons(self.lessons, week_number, week.lessons),
+            weeks_fetched_at={**self.weeks_fetched_at, week_number: week.fetched_at},
+        )
+
+    def week_view(self, week_number: int) -> CachedWeekDTO | None:
+        fetched_at = self.weeks_fetched_at.get(week_number)
+        if fetched_at is None:
+            return None
+        return CachedWeekDTO(
+            fetched_at=fetched_at,
+            lessons=lessons_in_week(self.lessons, week_number),
+        )
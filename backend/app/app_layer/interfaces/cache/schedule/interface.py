@@ -1,18 +1,97 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
 
-from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
+from app.app_layer.interfaces.cache.schedule.dto import (
+    CachedSemesterDTO,
+    CachedWeekDTO,
+    ScheduleGroupKeyDTO,
+)
 
 
 class IScheduleCacheStore(ABC):
     """Порт кэша расписания (driven). Реализация — Valkey, вне транзакции UoW.
 
-    TTL задаётся самой реализацией (конфиг), поэтому возврат значения = оно ещё свежо.
+    Запись общая на группу (``ScheduleGroupKeyDTO``) и неделю. Жёсткий TTL задаётся
+    самой реализацией (конфиг): возврат значения = его ещё можно показывать, но оно
+    может быть устаревшим — мягкую свежесть проверяют по ``fetched_at``.
     """
 
     @abstractmethod
-    async def get(self, account_id: int, week_number: int) -> CachedWeekDTO | None:
+    async def get(self, key: ScheduleGroupKeyDTO, week_number: int) -> CachedWeekDTO | None:
         raise NotImplementedError
 
     @abstractmethod
-    async def set(self, account_id: int, week_number: int, week: CachedWeekDTO) -> None:
+    async def get_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        """Пачка недель за один проход; отсутствующих в ответе нет."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: ScheduleGroupKeyDTO, week_number: int, week: CachedWeekDTO) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def touch(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        fetched_at: datetime,
+    ) -> bool:
+        """Обновляет ``fetched_at`` и TTL записи, не перезаписывая занятия.
+
+        ``False`` — записи нет или её формат не позволяет продлить её на месте;
+        тогда вызывающий делает обычный ``set``.
+        """
+        raise NotImplementedError
+
+
+class IScheduleSemesterStore(ABC):
+    """Порт хранилища семестрового расписания группы (см. ``CachedSemesterDTO``).
+
+    Живёт дольше недельного кэша: из него материализуются недели, уже однажды
+    полученные из СНИУ, без повторного запроса.
+    """
+
+    @abstractmethod
+    async def get(self, key: ScheduleGroupKeyDTO) -> CachedSemesterDTO | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: ScheduleGroupKeyDTO, semester: CachedSemesterDTO) -> None:
+        raise NotImplementedError
+
+
+class IScheduleChangeStore(ABC):
+    """Порт неотправленных изменений расписания: по (группе, неделе) — «база», версия
+    недели, с которой изменения ещё не сравнивали с текущей.
+
+    Изменение замечает любой фетч (фоновое обновление бота, синк по запросу, воркер,
+    любой процесс), а сообщает о нём джоба синка: заметивший сохраняет прежнюю
+    версию недели, джоба забирает её и сравнивает с текущей. Хранится самая ранняя
+    база, поэтому несколько правок подряд уходят одним сообщением.
+    """
+
+    @abstractmethod
+    async def record(
+        self, key: ScheduleGroupKeyDTO, week_number: int, baseline: CachedWeekDTO
+    ) -> None:
+        """Сохраняет базу, если для недели её ещё нет."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def restore(
+        self, key: ScheduleGroupKeyDTO, week_number: int, baseline: CachedWeekDTO
+    ) -> None:
+        """Возвращает забранную базу (сообщить не удалось), заменяя более позднюю."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def pop_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        """Забирает и удаляет базы недель; каждую получает только один вызывающий."""
         raise NotImplementedError
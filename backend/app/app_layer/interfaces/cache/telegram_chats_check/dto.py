@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.app_layer.interfaces.cache.telegram_chats_check.enums import (
+    TelegramChatsCheckJobStatusEnum,
+)
+from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheckResultDTO
+
+
+class TelegramChatsCheckJobDTO(BaseModel):
+    """Фоновая проверка чатов: ``checked`` растёт по мере выполнения, ``total`` известен сразу."""
+
+    model_config = ConfigDict(frozen=True)
+
+    job_id: str
+    status: TelegramChatsCheckJobStatusEnum
+    total: int
+    skipped: int
+    checked: list[TelegramChatCheckResultDTO]
+    started_at: datetime
+    finished_at: datetime | None = None
+    error: str | None = None
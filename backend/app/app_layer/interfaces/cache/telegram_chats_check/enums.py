@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class TelegramChatsCheckJobStatusEnum(StrEnum):
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.cache.telegram_chats_check.dto import TelegramChatsCheckJobDTO
+
+
+class ITelegramChatsCheckJobStore(ABC):
+    """Состояние фоновых проверок чатов, общее для всех процессов API.
+
+    Запись живёт ограниченное время (TTL): результаты забирают вскоре после завершения.
+    """
+
+    @abstractmethod
+    async def save(self, job: TelegramChatsCheckJobDTO) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, job_id: str) -> TelegramChatsCheckJobDTO | None:
+        raise NotImplementedError
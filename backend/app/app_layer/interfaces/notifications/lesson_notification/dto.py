@@ -14,3 +14,17 @@ class LessonNotificationDTO(BaseModel):
     lesson: Lesson
     lesson_start: datetime
     notification_type: NotificationTypeEnum
+
+
+class ScheduledNotificationDTO(BaseModel):
+    """Уведомление с точным моментом отправки.
+
+    ``expires_at`` — после этого момента уведомление неактуально (для «скоро
+    начало» — начало пары, для «пара началась» — её конец) и не отправляется.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    fire_at: datetime
+    expires_at: datetime
+    notification: LessonNotificationDTO
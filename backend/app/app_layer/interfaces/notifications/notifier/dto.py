@@ -0,0 +1,21 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.domain.messages.base import TelegramMessage
+
+
+class NotifierDeliveryDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    chat_id: int
+    message: TelegramMessage
+
+
+class NotifierDeliveryResultDTO(BaseModel):
+    """``retryable=False`` — повтор бессмыслен (бот заблокирован, чат не найден)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    chat_id: int
+    delivered: bool
+    error: str | None = None
+    retryable: bool = True
@@ -1,5 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
+from app.app_layer.interfaces.notifications.notifier.dto import (
+    NotifierDeliveryDTO,
+    NotifierDeliveryResultDTO,
+)
 from app.domain.messages.base import TelegramMessage
 
 
@@ -7,3 +12,14 @@ class INotifier(ABC):
     @abstractmethod
     async def send(self, chat_id: int, message: TelegramMessage) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def send_many(
+        self,
+        deliveries: Sequence[NotifierDeliveryDTO],
+    ) -> list[NotifierDeliveryResultDTO]:
+        """Рассылка пачки сообщений; результаты — в порядке ``deliveries``.
+
+        Ошибка одной доставки не прерывает остальные и не пробрасывается.
+        """
+        raise NotImplementedError
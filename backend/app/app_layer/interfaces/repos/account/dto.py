@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 
 from pydantic import BaseModel, ConfigDict
 
@@ -40,6 +40,26 @@ class AccountViewDTO(BaseModel):
         return self.ssau_profile is not None
 
 
+class AccountSummaryDTO(BaseModel):
+    """Проекция аккаунта для списков: без учётных данных СНИУ и лишних колонок."""
+
+    model_config = ConfigDict(frozen=True)
+
+    account_id: int
+    chat_id: int
+    display_name: str
+    created_at: datetime
+    notifications_enabled: bool
+    is_authed: bool
+    group_name: str | None
+    user_type: str | None
+    subgroup: Subgroup | None
+
+    @property
+    def is_provisioned(self) -> bool:
+        return self.group_name is not None
+
+
 # --- Save-DTO: create (без id) / update (с id) ---
 
 
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.app_layer.interfaces.repos.account.dto import (
     AccountSettingsCreateDTO,
     AccountSettingsUpdateDTO,
+    AccountSummaryDTO,
     AccountViewDTO,
     SsauIdentityCreateDTO,
     SsauIdentityUpdateDTO,
@@ -32,13 +34,27 @@ class IAccountRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def list_notifiable(self) -> list[AccountViewDTO]:
-        """Аккаунты с включёнными уведомлениями, у которых есть identity и профиль."""
+    def iter_notifiable(self, batch_size: int) -> AsyncIterator[list[AccountViewDTO]]:
+        """Аккаунты с включёнными уведомлениями, у которых есть identity и профиль.
+
+        Отдаются пачками по ``batch_size`` в порядке ``account_id`` (keyset, без
+        OFFSET): в памяти одновременно только одна пачка. Итерировать внутри UoW.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_summaries_page(
+        self, after_id: int | None, limit: int
+    ) -> list[AccountSummaryDTO]:
+        """Страница аккаунтов с ``account_id > after_id`` (для админских ручек).
+
+        Проекция без паролей и расшифровки.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def list_all(self) -> list[AccountViewDTO]:
-        """Все аккаунты системы (для админских ручек)."""
+    def iter_summaries(self, batch_size: int) -> AsyncIterator[list[AccountSummaryDTO]]:
+        """Все аккаунты системы пачками ``list_summaries_page``. Итерировать внутри UoW."""
         raise NotImplementedError
 
     # --- accounts ---
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.app_layer.interfaces.repos.broadcast.enums import BroadcastStatusEnum
+
+
+class BroadcastDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    text: str
+    total: int
+    created_at: datetime
+
+
+class BroadcastProgressDTO(BaseModel):
+    """Счётчики сообщений рассылки в outbox.
+
+    ``pending`` — ждут отправки или повтора (в том числе захваченные потребителем),
+    ``failed`` — ушли в dead letter.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    broadcast: BroadcastDTO
+    sent: int = 0
+    failed: int = 0
+    pending: int = 0
+
+    @property
+    def status(self) -> BroadcastStatusEnum:
+        if self.pending:
+            return BroadcastStatusEnum.IN_PROGRESS
+        return BroadcastStatusEnum.DONE
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class BroadcastStatusEnum(StrEnum):
+    IN_PROGRESS = "in_progress"
+    DONE = "done"
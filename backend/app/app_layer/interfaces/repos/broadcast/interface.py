@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.repos.broadcast.dto import BroadcastDTO, BroadcastProgressDTO
+
+
+class IBroadcastRepository(ABC):
+    """Админские рассылки; их сообщения доставляет общий outbox."""
+
+    @abstractmethod
+    async def create(self, text: str, total: int) -> BroadcastDTO:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_progress(self, broadcast_id: int) -> BroadcastProgressDTO | None:
+        """Рассылка и счётчики её сообщений по статусам; ``None`` — рассылки нет."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def finalize_finished(self) -> int:
+        """Записывает итоговые счётчики рассылкам без недоставленных сообщений.
+
+        Только после этого очистка outbox удаляет строки рассылки, так что прогресс
+        завершённой рассылки остаётся доступен. Возвращает число рассылок.
+        """
+        raise NotImplementedError
@@ -0,0 +1,26 @@
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict
+
+from app.domain.value_objects.notification_type import NotificationTypeEnum
+
+
+class NotificationLogKeyDTO(BaseModel):
+    """Ключ идемпотентности отправки (совпадает с ``uq_notification_once``)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    account_id: int
+    lesson_id: int
+    lesson_date: date
+    notification_type: NotificationTypeEnum
+
+
+class NotificationLogPurgeResultDTO(BaseModel):
+    """Итог одного шага очистки; ``done=False`` — остались строки старше отсечки."""
+
+    model_config = ConfigDict(frozen=True)
+
+    dropped_partitions: int = 0
+    deleted_rows: int = 0
+    done: bool = True
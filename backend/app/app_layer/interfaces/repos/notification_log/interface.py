@@ -1,27 +1,61 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
 from datetime import date, datetime
 
-from app.domain.value_objects.notification_type import NotificationTypeEnum
+from app.app_layer.interfaces.repos.notification_log.dto import (
+    NotificationLogKeyDTO,
+    NotificationLogPurgeResultDTO,
+)
 
 
 class INotificationLogRepository(ABC):
     @abstractmethod
-    async def was_sent(
+    async def filter_unsent(
         self,
-        account_id: int,
-        lesson_id: int,
-        lesson_date: date,
-        notification_type: NotificationTypeEnum,
-    ) -> bool:
+        keys: Sequence[NotificationLogKeyDTO],
+    ) -> list[NotificationLogKeyDTO]:
+        """Ещё не отправленные из ``keys`` (в исходном порядке) — одним запросом."""
         raise NotImplementedError
 
     @abstractmethod
-    async def mark_sent(
+    async def find_sent_on(
         self,
-        account_id: int,
-        lesson_id: int,
-        lesson_date: date,
-        notification_type: NotificationTypeEnum,
+        lesson_dates: Collection[date],
+    ) -> set[NotificationLogKeyDTO]:
+        """Все отметки на даты ``lesson_dates`` (прогрев кэша отправленных)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_sent_many(
+        self,
+        keys: Sequence[NotificationLogKeyDTO],
         sent_at: datetime,
-    ) -> None:
+    ) -> set[NotificationLogKeyDTO]:
+        """Помечает ``keys`` отправленными одним ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        Возвращает ключи, вставленные именно этим вызовом: уже помеченные (в том
+        числе параллельным воркером) пропускаются без ошибки и в ответ не попадают.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ensure_partitions(self, since: date, until: date) -> int:
+        """Создаёт недостающие партиции на даты ``[since; until]``; сколько создано.
+
+        Без партиционирования (SQLite) ничего не делает.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge_before(
+        self,
+        cutoff: date,
+        batch_size: int,
+    ) -> NotificationLogPurgeResultDTO:
+        """Один шаг очистки записей с ``lesson_date < cutoff``.
+
+        Партиционированная таблица сбрасывает целиком устаревшие партиции за один
+        шаг; без партиций удаляется не больше ``batch_size`` строк — вызывающий
+        повторяет шаги в отдельных транзакциях, пока ``done`` не станет ``True``.
+        """
         raise NotImplementedError
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.domain.messages.base import TelegramMessage
+from app.domain.value_objects.outbox_priority import OutboxPriorityEnum
+
+
+class OutboxEnqueueDTO(BaseModel):
+    """``broadcast_id`` связывает сообщение с админской рассылкой (для прогресса)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    chat_id: int
+    message: TelegramMessage
+    priority: OutboxPriorityEnum = OutboxPriorityEnum.NOTIFICATION
+    broadcast_id: int | None = None
+
+
+class OutboxMessageDTO(BaseModel):
+    """Захваченное потребителем сообщение; ``attempts`` уже учитывает текущую попытку."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    chat_id: int
+    message: TelegramMessage
+    attempts: int
+
+
+class OutboxFailureDTO(BaseModel):
+    """Неудачная доставка: ``retry_at`` — когда повторить, ``None`` — в dead letter."""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    error: str
+    retry_at: datetime | None = None
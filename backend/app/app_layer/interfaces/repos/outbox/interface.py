@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.app_layer.interfaces.repos.outbox.dto import (
+    OutboxEnqueueDTO,
+    OutboxFailureDTO,
+    OutboxMessageDTO,
+)
+
+
+class IOutboxRepository(ABC):
+    """Очередь исходящих сообщений Telegram (transactional outbox)."""
+
+    @abstractmethod
+    async def enqueue(
+        self,
+        messages: Sequence[OutboxEnqueueDTO],
+        available_at: datetime,
+    ) -> None:
+        """Кладёт сообщения в очередь в транзакции текущего UoW."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim(
+        self,
+        now: datetime,
+        limit: int,
+        locked_until: datetime,
+    ) -> list[OutboxMessageDTO]:
+        """Захватывает до ``limit`` готовых сообщений до ``locked_until``.
+
+        Готовы ожидающие с наступившим ``available_at`` и захваченные, чья аренда
+        истекла (потребитель упал, не подтвердив). Первыми захватываются сообщения
+        с меньшим ``priority``. Параллельные потребители захваченные друг другом
+        строки пропускают.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_sent(self, ids: Sequence[int], sent_at: datetime) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_failed(self, failures: Sequence[OutboxFailureDTO]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge_finished_before(self, cutoff: datetime, batch_size: int) -> int:
+        """Удаляет до ``batch_size`` отправленных и мёртвых сообщений старше ``cutoff``.
+
+        Возраст считается от отправки (у мёртвых — от последней попытки). Сообщения
+        рассылки удаляются только после записи её итоговых счётчиков
+        (``IBroadcastRepository.finalize_finished``). Возвращает число удалённых строк.
+        """
+        raise NotImplementedError
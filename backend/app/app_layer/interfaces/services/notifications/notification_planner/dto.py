@@ -2,21 +2,32 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict
 
-from app.app_layer.interfaces.notifications.lesson_notification.dto import LessonNotificationDTO
+from app.app_layer.interfaces.notifications.lesson_notification.dto import (
+    LessonNotificationDTO,
+    ScheduledNotificationDTO,
+)
 from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
 
 
-class NotificationPlannerCollectDueInputDTO(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+class NotificationPlannerCollectUpcomingInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
-    account: AccountViewDTO
+    accounts: list[AccountViewDTO]
     now: datetime
+    # Сколько дней, начиная с сегодняшнего (локально), планировать.
+    days: int = 2
 
 
-class NotificationPlannerMarkSentInputDTO(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+class NotificationPlannerFilterUnsentInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
-    notification: LessonNotificationDTO
+    notifications: list[LessonNotificationDTO]
+
+
+class NotificationPlannerMarkSentManyInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    notifications: list[LessonNotificationDTO]
     sent_at: datetime | None = None
 
 
@@ -24,3 +35,21 @@ class NotificationPlannerCollectDueOutputDTO(BaseModel):
     model_config = ConfigDict(extra="ignore", validate_assignment=True)
 
     notifications: list[LessonNotificationDTO]
+
+
+class AccountNotificationPlanDTO(BaseModel):
+    """Расписание уведомлений аккаунта; ``fingerprint`` меняется вместе с входом
+    (профиль, подгруппа, содержимое недель, горизонт), по нему таймер решает,
+    перестраивать ли записи аккаунта."""
+
+    model_config = ConfigDict(frozen=True)
+
+    account_id: int
+    fingerprint: str
+    notifications: list[ScheduledNotificationDTO]
+
+
+class NotificationPlannerCollectUpcomingOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    plans: list[AccountNotificationPlanDTO]
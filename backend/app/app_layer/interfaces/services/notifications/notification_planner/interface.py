@@ -1,20 +1,32 @@
 from abc import ABC, abstractmethod
 
 from app.app_layer.interfaces.services.notifications.notification_planner.dto import (
-    NotificationPlannerCollectDueInputDTO,
     NotificationPlannerCollectDueOutputDTO,
-    NotificationPlannerMarkSentInputDTO,
+    NotificationPlannerCollectUpcomingInputDTO,
+    NotificationPlannerCollectUpcomingOutputDTO,
+    NotificationPlannerFilterUnsentInputDTO,
+    NotificationPlannerMarkSentManyInputDTO,
 )
 
 
 class INotificationPlannerService(ABC):
     @abstractmethod
-    async def collect_due(
+    async def collect_upcoming(
         self,
-        input_dto: NotificationPlannerCollectDueInputDTO,
+        input_dto: NotificationPlannerCollectUpcomingInputDTO,
+    ) -> NotificationPlannerCollectUpcomingOutputDTO:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def filter_unsent(
+        self,
+        input_dto: NotificationPlannerFilterUnsentInputDTO,
     ) -> NotificationPlannerCollectDueOutputDTO:
         raise NotImplementedError
 
     @abstractmethod
-    async def mark_sent(self, input_dto: NotificationPlannerMarkSentInputDTO) -> None:
+    async def mark_sent_many(
+        self,
+        input_dto: NotificationPlannerMarkSentManyInputDTO,
+    ) -> NotificationPlannerCollectDueOutputDTO:
         raise NotImplementedError
@@ -1,15 +1,16 @@
 from pydantic import BaseModel, ConfigDict
 
-from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.notifications.lesson_notification.dto import LessonNotificationDTO
 
 
-class NotificationServiceInputDTO(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+class NotificationServiceSendInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
 
-    account: AccountViewDTO
+    notifications: list[LessonNotificationDTO]
 
 
 class NotificationServiceOutputDTO(BaseModel):
     model_config = ConfigDict(extra="ignore", validate_assignment=True)
 
+    # Сколько уведомлений поставлено в очередь на отправку.
     sent_count: int
@@ -1,15 +1,15 @@
 from abc import ABC, abstractmethod
 
 from app.app_layer.interfaces.services.notifications.notification_service.dto import (
-    NotificationServiceInputDTO,
     NotificationServiceOutputDTO,
+    NotificationServiceSendInputDTO,
 )
 
 
 class INotificationService(ABC):
     @abstractmethod
-    async def process_user(
+    async def send_notifications(
         self,
-        input_dto: NotificationServiceInputDTO,
+        input_dto: NotificationServiceSendInputDTO,
     ) -> NotificationServiceOutputDTO:
         raise NotImplementedError
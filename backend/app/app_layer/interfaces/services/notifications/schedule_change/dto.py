@@ -0,0 +1,19 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.domain.services.schedule_diff import ScheduleDiff
+
+
+class ScheduleChangeNotifyInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Номер учебной недели → изменения в ней (для одной группы).
+    weeks: dict[int, ScheduleDiff]
+    recipients: list[AccountViewDTO]
+
+
+class ScheduleChangeNotifyOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Сколько сообщений поставлено в очередь на отправку.
+    sent_count: int
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.services.notifications.schedule_change.dto import (
+    ScheduleChangeNotifyInputDTO,
+    ScheduleChangeNotifyOutputDTO,
+)
+
+
+class IScheduleChangeNotificationService(ABC):
+    @abstractmethod
+    async def notify(
+        self,
+        input_dto: ScheduleChangeNotifyInputDTO,
+    ) -> ScheduleChangeNotifyOutputDTO:
+        raise NotImplementedError
@@ -3,13 +3,18 @@ from datetime import date
 from pydantic import BaseModel, ConfigDict
 
 from app.domain.entities.lesson import Lesson
+from app.domain.services.lesson_index import WeekdayLessonIndex
 from app.domain.value_objects.subgroup import Subgroup
 
 
 class DailyScheduleServiceInputDTO(BaseModel):
-    model_config = ConfigDict(extra="ignore", validate_assignment=True)
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=True,
+        arbitrary_types_allowed=True,
+    )
 
-    lessons: list[Lesson]
+    index: WeekdayLessonIndex
     target_date: date
     week_number: int
     subgroup: Subgroup
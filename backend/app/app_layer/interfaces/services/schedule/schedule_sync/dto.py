@@ -2,8 +2,12 @@ from datetime import date
 
 from pydantic import BaseModel, ConfigDict
 
-from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO, ScheduleGroupKeyDTO
 from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.dto import (
+    ScheduleSyncUnitDTO,
+)
+from app.domain.services.schedule_diff import ScheduleDiff
 
 
 class ScheduleSyncForUserInputDTO(BaseModel):
@@ -20,6 +24,12 @@ class ScheduleSyncIfStaleInputDTO(BaseModel):
     target_date: date
 
 
+class ScheduleSyncUnitInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    unit: ScheduleSyncUnitDTO
+
+
 class ScheduleSyncForUserOutputDTO(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -30,3 +40,42 @@ class ScheduleSyncIfStaleOutputDTO(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     cache: CachedWeekDTO
+
+
+class ScheduleSyncUnitOutputDTO(BaseModel):
+    """``unchanged`` — СНИУ вернул ту же неделю, запись только продлена."""
+
+    model_config = ConfigDict(frozen=True)
+
+    cache: CachedWeekDTO
+    unchanged: bool = False
+
+
+class PendingScheduleChangeDTO(BaseModel):
+    """Неотправленные изменения недели группы; ``baseline`` — версия, с которой они
+    посчитаны (возвращается в хранилище, если сообщить не удалось)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    key: ScheduleGroupKeyDTO
+    week_number: int
+    baseline: CachedWeekDTO
+    changes: ScheduleDiff
+
+
+class ScheduleSyncTakeChangesInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    requests: list[tuple[ScheduleGroupKeyDTO, int]]
+
+
+class ScheduleSyncTakeChangesOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    changes: list[PendingScheduleChangeDTO]
+
+
+class ScheduleSyncRestoreChangesInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    changes: list[PendingScheduleChangeDTO]
@@ -5,6 +5,11 @@ from app.app_layer.interfaces.services.schedule.schedule_sync.dto import (
     ScheduleSyncForUserOutputDTO,
     ScheduleSyncIfStaleInputDTO,
     ScheduleSyncIfStaleOutputDTO,
+    ScheduleSyncRestoreChangesInputDTO,
+    ScheduleSyncTakeChangesInputDTO,
+    ScheduleSyncTakeChangesOutputDTO,
+    ScheduleSyncUnitInputDTO,
+    ScheduleSyncUnitOutputDTO,
 )
 
 
@@ -22,3 +27,23 @@ class IScheduleSyncService(ABC):
         input_dto: ScheduleSyncIfStaleInputDTO,
     ) -> ScheduleSyncIfStaleOutputDTO:
         raise NotImplementedError
+
+    @abstractmethod
+    async def sync_unit(
+        self,
+        input_dto: ScheduleSyncUnitInputDTO,
+    ) -> ScheduleSyncUnitOutputDTO:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def take_changes(
+        self,
+        input_dto: ScheduleSyncTakeChangesInputDTO,
+    ) -> ScheduleSyncTakeChangesOutputDTO:
+        """Забирает неотправленные изменения недель, кем бы из фетчей они ни были замечены."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def restore_changes(self, input_dto: ScheduleSyncRestoreChangesInputDTO) -> None:
+        """Возвращает забранные изменения, о которых сообщить не удалось."""
+        raise NotImplementedError
@@ -0,0 +1,37 @@
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict
+
+from app.app_layer.interfaces.cache.schedule.dto import ScheduleGroupKeyDTO
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+
+
+class ScheduleSyncUnitDTO(BaseModel):
+    """Единица синка: одна пара (группа, неделя) = один запрос в СНИУ.
+
+    ``holders`` — аккаунты группы, чьими кредами можно выполнить запрос, в порядке
+    попыток: если первый не авторизуется, берётся следующий.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    key: ScheduleGroupKeyDTO
+    week_number: int
+    holders: list[AccountViewDTO]
+
+
+class ScheduleSyncPlanOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    units: list[ScheduleSyncUnitDTO]
+    skipped_accounts: int
+
+
+class ScheduleSyncPlanInputDTO(BaseModel):
+    """``previous`` — план предыдущих пачек аккаунтов: новая пачка дописывается в него."""
+
+    model_config = ConfigDict(frozen=True)
+
+    accounts: list[AccountViewDTO]
+    today: date
+    previous: ScheduleSyncPlanOutputDTO | None = None
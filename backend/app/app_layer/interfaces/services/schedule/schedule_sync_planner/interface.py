@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.dto import (
+    ScheduleSyncPlanInputDTO,
+    ScheduleSyncPlanOutputDTO,
+)
+
+
+class IScheduleSyncPlannerService(ABC):
+    @abstractmethod
+    def plan(self, input_dto: ScheduleSyncPlanInputDTO) -> ScheduleSyncPlanOutputDTO:
+        raise NotImplementedError
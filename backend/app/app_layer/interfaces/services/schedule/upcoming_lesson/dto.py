@@ -3,14 +3,18 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict
 
 from app.app_layer.interfaces.schedule.upcoming_lesson.dto import UpcomingLessonDTO
-from app.domain.entities.lesson import Lesson
+from app.domain.services.lesson_index import WeekdayLessonIndex
 from app.domain.value_objects.subgroup import Subgroup
 
 
 class UpcomingLessonServiceInputDTO(BaseModel):
-    model_config = ConfigDict(extra="ignore", validate_assignment=True)
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=True,
+        arbitrary_types_allowed=True,
+    )
 
-    lessons: list[Lesson]
+    index: WeekdayLessonIndex
     now_local: datetime
     week_number: int
     subgroup: Subgroup
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheckResultDTO
 
@@ -7,3 +8,8 @@ class ITelegramChatChecker(ABC):
     @abstractmethod
     async def check(self, chat_id: int) -> TelegramChatCheckResultDTO:
         raise NotImplementedError
+
+    @abstractmethod
+    async def check_many(self, chat_ids: Sequence[int]) -> list[TelegramChatCheckResultDTO]:
+        """Проверяет чаты параллельно; результаты — в порядке ``chat_ids``."""
+        raise NotImplementedError
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
@@ -12,8 +12,14 @@ class TelegramEntityDTO:
 
 @dataclass(frozen=True)
 class RenderedTelegramMessageDTO:
+    """``chunks`` — куски под лимит длины Telegram, если рендерер нарезал их заранее.
+
+    Пустой кортеж — отправитель режет сообщение сам.
+    """
+
     text: str
     entities: tuple[TelegramEntityDTO, ...] = ()
+    chunks: tuple["RenderedTelegramMessageDTO", ...] = field(default=(), compare=False, repr=False)
 
     @property
     def length(self) -> int:
@@ -1,6 +1,9 @@
+from collections.abc import Sequence
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheckResultDTO
+from app.app_layer.interfaces.telegram.chat_checker.enums import TelegramChatCheckStatusEnum
 
 
 class CheckTelegramChatsUseCaseInputDTO(BaseModel):
@@ -19,3 +22,22 @@ class CheckTelegramChatsUseCaseOutputDTO(BaseModel):
     forbidden: int
     failed: int
     skipped: int
+
+    @classmethod
+    def from_results(
+        cls,
+        checked: Sequence[TelegramChatCheckResultDTO],
+        skipped: int,
+    ) -> "CheckTelegramChatsUseCaseOutputDTO":
+        def _count(status: TelegramChatCheckStatusEnum) -> int:
+            return sum(1 for result in checked if result.status == status)
+
+        return cls(
+            checked=list(checked),
+            total=len(checked),
+            reachable=_count(TelegramChatCheckStatusEnum.REACHABLE),
+            not_found=_count(TelegramChatCheckStatusEnum.NOT_FOUND),
+            forbidden=_count(TelegramChatCheckStatusEnum.FORBIDDEN),
+            failed=_count(TelegramChatCheckStatusEnum.FAILED),
+            skipped=skipped,
+        )
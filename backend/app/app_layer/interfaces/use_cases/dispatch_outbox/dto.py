@@ -0,0 +1,16 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DispatchOutboxUseCaseInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    limit: int = Field(default=100, ge=1)
+
+
+class DispatchOutboxUseCaseOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
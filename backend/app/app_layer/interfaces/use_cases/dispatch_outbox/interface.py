@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.use_cases.dispatch_outbox.dto import (
+    DispatchOutboxUseCaseInputDTO,
+    DispatchOutboxUseCaseOutputDTO,
+)
+
+
+class IDispatchOutboxUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        input_dto: DispatchOutboxUseCaseInputDTO,
+    ) -> DispatchOutboxUseCaseOutputDTO:
+        raise NotImplementedError
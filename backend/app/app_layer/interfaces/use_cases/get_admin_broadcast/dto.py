@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.app_layer.interfaces.repos.broadcast.dto import BroadcastProgressDTO
+
+
+class GetAdminBroadcastUseCaseInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    broadcast_id: int
+
+
+class GetAdminBroadcastUseCaseOutputDTO(BaseModel):
+    """``progress`` — ``None``, если рассылки нет."""
+
+    model_config = ConfigDict(frozen=True)
+
+    progress: BroadcastProgressDTO | None
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.use_cases.get_admin_broadcast.dto import (
+    GetAdminBroadcastUseCaseInputDTO,
+    GetAdminBroadcastUseCaseOutputDTO,
+)
+
+
+class IGetAdminBroadcastUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        input_dto: GetAdminBroadcastUseCaseInputDTO,
+    ) -> GetAdminBroadcastUseCaseOutputDTO:
+        raise NotImplementedError
@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.app_layer.interfaces.cache.telegram_chats_check.dto import TelegramChatsCheckJobDTO
+
+
+class GetTelegramChatsCheckUseCaseInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    job_id: str
+
+
+class GetTelegramChatsCheckUseCaseOutputDTO(BaseModel):
+    """``job`` — ``None``, если задачи нет или её запись уже истекла."""
+
+    model_config = ConfigDict(frozen=True)
+
+    job: TelegramChatsCheckJobDTO | None
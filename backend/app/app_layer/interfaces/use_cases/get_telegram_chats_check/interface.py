@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.use_cases.get_telegram_chats_check.dto import (
+    GetTelegramChatsCheckUseCaseInputDTO,
+    GetTelegramChatsCheckUseCaseOutputDTO,
+)
+
+
+class IGetTelegramChatsCheckUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        input_dto: GetTelegramChatsCheckUseCaseInputDTO,
+    ) -> GetTelegramChatsCheckUseCaseOutputDTO:
+        raise NotImplementedError
@@ -1,9 +1,21 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
-from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.repos.account.dto import AccountSummaryDTO
+
+
+class ListAccountsUseCaseInputDTO(BaseModel):
+    """Страница списка: аккаунты с ``account_id > cursor``, не больше ``limit``."""
+
+    model_config = ConfigDict(frozen=True)
+
+    cursor: int | None = None
+    limit: int = Field(default=100, ge=1, le=500)
 
 
 class ListAccountsUseCaseOutputDTO(BaseModel):
+    """``next_cursor`` — курсор следующей страницы; ``None``, если страница последняя."""
+
     model_config = ConfigDict(frozen=True)
 
-    accounts: list[AccountViewDTO]
+    accounts: list[AccountSummaryDTO]
+    next_cursor: int | None
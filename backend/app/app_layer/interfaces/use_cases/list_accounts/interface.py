@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 
 from app.app_layer.interfaces.use_cases.list_accounts.dto import (
+    ListAccountsUseCaseInputDTO,
     ListAccountsUseCaseOutputDTO,
 )
 
 
 class IListAccountsUseCase(ABC):
     @abstractmethod
-    async def execute(self) -> ListAccountsUseCaseOutputDTO:
+    async def execute(self, input_dto: ListAccountsUseCaseInputDTO) -> ListAccountsUseCaseOutputDTO:
         raise NotImplementedError
@@ -0,0 +1,23 @@
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PurgeNotificationLogUseCaseInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    # Журнал нужен для дедупликации только на горизонте планировщика (сегодня и
+    # завтра), поэтому короче двух дней хранить нельзя.
+    retention_days: int = Field(default=30, ge=2)
+    batch_size: int = Field(default=5000, ge=1)
+    # На сколько дней вперёд заранее создавать партиции.
+    partitions_ahead_days: int = Field(default=62, ge=1)
+
+
+class PurgeNotificationLogUseCaseOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    cutoff: date
+    created_partitions: int
+    dropped_partitions: int
+    deleted_rows: int
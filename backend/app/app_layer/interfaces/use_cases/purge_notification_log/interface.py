@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.use_cases.purge_notification_log.dto import (
+    PurgeNotificationLogUseCaseInputDTO,
+    PurgeNotificationLogUseCaseOutputDTO,
+)
+
+
+class IPurgeNotificationLogUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        input_dto: PurgeNotificationLogUseCaseInputDTO,
+    ) -> PurgeNotificationLogUseCaseOutputDTO:
+        raise NotImplementedError
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class PurgeOutboxUseCaseInputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    retention_days: int = Field(default=7, ge=1)
+    batch_size: int = Field(default=5000, ge=1)
+
+
+class PurgeOutboxUseCaseOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    cutoff: datetime
+    deleted_rows: int
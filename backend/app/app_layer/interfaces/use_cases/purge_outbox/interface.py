@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.use_cases.purge_outbox.dto import (
+    PurgeOutboxUseCaseInputDTO,
+    PurgeOutboxUseCaseOutputDTO,
+)
+
+
+class IPurgeOutboxUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        input_dto: PurgeOutboxUseCaseInputDTO,
+    ) -> PurgeOutboxUseCaseOutputDTO:
+        raise NotImplementedError
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class StartTelegramChatsCheckUseCaseOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    job_id: str
+    total: int
+    skipped: int
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.use_cases.check_telegram_chats.dto import (
+    CheckTelegramChatsUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.start_telegram_chats_check.dto import (
+    StartTelegramChatsCheckUseCaseOutputDTO,
+)
+
+
+class IStartTelegramChatsCheckUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        input_dto: CheckTelegramChatsUseCaseInputDTO,
+    ) -> StartTelegramChatsCheckUseCaseOutputDTO:
+        raise NotImplementedError
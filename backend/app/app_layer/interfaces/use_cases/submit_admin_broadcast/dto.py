@@ -0,0 +1,17 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class SubmitAdminBroadcastUseCaseInputDTO(BaseModel):
+    """``chat_ids=None`` — рассылка всем аккаунтам системы."""
+
+    model_config = ConfigDict(frozen=True)
+
+    chat_ids: list[int] | None = None
+    text: str
+
+
+class SubmitAdminBroadcastUseCaseOutputDTO(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    broadcast_id: int
+    total: int
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.dto import (
+    SubmitAdminBroadcastUseCaseInputDTO,
+    SubmitAdminBroadcastUseCaseOutputDTO,
+)
+
+
+class ISubmitAdminBroadcastUseCase(ABC):
+    @abstractmethod
+    async def execute(
+        self,
+        input_dto: SubmitAdminBroadcastUseCaseInputDTO,
+    ) -> SubmitAdminBroadcastUseCaseOutputDTO:
+        raise NotImplementedError
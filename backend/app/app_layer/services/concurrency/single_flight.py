@@ -0,0 +1,37 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[K, T]):
+    """Схлопывание одновременных вызовов в пределах процесса.
+
+    Пока операция по ключу выполняется, остальные вызовы с тем же ключом не
+    запускают свою, а ждут результат (или исключение) первой. Операция идёт
+    отдельной задачей: отмена одного ожидающего не отменяет её для остальных.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[K, asyncio.Task[T]] = {}
+
+    def in_flight(self, key: K) -> bool:
+        return key in self._in_flight
+
+    async def do(self, key: K, operation: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(operation())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[T]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Помечаем исключение прочитанным: если все ожидающие отменены,
+        # asyncio не должен ругаться на "never retrieved".
+        if not task.cancelled():
+            task.exception()
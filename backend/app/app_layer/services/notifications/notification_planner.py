@@ -1,16 +1,25 @@
-from datetime import UTC, datetime, timedelta
+import hashlib
+import json
+from datetime import UTC, date, datetime, timedelta
 
+from app.app_layer.interfaces.cache.schedule.dto import ScheduleGroupKeyDTO
 from app.app_layer.interfaces.cache.schedule.interface import IScheduleCacheStore
 from app.app_layer.interfaces.notifications.lesson_notification.dto import (
     LessonNotificationDTO,
+    ScheduledNotificationDTO,
 )
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.repos.notification_log.dto import NotificationLogKeyDTO
 from app.app_layer.interfaces.repos.notification_log.interface import (
     INotificationLogRepository,
 )
 from app.app_layer.interfaces.services.notifications.notification_planner.dto import (
-    NotificationPlannerCollectDueInputDTO,
+    AccountNotificationPlanDTO,
     NotificationPlannerCollectDueOutputDTO,
-    NotificationPlannerMarkSentInputDTO,
+    NotificationPlannerCollectUpcomingInputDTO,
+    NotificationPlannerCollectUpcomingOutputDTO,
+    NotificationPlannerFilterUnsentInputDTO,
+    NotificationPlannerMarkSentManyInputDTO,
 )
 from app.app_layer.interfaces.services.notifications.notification_planner.interface import (
     INotificationPlannerService,
@@ -22,7 +31,6 @@ from app.app_layer.interfaces.services.schedule.week_calculator.interface import
     IWeekCalculatorService,
 )
 from app.domain.value_objects.notification_type import NotificationTypeEnum
-from app.domain.value_objects.subgroup import Subgroup
 from app.domain.value_objects.timezone import Timezone
 
 BEFORE_START_NOTIFICATION_TYPE = NotificationTypeEnum.BEFORE_START
@@ -44,84 +52,128 @@ class NotificationPlanner(INotificationPlannerService):
         self._cache_store = cache_store
         self._notification_log_repo = notification_log_repo
 
-    async def collect_due(
+    async def collect_upcoming(
         self,
-        input_dto: NotificationPlannerCollectDueInputDTO,
-    ) -> NotificationPlannerCollectDueOutputDTO:
-        account = input_dto.account
-        now = input_dto.now
-
-        if account.ssau_profile is None:
-            return NotificationPlannerCollectDueOutputDTO(notifications=[])
-
-        now_local = self._to_local_time(now)
-        week_number = self._week_calculator.get_week_number(
-            WeekCalculatorServiceInputDTO(
-                start_date=account.ssau_profile.academic_year_start,
-                target_date=now_local.date(),
-            )
-        ).week_number
-        cache = await self._cache_store.get(account.account_id, week_number)
-        if cache is None:
-            return NotificationPlannerCollectDueOutputDTO(notifications=[])
-
-        due: list[LessonNotificationDTO] = []
-        today = now_local.date()
-        for lesson in cache.lessons:
-            if lesson.weekday != now_local.isoweekday():
+        input_dto: NotificationPlannerCollectUpcomingInputDTO,
+    ) -> NotificationPlannerCollectUpcomingOutputDTO:
+        """Точные моменты отправки на ``days`` дней вперёд для каждого аккаунта.
+
+        Для занятия планируются «скоро начало» (``start - lead_minutes``) и «пара
+        началась» (``start``); уже неактуальные пропускаются, а актуальные, чей
+        момент прошёл (рестарт воркера), попадают в план и уйдут сразу. Недели
+        читаются одним ``get_many``; отправленность проверяется в момент отправки.
+        """
+        now_local = self._to_local_time(input_dto.now)
+        days = [now_local.date() + timedelta(days=offset) for offset in range(input_dto.days)]
+
+        targets: list[tuple[AccountViewDTO, ScheduleGroupKeyDTO, list[tuple[date, int]]]] = []
+        for account in input_dto.accounts:
+            if account.ssau_profile is None:
                 continue
-            if week_number not in lesson.week_numbers:
-                continue
-            if not _lesson_matches_subgroup(
-                lesson.subgroup,
-                account.ssau_profile.subgroup,
-            ):
-                continue
-
-            lesson_start = datetime.combine(today, lesson.time.start, tzinfo=now_local.tzinfo)
-            lesson_end = datetime.combine(today, lesson.time.end, tzinfo=now_local.tzinfo)
-            notification_type = _resolve_notification_type(
-                now=now_local,
-                lesson_start=lesson_start,
-                lesson_end=lesson_end,
-                lead_minutes=self._lead_minutes,
-            )
-            if notification_type is None:
-                continue
-
-            already_sent = await self._notification_log_repo.was_sent(
-                account.account_id,
-                lesson.id,
-                today,
-                notification_type,
+            start_date = account.ssau_profile.academic_year_start
+            targets.append(
+                (
+                    account,
+                    ScheduleGroupKeyDTO.from_profile(account.ssau_profile),
+                    [(day, self._week_number(start_date, day)) for day in days],
+                )
             )
-            if already_sent:
-                continue
+        weeks = await self._cache_store.get_many(
+            [(key, week_number) for _, key, day_weeks in targets for _, week_number in day_weeks]
+        )
 
-            due.append(
-                LessonNotificationDTO(
-                    account=account,
-                    lesson=lesson,
-                    lesson_start=lesson_start,
-                    notification_type=notification_type,
+        plans: list[AccountNotificationPlanDTO] = []
+        for account, key, day_weeks in targets:
+            assert account.ssau_profile is not None
+            subgroup = account.ssau_profile.subgroup
+            scheduled: list[ScheduledNotificationDTO] = []
+            hashes: list[str | None] = []
+            for day, week_number in day_weeks:
+                cache = weeks.get((key, week_number))
+                hashes.append(None if cache is None else cache.content_hash)
+                if cache is None:
+                    continue
+                for lesson in cache.lesson_index.lessons_on(
+                    day.isoweekday(), week_number, subgroup
+                ):
+                    lesson_start = datetime.combine(day, lesson.time.start, tzinfo=now_local.tzinfo)
+                    lesson_end = datetime.combine(day, lesson.time.end, tzinfo=now_local.tzinfo)
+                    windows = [
+                        (
+                            lesson_start - timedelta(minutes=self._lead_minutes),
+                            lesson_start,
+                            BEFORE_START_NOTIFICATION_TYPE,
+                        ),
+                        (lesson_start, lesson_end, AT_START_NOTIFICATION_TYPE),
+                    ]
+                    for fire_at, expires_at, notification_type in windows:
+                        if fire_at >= expires_at or expires_at <= now_local:
+                            continue
+                        scheduled.append(
+                            ScheduledNotificationDTO(
+                                fire_at=fire_at,
+                                expires_at=expires_at,
+                                notification=LessonNotificationDTO(
+                                    account=account,
+                                    lesson=lesson,
+                                    lesson_start=lesson_start,
+                                    notification_type=notification_type,
+                                ),
+                            )
+                        )
+            plans.append(
+                AccountNotificationPlanDTO(
+                    account_id=account.account_id,
+                    fingerprint=_fingerprint(account, key, days[0], hashes),
+                    notifications=scheduled,
                 )
             )
+        return NotificationPlannerCollectUpcomingOutputDTO(plans=plans)
 
-        return NotificationPlannerCollectDueOutputDTO(notifications=due)
+    async def filter_unsent(
+        self,
+        input_dto: NotificationPlannerFilterUnsentInputDTO,
+    ) -> NotificationPlannerCollectDueOutputDTO:
+        notifications = input_dto.notifications
+        if not notifications:
+            return NotificationPlannerCollectDueOutputDTO(notifications=[])
+        unsent = set(
+            await self._notification_log_repo.filter_unsent(
+                [_log_key(notification) for notification in notifications]
+            )
+        )
+        return NotificationPlannerCollectDueOutputDTO(
+            notifications=[
+                notification for notification in notifications if _log_key(notification) in unsent
+            ]
+        )
 
-    async def mark_sent(
+    async def mark_sent_many(
         self,
-        input_dto: NotificationPlannerMarkSentInputDTO,
-    ) -> None:
-        notification = input_dto.notification
-        sent_at = input_dto.sent_at or datetime.now(UTC)
-        await self._notification_log_repo.mark_sent(
-            account_id=notification.account.account_id,
-            lesson_id=notification.lesson.id,
-            lesson_date=notification.lesson_start.date(),
-            notification_type=notification.notification_type,
-            sent_at=sent_at,
+        input_dto: NotificationPlannerMarkSentManyInputDTO,
+    ) -> NotificationPlannerCollectDueOutputDTO:
+        """Помечает пачку одним запросом; возвращает уведомления, помеченные этим вызовом.
+
+        Отправлять стоит только их: остальные уже помечены раньше или параллельным
+        воркером, и повторная отправка была бы дублем.
+        """
+        notifications = input_dto.notifications
+        if not notifications:
+            return NotificationPlannerCollectDueOutputDTO(notifications=[])
+        claimed = await self._notification_log_repo.mark_sent_many(
+            [_log_key(notification) for notification in notifications],
+            sent_at=input_dto.sent_at or datetime.now(UTC),
         )
+        return NotificationPlannerCollectDueOutputDTO(
+            notifications=[
+                notification for notification in notifications if _log_key(notification) in claimed
+            ]
+        )
+
+    def _week_number(self, start_date: date, target_date: date) -> int:
+        return self._week_calculator.get_week_number(
+            WeekCalculatorServiceInputDTO(start_date=start_date, target_date=target_date)
+        ).week_number
 
     def _to_local_time(self, now: datetime) -> datetime:
         zone = self._timezone.tzinfo()
@@ -130,23 +182,29 @@ class NotificationPlanner(INotificationPlannerService):
         return now.astimezone(zone)
 
 
-def _lesson_matches_subgroup(lesson_subgroup: int | None, subgroup: Subgroup) -> bool:
-    if subgroup.is_all:
-        return True
-    if lesson_subgroup is None:
-        return True
-    return lesson_subgroup == subgroup.value
-
-
-def _resolve_notification_type(
-    now: datetime,
-    lesson_start: datetime,
-    lesson_end: datetime,
-    lead_minutes: int,
-) -> NotificationTypeEnum | None:
-    notify_time = lesson_start - timedelta(minutes=lead_minutes)
-    if notify_time <= now < lesson_start:
-        return BEFORE_START_NOTIFICATION_TYPE
-    if lesson_start <= now < lesson_end:
-        return AT_START_NOTIFICATION_TYPE
-    return None
+def _log_key(notification: LessonNotificationDTO) -> NotificationLogKeyDTO:
+    return NotificationLogKeyDTO(
+        account_id=notification.account.account_id,
+        lesson_id=notification.lesson.id,
+        lesson_date=notification.lesson_start.date(),
+        notification_type=notification.notification_type,
+    )
+
+
+def _fingerprint(
+    account: AccountViewDTO,
+    key: ScheduleGroupKeyDTO,
+    first_day: date,
+    week_hashes: list[str | None],
+) -> str:
+    assert account.ssau_profile is not None
+    payload = [
+        key.model_dump(mode="json"),
+        str(account.ssau_profile.subgroup),
+        account.ssau_profile.academic_year_start.isoformat(),
+        account.chat_id,
+        first_day.isoformat(),
+        week_hashes,
+    ]
+    raw = json.dumps(payload, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
@@ -1,14 +1,18 @@
-from app.app_layer.interfaces.notifications.notifier.interface import INotifier
+from datetime import datetime
+
+from app.app_layer.interfaces.notifications.lesson_notification.dto import LessonNotificationDTO
+from app.app_layer.interfaces.repos.outbox.dto import OutboxEnqueueDTO
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
 from app.app_layer.interfaces.services.notifications.notification_planner.dto import (
-    NotificationPlannerCollectDueInputDTO,
-    NotificationPlannerMarkSentInputDTO,
+    NotificationPlannerFilterUnsentInputDTO,
+    NotificationPlannerMarkSentManyInputDTO,
 )
 from app.app_layer.interfaces.services.notifications.notification_planner.interface import (
     INotificationPlannerService,
 )
 from app.app_layer.interfaces.services.notifications.notification_service.dto import (
-    NotificationServiceInputDTO,
     NotificationServiceOutputDTO,
+    NotificationServiceSendInputDTO,
 )
 from app.app_layer.interfaces.services.notifications.notification_service.interface import (
     INotificationService,
@@ -22,56 +26,60 @@ logger = get_logger(__name__)
 
 
 class NotificationService(INotificationService):
+    """Ставит уведомления в outbox; в Telegram их отправляет отдельный потребитель.
+
+    Запись в журнал отправок и в очередь идёт в одной транзакции UoW вызывающего:
+    уведомление либо поставлено в очередь и помечено, либо ни то ни другое.
+    """
+
     def __init__(
         self,
         planner: INotificationPlannerService,
-        notifier: INotifier,
+        outbox_repo: IOutboxRepository,
         clock: IClock,
     ) -> None:
         self._planner = planner
-        self._notifier = notifier
+        self._outbox_repo = outbox_repo
         self._clock = clock
 
-    async def process_user(
+    async def send_notifications(
         self,
-        input_dto: NotificationServiceInputDTO,
+        input_dto: NotificationServiceSendInputDTO,
     ) -> NotificationServiceOutputDTO:
-        account = input_dto.account
-        now = self._clock.now()
-        due = await self._planner.collect_due(
-            NotificationPlannerCollectDueInputDTO(
-                account=account,
-                now=now,
-            )
+        """Ставит в очередь уведомления, сработавшие по таймеру, кроме уже отправленных."""
+        unsent = await self._planner.filter_unsent(
+            NotificationPlannerFilterUnsentInputDTO(notifications=input_dto.notifications)
         )
-        if not due.notifications:
-            return NotificationServiceOutputDTO(sent_count=0)
-
-        sent = 0
-        for notification in due.notifications:
-            await self._notifier.send(
-                notification.account.telegram.chat_id,
-                NotificationMessage(
-                    lesson=notification.lesson,
-                    lesson_start=notification.lesson_start,
-                    title=_notification_title(notification.notification_type),
-                ),
-            )
-            await self._planner.mark_sent(
-                NotificationPlannerMarkSentInputDTO(
-                    notification=notification,
-                    sent_at=now,
-                )
-            )
-            sent += 1
-
+        sent = await self._enqueue(unsent.notifications, self._clock.now())
         logger.info(
-            "Notifications sent: account=%s count=%s",
-            account.account_id,
+            "Notifications fired: due=%s queued=%s",
+            len(input_dto.notifications),
             sent,
         )
         return NotificationServiceOutputDTO(sent_count=sent)
 
+    async def _enqueue(self, notifications: list[LessonNotificationDTO], now: datetime) -> int:
+        # В очередь идут только уведомления, которые пометил этот вызов: если
+        # параллельный воркер успел раньше, его вставка выиграла, а наша — пропуск.
+        claimed = await self._planner.mark_sent_many(
+            NotificationPlannerMarkSentManyInputDTO(notifications=notifications, sent_at=now)
+        )
+        await self._outbox_repo.enqueue(
+            [
+                OutboxEnqueueDTO(
+                    chat_id=notification.account.telegram.chat_id,
+                    message=NotificationMessage(
+                        lesson=notification.lesson,
+                        lesson_start=notification.lesson_start,
+                        title=_notification_title(notification.notification_type),
+                    ),
+                )
+                for notification in claimed.notifications
+            ],
+            available_at=now,
+        )
+        return len(claimed.notifications)
+
 
 def _notification_title(notification_type: NotificationTypeEnum) -> str:
     if notification_type == NotificationTypeEnum.AT_START:
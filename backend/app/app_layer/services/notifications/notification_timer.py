@@ -0,0 +1,111 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+from collections.abc import Iterable
+from datetime import datetime
+
+from app.app_layer.interfaces.notifications.lesson_notification.dto import (
+    ScheduledNotificationDTO,
+)
+
+# (fire_at, seq, account_id, generation, notification)
+_Entry = tuple[datetime, int, int, int, ScheduledNotificationDTO]
+
+
+class NotificationTimer:
+    """Мин-куча моментов отправки уведомлений, общая на процесс воркера.
+
+    Записи аккаунта перестраиваются целиком (``replace_account``), но только если
+    изменился его ``fingerprint``. Старые записи не ищутся в куче: у аккаунта
+    растёт поколение, и устаревшие записи выбрасываются, когда всплывают наверх.
+    ``wait`` спит ровно до ближайшего момента и просыпается раньше, если план
+    поменялся. Не потокобезопасен: работает в одном event loop воркера.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[_Entry] = []
+        self._generations: dict[int, int] = {}
+        self._fingerprints: dict[int, str] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return sum(1 for entry in self._heap if self._is_live(entry))
+
+    def fingerprint(self, account_id: int) -> str | None:
+        return self._fingerprints.get(account_id)
+
+    def replace_account(
+        self,
+        account_id: int,
+        fingerprint: str,
+        notifications: Iterable[ScheduledNotificationDTO],
+    ) -> None:
+        generation = self._generations.get(account_id, 0) + 1
+        self._generations[account_id] = generation
+        self._fingerprints[account_id] = fingerprint
+        for scheduled in notifications:
+            heapq.heappush(
+                self._heap,
+                (scheduled.fire_at, next(self._seq), account_id, generation, scheduled),
+            )
+        self._wakeup.set()
+
+    def retain_accounts(self, account_ids: set[int]) -> None:
+        """Снимает записи аккаунтов, которых больше нет среди получателей."""
+        for account_id in self._fingerprints.keys() - account_ids:
+            self._generations[account_id] += 1
+            del self._fingerprints[account_id]
+        # Устаревшие записи живут в куче до всплытия; если их стало больше живых —
+        # пересобираем кучу, чтобы перестройки не копили память.
+        live = [entry for entry in self._heap if self._is_live(entry)]
+        if len(self._heap) > 2 * len(live) + 64:
+            heapq.heapify(live)
+            self._heap = live
+
+    def next_fire_at(self) -> datetime | None:
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[ScheduledNotificationDTO]:
+        due: list[ScheduledNotificationDTO] = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            scheduled = entry[4]
+            if self._is_live(entry) and now < scheduled.expires_at:
+                due.append(scheduled)
+        return due
+
+    def requeue(self, due: Iterable[ScheduledNotificationDTO], retry_at: datetime) -> None:
+        """Возвращает снятые ``pop_due`` уведомления, которые не удалось поставить в очередь.
+
+        Они сработают снова в ``retry_at`` (если ещё не истекут). Аккаунты, снятые с
+        таймера за это время, пропускаются; повтор после перестройки аккаунта
+        безопасен — дубли отсекает ``notification_log``.
+        """
+        for scheduled in due:
+            account_id = scheduled.notification.account.account_id
+            if account_id not in self._fingerprints:
+                continue
+            heapq.heappush(
+                self._heap,
+                (retry_at, next(self._seq), account_id, self._generations[account_id], scheduled),
+            )
+        self._wakeup.set()
+
+    async def wait(self, now: datetime, max_seconds: float) -> None:
+        """Ждёт ближайшего момента отправки, но не дольше ``max_seconds``."""
+        self._wakeup.clear()
+        next_at = self.next_fire_at()
+        timeout = max_seconds
+        if next_at is not None:
+            timeout = min(timeout, (next_at - now).total_seconds())
+        if timeout <= 0:
+            return
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+
+    def _is_live(self, entry: _Entry) -> bool:
+        return self._generations.get(entry[2]) == entry[3] and entry[2] in self._fingerprints
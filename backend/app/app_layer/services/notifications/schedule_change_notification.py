@@ -0,0 +1,52 @@
+from app.app_layer.interfaces.repos.outbox.dto import OutboxEnqueueDTO
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
+from app.app_layer.interfaces.services.notifications.schedule_change.dto import (
+    ScheduleChangeNotifyInputDTO,
+    ScheduleChangeNotifyOutputDTO,
+)
+from app.app_layer.interfaces.services.notifications.schedule_change.interface import (
+    IScheduleChangeNotificationService,
+)
+from app.app_layer.interfaces.time.clock.interface import IClock
+from app.domain.messages.schedule_change import ScheduleChangeMessage
+from app.domain.services.schedule_diff import ScheduleDiff
+from app.domain.value_objects.outbox_priority import OutboxPriorityEnum
+
+
+class ScheduleChangeNotificationService(IScheduleChangeNotificationService):
+    """Одно сообщение «расписание изменилось» на получателя за прогон синка.
+
+    Изменения фильтруются по подгруппе получателя: студент не узнаёт о парах
+    чужой подгруппы, и если для него ничего не изменилось — сообщения нет.
+    Сообщения ставятся в outbox в транзакции UoW вызывающего: доставку, повторы и
+    dead letter берёт на себя потребитель очереди.
+    """
+
+    def __init__(self, outbox_repo: IOutboxRepository, clock: IClock) -> None:
+        self._outbox_repo = outbox_repo
+        self._clock = clock
+
+    async def notify(
+        self,
+        input_dto: ScheduleChangeNotifyInputDTO,
+    ) -> ScheduleChangeNotifyOutputDTO:
+        messages: list[OutboxEnqueueDTO] = []
+        for account in input_dto.recipients:
+            if account.ssau_profile is None:
+                continue
+            subgroup = account.ssau_profile.subgroup
+            weeks: dict[int, ScheduleDiff] = {}
+            for week_number, changes in input_dto.weeks.items():
+                visible = changes.for_subgroup(subgroup)
+                if not visible.is_empty:
+                    weeks[week_number] = visible
+            if weeks:
+                messages.append(
+                    OutboxEnqueueDTO(
+                        chat_id=account.chat_id,
+                        message=ScheduleChangeMessage(weeks=weeks),
+                        priority=OutboxPriorityEnum.NOTIFICATION,
+                    )
+                )
+        await self._outbox_repo.enqueue(messages, available_at=self._clock.now())
+        return ScheduleChangeNotifyOutputDTO(sent_count=len(messages))
@@ -5,7 +5,6 @@ from app.app_layer.interfaces.services.schedule.daily_schedule.dto import (
 from app.app_layer.interfaces.services.schedule.daily_schedule.interface import (
     IDailyScheduleService,
 )
-from app.domain.value_objects.subgroup import Subgroup
 
 
 class DailyScheduleService(IDailyScheduleService):
@@ -13,26 +12,10 @@ class DailyScheduleService(IDailyScheduleService):
         self,
         input_dto: DailyScheduleServiceInputDTO,
     ) -> DailyScheduleServiceOutputDTO:
-        lessons = input_dto.lessons
-        target_date = input_dto.target_date
-        week_number = input_dto.week_number
-        subgroup = input_dto.subgroup
-
-        weekday = target_date.isoweekday()
         return DailyScheduleServiceOutputDTO(
-            lessons=[
-                lesson
-                for lesson in lessons
-                if lesson.weekday == weekday
-                and week_number in lesson.week_numbers
-                and _lesson_matches_subgroup(lesson.subgroup, subgroup)
-            ]
+            lessons=input_dto.index.lessons_on(
+                input_dto.target_date.isoweekday(),
+                input_dto.week_number,
+                input_dto.subgroup,
+            )
         )
-
-
-def _lesson_matches_subgroup(lesson_subgroup: int | None, subgroup: Subgroup) -> bool:
-    if subgroup.is_all:
-        return True
-    if lesson_subgroup is None:
-        return True
-    return lesson_subgroup == subgroup.value
@@ -1,14 +1,32 @@
-from datetime import date
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 
-from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
-from app.app_layer.interfaces.cache.schedule.interface import IScheduleCacheStore
+from app.app_layer.interfaces.cache.lock.interface import IDistributedLock
+from app.app_layer.interfaces.cache.schedule.dto import (
+    CachedSemesterDTO,
+    CachedWeekDTO,
+    ScheduleGroupKeyDTO,
+)
+from app.app_layer.interfaces.cache.schedule.interface import (
+    IScheduleCacheStore,
+    IScheduleChangeStore,
+    IScheduleSemesterStore,
+)
 from app.app_layer.interfaces.http.ssau.api.interface import ISsauApiClient
 from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
 from app.app_layer.interfaces.services.schedule.schedule_sync.dto import (
+    PendingScheduleChangeDTO,
     ScheduleSyncForUserInputDTO,
     ScheduleSyncForUserOutputDTO,
     ScheduleSyncIfStaleInputDTO,
     ScheduleSyncIfStaleOutputDTO,
+    ScheduleSyncRestoreChangesInputDTO,
+    ScheduleSyncTakeChangesInputDTO,
+    ScheduleSyncTakeChangesOutputDTO,
+    ScheduleSyncUnitInputDTO,
+    ScheduleSyncUnitOutputDTO,
 )
 from app.app_layer.interfaces.services.schedule.schedule_sync.interface import (
     IScheduleSyncService,
@@ -20,23 +38,72 @@ from app.app_layer.interfaces.services.schedule.week_calculator.interface import
     IWeekCalculatorService,
 )
 from app.app_layer.interfaces.time.clock.interface import IClock
+from app.app_layer.services.concurrency.single_flight import SingleFlight
+from app.domain.services.schedule_diff import diff_week_lessons
 from app.logging.config import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _FetchResult:
+    cache: CachedWeekDTO
+    unchanged: bool = False
+
+
 class ScheduleSyncService(IScheduleSyncService):
+    """Синк недельного расписания через общий на группу кэш.
+
+    Кэш адресуется ``ScheduleGroupKeyDTO`` (год/группа/тип), поэтому студенты одной
+    группы делят одну запись и один запрос в СНИУ; креды аккаунта используются лишь
+    для авторизации запроса. Фильтрация по подгруппе — ниже по потоку.
+
+    Запросы в СНИУ по одной паре (группа, неделя) не дублируются: внутри процесса
+    их схлопывает ``SingleFlight``, между процессами (бот, API, воркер) — опциональная
+    ``IDistributedLock``. Проигравший блокировку ждёт, пока владелец положит неделю
+    в кэш, и отдаёт её. Сервис должен быть singleton-ом, иначе карта in-flight не общая.
+
+    ``sync_if_stale`` работает в режиме stale-while-revalidate: запись старше
+    ``soft_ttl_seconds`` отдаётся сразу, а обновление запускается в фоне. Блокирует
+    пользователя только промах кэша (запись пережила жёсткий TTL хранилища).
+
+    Каждая полученная неделя вливается в семестровое расписание группы; при промахе
+    недельного кэша неделя, однажды уже полученная, материализуется оттуда без СНИУ.
+
+    Ответ СНИУ сравнивается с прежней версией недели по ``content_hash``: если
+    ничего не изменилось, запись только продлевается (``touch``), иначе
+    перезаписывается. Если при этом изменились занятия, прежняя версия сохраняется
+    в ``IScheduleChangeStore`` — каким бы путём и в каком процессе ни шёл фетч, —
+    а джоба синка забирает изменения через ``take_changes``.
+    """
+
     def __init__(
         self,
         provider: ISsauApiClient,
         clock: IClock,
         week_calculator: IWeekCalculatorService,
         cache_store: IScheduleCacheStore,
+        soft_ttl_seconds: int | None = None,
+        semester_store: IScheduleSemesterStore | None = None,
+        change_store: IScheduleChangeStore | None = None,
+        lock: IDistributedLock | None = None,
+        lock_ttl_seconds: int = 30,
+        lock_poll_interval_seconds: float = 0.2,
     ) -> None:
         self._provider = provider
         self._clock = clock
         self._week_calculator = week_calculator
         self._cache_store = cache_store
+        self._soft_ttl = timedelta(seconds=soft_ttl_seconds) if soft_ttl_seconds else None
+        self._semester_store = semester_store
+        self._change_store = change_store
+        self._lock = lock
+        self._lock_ttl_seconds = lock_ttl_seconds
+        self._lock_poll_interval_seconds = lock_poll_interval_seconds
+        self._single_flight: SingleFlight[tuple[ScheduleGroupKeyDTO, int], _FetchResult] = (
+            SingleFlight()
+        )
+        self._background: set[asyncio.Task[None]] = set()
 
     async def sync_for_user(
         self,
@@ -44,8 +111,13 @@ class ScheduleSyncService(IScheduleSyncService):
     ) -> ScheduleSyncForUserOutputDTO:
         account = input_dto.account
         week_number = self._week_number(account, input_dto.target_date)
-        cache = await self._fetch_and_store(account, week_number)
-        return ScheduleSyncForUserOutputDTO(cache=cache)
+        result = await self._fetch_coalesced(
+            _group_key(account),
+            week_number,
+            lambda: self._fetch_and_store(account, week_number),
+            newer_than=self._clock.now(),
+        )
+        return ScheduleSyncForUserOutputDTO(cache=result.cache)
 
     async def sync_if_stale(
         self,
@@ -53,11 +125,75 @@ class ScheduleSyncService(IScheduleSyncService):
     ) -> ScheduleSyncIfStaleOutputDTO:
         account = input_dto.account
         week_number = self._week_number(account, input_dto.target_date)
-        cache = await self._cache_store.get(account.account_id, week_number)
+        key = _group_key(account)
+        cache = await self._cache_store.get(key, week_number)
+        if cache is None:
+            cache = await self._from_semester(key, week_number)
         if cache is not None:
+            if self._is_soft_expired(cache):
+                self._refresh_in_background(account, key, week_number)
             return ScheduleSyncIfStaleOutputDTO(cache=cache)
-        fresh = await self._fetch_and_store(account, week_number)
-        return ScheduleSyncIfStaleOutputDTO(cache=fresh)
+        fresh = await self._fetch_coalesced(
+            key,
+            week_number,
+            lambda: self._fetch_and_store(account, week_number),
+            newer_than=None,
+        )
+        return ScheduleSyncIfStaleOutputDTO(cache=fresh.cache)
+
+    async def sync_unit(
+        self,
+        input_dto: ScheduleSyncUnitInputDTO,
+    ) -> ScheduleSyncUnitOutputDTO:
+        unit = input_dto.unit
+        if not unit.holders:
+            raise ValueError("Schedule sync unit has no credential holders.")
+        result = await self._fetch_coalesced(
+            unit.key,
+            unit.week_number,
+            lambda: self._fetch_via_holders(unit.holders, unit.week_number),
+            newer_than=self._clock.now(),
+        )
+        return ScheduleSyncUnitOutputDTO(cache=result.cache, unchanged=result.unchanged)
+
+    async def take_changes(
+        self,
+        input_dto: ScheduleSyncTakeChangesInputDTO,
+    ) -> ScheduleSyncTakeChangesOutputDTO:
+        """Забирает базы запрошенных недель и сравнивает их с текущими версиями.
+
+        База снимается до чтения текущей недели: правка, пришедшая между ними,
+        сохранит новую базу и попадёт в следующий прогон, а не потеряется.
+        """
+        if self._change_store is None:
+            return ScheduleSyncTakeChangesOutputDTO(changes=[])
+        baselines = await self._change_store.pop_many(input_dto.requests)
+        if not baselines:
+            return ScheduleSyncTakeChangesOutputDTO(changes=[])
+        current = await self._cache_store.get_many(list(baselines))
+        pending: list[PendingScheduleChangeDTO] = []
+        for (key, week_number), baseline in baselines.items():
+            week = current.get((key, week_number))
+            if week is None or week.content_hash == baseline.content_hash:
+                continue
+            changes = diff_week_lessons(baseline.lessons, week.lessons, week_number)
+            if changes.is_empty:
+                continue
+            pending.append(
+                PendingScheduleChangeDTO(
+                    key=key,
+                    week_number=week_number,
+                    baseline=baseline,
+                    changes=changes,
+                )
+            )
+        return ScheduleSyncTakeChangesOutputDTO(changes=pending)
+
+    async def restore_changes(self, input_dto: ScheduleSyncRestoreChangesInputDTO) -> None:
+        if self._change_store is None:
+            return
+        for pending in input_dto.changes:
+            await self._change_store.restore(pending.key, pending.week_number, pending.baseline)
 
     def _week_number(self, account: AccountViewDTO, target_date: date) -> int:
         if account.ssau_profile is None:
@@ -69,17 +205,203 @@ class ScheduleSyncService(IScheduleSyncService):
             )
         ).week_number
 
-    async def _fetch_and_store(self, account: AccountViewDTO, week_number: int) -> CachedWeekDTO:
+    def _is_soft_expired(self, cache: CachedWeekDTO) -> bool:
+        if self._soft_ttl is None:
+            return False
+        return self._clock.now() - cache.fetched_at >= self._soft_ttl
+
+    def _refresh_in_background(
+        self,
+        account: AccountViewDTO,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+    ) -> None:
+        if self._single_flight.in_flight((key, week_number)):
+            return
+        task = asyncio.create_task(self._refresh(account, key, week_number))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _refresh(
+        self,
+        account: AccountViewDTO,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+    ) -> None:
+        try:
+            await self._fetch_coalesced(
+                key,
+                week_number,
+                lambda: self._fetch_and_store(account, week_number),
+                newer_than=self._clock.now(),
+            )
+        except Exception:
+            logger.warning(
+                "Background schedule refresh failed (group=%s week=%s).",
+                key.group_id,
+                week_number,
+                exc_info=True,
+            )
+
+    async def _fetch_coalesced(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        fetch: Callable[[], Awaitable[_FetchResult]],
+        *,
+        newer_than: datetime | None,
+    ) -> _FetchResult:
+        return await self._single_flight.do(
+            (key, week_number),
+            lambda: self._fetch_exclusive(key, week_number, fetch, newer_than=newer_than),
+        )
+
+    async def _fetch_exclusive(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        fetch: Callable[[], Awaitable[_FetchResult]],
+        *,
+        newer_than: datetime | None,
+    ) -> _FetchResult:
+        """Фетч под межпроцессной блокировкой.
+
+        Пока блокировка чужая, опрашиваем кэш: годится запись, записанная не раньше
+        ``newer_than`` (для ``sync_if_stale`` — любая). Если владелец так и не
+        положил неделю за TTL блокировки, забираем блокировку и фетчим сами.
+        """
+        if self._lock is None:
+            return await fetch()
+        name = _lock_name(key, week_number)
+        token = await self._lock.acquire(name, self._lock_ttl_seconds)
+        while token is None:
+            await asyncio.sleep(self._lock_poll_interval_seconds)
+            cached = await self._cache_store.get(key, week_number)
+            if cached is not None and (newer_than is None or cached.fetched_at >= newer_than):
+                return _FetchResult(cache=cached)
+            token = await self._lock.acquire(name, self._lock_ttl_seconds)
+        try:
+            return await fetch()
+        finally:
+            await self._lock.release(name, token)
+
+    async def _fetch_via_holders(
+        self,
+        holders: list[AccountViewDTO],
+        week_number: int,
+    ) -> _FetchResult:
+        last_error: Exception | None = None
+        for holder in holders:
+            try:
+                return await self._fetch_and_store(holder, week_number)
+            except Exception as exc:
+                logger.warning(
+                    "Schedule fetch via account %s failed (week=%s): %s",
+                    holder.account_id,
+                    week_number,
+                    exc,
+                )
+                last_error = exc
+        assert last_error is not None
+        raise last_error
+
+    async def _fetch_and_store(self, account: AccountViewDTO, week_number: int) -> _FetchResult:
         if account.ssau_identity is None or account.ssau_profile is None:
             raise ValueError("Credentials and SSAU profile are required to sync schedule.")
         lessons = await self._provider.fetch_week_schedule(
             login=account.ssau_identity.login,
-            password=account.ssau_identity.password,
+            password=account.ssau_identity.password.get_secret_value(),
             group_id=account.ssau_profile.group_id.value,
             year_id=account.ssau_profile.year_id.value,
             user_type=account.ssau_profile.user_type,
             week_number=week_number,
         )
         cache = CachedWeekDTO(fetched_at=self._clock.now(), lessons=lessons)
-        await self._cache_store.set(account.account_id, week_number, cache)
-        return cache
+        key = _group_key(account)
+        previous = await self._cache_store.get(key, week_number)
+        if previous is None:
+            previous = await self._semester_week(key, week_number)
+
+        if previous is not None and previous.content_hash == cache.content_hash:
+            if not await self._cache_store.touch(key, week_number, cache.fetched_at):
+                await self._cache_store.set(key, week_number, cache)
+            return _FetchResult(cache=cache, unchanged=True)
+
+        if previous is not None:
+            # База — до записи недели: иначе сбой между ними потерял бы изменения.
+            changes = diff_week_lessons(previous.lessons, cache.lessons, week_number)
+            if not changes.is_empty:
+                await self._record_change(key, week_number, previous)
+        await self._cache_store.set(key, week_number, cache)
+        await self._merge_into_semester(key, week_number, cache)
+        return _FetchResult(cache=cache)
+
+    async def _record_change(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        previous: CachedWeekDTO,
+    ) -> None:
+        if self._change_store is None:
+            return
+        try:
+            await self._change_store.record(key, week_number, previous)
+        except Exception:
+            logger.warning(
+                "Failed to record schedule change for week %s (group=%s).",
+                week_number,
+                key.group_id,
+                exc_info=True,
+            )
+
+    async def _from_semester(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+    ) -> CachedWeekDTO | None:
+        """Материализует неделю из семестрового расписания, если она уже получалась."""
+        view = await self._semester_week(key, week_number)
+        if view is not None:
+            await self._cache_store.set(key, week_number, view)
+        return view
+
+    async def _semester_week(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+    ) -> CachedWeekDTO | None:
+        if self._semester_store is None:
+            return None
+        semester = await self._semester_store.get(key)
+        if semester is None:
+            return None
+        return semester.week_view(week_number)
+
+    async def _merge_into_semester(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        week: CachedWeekDTO,
+    ) -> None:
+        if self._semester_store is None:
+            return
+        try:
+            semester = await self._semester_store.get(key) or CachedSemesterDTO.empty()
+            await self._semester_store.set(key, semester.merge_week(week_number, week))
+        except Exception:
+            logger.warning(
+                "Failed to merge week %s into semester schedule (group=%s).",
+                week_number,
+                key.group_id,
+                exc_info=True,
+            )
+
+
+def _group_key(account: AccountViewDTO) -> ScheduleGroupKeyDTO:
+    if account.ssau_profile is None:
+        raise ValueError("User SSAU profile is required to sync schedule.")
+    return ScheduleGroupKeyDTO.from_profile(account.ssau_profile)
+
+
+def _lock_name(key: ScheduleGroupKeyDTO, week_number: int) -> str:
+    return f"schedule-sync:{key.year_id}:{key.group_id}:{key.user_type}:{week_number}"
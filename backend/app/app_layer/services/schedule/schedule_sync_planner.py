@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+from app.app_layer.interfaces.cache.schedule.dto import ScheduleGroupKeyDTO
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.dto import (
+    ScheduleSyncPlanInputDTO,
+    ScheduleSyncPlanOutputDTO,
+    ScheduleSyncUnitDTO,
+)
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.interface import (
+    IScheduleSyncPlannerService,
+)
+from app.app_layer.interfaces.services.schedule.week_calculator.dto import (
+    WeekCalculatorServiceInputDTO,
+)
+from app.app_layer.interfaces.services.schedule.week_calculator.interface import (
+    IWeekCalculatorService,
+)
+
+
+class ScheduleSyncPlanner(IScheduleSyncPlannerService):
+    """Сворачивает аккаунты в уникальные пары (группа, неделя) до начала прогона.
+
+    Для каждого аккаунта берётся текущая неделя, на стыке недель — завтрашняя, и
+    ``prefetch_weeks`` следующих недель: они ложатся в семестровое расписание, и
+    запросы бота о будущих неделях обслуживаются без СНИУ.
+    Аккаунты без профиля или кредов в план не попадают и считаются пропущенными.
+    Аккаунты можно подавать пачками, передавая план предыдущих пачек в ``previous``.
+    """
+
+    def __init__(
+        self,
+        week_calculator: IWeekCalculatorService,
+        max_holders: int = 3,
+        prefetch_weeks: int = 0,
+    ) -> None:
+        self._week_calculator = week_calculator
+        self._max_holders = max_holders
+        self._prefetch_weeks = prefetch_weeks
+
+    def plan(self, input_dto: ScheduleSyncPlanInputDTO) -> ScheduleSyncPlanOutputDTO:
+        tomorrow = input_dto.today + timedelta(days=1)
+        holders: dict[tuple[ScheduleGroupKeyDTO, int], list[AccountViewDTO]] = {}
+        skipped = 0
+        if input_dto.previous is not None:
+            for unit in input_dto.previous.units:
+                holders[(unit.key, unit.week_number)] = list(unit.holders)
+            skipped = input_dto.previous.skipped_accounts
+        for account in sorted(input_dto.accounts, key=lambda item: item.account_id):
+            profile = account.ssau_profile
+            if profile is None or account.ssau_identity is None:
+                skipped += 1
+                continue
+            key = ScheduleGroupKeyDTO.from_profile(profile)
+            current_week = self._week_number(profile.academic_year_start, input_dto.today)
+            weeks = {
+                self._week_number(profile.academic_year_start, tomorrow),
+                *range(current_week, current_week + self._prefetch_weeks + 1),
+            }
+            for week_number in sorted(weeks):
+                unit_holders = holders.setdefault((key, week_number), [])
+                if len(unit_holders) < self._max_holders:
+                    unit_holders.append(account)
+
+        units = [
+            ScheduleSyncUnitDTO(key=key, week_number=week_number, holders=unit_holders)
+            for (key, week_number), unit_holders in holders.items()
+        ]
+        return ScheduleSyncPlanOutputDTO(units=units, skipped_accounts=skipped)
+
+    def _week_number(self, start_date: date, target_date: date) -> int:
+        return self._week_calculator.get_week_number(
+            WeekCalculatorServiceInputDTO(
+                start_date=start_date,
+                target_date=target_date,
+            )
+        ).week_number
@@ -9,7 +9,6 @@ from app.app_layer.interfaces.services.schedule.upcoming_lesson.interface import
     IUpcomingLessonService,
 )
 from app.domain.constants import DAYS_IN_WEEK
-from app.domain.value_objects.subgroup import Subgroup
 
 
 class UpcomingLessonService(IUpcomingLessonService):
@@ -17,41 +16,24 @@ class UpcomingLessonService(IUpcomingLessonService):
         self,
         input_dto: UpcomingLessonServiceInputDTO,
     ) -> UpcomingLessonServiceOutputDTO:
-        lessons = input_dto.lessons
         now_local = input_dto.now_local
-        week_number = input_dto.week_number
-        subgroup = input_dto.subgroup
-
-        candidates: list[UpcomingLessonDTO] = []
         today = now_local.date()
         tz = now_local.tzinfo
 
+        # Дни идут по возрастанию, занятия дня — по времени начала: первое
+        # неначавшееся занятие и есть ближайшее.
         for offset in range(DAYS_IN_WEEK):
             target_date = today + timedelta(days=offset)
-            weekday = target_date.isoweekday()
+            lessons = input_dto.index.lessons_on(
+                target_date.isoweekday(),
+                input_dto.week_number,
+                input_dto.subgroup,
+            )
             for lesson in lessons:
-                if lesson.weekday != weekday:
-                    continue
-                if week_number not in lesson.week_numbers:
-                    continue
-                if not _lesson_matches_subgroup(lesson.subgroup, subgroup):
-                    continue
                 start_at = datetime.combine(target_date, lesson.time.start, tzinfo=tz)
-                if start_at < now_local:
-                    continue
-                candidates.append(UpcomingLessonDTO(lesson=lesson, start_at=start_at))
-
-        if not candidates:
-            return UpcomingLessonServiceOutputDTO(upcoming_lesson=None)
-
-        return UpcomingLessonServiceOutputDTO(
-            upcoming_lesson=min(candidates, key=lambda item: item.start_at)
-        )
-
+                if start_at >= now_local:
+                    return UpcomingLessonServiceOutputDTO(
+                        upcoming_lesson=UpcomingLessonDTO(lesson=lesson, start_at=start_at)
+                    )
 
-def _lesson_matches_subgroup(lesson_subgroup: int | None, subgroup: Subgroup) -> bool:
-    if subgroup.is_all:
-        return True
-    if lesson_subgroup is None:
-        return True
-    return lesson_subgroup == subgroup.value
+        return UpcomingLessonServiceOutputDTO(upcoming_lesson=None)
@@ -1,8 +1,6 @@
 from collections.abc import Callable
 
 from app.app_layer.interfaces.repos.account.interface import IAccountRepository
-from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheckResultDTO
-from app.app_layer.interfaces.telegram.chat_checker.enums import TelegramChatCheckStatusEnum
 from app.app_layer.interfaces.telegram.chat_checker.interface import ITelegramChatChecker
 from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
 from app.app_layer.interfaces.use_cases.check_telegram_chats.dto import (
@@ -20,10 +18,12 @@ class CheckTelegramChatsUseCase(ICheckTelegramChatsUseCase):
         uow_factory: Callable[[], IUnitOfWork],
         account_repo: IAccountRepository,
         chat_checker: ITelegramChatChecker,
+        account_batch_size: int = 500,
     ) -> None:
         self._uow_factory = uow_factory
         self._account_repo = account_repo
         self._chat_checker = chat_checker
+        self._account_batch_size = account_batch_size
 
     async def execute(
         self,
@@ -33,40 +33,15 @@ class CheckTelegramChatsUseCase(ICheckTelegramChatsUseCase):
         if chat_ids is None:
             chat_ids = await self._load_known_chat_ids()
 
-        unique_chat_ids = _deduplicate(chat_ids)
-        checked: list[TelegramChatCheckResultDTO] = []
-        for chat_id in unique_chat_ids:
-            checked.append(await self._chat_checker.check(chat_id))
-
-        return CheckTelegramChatsUseCaseOutputDTO(
-            checked=checked,
-            total=len(checked),
-            reachable=_count_status(checked, TelegramChatCheckStatusEnum.REACHABLE),
-            not_found=_count_status(checked, TelegramChatCheckStatusEnum.NOT_FOUND),
-            forbidden=_count_status(checked, TelegramChatCheckStatusEnum.FORBIDDEN),
-            failed=_count_status(checked, TelegramChatCheckStatusEnum.FAILED),
-            skipped=len(chat_ids) - len(unique_chat_ids),
+        unique_chat_ids = list(dict.fromkeys(chat_ids))
+        checked = await self._chat_checker.check_many(unique_chat_ids)
+        return CheckTelegramChatsUseCaseOutputDTO.from_results(
+            checked, skipped=len(chat_ids) - len(unique_chat_ids)
         )
 
     async def _load_known_chat_ids(self) -> list[int]:
+        chat_ids: list[int] = []
         async with self._uow_factory():
-            accounts = await self._account_repo.list_all()
-        return [account.chat_id for account in accounts]
-
-
-def _deduplicate(chat_ids: list[int]) -> list[int]:
-    seen: set[int] = set()
-    result: list[int] = []
-    for chat_id in chat_ids:
-        if chat_id in seen:
-            continue
-        seen.add(chat_id)
-        result.append(chat_id)
-    return result
-
-
-def _count_status(
-    results: list[TelegramChatCheckResultDTO],
-    status: TelegramChatCheckStatusEnum,
-) -> int:
-    return sum(1 for result in results if result.status == status)
+            async for accounts in self._account_repo.iter_summaries(self._account_batch_size):
+                chat_ids.extend(account.chat_id for account in accounts)
+        return chat_ids
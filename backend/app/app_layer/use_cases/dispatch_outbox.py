@@ -0,0 +1,107 @@
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from app.app_layer.interfaces.notifications.notifier.dto import (
+    NotifierDeliveryDTO,
+    NotifierDeliveryResultDTO,
+)
+from app.app_layer.interfaces.notifications.notifier.interface import INotifier
+from app.app_layer.interfaces.repos.outbox.dto import OutboxFailureDTO, OutboxMessageDTO
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
+from app.app_layer.interfaces.time.clock.interface import IClock
+from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
+from app.app_layer.interfaces.use_cases.dispatch_outbox.dto import (
+    DispatchOutboxUseCaseInputDTO,
+    DispatchOutboxUseCaseOutputDTO,
+)
+from app.app_layer.interfaces.use_cases.dispatch_outbox.interface import IDispatchOutboxUseCase
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class DispatchOutboxUseCase(IDispatchOutboxUseCase):
+    """Один проход потребителя очереди: захват, отправка, подтверждение.
+
+    Захват и подтверждение — отдельные короткие транзакции, Telegram вызывается
+    между ними без открытой транзакции. Если процесс упадёт после отправки, но до
+    подтверждения, строка вернётся в очередь по истечении аренды
+    (``lease_seconds``): доставка «хотя бы один раз». Неудачи повторяются с
+    экспоненциальной задержкой; после ``max_attempts`` или неповторяемой ошибки
+    сообщение уходит в dead letter.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUnitOfWork],
+        outbox_repo: IOutboxRepository,
+        notifier: INotifier,
+        clock: IClock,
+        lease_seconds: int = 120,
+        max_attempts: int = 5,
+        retry_base_seconds: int = 10,
+        retry_max_seconds: int = 900,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._outbox_repo = outbox_repo
+        self._notifier = notifier
+        self._clock = clock
+        self._lease = timedelta(seconds=lease_seconds)
+        self._max_attempts = max_attempts
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+
+    async def execute(
+        self,
+        input_dto: DispatchOutboxUseCaseInputDTO,
+    ) -> DispatchOutboxUseCaseOutputDTO:
+        now = self._clock.now()
+        async with self._uow_factory():
+            claimed = await self._outbox_repo.claim(
+                now=now,
+                limit=input_dto.limit,
+                locked_until=now + self._lease,
+            )
+        if not claimed:
+            return DispatchOutboxUseCaseOutputDTO()
+
+        results = await self._notifier.send_many(
+            [NotifierDeliveryDTO(chat_id=item.chat_id, message=item.message) for item in claimed]
+        )
+
+        finished_at = self._clock.now()
+        sent_ids: list[int] = []
+        failures: list[OutboxFailureDTO] = []
+        for item, result in zip(claimed, results, strict=True):
+            if result.delivered:
+                sent_ids.append(item.id)
+            else:
+                failures.append(self._failure(item, result, finished_at))
+        async with self._uow_factory():
+            await self._outbox_repo.mark_sent(sent_ids, finished_at)
+            await self._outbox_repo.mark_failed(failures)
+
+        dead = sum(1 for failure in failures if failure.retry_at is None)
+        if dead:
+            logger.warning("Outbox messages dead-lettered: %s", dead)
+        return DispatchOutboxUseCaseOutputDTO(
+            claimed=len(claimed),
+            sent=len(sent_ids),
+            retried=len(failures) - dead,
+            dead=dead,
+        )
+
+    def _failure(
+        self,
+        item: OutboxMessageDTO,
+        result: NotifierDeliveryResultDTO,
+        now: datetime,
+    ) -> OutboxFailureDTO:
+        error = result.error or "unknown error"
+        if not result.retryable or item.attempts >= self._max_attempts:
+            return OutboxFailureDTO(id=item.id, error=error)
+        delay = min(
+            self._retry_base_seconds * 2 ** (item.attempts - 1),
+            self._retry_max_seconds,
+        )
+        return OutboxFailureDTO(id=item.id, error=error, retry_at=now + timedelta(seconds=delay))
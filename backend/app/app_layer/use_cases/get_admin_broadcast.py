@@ -0,0 +1,29 @@
+from collections.abc import Callable
+
+from app.app_layer.interfaces.repos.broadcast.interface import IBroadcastRepository
+from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
+from app.app_layer.interfaces.use_cases.get_admin_broadcast.dto import (
+    GetAdminBroadcastUseCaseInputDTO,
+    GetAdminBroadcastUseCaseOutputDTO,
+)
+from app.app_layer.interfaces.use_cases.get_admin_broadcast.interface import (
+    IGetAdminBroadcastUseCase,
+)
+
+
+class GetAdminBroadcastUseCase(IGetAdminBroadcastUseCase):
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUnitOfWork],
+        broadcast_repo: IBroadcastRepository,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._broadcast_repo = broadcast_repo
+
+    async def execute(
+        self,
+        input_dto: GetAdminBroadcastUseCaseInputDTO,
+    ) -> GetAdminBroadcastUseCaseOutputDTO:
+        async with self._uow_factory():
+            progress = await self._broadcast_repo.get_progress(input_dto.broadcast_id)
+        return GetAdminBroadcastUseCaseOutputDTO(progress=progress)
@@ -62,7 +62,7 @@ class GetScheduleForDateUseCase(IGetScheduleForDateUseCase):
         ).week_number
         lessons = self._daily_schedule_service.filter_for_date(
             DailyScheduleServiceInputDTO(
-                lessons=cache.lessons,
+                index=cache.lesson_index,
                 target_date=target_date,
                 week_number=week_number,
                 subgroup=profile.subgroup,
@@ -0,0 +1,23 @@
+from app.app_layer.interfaces.cache.telegram_chats_check.interface import (
+    ITelegramChatsCheckJobStore,
+)
+from app.app_layer.interfaces.use_cases.get_telegram_chats_check.dto import (
+    GetTelegramChatsCheckUseCaseInputDTO,
+    GetTelegramChatsCheckUseCaseOutputDTO,
+)
+from app.app_layer.interfaces.use_cases.get_telegram_chats_check.interface import (
+    IGetTelegramChatsCheckUseCase,
+)
+
+
+class GetTelegramChatsCheckUseCase(IGetTelegramChatsCheckUseCase):
+    def __init__(self, job_store: ITelegramChatsCheckJobStore) -> None:
+        self._job_store = job_store
+
+    async def execute(
+        self,
+        input_dto: GetTelegramChatsCheckUseCaseInputDTO,
+    ) -> GetTelegramChatsCheckUseCaseOutputDTO:
+        return GetTelegramChatsCheckUseCaseOutputDTO(
+            job=await self._job_store.get(input_dto.job_id)
+        )
@@ -83,7 +83,7 @@ class GetUpcomingLessonUseCase(IGetUpcomingLessonUseCase):
         ).week_number
         return self._upcoming_lesson_service.find_next(
             UpcomingLessonServiceInputDTO(
-                lessons=cache.lessons,
+                index=cache.lesson_index,
                 now_local=when,
                 week_number=week_number,
                 subgroup=profile.subgroup,
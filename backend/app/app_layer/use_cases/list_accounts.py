@@ -3,6 +3,7 @@ from collections.abc import Callable
 from app.app_layer.interfaces.repos.account.interface import IAccountRepository
 from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
 from app.app_layer.interfaces.use_cases.list_accounts.dto import (
+    ListAccountsUseCaseInputDTO,
     ListAccountsUseCaseOutputDTO,
 )
 from app.app_layer.interfaces.use_cases.list_accounts.interface import IListAccountsUseCase
@@ -17,7 +18,15 @@ class ListAccountsUseCase(IListAccountsUseCase):
         self._uow_factory = uow_factory
         self._account_repo = account_repo
 
-    async def execute(self) -> ListAccountsUseCaseOutputDTO:
+    async def execute(self, input_dto: ListAccountsUseCaseInputDTO) -> ListAccountsUseCaseOutputDTO:
+        # Берём на одну запись больше: так видно, есть ли следующая страница.
         async with self._uow_factory():
-            accounts = await self._account_repo.list_all()
-        return ListAccountsUseCaseOutputDTO(accounts=accounts)
+            accounts = await self._account_repo.list_summaries_page(
+                input_dto.cursor, input_dto.limit + 1
+            )
+        has_more = len(accounts) > input_dto.limit
+        accounts = accounts[: input_dto.limit]
+        return ListAccountsUseCaseOutputDTO(
+            accounts=accounts,
+            next_cursor=accounts[-1].account_id if has_more else None,
+        )
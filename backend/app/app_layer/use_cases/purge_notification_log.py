@@ -0,0 +1,67 @@
+from collections.abc import Callable
+from datetime import timedelta
+
+from app.app_layer.interfaces.repos.notification_log.interface import (
+    INotificationLogRepository,
+)
+from app.app_layer.interfaces.time.clock.interface import IClock
+from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
+from app.app_layer.interfaces.use_cases.purge_notification_log.dto import (
+    PurgeNotificationLogUseCaseInputDTO,
+    PurgeNotificationLogUseCaseOutputDTO,
+)
+from app.app_layer.interfaces.use_cases.purge_notification_log.interface import (
+    IPurgeNotificationLogUseCase,
+)
+
+
+class PurgeNotificationLogUseCase(IPurgeNotificationLogUseCase):
+    """Обслуживание журнала отправок: партиции вперёд и очистка старых записей.
+
+    Каждый шаг очистки — своя короткая транзакция: пакетное удаление (SQLite) не
+    держит блокировку на весь объём, пока воркер пишет новые отметки.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUnitOfWork],
+        notification_log_repo: INotificationLogRepository,
+        clock: IClock,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._notification_log_repo = notification_log_repo
+        self._clock = clock
+
+    async def execute(
+        self,
+        input_dto: PurgeNotificationLogUseCaseInputDTO,
+    ) -> PurgeNotificationLogUseCaseOutputDTO:
+        today = self._clock.now().date()
+        cutoff = today - timedelta(days=input_dto.retention_days)
+
+        async with self._uow_factory():
+            created = await self._notification_log_repo.ensure_partitions(
+                # Даты занятий локальные и могут отличаться от даты часов на сутки.
+                since=today - timedelta(days=1),
+                until=today + timedelta(days=input_dto.partitions_ahead_days),
+            )
+
+        dropped = 0
+        deleted = 0
+        while True:
+            async with self._uow_factory():
+                step = await self._notification_log_repo.purge_before(
+                    cutoff,
+                    input_dto.batch_size,
+                )
+            dropped += step.dropped_partitions
+            deleted += step.deleted_rows
+            if step.done:
+                break
+
+        return PurgeNotificationLogUseCaseOutputDTO(
+            cutoff=cutoff,
+            created_partitions=created,
+            dropped_partitions=dropped,
+            deleted_rows=deleted,
+        )
@@ -0,0 +1,52 @@
+from collections.abc import Callable
+from datetime import timedelta
+
+from app.app_layer.interfaces.repos.broadcast.interface import IBroadcastRepository
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
+from app.app_layer.interfaces.time.clock.interface import IClock
+from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
+from app.app_layer.interfaces.use_cases.purge_outbox.dto import (
+    PurgeOutboxUseCaseInputDTO,
+    PurgeOutboxUseCaseOutputDTO,
+)
+from app.app_layer.interfaces.use_cases.purge_outbox.interface import IPurgeOutboxUseCase
+
+
+class PurgeOutboxUseCase(IPurgeOutboxUseCase):
+    """Удаляет из outbox давно доставленные и мёртвые сообщения.
+
+    Удаление идёт пачками, каждая — в своей короткой транзакции, чтобы не мешать
+    потребителям, которые в это время захватывают и подтверждают сообщения.
+    Перед удалением завершённым рассылкам записываются итоговые счётчики.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUnitOfWork],
+        outbox_repo: IOutboxRepository,
+        broadcast_repo: IBroadcastRepository,
+        clock: IClock,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._outbox_repo = outbox_repo
+        self._broadcast_repo = broadcast_repo
+        self._clock = clock
+
+    async def execute(
+        self,
+        input_dto: PurgeOutboxUseCaseInputDTO,
+    ) -> PurgeOutboxUseCaseOutputDTO:
+        cutoff = self._clock.now() - timedelta(days=input_dto.retention_days)
+        async with self._uow_factory():
+            await self._broadcast_repo.finalize_finished()
+        deleted = 0
+        while True:
+            async with self._uow_factory():
+                step = await self._outbox_repo.purge_finished_before(
+                    cutoff,
+                    input_dto.batch_size,
+                )
+            deleted += step
+            if step < input_dto.batch_size:
+                break
+        return PurgeOutboxUseCaseOutputDTO(cutoff=cutoff, deleted_rows=deleted)
@@ -35,14 +35,15 @@ class RegisterUserUseCase(IRegisterUserUseCase):
             if existing is not None:
                 if existing.telegram.display_name == input_dto.display_name:
                     return RegisterUserUseCaseOutputDTO(account=existing)
-                await self._account_repo.update_telegram_identity(
+                telegram = await self._account_repo.update_telegram_identity(
                     TelegramIdentityUpdateDTO(
                         id=existing.telegram.id,
                         display_name=input_dto.display_name,
                     )
                 )
+                # Остальная часть view не менялась — повторное чтение не нужно.
                 return RegisterUserUseCaseOutputDTO(
-                    account=await _require_view(self._account_repo, input_dto.chat_id)
+                    account=existing.model_copy(update={"telegram": telegram})
                 )
 
             account = await self._account_repo.create_account()
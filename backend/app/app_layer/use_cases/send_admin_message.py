@@ -1,3 +1,4 @@
+from app.app_layer.interfaces.notifications.notifier.dto import NotifierDeliveryDTO
 from app.app_layer.interfaces.notifications.notifier.interface import INotifier
 from app.app_layer.interfaces.use_cases.send_admin_message.dto import (
     SendAdminMessageUseCaseInputDTO,
@@ -21,13 +22,20 @@ class SendAdminMessageUseCase(ISendAdminMessageUseCase):
         input_dto: SendAdminMessageUseCaseInputDTO,
     ) -> SendAdminMessageUseCaseOutputDTO:
         message = PlainMessage(text=input_dto.text)
+        results = await self._notifier.send_many(
+            [
+                NotifierDeliveryDTO(chat_id=chat_id, message=message)
+                for chat_id in input_dto.chat_ids
+            ]
+        )
         sent: list[int] = []
         failed: list[int] = []
-        for chat_id in input_dto.chat_ids:
-            try:
-                await self._notifier.send(chat_id, message)
-                sent.append(chat_id)
-            except Exception:
-                logger.exception("Admin message delivery failed for chat %s.", chat_id)
-                failed.append(chat_id)
+        for result in results:
+            if result.delivered:
+                sent.append(result.chat_id)
+            else:
+                logger.error(
+                    "Admin message delivery failed for chat %s: %s", result.chat_id, result.error
+                )
+                failed.append(result.chat_id)
         return SendAdminMessageUseCaseOutputDTO(sent=sent, failed=failed)
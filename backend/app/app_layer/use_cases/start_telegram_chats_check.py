@@ -0,0 +1,126 @@
+import asyncio
+import uuid
+from collections.abc import Callable
+
+from app.app_layer.interfaces.cache.telegram_chats_check.dto import TelegramChatsCheckJobDTO
+from app.app_layer.interfaces.cache.telegram_chats_check.enums import (
+    TelegramChatsCheckJobStatusEnum,
+)
+from app.app_layer.interfaces.cache.telegram_chats_check.interface import (
+    ITelegramChatsCheckJobStore,
+)
+from app.app_layer.interfaces.repos.account.interface import IAccountRepository
+from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheckResultDTO
+from app.app_layer.interfaces.telegram.chat_checker.interface import ITelegramChatChecker
+from app.app_layer.interfaces.time.clock.interface import IClock
+from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
+from app.app_layer.interfaces.use_cases.check_telegram_chats.dto import (
+    CheckTelegramChatsUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.start_telegram_chats_check.dto import (
+    StartTelegramChatsCheckUseCaseOutputDTO,
+)
+from app.app_layer.interfaces.use_cases.start_telegram_chats_check.interface import (
+    IStartTelegramChatsCheckUseCase,
+)
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class StartTelegramChatsCheckUseCase(IStartTelegramChatsCheckUseCase):
+    """Запускает проверку чатов в фоне и сразу возвращает ``job_id``.
+
+    Прогресс пишется в хранилище задач после каждой пачки из ``progress_batch_size``
+    чатов, поэтому опрашивать его можно из любого процесса API. Сама проверка
+    выполняется в процессе, который её запустил; при его остановке задача остаётся
+    в статусе ``running`` до истечения TTL записи.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUnitOfWork],
+        account_repo: IAccountRepository,
+        chat_checker: ITelegramChatChecker,
+        job_store: ITelegramChatsCheckJobStore,
+        clock: IClock,
+        account_batch_size: int = 500,
+        progress_batch_size: int = 200,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._account_repo = account_repo
+        self._chat_checker = chat_checker
+        self._job_store = job_store
+        self._clock = clock
+        self._account_batch_size = account_batch_size
+        self._progress_batch_size = max(progress_batch_size, 1)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def execute(
+        self,
+        input_dto: CheckTelegramChatsUseCaseInputDTO,
+    ) -> StartTelegramChatsCheckUseCaseOutputDTO:
+        chat_ids = input_dto.chat_ids
+        if chat_ids is None:
+            chat_ids = await self._load_known_chat_ids()
+        unique_chat_ids = list(dict.fromkeys(chat_ids))
+
+        job = TelegramChatsCheckJobDTO(
+            job_id=uuid.uuid4().hex,
+            status=TelegramChatsCheckJobStatusEnum.RUNNING,
+            total=len(unique_chat_ids),
+            skipped=len(chat_ids) - len(unique_chat_ids),
+            checked=[],
+            started_at=self._clock.now(),
+        )
+        await self._job_store.save(job)
+        task = asyncio.create_task(self._run(job, unique_chat_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info("Telegram chats check %s started: total=%s", job.job_id, job.total)
+        return StartTelegramChatsCheckUseCaseOutputDTO(
+            job_id=job.job_id, total=job.total, skipped=job.skipped
+        )
+
+    async def _run(self, job: TelegramChatsCheckJobDTO, chat_ids: list[int]) -> None:
+        checked: list[TelegramChatCheckResultDTO] = []
+        try:
+            for start in range(0, len(chat_ids), self._progress_batch_size):
+                batch = chat_ids[start : start + self._progress_batch_size]
+                checked.extend(await self._chat_checker.check_many(batch))
+                if len(checked) < len(chat_ids):
+                    await self._job_store.save(job.model_copy(update={"checked": list(checked)}))
+            final = job.model_copy(
+                update={
+                    "status": TelegramChatsCheckJobStatusEnum.DONE,
+                    "checked": checked,
+                    "finished_at": self._clock.now(),
+                }
+            )
+        except Exception as exc:
+            logger.exception("Telegram chats check %s failed.", job.job_id)
+            final = job.model_copy(
+                update={
+                    "status": TelegramChatsCheckJobStatusEnum.FAILED,
+                    "checked": checked,
+                    "finished_at": self._clock.now(),
+                    "error": str(exc),
+                }
+            )
+        try:
+            await self._job_store.save(final)
+        except Exception:
+            logger.exception("Failed to store result of telegram chats check %s.", job.job_id)
+        logger.info(
+            "Telegram chats check %s finished: status=%s checked=%s",
+            job.job_id,
+            final.status,
+            len(checked),
+        )
+
+    async def _load_known_chat_ids(self) -> list[int]:
+        chat_ids: list[int] = []
+        async with self._uow_factory():
+            async for accounts in self._account_repo.iter_summaries(self._account_batch_size):
+                chat_ids.extend(account.chat_id for account in accounts)
+        return chat_ids
@@ -0,0 +1,84 @@
+from collections.abc import Callable
+
+from app.app_layer.interfaces.repos.account.interface import IAccountRepository
+from app.app_layer.interfaces.repos.broadcast.interface import IBroadcastRepository
+from app.app_layer.interfaces.repos.outbox.dto import OutboxEnqueueDTO
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
+from app.app_layer.interfaces.time.clock.interface import IClock
+from app.app_layer.interfaces.uow.unit_of_work.interface import IUnitOfWork
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.dto import (
+    SubmitAdminBroadcastUseCaseInputDTO,
+    SubmitAdminBroadcastUseCaseOutputDTO,
+)
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.interface import (
+    ISubmitAdminBroadcastUseCase,
+)
+from app.domain.messages.plain import PlainMessage
+from app.domain.value_objects.outbox_priority import OutboxPriorityEnum
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SubmitAdminBroadcastUseCase(ISubmitAdminBroadcastUseCase):
+    """Ставит рассылку в outbox и сразу возвращает её ``id``.
+
+    Рассылка и все её сообщения пишутся одной транзакцией; доставляет их пул
+    потребителей outbox воркера с приоритетом ниже уведомлений о парах. Состояние
+    живёт в БД, поэтому рестарт воркера рассылку не теряет: незахваченные и
+    брошенные по аренде сообщения дойдут после подъёма.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], IUnitOfWork],
+        account_repo: IAccountRepository,
+        broadcast_repo: IBroadcastRepository,
+        outbox_repo: IOutboxRepository,
+        clock: IClock,
+        account_batch_size: int = 500,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._account_repo = account_repo
+        self._broadcast_repo = broadcast_repo
+        self._outbox_repo = outbox_repo
+        self._clock = clock
+        self._batch_size = max(account_batch_size, 1)
+
+    async def execute(
+        self,
+        input_dto: SubmitAdminBroadcastUseCaseInputDTO,
+    ) -> SubmitAdminBroadcastUseCaseOutputDTO:
+        message = PlainMessage(text=input_dto.text)
+        now = self._clock.now()
+        async with self._uow_factory():
+            chat_ids = input_dto.chat_ids
+            if chat_ids is None:
+                chat_ids = await self._load_known_chat_ids()
+            unique_chat_ids = list(dict.fromkeys(chat_ids))
+            broadcast = await self._broadcast_repo.create(
+                text=input_dto.text, total=len(unique_chat_ids)
+            )
+            for start in range(0, len(unique_chat_ids), self._batch_size):
+                await self._outbox_repo.enqueue(
+                    [
+                        OutboxEnqueueDTO(
+                            chat_id=chat_id,
+                            message=message,
+                            priority=OutboxPriorityEnum.BROADCAST,
+                            broadcast_id=broadcast.id,
+                        )
+                        for chat_id in unique_chat_ids[start : start + self._batch_size]
+                    ],
+                    available_at=now,
+                )
+        logger.info("Admin broadcast %s queued: total=%s", broadcast.id, broadcast.total)
+        return SubmitAdminBroadcastUseCaseOutputDTO(
+            broadcast_id=broadcast.id, total=broadcast.total
+        )
+
+    async def _load_known_chat_ids(self) -> list[int]:
+        chat_ids: list[int] = []
+        async for accounts in self._account_repo.iter_summaries(self._batch_size):
+            chat_ids.extend(account.chat_id for account in accounts)
+        return chat_ids
@@ -42,7 +42,7 @@ class SyncUserProfileUseCase(ISyncUserProfileUseCase):
 
         fetched = await self._profile_provider.fetch_profile(
             account.ssau_identity.login,
-            account.ssau_identity.password,
+            account.ssau_identity.password.get_secret_value(),
         )
         logger.info(
             "SSAU profile fetched: group=%s year=%s",
@@ -1,10 +1,28 @@
 from dependency_injector import containers, providers
 
 from app.app_layer.interfaces.cache.interface import ICacheClient
-from app.app_layer.interfaces.cache.schedule.interface import IScheduleCacheStore
+from app.app_layer.interfaces.cache.lock.interface import IDistributedLock
+from app.app_layer.interfaces.cache.schedule.interface import (
+    IScheduleCacheStore,
+    IScheduleChangeStore,
+    IScheduleSemesterStore,
+)
+from app.app_layer.interfaces.cache.telegram_chats_check.interface import (
+    ITelegramChatsCheckJobStore,
+)
+from app.app_layer.interfaces.security.password_cipher.interface import IPasswordCipher
+from app.infra.cache.local.account_view_cache import TieredAccountViewCache
+from app.infra.cache.local.lru import LruTtlCache
+from app.infra.cache.local.schedule_cache import TieredScheduleCacheStore
+from app.infra.cache.valkey.account_view_cache import ValkeyAccountViewCache
 from app.infra.cache.valkey.client import ValkeyClient, build_valkey_client
+from app.infra.cache.valkey.invalidation import run_cache_invalidation
+from app.infra.cache.valkey.lock import ValkeyDistributedLock
 from app.infra.cache.valkey.schedule_cache import ValkeyScheduleCacheStore
+from app.infra.cache.valkey.schedule_change_store import ValkeyScheduleChangeStore
+from app.infra.cache.valkey.schedule_semester_cache import ValkeyScheduleSemesterStore
 from app.infra.cache.valkey.settings import ValkeyClientSettings
+from app.infra.cache.valkey.telegram_chats_check_store import ValkeyTelegramChatsCheckJobStore
 from app.settings.config import settings
 
 
@@ -14,6 +32,8 @@ def _valkey_password() -> str | None:
 
 
 class CacheContainer(containers.DeclarativeContainer):
+    password_cipher: providers.Dependency[IPasswordCipher] = providers.Dependency()
+
     valkey_engine = providers.Resource(
         build_valkey_client,
         settings=providers.Singleton(
@@ -33,8 +53,74 @@ class CacheContainer(containers.DeclarativeContainer):
         ValkeyClient,
         client=valkey_engine,
     )
-    schedule_cache_store: providers.Provider[IScheduleCacheStore] = providers.Singleton(
+    valkey_schedule_cache_store: providers.Provider[IScheduleCacheStore] = providers.Singleton(
         ValkeyScheduleCacheStore,
         client=cache_client,
-        ttl_seconds=settings.workers.schedule_fetch_interval_hours * 3600,
+        ttl_seconds=max(
+            settings.valkey.schedule_hard_ttl_seconds,
+            settings.workers.schedule_fetch_interval_hours * 3600,
+        ),
+    )
+    # Порт кэша расписания для сервисов: локальный уровень поверх Valkey.
+    schedule_cache_store: providers.Provider[TieredScheduleCacheStore] = providers.Singleton(
+        TieredScheduleCacheStore,
+        inner=valkey_schedule_cache_store,
+        local=providers.Singleton(
+            LruTtlCache,
+            max_entries=settings.valkey.local_cache_max_entries,
+            ttl_seconds=settings.valkey.local_cache_ttl_seconds,
+        ),
+        client=cache_client,
+        channel="schedule:invalidate",
+    )
+    schedule_cache_invalidation = providers.Resource(
+        run_cache_invalidation,
+        client=valkey_engine,
+        store=schedule_cache_store,
+    )
+    schedule_semester_store: providers.Provider[IScheduleSemesterStore] = providers.Singleton(
+        ValkeyScheduleSemesterStore,
+        client=cache_client,
+        ttl_seconds=settings.valkey.schedule_semester_ttl_seconds,
+    )
+    # База изменений живёт, пока жива сама неделя в кэше: сравнивать позже не с чем.
+    schedule_change_store: providers.Provider[IScheduleChangeStore] = providers.Singleton(
+        ValkeyScheduleChangeStore,
+        client=cache_client,
+        ttl_seconds=max(
+            settings.valkey.schedule_hard_ttl_seconds,
+            settings.workers.schedule_fetch_interval_hours * 3600,
+        ),
+    )
+    distributed_lock: providers.Provider[IDistributedLock] = providers.Singleton(
+        ValkeyDistributedLock,
+        client=cache_client,
+    )
+    account_view_cache: providers.Provider[TieredAccountViewCache] = providers.Singleton(
+        TieredAccountViewCache,
+        inner=providers.Singleton(
+            ValkeyAccountViewCache,
+            client=cache_client,
+            cipher=password_cipher,
+            ttl_seconds=settings.valkey.account_view_ttl_seconds,
+        ),
+        local=providers.Singleton(
+            LruTtlCache,
+            max_entries=settings.valkey.account_view_local_max_entries,
+            ttl_seconds=settings.valkey.account_view_local_ttl_seconds,
+        ),
+        client=cache_client,
+        channel="account:invalidate",
+    )
+    account_view_cache_invalidation = providers.Resource(
+        run_cache_invalidation,
+        client=valkey_engine,
+        store=account_view_cache,
+    )
+    telegram_chats_check_store: providers.Provider[ITelegramChatsCheckJobStore] = (
+        providers.Singleton(
+            ValkeyTelegramChatsCheckJobStore,
+            client=cache_client,
+            ttl_seconds=settings.valkey.telegram_chats_check_ttl_seconds,
+        )
     )
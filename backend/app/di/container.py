@@ -19,13 +19,14 @@ from app.di.usecases_container import UseCasesContainer
 class Container(containers.DeclarativeContainer):
     core = providers.Container(CoreContainer)
     db = providers.Container(DbContainer)
-    cache = providers.Container(CacheContainer)
+    cache = providers.Container(CacheContainer, password_cipher=core.password_cipher)
     metrics = providers.Container(MetricsContainer)
     telegram = providers.Container(TelegramContainer, metrics=metrics)
     ssau = providers.Container(SsauContainer, clock=core.clock, metrics=metrics)
     repositories = providers.Container(
         RepositoriesContainer,
         password_cipher=core.password_cipher,
+        account_view_cache=cache.account_view_cache,
     )
     services = providers.Container(
         ServicesContainer,
@@ -33,10 +34,11 @@ class Container(containers.DeclarativeContainer):
         cache=cache,
         ssau=ssau,
         repositories=repositories,
-        telegram=telegram,
     )
     usecases = providers.Container(
         UseCasesContainer,
+        core=core,
+        cache=cache,
         db=db,
         repositories=repositories,
         ssau=ssau,
@@ -1,21 +1,40 @@
 from dependency_injector import containers, providers
 
+from app.app_layer.interfaces.cache.account.interface import IAccountViewCache
 from app.app_layer.interfaces.repos.account.interface import IAccountRepository
+from app.app_layer.interfaces.repos.broadcast.interface import IBroadcastRepository
 from app.app_layer.interfaces.repos.notification_log.interface import (
     INotificationLogRepository,
 )
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
 from app.app_layer.interfaces.security.password_cipher.interface import IPasswordCipher
 from app.infra.repos.account.repo import SqlAlchemyAccountRepository
+from app.infra.repos.broadcast_repository import SqlAlchemyBroadcastRepository
+from app.infra.repos.cached_notification_log_repository import (
+    CachedNotificationLogRepository,
+)
 from app.infra.repos.notification_log_repository import SqlAlchemyNotificationLogRepository
+from app.infra.repos.outbox_repository import SqlAlchemyOutboxRepository
+from app.settings.config import settings
 
 
 class RepositoriesContainer(containers.DeclarativeContainer):
     password_cipher: providers.Dependency[IPasswordCipher] = providers.Dependency()
+    account_view_cache: providers.Dependency[IAccountViewCache] = providers.Dependency()
 
     account_repo: providers.Provider[IAccountRepository] = providers.Singleton(
         SqlAlchemyAccountRepository,
         password_cipher=password_cipher,
+        view_cache=account_view_cache if settings.valkey.account_view_cache_enabled else None,
     )
+    # Singleton: множество отправленных по датам живёт весь процесс.
     notification_log_repo: providers.Provider[INotificationLogRepository] = providers.Singleton(
-        SqlAlchemyNotificationLogRepository,
+        CachedNotificationLogRepository,
+        inner=providers.Singleton(SqlAlchemyNotificationLogRepository),
+    )
+    outbox_repo: providers.Provider[IOutboxRepository] = providers.Singleton(
+        SqlAlchemyOutboxRepository,
+    )
+    broadcast_repo: providers.Provider[IBroadcastRepository] = providers.Singleton(
+        SqlAlchemyBroadcastRepository,
     )
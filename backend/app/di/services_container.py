@@ -6,6 +6,9 @@ from app.app_layer.interfaces.services.notifications.notification_planner.interf
 from app.app_layer.interfaces.services.notifications.notification_service.interface import (
     INotificationService,
 )
+from app.app_layer.interfaces.services.notifications.schedule_change.interface import (
+    IScheduleChangeNotificationService,
+)
 from app.app_layer.interfaces.services.schedule.daily_schedule.interface import (
     IDailyScheduleService,
 )
@@ -15,6 +18,9 @@ from app.app_layer.interfaces.services.schedule.lesson_date_resolver.interface i
 from app.app_layer.interfaces.services.schedule.schedule_sync.interface import (
     IScheduleSyncService,
 )
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.interface import (
+    IScheduleSyncPlannerService,
+)
 from app.app_layer.interfaces.services.schedule.upcoming_lesson.interface import (
     IUpcomingLessonService,
 )
@@ -23,9 +29,14 @@ from app.app_layer.interfaces.services.schedule.week_calculator.interface import
 )
 from app.app_layer.services.notifications.notification_planner import NotificationPlanner
 from app.app_layer.services.notifications.notification_service import NotificationService
+from app.app_layer.services.notifications.notification_timer import NotificationTimer
+from app.app_layer.services.notifications.schedule_change_notification import (
+    ScheduleChangeNotificationService,
+)
 from app.app_layer.services.schedule.daily_schedule import DailyScheduleService
 from app.app_layer.services.schedule.lesson_date_resolver import LessonDateResolver
 from app.app_layer.services.schedule.schedule_sync import ScheduleSyncService
+from app.app_layer.services.schedule.schedule_sync_planner import ScheduleSyncPlanner
 from app.app_layer.services.schedule.upcoming_lesson import UpcomingLessonService
 from app.app_layer.services.schedule.week_calculator import AcademicWeekCalculator
 from app.settings.config import settings
@@ -36,7 +47,6 @@ class ServicesContainer(containers.DeclarativeContainer):
     cache = providers.DependenciesContainer()
     ssau = providers.DependenciesContainer()
     repositories = providers.DependenciesContainer()
-    telegram = providers.DependenciesContainer()
 
     week_calculator_service: providers.Provider[IWeekCalculatorService] = providers.Singleton(
         AcademicWeekCalculator
@@ -51,12 +61,24 @@ class ServicesContainer(containers.DeclarativeContainer):
         providers.Singleton(LessonDateResolver)
     )
 
-    schedule_sync_service: providers.Provider[IScheduleSyncService] = providers.Factory(
+    # Singleton: карта in-flight запросов (singleflight) должна быть общей на процесс.
+    schedule_sync_service: providers.Provider[IScheduleSyncService] = providers.Singleton(
         ScheduleSyncService,
         provider=ssau.api_client,
         clock=core.clock,
         week_calculator=week_calculator_service,
         cache_store=cache.schedule_cache_store,
+        soft_ttl_seconds=settings.workers.schedule_fetch_interval_hours * 3600,
+        semester_store=cache.schedule_semester_store,
+        change_store=cache.schedule_change_store,
+        lock=cache.distributed_lock if settings.valkey.schedule_lock_enabled else None,
+        lock_ttl_seconds=settings.valkey.schedule_lock_ttl_seconds,
+        lock_poll_interval_seconds=settings.valkey.schedule_lock_poll_interval_seconds,
+    )
+    schedule_sync_planner: providers.Provider[IScheduleSyncPlannerService] = providers.Singleton(
+        ScheduleSyncPlanner,
+        week_calculator=week_calculator_service,
+        prefetch_weeks=settings.workers.schedule_prefetch_weeks,
     )
     notification_planner: providers.Provider[INotificationPlannerService] = providers.Singleton(
         NotificationPlanner,
@@ -66,9 +88,20 @@ class ServicesContainer(containers.DeclarativeContainer):
         cache_store=cache.schedule_cache_store,
         notification_log_repo=repositories.notification_log_repo,
     )
+    # Singleton: куча моментов отправки живёт весь процесс воркера.
+    notification_timer: providers.Provider[NotificationTimer] = providers.Singleton(
+        NotificationTimer
+    )
     notification_service: providers.Provider[INotificationService] = providers.Factory(
         NotificationService,
         planner=notification_planner,
-        notifier=telegram.notifier,
+        outbox_repo=repositories.outbox_repo,
         clock=core.clock,
     )
+    schedule_change_notification_service: providers.Provider[IScheduleChangeNotificationService] = (
+        providers.Factory(
+            ScheduleChangeNotificationService,
+            outbox_repo=repositories.outbox_repo,
+            clock=core.clock,
+        )
+    )
@@ -3,8 +3,12 @@ from dependency_injector import containers, providers
 from app.app_layer.interfaces.http.ssau.api.interface import ISsauApiClient
 from app.app_layer.interfaces.http.ssau.auth.interface import ISsauAuthClient
 from app.app_layer.interfaces.time.clock.interface import IClock
+from app.infra.clients.http.rate_limit import RateLimiter
 from app.infra.clients.ssau.api.client import SsauApiClient
-from app.infra.clients.ssau.api.session_cache import AuthSessionCache
+from app.infra.clients.ssau.api.session_cache import (
+    AuthSessionCache,
+    run_auth_session_refresher,
+)
 from app.infra.clients.ssau.auth.client import SsauAuthClient
 from app.infra.clients.ssau.settings import AuthCacheSettings, SSAUClientSettings
 from app.infra.retry import RetryPolicy
@@ -27,20 +31,38 @@ class SsauContainer(containers.DeclarativeContainer):
         base_url=settings.ssau.base_url,
         timeout_seconds=settings.ssau.retry.timeout_seconds,
     )
+    # Один лимитер на процесс: auth- и data-клиент делят общий бюджет запросов к СНИУ.
+    rate_limiter: providers.Provider[RateLimiter] = providers.Singleton(
+        RateLimiter,
+        requests_per_second=settings.ssau.rate_limit.requests_per_second,
+        burst=settings.ssau.rate_limit.burst,
+        max_concurrency_per_host=settings.ssau.rate_limit.max_concurrency_per_host,
+    )
     auth_cache: providers.Provider[AuthSessionCache] = providers.Singleton(
         AuthSessionCache,
         settings=providers.Singleton(
             AuthCacheSettings,
             ttl_seconds=settings.ssau.auth.cookie_ttl_seconds,
             min_login_interval_seconds=settings.ssau.auth.min_login_interval_seconds,
+            refresh_ahead_seconds=settings.ssau.auth.refresh_ahead_seconds,
+            refresh_active_seconds=settings.ssau.auth.refresh_active_seconds,
+            refresh_spacing_seconds=settings.ssau.auth.refresh_spacing_seconds,
         ),
         clock=clock,
     )
+    # Кэш кук свой у каждого процесса, поэтому и продление идёт в каждом процессе.
+    auth_refresher = providers.Resource(
+        run_auth_session_refresher,
+        cache=auth_cache,
+        interval_seconds=settings.ssau.auth.refresh_interval_seconds,
+        enabled=settings.ssau.auth.refresh_enabled,
+    )
     auth_client: providers.Provider[ISsauAuthClient] = providers.Resource(
         SsauAuthClient,
         settings=client_settings,
         retry_policy=retry_policy,
         metrics_service=metrics.metrics_service,
+        rate_limiter=rate_limiter,
     )
     # Один авторизованный data-клиент закрывает оба порта (schedule + profile).
     # SsauApiClient — async context manager, lifecycle ведёт сам providers.Resource.
@@ -51,4 +73,5 @@ class SsauContainer(containers.DeclarativeContainer):
         auth_cache=auth_cache,
         retry_policy=retry_policy,
         metrics_service=metrics.metrics_service,
+        rate_limiter=rate_limiter,
     )
@@ -5,12 +5,15 @@ from app.app_layer.interfaces.notifications.notifier.interface import INotifier
 from app.app_layer.interfaces.telegram.chat_checker.interface import ITelegramChatChecker
 from app.app_layer.interfaces.telegram.renderer.interface import ITelegramMessageRenderer
 from app.app_layer.interfaces.telegram.sender.interface import ITelegramMessageSender
+from app.infra.cache.local.lru import LruTtlCache
 from app.infra.clients.telegram.bot import AiogramTelegramBot, create_bot
 from app.infra.clients.telegram.chat_checker import TelegramChatChecker
 from app.infra.clients.telegram.interface import ITelegramBot
 from app.infra.clients.telegram.message_renderer import AiogramTelegramMessageRenderer
 from app.infra.clients.telegram.message_sender import TelegramMessageSender
 from app.infra.clients.telegram.notifier import TelegramNotifier
+from app.infra.clients.telegram.rate_limit import TelegramRateLimiter
+from app.infra.clients.telegram.render_cache import CachingTelegramMessageRenderer
 from app.infra.clients.telegram.settings import TelegramClientSettings
 from app.infra.retry import RetryPolicy
 from app.settings.config import settings
@@ -38,26 +41,44 @@ class TelegramContainer(containers.DeclarativeContainer):
         max_delay=settings.telegram.retry.max_seconds,
         jitter=settings.telegram.retry.jitter_seconds,
     )
+    # Singleton: кэш рендера общий для всех отправок процесса.
     renderer: providers.Provider[ITelegramMessageRenderer] = providers.Singleton(
-        AiogramTelegramMessageRenderer,
+        CachingTelegramMessageRenderer,
+        inner=providers.Singleton(AiogramTelegramMessageRenderer),
+        cache=providers.Singleton(
+            LruTtlCache,
+            max_entries=settings.telegram.delivery.render_cache_max_entries,
+            ttl_seconds=settings.telegram.delivery.render_cache_ttl_seconds,
+        ),
     )
     bot_client: providers.Provider[ITelegramBot] = providers.Singleton(
         AiogramTelegramBot,
         bot=bot,
     )
+    # Singleton: лимиты Bot API общие на весь процесс.
+    rate_limiter: providers.Provider[TelegramRateLimiter] = providers.Singleton(
+        TelegramRateLimiter,
+        messages_per_second=settings.telegram.delivery.messages_per_second,
+        private_chat_interval_seconds=settings.telegram.delivery.private_chat_interval_seconds,
+        group_messages_per_minute=settings.telegram.delivery.group_messages_per_minute,
+    )
     sender: providers.Provider[ITelegramMessageSender] = providers.Singleton(
         TelegramMessageSender,
         bot=bot_client,
         retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
     )
     chat_checker: providers.Provider[ITelegramChatChecker] = providers.Singleton(
         TelegramChatChecker,
         bot=bot_client,
         retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        max_concurrency=settings.telegram.delivery.chat_check_max_concurrency,
     )
     notifier: providers.Provider[INotifier] = providers.Factory(
         TelegramNotifier,
         renderer=renderer,
         sender=sender,
         metrics=metrics.metrics_service,
+        max_concurrency=settings.telegram.delivery.max_concurrency,
     )
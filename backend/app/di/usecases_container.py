@@ -6,13 +6,24 @@ from app.app_layer.interfaces.use_cases.authenticate_user.interface import (
 from app.app_layer.interfaces.use_cases.check_telegram_chats.interface import (
     ICheckTelegramChatsUseCase,
 )
+from app.app_layer.interfaces.use_cases.dispatch_outbox.interface import IDispatchOutboxUseCase
+from app.app_layer.interfaces.use_cases.get_admin_broadcast.interface import (
+    IGetAdminBroadcastUseCase,
+)
 from app.app_layer.interfaces.use_cases.get_schedule_for_date.interface import (
     IGetScheduleForDateUseCase,
 )
+from app.app_layer.interfaces.use_cases.get_telegram_chats_check.interface import (
+    IGetTelegramChatsCheckUseCase,
+)
 from app.app_layer.interfaces.use_cases.get_upcoming_lesson.interface import (
     IGetUpcomingLessonUseCase,
 )
 from app.app_layer.interfaces.use_cases.list_accounts.interface import IListAccountsUseCase
+from app.app_layer.interfaces.use_cases.purge_notification_log.interface import (
+    IPurgeNotificationLogUseCase,
+)
+from app.app_layer.interfaces.use_cases.purge_outbox.interface import IPurgeOutboxUseCase
 from app.app_layer.interfaces.use_cases.refresh_schedule.interface import (
     IRefreshScheduleUseCase,
 )
@@ -22,6 +33,12 @@ from app.app_layer.interfaces.use_cases.register_user.interface import (
 from app.app_layer.interfaces.use_cases.send_admin_message.interface import (
     ISendAdminMessageUseCase,
 )
+from app.app_layer.interfaces.use_cases.start_telegram_chats_check.interface import (
+    IStartTelegramChatsCheckUseCase,
+)
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.interface import (
+    ISubmitAdminBroadcastUseCase,
+)
 from app.app_layer.interfaces.use_cases.sync_user_profile.interface import (
     ISyncUserProfileUseCase,
 )
@@ -33,18 +50,28 @@ from app.app_layer.interfaces.use_cases.update_user_settings.interface import (
 )
 from app.app_layer.use_cases.authenticate_user import AuthenticateUserUseCase
 from app.app_layer.use_cases.check_telegram_chats import CheckTelegramChatsUseCase
+from app.app_layer.use_cases.dispatch_outbox import DispatchOutboxUseCase
+from app.app_layer.use_cases.get_admin_broadcast import GetAdminBroadcastUseCase
 from app.app_layer.use_cases.get_schedule_for_date import GetScheduleForDateUseCase
+from app.app_layer.use_cases.get_telegram_chats_check import GetTelegramChatsCheckUseCase
 from app.app_layer.use_cases.get_upcoming_lesson import GetUpcomingLessonUseCase
 from app.app_layer.use_cases.list_accounts import ListAccountsUseCase
+from app.app_layer.use_cases.purge_notification_log import PurgeNotificationLogUseCase
+from app.app_layer.use_cases.purge_outbox import PurgeOutboxUseCase
 from app.app_layer.use_cases.refresh_schedule import RefreshScheduleUseCase
 from app.app_layer.use_cases.register_user import RegisterUserUseCase
 from app.app_layer.use_cases.send_admin_message import SendAdminMessageUseCase
+from app.app_layer.use_cases.start_telegram_chats_check import StartTelegramChatsCheckUseCase
+from app.app_layer.use_cases.submit_admin_broadcast import SubmitAdminBroadcastUseCase
 from app.app_layer.use_cases.sync_user_profile import SyncUserProfileUseCase
 from app.app_layer.use_cases.update_user_credentials import UpdateUserCredentialsUseCase
 from app.app_layer.use_cases.update_user_settings import UpdateUserSettingsUseCase
+from app.settings.config import settings
 
 
 class UseCasesContainer(containers.DeclarativeContainer):
+    core = providers.DependenciesContainer()
+    cache = providers.DependenciesContainer()
     db = providers.DependenciesContainer()
     repositories = providers.DependenciesContainer()
     ssau = providers.DependenciesContainer()
@@ -60,14 +87,75 @@ class UseCasesContainer(containers.DeclarativeContainer):
         SendAdminMessageUseCase,
         notifier=telegram.notifier,
     )
+    submit_admin_broadcast_use_case: providers.Provider[ISubmitAdminBroadcastUseCase] = (
+        providers.Factory(
+            SubmitAdminBroadcastUseCase,
+            uow_factory=db.uow_factory,
+            account_repo=repositories.account_repo,
+            broadcast_repo=repositories.broadcast_repo,
+            outbox_repo=repositories.outbox_repo,
+            clock=core.clock,
+            account_batch_size=settings.workers.account_batch_size,
+        )
+    )
+    get_admin_broadcast_use_case: providers.Provider[IGetAdminBroadcastUseCase] = providers.Factory(
+        GetAdminBroadcastUseCase,
+        uow_factory=db.uow_factory,
+        broadcast_repo=repositories.broadcast_repo,
+    )
     check_telegram_chats_use_case: providers.Provider[ICheckTelegramChatsUseCase] = (
         providers.Factory(
             CheckTelegramChatsUseCase,
             uow_factory=db.uow_factory,
             account_repo=repositories.account_repo,
             chat_checker=telegram.chat_checker,
+            account_batch_size=settings.workers.account_batch_size,
         )
     )
+    # Singleton: держит ссылки на запущенные фоновые проверки процесса.
+    start_telegram_chats_check_use_case: providers.Provider[IStartTelegramChatsCheckUseCase] = (
+        providers.Singleton(
+            StartTelegramChatsCheckUseCase,
+            uow_factory=db.uow_factory,
+            account_repo=repositories.account_repo,
+            chat_checker=telegram.chat_checker,
+            job_store=cache.telegram_chats_check_store,
+            clock=core.clock,
+            account_batch_size=settings.workers.account_batch_size,
+        )
+    )
+    get_telegram_chats_check_use_case: providers.Provider[IGetTelegramChatsCheckUseCase] = (
+        providers.Factory(
+            GetTelegramChatsCheckUseCase,
+            job_store=cache.telegram_chats_check_store,
+        )
+    )
+    dispatch_outbox_use_case: providers.Provider[IDispatchOutboxUseCase] = providers.Factory(
+        DispatchOutboxUseCase,
+        uow_factory=db.uow_factory,
+        outbox_repo=repositories.outbox_repo,
+        notifier=telegram.notifier,
+        clock=core.clock,
+        lease_seconds=settings.workers.outbox_lease_seconds,
+        max_attempts=settings.workers.outbox_max_attempts,
+        retry_base_seconds=settings.workers.outbox_retry_base_seconds,
+        retry_max_seconds=settings.workers.outbox_retry_max_seconds,
+    )
+    purge_notification_log_use_case: providers.Provider[IPurgeNotificationLogUseCase] = (
+        providers.Factory(
+            PurgeNotificationLogUseCase,
+            uow_factory=db.uow_factory,
+            notification_log_repo=repositories.notification_log_repo,
+            clock=core.clock,
+        )
+    )
+    purge_outbox_use_case: providers.Provider[IPurgeOutboxUseCase] = providers.Factory(
+        PurgeOutboxUseCase,
+        uow_factory=db.uow_factory,
+        outbox_repo=repositories.outbox_repo,
+        broadcast_repo=repositories.broadcast_repo,
+        clock=core.clock,
+    )
 
     register_user_use_case: providers.Provider[IRegisterUserUseCase] = providers.Factory(
         RegisterUserUseCase,
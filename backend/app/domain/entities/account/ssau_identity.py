@@ -1,13 +1,15 @@
 from app.domain.entities.base import TimestampedEntity
+from app.domain.value_objects.lazy_secret import LazySecret
 
 
 class SsauIdentityEntity(TimestampedEntity):
     """SSAU-идентичность аккаунта: учётные данные lk.ssau.ru.
 
     Привязывается на ``/auth``; наличие сущности = аккаунт авторизован в СНИУ.
-    ``password`` в домене — открытый текст; шифрование на границе мапера репозитория.
+    ``password`` в домене — открытый текст за ``LazySecret``: мапер репозитория
+    расшифровывает его только при первом ``get_secret_value()``.
     """
 
     account_id: int
     login: str
-    password: str
+    password: LazySecret
@@ -0,0 +1,8 @@
+from app.domain.messages.base import TelegramMessage
+from app.domain.services.schedule_diff import ScheduleDiff
+
+
+class ScheduleChangeMessage(TelegramMessage):
+    # Номер учебной недели → изменения в ней.
+    weeks: dict[int, ScheduleDiff]
+    title: str = "Расписание изменилось"
@@ -0,0 +1,72 @@
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from app.domain.entities.lesson import Lesson
+from app.domain.value_objects.subgroup import Subgroup
+
+_Entry = tuple[int, Lesson]
+
+
+class _Day(NamedTuple):
+    """Занятия одного дня, уже отсортированные по началу."""
+
+    # Все занятия (подгруппа "all").
+    all: tuple[_Entry, ...]
+    # Только общие — для подгруппы, у которой в этот день своих занятий нет.
+    common: tuple[_Entry, ...]
+    # Номер подгруппы -> общие + занятия этой подгруппы.
+    by_subgroup: dict[int, tuple[_Entry, ...]]
+
+
+class WeekdayLessonIndex:
+    """Индекс занятий недели: по дню недели и подгруппе, по времени начала.
+
+    Строится один раз на загруженную неделю. Принадлежность к учебной неделе —
+    битовая маска, поэтому выборка дня стоит O(занятий в этот день) вместо
+    прохода по всем занятиям с проверкой ``week_number in week_numbers``.
+    """
+
+    __slots__ = ("_lessons", "_days")
+
+    def __init__(self, lessons: Sequence[Lesson]) -> None:
+        self._lessons = list(lessons)
+        entries: dict[int, list[_Entry]] = {}
+        for lesson in sorted(self._lessons, key=lambda item: (item.time.start, item.time.end)):
+            mask = 0
+            for week in lesson.week_numbers:
+                mask |= 1 << week
+            entries.setdefault(lesson.weekday, []).append((mask, lesson))
+
+        self._days: dict[int, _Day] = {}
+        for weekday, day_entries in entries.items():
+            by_subgroup: dict[int, tuple[_Entry, ...]] = {}
+            subgroups = {entry[1].subgroup for entry in day_entries}
+            for subgroup in (value for value in subgroups if value is not None):
+                by_subgroup[subgroup] = tuple(
+                    entry for entry in day_entries if entry[1].subgroup in (None, subgroup)
+                )
+            self._days[weekday] = _Day(
+                all=tuple(day_entries),
+                common=tuple(entry for entry in day_entries if entry[1].subgroup is None),
+                by_subgroup=by_subgroup,
+            )
+
+    def lessons_on(self, weekday: int, week_number: int, subgroup: Subgroup) -> list[Lesson]:
+        """Занятия дня ``weekday`` (ISO, 1 = понедельник) учебной недели, по времени."""
+        day = self._days.get(weekday)
+        if day is None or week_number < 0:
+            return []
+        if subgroup.is_all:
+            entries = day.all
+        else:
+            entries = day.by_subgroup.get(int(subgroup), day.common)
+        bit = 1 << week_number
+        return [lesson for mask, lesson in entries if mask & bit]
+
+    def __eq__(self, other: object) -> bool:
+        # Индекс целиком выводится из занятий: равны занятия — равны индексы.
+        if not isinstance(other, WeekdayLessonIndex):
+            return NotImplemented
+        return self._lessons == other._lessons
+
+    __hash__ = None  # type: ignore[assignment]
@@ -0,0 +1,108 @@
+import hashlib
+import json
+from collections.abc import Iterable, Sequence
+from datetime import time
+
+from pydantic import BaseModel, ConfigDict
+
+from app.domain.entities.lesson import Lesson
+from app.domain.value_objects.subgroup import Subgroup
+
+# Поля, смена которых означает перенос занятия; остальные (кроме недель) — правку.
+_PLACEMENT_FIELDS = ("weekday", "time")
+_DETAIL_FIELDS = ("type", "subject", "teacher", "is_online", "conference_url", "subgroup")
+
+
+def lessons_content_hash(lessons: Sequence[Lesson]) -> str:
+    """Стабильный хэш содержимого недели: не зависит от порядка занятий и недель."""
+    payload = sorted(
+        (
+            {**lesson.model_dump(mode="json"), "week_numbers": sorted(lesson.week_numbers)}
+            for lesson in lessons
+        ),
+        key=lambda item: json.dumps(item, sort_keys=True, ensure_ascii=False),
+    )
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class LessonChange(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    before: Lesson
+    after: Lesson
+
+
+class ScheduleDiff(BaseModel):
+    """Разница двух версий одной учебной недели.
+
+    ``moved`` — сменились день или время, ``changed`` — тип, предмет, преподаватель,
+    формат, ссылка или подгруппа. Правка одного лишь списка недель (занятие
+    добавили на другую неделю) изменением этой недели не считается.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    added: list[Lesson] = []
+    removed: list[Lesson] = []
+    moved: list[LessonChange] = []
+    changed: list[LessonChange] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.moved or self.changed)
+
+    def for_subgroup(self, subgroup: Subgroup) -> "ScheduleDiff":
+        """Только изменения, видимые студенту подгруппы ``subgroup``."""
+        if subgroup.is_all:
+            return self
+
+        def _visible(lesson: Lesson) -> bool:
+            return lesson.subgroup is None or lesson.subgroup == int(subgroup)
+
+        return ScheduleDiff(
+            added=[lesson for lesson in self.added if _visible(lesson)],
+            removed=[lesson for lesson in self.removed if _visible(lesson)],
+            moved=[
+                change for change in self.moved if _visible(change.before) or _visible(change.after)
+            ],
+            changed=[
+                change
+                for change in self.changed
+                if _visible(change.before) or _visible(change.after)
+            ],
+        )
+
+
+def diff_week_lessons(
+    previous: Sequence[Lesson],
+    current: Sequence[Lesson],
+    week_number: int,
+) -> ScheduleDiff:
+    """Сравнивает занятия недели ``week_number`` в двух ответах СНИУ (по ``id``)."""
+    before = {lesson.id: lesson for lesson in previous if week_number in lesson.week_numbers}
+    after = {lesson.id: lesson for lesson in current if week_number in lesson.week_numbers}
+
+    moved: list[LessonChange] = []
+    changed: list[LessonChange] = []
+    for lesson_id in before.keys() & after.keys():
+        old, new = before[lesson_id], after[lesson_id]
+        if any(getattr(old, name) != getattr(new, name) for name in _PLACEMENT_FIELDS):
+            moved.append(LessonChange(before=old, after=new))
+        elif any(getattr(old, name) != getattr(new, name) for name in _DETAIL_FIELDS):
+            changed.append(LessonChange(before=old, after=new))
+
+    return ScheduleDiff(
+        added=_ordered(after[lesson_id] for lesson_id in after.keys() - before.keys()),
+        removed=_ordered(before[lesson_id] for lesson_id in before.keys() - after.keys()),
+        moved=sorted(moved, key=lambda change: _order_key(change.after)),
+        changed=sorted(changed, key=lambda change: _order_key(change.after)),
+    )
+
+
+def _ordered(lessons: Iterable[Lesson]) -> list[Lesson]:
+    return sorted(lessons, key=_order_key)
+
+
+def _order_key(lesson: Lesson) -> tuple[int, time, int]:
+    return (lesson.weekday, lesson.time.start, lesson.id)
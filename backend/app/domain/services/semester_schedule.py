@@ -0,0 +1,34 @@
+from collections.abc import Sequence
+
+from app.domain.entities.lesson import Lesson
+
+
+def merge_week_lessons(
+    semester_lessons: Sequence[Lesson],
+    week_number: int,
+    week_lessons: Sequence[Lesson],
+) -> list[Lesson]:
+    """Вливает свежий ответ СНИУ за неделю в расписание семестра.
+
+    Ответ за неделю авторитетен только для неё самой: занятия из ответа заменяют
+    одноимённые (по ``id``) целиком — у них актуальный полный список недель;
+    занятия семестра, которые числились на этой неделе, но в ответ не попали,
+    теряют эту неделю (и пропадают, если недель не осталось).
+    """
+    fresh = {lesson.id: lesson for lesson in week_lessons}
+    merged: list[Lesson] = []
+    for lesson in semester_lessons:
+        if lesson.id in fresh:
+            continue
+        if week_number in lesson.week_numbers:
+            weeks = [week for week in lesson.week_numbers if week != week_number]
+            if not weeks:
+                continue
+            lesson = lesson.model_copy(update={"week_numbers": weeks})
+        merged.append(lesson)
+    merged.extend(fresh.values())
+    return merged
+
+
+def lessons_in_week(lessons: Sequence[Lesson], week_number: int) -> list[Lesson]:
+    return [lesson for lesson in lessons if week_number in lesson.week_numbers]
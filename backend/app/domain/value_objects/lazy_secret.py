@@ -0,0 +1,82 @@
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+# Ключ контекста ``model_dump``: функция шифрования. С ним секрет сериализуется
+# шифротекстом — сохранённым, если он известен, иначе зашифрованным ею значением.
+ENCRYPT_CONTEXT_KEY = "encrypt_secret"
+
+
+class LazySecret:
+    """Секрет, который вычисляется (расшифровывается) при первом обращении.
+
+    Репозиторий отдаёт пароль СНИУ отложенным: списки аккаунтов не платят за
+    расшифровку тех паролей, которые никто не читает. Результат запоминается.
+    В ``repr``/``str`` значение скрыто; в JSON сериализуется открытым текстом,
+    а с ``ENCRYPT_CONTEXT_KEY`` в контексте — шифротекстом без расшифровки.
+    """
+
+    __slots__ = ("_ciphertext", "_resolve", "_value")
+
+    def __init__(self, value: str | Callable[[], str], *, ciphertext: str | None = None) -> None:
+        self._value: str | None = None
+        self._resolve: Callable[[], str] | None = None
+        self._ciphertext = ciphertext
+        if isinstance(value, str):
+            self._value = value
+        else:
+            self._resolve = value
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._resolve is None
+
+    @property
+    def ciphertext(self) -> str | None:
+        """Шифротекст, из которого получен секрет, если он известен."""
+        return self._ciphertext
+
+    def get_secret_value(self) -> str:
+        if self._resolve is not None:
+            self._value = self._resolve()
+            self._resolve = None
+        assert self._value is not None
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LazySecret):
+            return NotImplemented
+        return self.get_secret_value() == other.get_secret_value()
+
+    def __hash__(self) -> int:
+        return hash(self.get_secret_value())
+
+    def __repr__(self) -> str:
+        return "LazySecret('**********')"
+
+    def __str__(self) -> str:
+        return "**********"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        from_str = core_schema.no_info_after_validator_function(cls, core_schema.str_schema())
+        return core_schema.json_or_python_schema(
+            json_schema=from_str,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_str]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                _serialize, info_arg=True, when_used="json"
+            ),
+        )
+
+
+def _serialize(secret: LazySecret, info: core_schema.SerializationInfo) -> str:
+    encrypt: Callable[[str], str] | None = (info.context or {}).get(ENCRYPT_CONTEXT_KEY)
+    if encrypt is None:
+        return secret.get_secret_value()
+    if secret.ciphertext is not None:
+        return secret.ciphertext
+    return encrypt(secret.get_secret_value())
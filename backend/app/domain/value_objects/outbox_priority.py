@@ -0,0 +1,11 @@
+from enum import IntEnum
+
+
+class OutboxPriorityEnum(IntEnum):
+    """Порядок разбора outbox: меньшее значение уходит раньше.
+
+    Напоминания о парах привязаны ко времени и не должны стоять за массовой рассылкой.
+    """
+
+    NOTIFICATION = 0
+    BROADCAST = 10
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+
+class OutboxStatusEnum(StrEnum):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    SENT = "sent"
+    DEAD = "dead"
@@ -0,0 +1,61 @@
+import secrets
+
+from app.app_layer.interfaces.cache.account.interface import IAccountViewCache
+from app.app_layer.interfaces.cache.interface import ICacheClient
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.infra.cache.local.lru import LruTtlCache
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TieredAccountViewCache(IAccountViewCache):
+    """In-process LRU/TTL перед Valkey; инвалидация рассылается остальным процессам
+    через канал (``{origin} {chat_id}``), как у ``TieredScheduleCacheStore``.
+    """
+
+    def __init__(
+        self,
+        inner: IAccountViewCache,
+        local: LruTtlCache[int, AccountViewDTO],
+        client: ICacheClient,
+        channel: str,
+    ) -> None:
+        self._inner = inner
+        self._local = local
+        self._client = client
+        self._channel = channel
+        self._origin = secrets.token_hex(8)
+
+    @property
+    def channel(self) -> str:
+        return self._channel
+
+    async def get(self, chat_id: int) -> AccountViewDTO | None:
+        cached = self._local.get(chat_id)
+        if cached is not None:
+            return cached
+        view = await self._inner.get(chat_id)
+        if view is not None:
+            self._local.set(chat_id, view)
+        return view
+
+    async def set(self, view: AccountViewDTO) -> None:
+        self._local.set(view.chat_id, view)
+        await self._inner.set(view)
+
+    async def invalidate(self, chat_id: int) -> None:
+        self._local.delete(chat_id)
+        await self._inner.invalidate(chat_id)
+        try:
+            await self._client.publish(self._channel, f"{self._origin} {chat_id}")
+        except Exception:
+            logger.warning("Failed to publish account view invalidation.", exc_info=True)
+
+    def handle_invalidation(self, message: str) -> None:
+        origin, _, chat_id = message.partition(" ")
+        if origin != self._origin and chat_id.lstrip("-").isdigit():
+            self._local.delete(int(chat_id))
+
+    def clear_local(self) -> None:
+        self._local.clear()
@@ -0,0 +1,108 @@
+import secrets
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.app_layer.interfaces.cache.interface import ICacheClient
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO, ScheduleGroupKeyDTO
+from app.app_layer.interfaces.cache.schedule.interface import IScheduleCacheStore
+from app.infra.cache.local.lru import LruTtlCache
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TieredScheduleCacheStore(IScheduleCacheStore):
+    """Двухуровневый кэш расписания: in-process LRU/TTL перед общим хранилищем.
+
+    Попадание в локальный уровень не ходит в сеть и не валидирует JSON — отдаётся
+    уже собранный ``CachedWeekDTO``. Запись идёт в общее хранилище, локальный
+    уровень обновляется, а остальные процессы получают сообщение в канал
+    инвалидации (``{origin} {year}:{group}:{type}:{week}``) и выбрасывают свою копию.
+    Локальный TTL — страховка на случай потерянного сообщения.
+    """
+
+    def __init__(
+        self,
+        inner: IScheduleCacheStore,
+        local: LruTtlCache[str, CachedWeekDTO],
+        client: ICacheClient,
+        channel: str,
+    ) -> None:
+        self._inner = inner
+        self._local = local
+        self._client = client
+        self._channel = channel
+        self._origin = secrets.token_hex(8)
+
+    @property
+    def channel(self) -> str:
+        return self._channel
+
+    async def get(self, key: ScheduleGroupKeyDTO, week_number: int) -> CachedWeekDTO | None:
+        local_key = _local_key(key, week_number)
+        cached = self._local.get(local_key)
+        if cached is not None:
+            return cached
+        week = await self._inner.get(key, week_number)
+        if week is not None:
+            self._local.set(local_key, week)
+        return week
+
+    async def get_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        found: dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO] = {}
+        misses: list[tuple[ScheduleGroupKeyDTO, int]] = []
+        for request in dict.fromkeys(requests):
+            cached = self._local.get(_local_key(*request))
+            if cached is None:
+                misses.append(request)
+            else:
+                found[request] = cached
+        if misses:
+            fetched = await self._inner.get_many(misses)
+            for request, week in fetched.items():
+                self._local.set(_local_key(*request), week)
+            found.update(fetched)
+        return found
+
+    async def set(self, key: ScheduleGroupKeyDTO, week_number: int, week: CachedWeekDTO) -> None:
+        await self._inner.set(key, week_number, week)
+        local_key = _local_key(key, week_number)
+        self._local.set(local_key, week)
+        await self._publish(local_key)
+
+    async def touch(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        fetched_at: datetime,
+    ) -> bool:
+        if not await self._inner.touch(key, week_number, fetched_at):
+            return False
+        local_key = _local_key(key, week_number)
+        cached = self._local.get(local_key)
+        if cached is not None:
+            # Содержимое то же: копия разделяет занятия, индекс и хэш.
+            self._local.set(local_key, cached.model_copy(update={"fetched_at": fetched_at}))
+        await self._publish(local_key)
+        return True
+
+    async def _publish(self, local_key: str) -> None:
+        try:
+            await self._client.publish(self._channel, f"{self._origin} {local_key}")
+        except Exception:
+            logger.warning("Failed to publish schedule cache invalidation.", exc_info=True)
+
+    def handle_invalidation(self, message: str) -> None:
+        origin, _, local_key = message.partition(" ")
+        if origin != self._origin:
+            self._local.delete(local_key)
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+
+def _local_key(key: ScheduleGroupKeyDTO, week_number: int) -> str:
+    return f"{key.year_id}:{key.group_id}:{key.user_type}:{week_number}"
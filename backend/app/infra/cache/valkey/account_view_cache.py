@@ -0,0 +1,73 @@
+import json
+from functools import partial
+
+from app.app_layer.interfaces.cache.account.interface import IAccountViewCache
+from app.app_layer.interfaces.cache.interface import ICacheClient
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.security.password_cipher.interface import IPasswordCipher
+from app.domain.value_objects.lazy_secret import ENCRYPT_CONTEXT_KEY, LazySecret
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ValkeyAccountViewCache(IAccountViewCache):
+    """View аккаунта в Valkey: ключ ``account:view:{chat_id}`` → JSON ``AccountViewDTO``.
+
+    Пароль СНИУ в Valkey открытым текстом не попадает: пишется шифротекст того же
+    шифра, что и в БД (для view из БД — он сам, без расшифровки), а расшифровывается
+    пароль лишь при первом обращении.
+    """
+
+    _KEY_PREFIX = "account:view"
+
+    def __init__(
+        self,
+        client: ICacheClient,
+        cipher: IPasswordCipher,
+        ttl_seconds: int,
+    ) -> None:
+        self._client = client
+        self._cipher = cipher
+        self._ttl_seconds = ttl_seconds
+
+    def _key(self, chat_id: int) -> str:
+        return f"{self._KEY_PREFIX}:{chat_id}"
+
+    async def get(self, chat_id: int) -> AccountViewDTO | None:
+        try:
+            raw = await self._client.get(self._key(chat_id))
+            if raw is None:
+                return None
+            payload = json.loads(raw)
+            identity = payload.get("ssau_identity")
+            if identity is not None:
+                identity["password"] = LazySecret(
+                    partial(self._cipher.decrypt, identity["password"]),
+                    ciphertext=identity["password"],
+                )
+            return AccountViewDTO.model_validate(payload)
+        except Exception:
+            # Недоступный Valkey или запись старого формата — это промах, читаем из БД.
+            logger.warning("Account view cache read failed.", exc_info=True)
+            return None
+
+    async def set(self, view: AccountViewDTO) -> None:
+        payload = view.model_dump(
+            mode="json",
+            context={ENCRYPT_CONTEXT_KEY: self._cipher.encrypt},
+        )
+        try:
+            await self._client.set(
+                self._key(view.chat_id),
+                json.dumps(payload, separators=(",", ":")),
+                ttl=self._ttl_seconds,
+            )
+        except Exception:
+            logger.warning("Account view cache write failed.", exc_info=True)
+
+    async def invalidate(self, chat_id: int) -> None:
+        try:
+            await self._client.delete(self._key(chat_id))
+        except Exception:
+            logger.warning("Account view cache invalidation failed.", exc_info=True)
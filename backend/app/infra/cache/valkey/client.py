@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any
 
 import valkey.asyncio as valkey
@@ -33,9 +34,30 @@ def build_valkey_client(settings: ValkeyClientSettings) -> valkey.Valkey:
     )
 
 
+_DELETE_IF_EQUALS_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
+"""
+
+_SET_RANGE_IF_PREFIX_SCRIPT = """
+if redis.call("GETRANGE", KEYS[1], 0, string.len(ARGV[1]) - 1) ~= ARGV[1] then
+    return 0
+end
+redis.call("SETRANGE", KEYS[1], ARGV[2], ARGV[3])
+if tonumber(ARGV[4]) > 0 then
+    redis.call("EXPIRE", KEYS[1], ARGV[4])
+end
+return 1
+"""
+
+
 class ValkeyClient(ICacheClient):
     def __init__(self, client: valkey.Valkey) -> None:
         self._client = client
+        self._delete_if_equals = client.register_script(_DELETE_IF_EQUALS_SCRIPT)
+        self._set_range_if_prefix = client.register_script(_SET_RANGE_IF_PREFIX_SCRIPT)
 
     async def set(
         self,
@@ -57,6 +79,11 @@ class ValkeyClient(ICacheClient):
     async def get(self, key: str) -> Any | None:
         return await self._client.get(key)
 
+    async def mget(self, keys: Sequence[str]) -> list[Any | None]:
+        if not keys:
+            return []
+        return list(await self._client.mget(keys))
+
     async def exists(self, key: str) -> bool:
         return bool(await self._client.exists(key))
 
@@ -65,3 +92,22 @@ class ValkeyClient(ICacheClient):
 
     async def delete(self, key: str) -> int:
         return int(await self._client.delete(key))
+
+    async def delete_if_equals(self, key: str, value: Any) -> bool:
+        return bool(await self._delete_if_equals(keys=[key], args=[value]))
+
+    async def set_range_if_prefix(
+        self,
+        key: str,
+        offset: int,
+        value: bytes,
+        *,
+        prefix: bytes,
+        ttl: int | None = None,
+    ) -> bool:
+        return bool(
+            await self._set_range_if_prefix(keys=[key], args=[prefix, offset, value, ttl or 0])
+        )
+
+    async def publish(self, channel: str, message: str) -> int:
+        return int(await self._client.publish(channel, message))
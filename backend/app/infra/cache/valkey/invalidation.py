@@ -0,0 +1,80 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+from typing import Protocol
+
+import valkey.asyncio as valkey
+
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class LocalCacheInvalidationTarget(Protocol):
+    """Локальный уровень кэша, который чистится сообщениями из своего канала."""
+
+    @property
+    def channel(self) -> str: ...
+
+    def handle_invalidation(self, message: str) -> None: ...
+
+    def clear_local(self) -> None: ...
+
+
+class ValkeyInvalidationListener:
+    """Подписка на канал инвалидации локального кэша (Valkey pub/sub).
+
+    После обрыва соединения локальный уровень очищается целиком: сообщения,
+    пришедшие за время разрыва, потеряны.
+    """
+
+    def __init__(
+        self,
+        client: valkey.Valkey,
+        store: LocalCacheInvalidationTarget,
+        reconnect_delay_seconds: float = 1.0,
+    ) -> None:
+        self._client = client
+        self._store = store
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "Cache invalidation listener failed: channel=%s",
+                    self._store.channel,
+                    exc_info=True,
+                )
+            self._store.clear_local()
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _listen(self) -> None:
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self._store.channel)
+            async for message in pubsub.listen():
+                data = message.get("data")
+                if isinstance(data, bytes):
+                    self._store.handle_invalidation(data.decode())
+        finally:
+            await pubsub.aclose()  # type: ignore[no-untyped-call]
+
+
+async def run_cache_invalidation(
+    client: valkey.Valkey,
+    store: LocalCacheInvalidationTarget,
+) -> AsyncIterator[ValkeyInvalidationListener]:
+    """DI Resource: слушает канал инвалидации в фоне, останавливается на shutdown."""
+    listener = ValkeyInvalidationListener(client, store)
+    task = asyncio.create_task(listener.run())
+    try:
+        yield listener
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,28 @@
+import secrets
+
+from app.app_layer.interfaces.cache.interface import ICacheClient
+from app.app_layer.interfaces.cache.lock.interface import IDistributedLock
+
+
+class ValkeyDistributedLock(IDistributedLock):
+    """Блокировка на ``SET lock:{name} <token> NX EX ttl``.
+
+    Снятие — атомарное сравнение токена и удаление (``delete_if_equals``), чтобы
+    процесс, чья блокировка уже истекла, не снял чужую.
+    """
+
+    _KEY_PREFIX = "lock"
+
+    def __init__(self, client: ICacheClient) -> None:
+        self._client = client
+
+    def _key(self, name: str) -> str:
+        return f"{self._KEY_PREFIX}:{name}"
+
+    async def acquire(self, name: str, ttl_seconds: int) -> str | None:
+        token = secrets.token_hex(16)
+        acquired = await self._client.set(self._key(name), token, ttl=ttl_seconds, nx=True)
+        return token if acquired else None
+
+    async def release(self, name: str, token: str) -> None:
+        await self._client.delete_if_equals(self._key(name), token)
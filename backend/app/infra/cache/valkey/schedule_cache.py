@@ -1,12 +1,28 @@
+from collections.abc import Sequence
+from datetime import datetime
+
 from app.app_layer.interfaces.cache.interface import ICacheClient
-from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO, ScheduleGroupKeyDTO
 from app.app_layer.interfaces.cache.schedule.interface import IScheduleCacheStore
+from app.infra.cache.valkey.schedule_codec import (
+    FETCHED_AT_OFFSET,
+    HEADER_PREFIX,
+    decode_cached_week,
+    encode_cached_week,
+    encode_fetched_at,
+)
 
 
 class ValkeyScheduleCacheStore(IScheduleCacheStore):
-    """Кэш расписания в Valkey: ключ ``schedule:{account_id}:{week}`` → JSON ``CachedWeekDTO``.
+    """Кэш расписания в Valkey: ключ ``schedule:{year_id}:{group_id}:{user_type}:{week}``
+    → ``CachedWeekDTO`` в компактном бинарном формате (``schedule_codec``).
+
+    Старые JSON-записи читаются прозрачно и перезапишутся при следующем синке.
+    ``touch`` правит только ``fetched_at`` в заголовке (``SETRANGE``) и продлевает TTL.
 
-    Свежесть обеспечивает TTL Valkey (``SETEX``): вернулся ключ — он ещё актуален.
+    Одна запись на группу: все студенты группы читают одну и ту же копию.
+    TTL Valkey (``SETEX``) — жёсткий срок жизни записи; мягкую свежесть по
+    ``fetched_at`` оценивает ``ScheduleSyncService``.
     """
 
     _KEY_PREFIX = "schedule"
@@ -15,18 +31,44 @@ class ValkeyScheduleCacheStore(IScheduleCacheStore):
         self._client = client
         self._ttl_seconds = ttl_seconds
 
-    def _key(self, account_id: int, week_number: int) -> str:
-        return f"{self._KEY_PREFIX}:{account_id}:{week_number}"
+    def _key(self, key: ScheduleGroupKeyDTO, week_number: int) -> str:
+        return f"{self._KEY_PREFIX}:{key.year_id}:{key.group_id}:{key.user_type}:{week_number}"
 
-    async def get(self, account_id: int, week_number: int) -> CachedWeekDTO | None:
-        raw = await self._client.get(self._key(account_id, week_number))
+    async def get(self, key: ScheduleGroupKeyDTO, week_number: int) -> CachedWeekDTO | None:
+        raw = await self._client.get(self._key(key, week_number))
         if raw is None:
             return None
-        return CachedWeekDTO.model_validate_json(raw)
+        return decode_cached_week(raw)
+
+    async def get_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        unique = list(dict.fromkeys(requests))
+        raws = await self._client.mget([self._key(key, week) for key, week in unique])
+        return {
+            request: decode_cached_week(raw)
+            for request, raw in zip(unique, raws, strict=True)
+            if raw is not None
+        }
 
-    async def set(self, account_id: int, week_number: int, week: CachedWeekDTO) -> None:
+    async def set(self, key: ScheduleGroupKeyDTO, week_number: int, week: CachedWeekDTO) -> None:
         await self._client.set(
-            self._key(account_id, week_number),
-            week.model_dump_json(),
+            self._key(key, week_number),
+            encode_cached_week(week),
+            ttl=self._ttl_seconds,
+        )
+
+    async def touch(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        fetched_at: datetime,
+    ) -> bool:
+        return await self._client.set_range_if_prefix(
+            self._key(key, week_number),
+            FETCHED_AT_OFFSET,
+            encode_fetched_at(fetched_at),
+            prefix=HEADER_PREFIX,
             ttl=self._ttl_seconds,
         )
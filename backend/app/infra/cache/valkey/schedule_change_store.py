@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+
+from app.app_layer.interfaces.cache.interface import ICacheClient
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO, ScheduleGroupKeyDTO
+from app.app_layer.interfaces.cache.schedule.interface import IScheduleChangeStore
+
+
+class ValkeyScheduleChangeStore(IScheduleChangeStore):
+    """Базы изменений в Valkey:
+    ``schedule-changes:{year_id}:{group_id}:{user_type}:{week}`` → JSON ``CachedWeekDTO``.
+
+    Первая база пишется ``SET NX``; забирается ``GET`` и удалением «если не изменилось»,
+    так что параллельные джобы не сообщат об одной базе дважды.
+    """
+
+    _KEY_PREFIX = "schedule-changes"
+
+    def __init__(self, client: ICacheClient, ttl_seconds: int) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    def _key(self, key: ScheduleGroupKeyDTO, week_number: int) -> str:
+        return f"{self._KEY_PREFIX}:{key.year_id}:{key.group_id}:{key.user_type}:{week_number}"
+
+    async def record(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        baseline: CachedWeekDTO,
+    ) -> None:
+        await self._client.set(
+            self._key(key, week_number),
+            baseline.model_dump_json(),
+            ttl=self._ttl_seconds,
+            nx=True,
+        )
+
+    async def restore(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        baseline: CachedWeekDTO,
+    ) -> None:
+        await self._client.set(
+            self._key(key, week_number),
+            baseline.model_dump_json(),
+            ttl=self._ttl_seconds,
+        )
+
+    async def pop_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        requests = list(dict.fromkeys(requests))
+        if not requests:
+            return {}
+        keys = [self._key(key, week_number) for key, week_number in requests]
+        values = await self._client.mget(keys)
+        popped: dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO] = {}
+        for request, name, raw in zip(requests, keys, values, strict=True):
+            if raw is None or not await self._client.delete_if_equals(name, raw):
+                continue
+            popped[request] = CachedWeekDTO.model_validate_json(raw)
+        return popped
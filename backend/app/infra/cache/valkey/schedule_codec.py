@@ -0,0 +1,226 @@
+import struct
+from datetime import UTC, datetime, time, timedelta
+from functools import cache
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
+from app.domain.entities.lesson import Lesson
+from app.domain.services.lesson_index import WeekdayLessonIndex
+from app.domain.services.schedule_diff import lessons_content_hash
+from app.domain.value_objects.lesson_time import LessonTime
+
+# Компактный бинарный формат недели расписания для Valkey.
+#
+#   header   : MAGIC (3 байта) + VERSION (1) + fetched_at (int64, мкс от эпохи, UTC)
+#              + content_hash (16 байт; с версии 2)
+#   strings  : count (uint16) + [len (uint16) + utf-8]…  — таблица уникальных строк
+#   lessons  : count (uint16) + [_LESSON]…  — записи фиксированной длины
+#
+# Строки (тип, предмет, преподаватель, ссылка) хранятся один раз, в занятии — индекс.
+# Время — минуты от полуночи, недели — 64-битная маска. Первый байт MAGIC нулевой,
+# поэтому JSON старых записей (``{…``) отличается по первому байту.
+#
+# ``fetched_at`` лежит по фиксированному смещению: неизменившуюся неделю можно
+# продлить, переписав только его (см. ``encode_fetched_at``).
+
+MAGIC = b"\x00SW"
+VERSION = 2
+FETCHED_AT_OFFSET = 4
+# Начало записи текущей версии: по нему её отличают от старых форматов.
+HEADER_PREFIX = MAGIC + bytes([VERSION])
+
+_HEADER_V1 = struct.Struct("<3sBq")
+_HEADER = struct.Struct("<3sBq16s")
+_FETCHED_AT = struct.Struct("<q")
+_COUNT = struct.Struct("<H")
+_LESSON = struct.Struct("<qHHHBHHBBHQ")
+_NONE = 0xFFFF
+_FLAG_ONLINE = 0x01
+_FLAG_SUBGROUP = 0x02
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+_M = TypeVar("_M", bound=BaseModel)
+_set_attr = object.__setattr__
+
+
+def encode_cached_week(week: CachedWeekDTO) -> bytes:
+    """Кодирует неделю; если её нельзя выразить компактно — отдаёт JSON."""
+    try:
+        return _encode(week)
+    except (ValueError, struct.error, OverflowError):
+        return week.model_dump_json().encode()
+
+
+def decode_cached_week(raw: bytes | str) -> CachedWeekDTO:
+    """Декодирует бинарную запись или (для старых записей) JSON.
+
+    Бинарная ветка собирает модели через ``model_construct``: данные записаны
+    нами же из валидных моделей, повторная валидация не нужна.
+    """
+    if isinstance(raw, bytes) and raw[:3] == MAGIC:
+        return _decode(raw)
+    return CachedWeekDTO.model_validate_json(raw)
+
+
+def encode_fetched_at(fetched_at: datetime) -> bytes:
+    """Байты ``fetched_at`` для записи по смещению ``FETCHED_AT_OFFSET``."""
+    if fetched_at.tzinfo is None:
+        raise ValueError("fetched_at must be timezone-aware.")
+    return _FETCHED_AT.pack((fetched_at - _EPOCH) // timedelta(microseconds=1))
+
+
+def _encode(week: CachedWeekDTO) -> bytes:
+    if week.fetched_at.tzinfo is None:
+        raise ValueError("fetched_at must be timezone-aware.")
+    assert week.content_hash is not None
+    strings: dict[str, int] = {}
+
+    def _index(value: str | None) -> int:
+        if value is None:
+            return _NONE
+        index = strings.setdefault(value, len(strings))
+        if index >= _NONE:
+            raise ValueError("String table overflow.")
+        return index
+
+    body = bytearray(_COUNT.pack(len(week.lessons)))
+    for lesson in week.lessons:
+        flags = _FLAG_ONLINE if lesson.is_online else 0
+        if lesson.subgroup is not None:
+            flags |= _FLAG_SUBGROUP
+        body += _LESSON.pack(
+            lesson.id,
+            _index(lesson.type),
+            _index(lesson.subject),
+            _index(lesson.teacher),
+            lesson.weekday,
+            _minutes(lesson.time.start),
+            _minutes(lesson.time.end),
+            flags,
+            lesson.subgroup or 0,
+            _index(lesson.conference_url),
+            _weeks_mask(lesson.week_numbers),
+        )
+
+    fetched_at = (week.fetched_at - _EPOCH) // timedelta(microseconds=1)
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, fetched_at, bytes.fromhex(week.content_hash)))
+    header += _COUNT.pack(len(strings))
+    for value in strings:
+        encoded = value.encode()
+        header += _COUNT.pack(len(encoded)) + encoded
+    return bytes(header + body)
+
+
+def _decode(raw: bytes) -> CachedWeekDTO:
+    version = raw[3]
+    content_hash: str | None
+    if version == VERSION:
+        _, _, fetched_at, digest = _HEADER.unpack_from(raw, 0)
+        content_hash = digest.hex()
+        offset = _HEADER.size
+    elif version == 1:
+        _, _, fetched_at = _HEADER_V1.unpack_from(raw, 0)
+        content_hash = None
+        offset = _HEADER_V1.size
+    else:
+        raise ValueError(f"Unsupported schedule codec version: {version}")
+
+    (strings_count,) = _COUNT.unpack_from(raw, offset)
+    offset += _COUNT.size
+    strings: list[str] = []
+    for _ in range(strings_count):
+        (length,) = _COUNT.unpack_from(raw, offset)
+        offset += _COUNT.size
+        strings.append(raw[offset : offset + length].decode())
+        offset += length
+
+    (lessons_count,) = _COUNT.unpack_from(raw, offset)
+    offset += _COUNT.size
+    end = offset + lessons_count * _LESSON.size
+    lessons = [
+        _construct(
+            Lesson,
+            {
+                "id": lesson_id,
+                "type": strings[type_index],
+                "subject": strings[subject_index],
+                "teacher": None if teacher_index == _NONE else strings[teacher_index],
+                "weekday": weekday,
+                "week_numbers": list(_weeks(weeks)),
+                "time": _lesson_time(start, end_minutes),
+                "is_online": bool(flags & _FLAG_ONLINE),
+                "conference_url": None if conference_index == _NONE else strings[conference_index],
+                "subgroup": subgroup if flags & _FLAG_SUBGROUP else None,
+            },
+        )
+        for (
+            lesson_id,
+            type_index,
+            subject_index,
+            teacher_index,
+            weekday,
+            start,
+            end_minutes,
+            flags,
+            subgroup,
+            conference_index,
+            weeks,
+        ) in _LESSON.iter_unpack(raw[offset:end])
+    ]
+
+    return _construct(
+        CachedWeekDTO,
+        {
+            "fetched_at": _EPOCH + timedelta(microseconds=fetched_at),
+            "lessons": lessons,
+            "content_hash": content_hash or lessons_content_hash(lessons),
+            "index": WeekdayLessonIndex(lessons),
+        },
+    )
+
+
+def _construct(model: type[_M], values: dict[str, Any]) -> _M:
+    """Облегчённый ``model_construct``: все поля заданы, extra/private нет.
+
+    ``BaseModel.model_construct`` обходит поля и дефолты на Python и на горячем
+    пути стоит дороже, чем ``model_validate_json`` целиком.
+    """
+    instance = model.__new__(model)
+    _set_attr(instance, "__dict__", values)
+    _set_attr(instance, "__pydantic_fields_set__", set(values))
+    _set_attr(instance, "__pydantic_extra__", None)
+    _set_attr(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _minutes(value: time) -> int:
+    if value.second or value.microsecond:
+        raise ValueError("Lesson time has sub-minute precision.")
+    return value.hour * 60 + value.minute
+
+
+@cache
+def _lesson_time(start: int, end: int) -> LessonTime:
+    # LessonTime неизменяем, поэтому одинаковые пары времени можно разделять.
+    return _construct(
+        LessonTime,
+        {"start": time(start // 60, start % 60), "end": time(end // 60, end % 60)},
+    )
+
+
+@cache
+def _weeks(mask: int) -> tuple[int, ...]:
+    return tuple(bit for bit in range(mask.bit_length()) if mask >> bit & 1)
+
+
+def _weeks_mask(week_numbers: list[int]) -> int:
+    if week_numbers != sorted(set(week_numbers)):
+        raise ValueError("Week numbers are not strictly ascending.")
+    mask = 0
+    for week in week_numbers:
+        if not 0 <= week < 64:
+            raise ValueError("Week number does not fit the mask.")
+        mask |= 1 << week
+    return mask
@@ -0,0 +1,34 @@
+from app.app_layer.interfaces.cache.interface import ICacheClient
+from app.app_layer.interfaces.cache.schedule.dto import CachedSemesterDTO, ScheduleGroupKeyDTO
+from app.app_layer.interfaces.cache.schedule.interface import IScheduleSemesterStore
+
+
+class ValkeyScheduleSemesterStore(IScheduleSemesterStore):
+    """Семестровое расписание в Valkey: ``schedule-semester:{year_id}:{group_id}:{user_type}``
+    → JSON ``CachedSemesterDTO``.
+
+    Запись пишется read-modify-write без блокировки: при гонке двух недель одной
+    группы одна из них может потеряться и будет просто получена из СНИУ заново.
+    """
+
+    _KEY_PREFIX = "schedule-semester"
+
+    def __init__(self, client: ICacheClient, ttl_seconds: int) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    def _key(self, key: ScheduleGroupKeyDTO) -> str:
+        return f"{self._KEY_PREFIX}:{key.year_id}:{key.group_id}:{key.user_type}"
+
+    async def get(self, key: ScheduleGroupKeyDTO) -> CachedSemesterDTO | None:
+        raw = await self._client.get(self._key(key))
+        if raw is None:
+            return None
+        return CachedSemesterDTO.model_validate_json(raw)
+
+    async def set(self, key: ScheduleGroupKeyDTO, semester: CachedSemesterDTO) -> None:
+        await self._client.set(
+            self._key(key),
+            semester.model_dump_json(),
+            ttl=self._ttl_seconds,
+        )
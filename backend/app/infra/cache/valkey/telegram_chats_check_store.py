@@ -0,0 +1,27 @@
+from app.app_layer.interfaces.cache.interface import ICacheClient
+from app.app_layer.interfaces.cache.telegram_chats_check.dto import TelegramChatsCheckJobDTO
+from app.app_layer.interfaces.cache.telegram_chats_check.interface import (
+    ITelegramChatsCheckJobStore,
+)
+
+
+class ValkeyTelegramChatsCheckJobStore(ITelegramChatsCheckJobStore):
+    """Задача проверки чатов в Valkey: ключ ``telegram:chats-check:{job_id}`` → JSON."""
+
+    _KEY_PREFIX = "telegram:chats-check"
+
+    def __init__(self, client: ICacheClient, ttl_seconds: int) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    def _key(self, job_id: str) -> str:
+        return f"{self._KEY_PREFIX}:{job_id}"
+
+    async def save(self, job: TelegramChatsCheckJobDTO) -> None:
+        await self._client.set(self._key(job.job_id), job.model_dump_json(), ttl=self._ttl_seconds)
+
+    async def get(self, job_id: str) -> TelegramChatsCheckJobDTO | None:
+        raw = await self._client.get(self._key(job_id))
+        if raw is None:
+            return None
+        return TelegramChatsCheckJobDTO.model_validate_json(raw)
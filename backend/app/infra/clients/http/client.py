@@ -1,5 +1,6 @@
 import time
 from collections.abc import Mapping
+from contextlib import AbstractAsyncContextManager, nullcontext
 from types import TracebackType
 from typing import Any, Self
 
@@ -12,8 +13,10 @@ from app.infra.clients.http.options import (
     HttpClientMetrics,
     NoopHttpClientMetrics,
     WithMetrics,
+    WithRateLimit,
     WithRetry,
 )
+from app.infra.clients.http.rate_limit import RateLimiter
 from app.infra.observability.telemetry.tracing import get_tracer
 from app.infra.retry import RetryPolicy, retry_async
 from app.logging.config import get_logger
@@ -46,6 +49,8 @@ class BaseHttpClient:
         self._metrics: HttpClientMetrics = NoopHttpClientMetrics()
         self._retry_policy: RetryPolicy | None = None
         self._retry_status_codes: frozenset[int] = DEFAULT_RETRY_STATUSES
+        self._rate_limiter: RateLimiter | None = None
+        self._host = httpx.URL(self._base_url).host
         self._session: httpx.AsyncClient | None = None
         self._apply_options(options)
 
@@ -56,6 +61,8 @@ class BaseHttpClient:
             elif isinstance(option, WithRetry):
                 self._retry_policy = option.policy
                 self._retry_status_codes = option.status_codes
+            elif isinstance(option, WithRateLimit):
+                self._rate_limiter = option.limiter
 
     async def __aenter__(self) -> Self:
         if self._session is None or self._session.is_closed:
@@ -220,17 +227,18 @@ class BaseHttpClient:
                 request_kwargs: dict[str, Any] = {}
                 if follow_redirects is not None:
                     request_kwargs["follow_redirects"] = follow_redirects
-                response = await self._get_session().request(
-                    method,
-                    path,
-                    params=params,
-                    headers=headers,
-                    cookies=cookies,
-                    data=data,
-                    json=json,
-                    files=files,
-                    **request_kwargs,
-                )
+                async with self._rate_limit_slot():
+                    response = await self._get_session().request(
+                        method,
+                        path,
+                        params=params,
+                        headers=headers,
+                        cookies=cookies,
+                        data=data,
+                        json=json,
+                        files=files,
+                        **request_kwargs,
+                    )
                 status_code = response.status_code
                 span.set_attribute("http.status_code", status_code)
             if raise_retryable_status:
@@ -265,10 +273,11 @@ class BaseHttpClient:
                 send_kwargs: dict[str, Any] = {"stream": stream}
                 if follow_redirects is not None:
                     send_kwargs["follow_redirects"] = follow_redirects
-                response = await self._get_session().send(
-                    request,
-                    **send_kwargs,
-                )
+                async with self._rate_limit_slot():
+                    response = await self._get_session().send(
+                        request,
+                        **send_kwargs,
+                    )
                 status_code = response.status_code
                 span.set_attribute("http.status_code", status_code)
             if raise_retryable_status:
@@ -290,6 +299,11 @@ class BaseHttpClient:
         await response.aclose()
         raise RetryableHttpStatusError(response.status_code, retry_after)
 
+    def _rate_limit_slot(self) -> AbstractAsyncContextManager[None]:
+        if self._rate_limiter is None:
+            return nullcontext()
+        return self._rate_limiter.slot(self._host)
+
     def _get_session(self) -> httpx.AsyncClient:
         if self._session is None or self._session.is_closed:
             raise RuntimeError(f"{self.__class__.__name__} session is not initialized.")
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Protocol
 
+from app.infra.clients.http.rate_limit import RateLimiter
 from app.infra.retry import RetryPolicy
 
 DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
@@ -46,3 +47,8 @@ class WithMetrics(BaseHttpClientOption):
 class WithRetry(BaseHttpClientOption):
     policy: RetryPolicy
     status_codes: frozenset[int] = DEFAULT_RETRY_STATUSES
+
+
+@dataclass(frozen=True)
+class WithRateLimit(BaseHttpClientOption):
+    limiter: RateLimiter
@@ -0,0 +1,59 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class RateLimiter:
+    """Shared outbound budget: a global token bucket plus a per-host concurrency cap.
+
+    One instance is meant to be shared by every client that talks to the same
+    upstream (e.g. SSAU auth + data clients), so the budget holds across them.
+    Each HTTP attempt (including retries) takes one token.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: float,
+        burst: int,
+        max_concurrency_per_host: int,
+    ) -> None:
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive.")
+        self._rate = requests_per_second
+        self._capacity = float(max(burst, 1))
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self._max_concurrency_per_host = max(max_concurrency_per_host, 1)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        async with self._semaphore(host):
+            await self._take_token()
+            yield
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _take_token(self) -> None:
+        # Lock is held while sleeping: waiters are served in FIFO order and
+        # nobody can overtake a caller that is already waiting for a refill.
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
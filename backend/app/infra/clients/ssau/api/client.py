@@ -15,7 +15,13 @@ from app.domain.entities.lesson import Lesson
 from app.domain.value_objects.group_id import GroupId
 from app.domain.value_objects.year_id import YearId
 from app.infra.clients.http.client import BaseHttpClient
-from app.infra.clients.http.options import BaseHttpClientOption, WithMetrics, WithRetry
+from app.infra.clients.http.options import (
+    BaseHttpClientOption,
+    WithMetrics,
+    WithRateLimit,
+    WithRetry,
+)
+from app.infra.clients.http.rate_limit import RateLimiter
 from app.infra.clients.ssau.api.mapper import map_schedule
 from app.infra.clients.ssau.api.session_cache import AuthSessionCache
 from app.infra.clients.ssau.auth.client import ssau_default_headers
@@ -49,10 +55,13 @@ class SsauApiClient(BaseHttpClient, ISsauApiClient):
         auth_cache: AuthSessionCache,
         retry_policy: RetryPolicy,
         metrics_service: IMetricsService | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         options: list[BaseHttpClientOption] = [WithRetry(retry_policy)]
         if metrics_service is not None:
             options.append(WithMetrics(SsauHttpClientMetrics(metrics_service)))
+        if rate_limiter is not None:
+            options.append(WithRateLimit(rate_limiter))
         super().__init__(
             "ssau",
             settings.base_url,
@@ -1,5 +1,6 @@
 import asyncio
-from collections.abc import Awaitable, Callable
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -18,8 +19,20 @@ class AuthCacheEntry:
     expires_at: datetime
 
 
+@dataclass(frozen=True)
+class _Credentials:
+    password: str
+    login_func: LoginFunc
+
+
 class AuthSessionCache:
-    """In-memory SSAU auth-cookie cache with per-login refresh throttling."""
+    """In-memory SSAU auth-cookie cache with per-login refresh throttling.
+
+    Кроме ленивого входа умеет продлевать куки заранее (``refresh_expiring``):
+    логины, которыми пользовались за последние ``refresh_active_seconds``,
+    перелогиниваются за ``refresh_ahead_seconds`` до истечения, пока старая кука
+    ещё действует, — запросы пользователей на вход не ждут.
+    """
 
     def __init__(
         self,
@@ -29,9 +42,14 @@ class AuthSessionCache:
     ) -> None:
         self._settings = settings
         self._clock = clock
-        self._lock = asyncio.Lock()
+        # Вход сериализуется по логину: медленный вход одного пользователя
+        # (в том числе фоновое продление) не задерживает остальных.
+        self._locks: dict[str, asyncio.Lock] = {}
         self._entries: dict[str, AuthCacheEntry] = {}
         self._last_login_at: dict[str, datetime] = {}
+        self._last_used_at: dict[str, datetime] = {}
+        # Креды для фонового продления; живут только в памяти процесса.
+        self._credentials: dict[str, _Credentials] = {}
 
     async def get_or_refresh(
         self,
@@ -40,28 +58,96 @@ class AuthSessionCache:
         login_func: LoginFunc,
     ) -> str:
         now = self._clock.now()
+        self._last_used_at[login] = now
+        self._credentials[login] = _Credentials(password=password, login_func=login_func)
         entry = self._entries.get(login)
         if entry and entry.expires_at > now:
             return entry.auth_cookie
 
         await self._respect_rate_limit(login, now)
-        async with self._lock:
+        async with self._lock_for(login):
             entry = self._entries.get(login)
             if entry and entry.expires_at > self._clock.now():
                 return entry.auth_cookie
-
-            self._last_login_at[login] = self._clock.now()
-            cookie = await login_func(login, password)
-            expires_at = self._clock.now() + timedelta(seconds=self._settings.ttl_seconds)
-            self._entries[login] = AuthCacheEntry(
-                auth_cookie=cookie,
-                expires_at=expires_at,
-            )
-            return cookie
+            return await self._login(login, password, login_func)
 
     def invalidate(self, login: str) -> None:
         self._entries.pop(login, None)
 
+    async def refresh_expiring(self) -> int:
+        """Перелогинивает активные логины, чья кука скоро истечёт; сколько продлено.
+
+        Логины идут по очереди (раньше истекающие — первыми) с паузой
+        ``refresh_spacing_seconds``, чтобы не посылать в СНИУ пачку входов разом.
+        Неудачный вход убирает логин из продления до следующего запроса с ним.
+        """
+        refreshed = 0
+        for login in self._expiring_logins():
+            if refreshed:
+                await asyncio.sleep(self._settings.refresh_spacing_seconds)
+            credentials = self._credentials.get(login)
+            if credentials is None:
+                continue
+            await self._respect_rate_limit(login, self._clock.now())
+            async with self._lock_for(login):
+                entry = self._entries.get(login)
+                if entry is None or not self._is_expiring(entry, self._clock.now()):
+                    continue
+                try:
+                    await self._login(login, credentials.password, credentials.login_func)
+                except Exception:
+                    logger.warning("SSAU auth cookie refresh failed.", exc_info=True)
+                    self._credentials.pop(login, None)
+                    continue
+            refreshed += 1
+        return refreshed
+
+    def _expiring_logins(self) -> list[str]:
+        now = self._clock.now()
+        active_since = now - timedelta(seconds=self._settings.refresh_active_seconds)
+        expiring: list[tuple[datetime, str]] = []
+        idle: list[str] = []
+        for login, entry in self._entries.items():
+            last_used_at = self._last_used_at.get(login)
+            if last_used_at is None or last_used_at < active_since:
+                idle.append(login)
+                continue
+            if login in self._credentials and self._is_expiring(entry, now):
+                expiring.append((entry.expires_at, login))
+        for login in idle:
+            self._forget_idle(login, now)
+        return [login for _, login in sorted(expiring)]
+
+    def _forget_idle(self, login: str, now: datetime) -> None:
+        """Логином давно не пользовались: кука истечёт, креды и отметки забываем."""
+        self._credentials.pop(login, None)
+        self._last_used_at.pop(login, None)
+        self._last_login_at.pop(login, None)
+        entry = self._entries.get(login)
+        lock = self._locks.get(login)
+        if entry is not None and entry.expires_at <= now and not (lock and lock.locked()):
+            del self._entries[login]
+            self._locks.pop(login, None)
+
+    def _lock_for(self, login: str) -> asyncio.Lock:
+        lock = self._locks.get(login)
+        if lock is None:
+            lock = self._locks[login] = asyncio.Lock()
+        return lock
+
+    def _is_expiring(self, entry: AuthCacheEntry, now: datetime) -> bool:
+        return entry.expires_at - now <= timedelta(seconds=self._settings.refresh_ahead_seconds)
+
+    async def _login(self, login: str, password: str, login_func: LoginFunc) -> str:
+        self._last_login_at[login] = self._clock.now()
+        cookie = await login_func(login, password)
+        expires_at = self._clock.now() + timedelta(seconds=self._settings.ttl_seconds)
+        self._entries[login] = AuthCacheEntry(
+            auth_cookie=cookie,
+            expires_at=expires_at,
+        )
+        return cookie
+
     async def _respect_rate_limit(self, login: str, now: datetime) -> None:
         last_login = self._last_login_at.get(login)
         if last_login is None:
@@ -73,3 +159,33 @@ class AuthSessionCache:
         wait_for = (min_login_interval - elapsed).total_seconds()
         logger.info("SSAU login throttled for %.2fs", wait_for)
         await asyncio.sleep(wait_for)
+
+
+async def run_auth_session_refresher(
+    cache: AuthSessionCache,
+    interval_seconds: float,
+    enabled: bool = True,
+) -> AsyncIterator[None]:
+    """DI Resource: продлевает куки кэша в фоне, останавливается на shutdown."""
+    if not enabled:
+        yield None
+        return
+
+    async def _run() -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                refreshed = await cache.refresh_expiring()
+            except Exception:
+                logger.exception("SSAU auth cookie refresh pass failed.")
+                continue
+            if refreshed:
+                logger.info("SSAU auth cookies refreshed: %s", refreshed)
+
+    task = asyncio.create_task(_run())
+    try:
+        yield None
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
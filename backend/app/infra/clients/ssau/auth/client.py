@@ -3,7 +3,13 @@ import httpx
 from app.app_layer.interfaces.http.ssau.auth.interface import ISsauAuthClient
 from app.domain.entities.auth import AuthSession
 from app.infra.clients.http.client import BaseHttpClient
-from app.infra.clients.http.options import BaseHttpClientOption, WithMetrics, WithRetry
+from app.infra.clients.http.options import (
+    BaseHttpClientOption,
+    WithMetrics,
+    WithRateLimit,
+    WithRetry,
+)
+from app.infra.clients.http.rate_limit import RateLimiter
 from app.infra.clients.ssau.auth.scraper import NextJsLoginScraper
 from app.infra.clients.ssau.metrics import SsauHttpClientMetrics
 from app.infra.clients.ssau.settings import SSAUClientSettings
@@ -44,12 +50,15 @@ class SsauAuthClient(BaseHttpClient, ISsauAuthClient):
         retry_policy: RetryPolicy | None = None,
         scraper: NextJsLoginScraper | None = None,
         metrics_service: IMetricsService | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         options: list[BaseHttpClientOption] = []
         if metrics_service is not None:
             options.append(WithMetrics(SsauHttpClientMetrics(metrics_service)))
         if retry_policy is not None:
             options.append(WithRetry(retry_policy))
+        if rate_limiter is not None:
+            options.append(WithRateLimit(rate_limiter))
         super().__init__(
             "ssau-auth",
             settings.base_url,
@@ -11,3 +11,6 @@ class SSAUClientSettings:
 class AuthCacheSettings:
     ttl_seconds: int
     min_login_interval_seconds: int
+    refresh_ahead_seconds: int = 600
+    refresh_active_seconds: int = 21_600
+    refresh_spacing_seconds: float = 1.0
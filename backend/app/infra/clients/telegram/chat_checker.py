@@ -1,3 +1,6 @@
+import asyncio
+from collections.abc import Sequence
+
 from aiogram.exceptions import (
     TelegramBadRequest,
     TelegramForbiddenError,
@@ -9,6 +12,7 @@ from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheck
 from app.app_layer.interfaces.telegram.chat_checker.enums import TelegramChatCheckStatusEnum
 from app.app_layer.interfaces.telegram.chat_checker.interface import ITelegramChatChecker
 from app.infra.clients.telegram.interface import ITelegramBot
+from app.infra.clients.telegram.rate_limit import TelegramRateLimiter
 from app.infra.retry import RetryPolicy, retry_async
 from app.logging.config import get_logger
 
@@ -16,13 +20,44 @@ logger = get_logger(__name__)
 
 
 class TelegramChatChecker(ITelegramChatChecker):
-    def __init__(self, bot: ITelegramBot, retry_policy: RetryPolicy) -> None:
+    """``getChat`` с повторами. Каждая попытка берёт токен общего лимитера Bot API, а
+    ``RetryAfter`` ставит его на паузу — проверка делит бюджет с рассылками.
+    ``check_many`` раздаёт чаты пулу из ``max_concurrency`` воркеров.
+    """
+
+    def __init__(
+        self,
+        bot: ITelegramBot,
+        retry_policy: RetryPolicy,
+        rate_limiter: TelegramRateLimiter,
+        max_concurrency: int = 8,
+    ) -> None:
         self._bot = bot
         self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._max_concurrency = max(max_concurrency, 1)
+
+    async def check_many(self, chat_ids: Sequence[int]) -> list[TelegramChatCheckResultDTO]:
+        results: list[TelegramChatCheckResultDTO | None] = [None] * len(chat_ids)
+        queue = iter(enumerate(chat_ids))
+
+        async def _worker() -> None:
+            # Воркеры разбирают общий итератор: каждый чат достаётся одному.
+            for index, chat_id in queue:
+                results[index] = await self.check(chat_id)
+
+        workers = min(self._max_concurrency, len(chat_ids))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        return [result for result in results if result is not None]
 
     async def check(self, chat_id: int) -> TelegramChatCheckResultDTO:
         async def _operation() -> None:
-            await self._bot.get_chat(chat_id)
+            await self._rate_limiter.acquire()
+            try:
+                await self._bot.get_chat(chat_id)
+            except TelegramRetryAfter as exc:
+                self._rate_limiter.pause(exc.retry_after)
+                raise
 
         def _on_retry(exc: Exception, delay: float, attempt: int) -> None:
             logger.warning(
@@ -15,6 +15,10 @@ from app.domain.messages.info import InfoMessage
 from app.domain.messages.notification import NotificationMessage
 from app.domain.messages.plain import PlainMessage
 from app.domain.messages.schedule import ScheduleMessage
+from app.domain.messages.schedule_change import ScheduleChangeMessage
+from app.domain.services.schedule_diff import LessonChange
+
+_WEEKDAYS = ("Пн", "Вт", "Ср", "Чт", "Пт", "Сб", "Вс")
 
 
 def _make_link(text: str, url: str) -> Text:
@@ -27,6 +31,8 @@ class AiogramTelegramMessageRenderer(ITelegramMessageRenderer):
             return self._render_schedule(message)
         if isinstance(message, NotificationMessage):
             return self._render_notification(message)
+        if isinstance(message, ScheduleChangeMessage):
+            return self._render_schedule_change(message)
         if isinstance(message, InfoMessage):
             return self._render_info(message)
         if isinstance(message, ErrorMessage):
@@ -68,6 +74,22 @@ class AiogramTelegramMessageRenderer(ITelegramMessageRenderer):
         ]
         return self._as_rendered(Text(*parts))
 
+    def _render_schedule_change(self, message: ScheduleChangeMessage) -> RenderedTelegramMessageDTO:
+        parts: list[object] = [Bold(message.title)]
+        for week_number, changes in sorted(message.weeks.items()):
+            parts.extend(["\n\n", "Неделя: ", Code(str(week_number))])
+            sections: list[tuple[str, list[str]]] = [
+                ("Добавлены", [_lesson_slot(lesson) for lesson in changes.added]),
+                ("Отменены", [_lesson_slot(lesson) for lesson in changes.removed]),
+                ("Перенесены", [_moved_line(change) for change in changes.moved]),
+                ("Изменены", [_changed_line(change) for change in changes.changed]),
+            ]
+            for title, lines in sections:
+                if lines:
+                    parts.extend(["\n", Italic(title), "\n"])
+                    parts.extend(self._bulleted_lines(lines))
+        return self._as_rendered(Text(*parts))
+
     def _render_info(self, message: InfoMessage) -> RenderedTelegramMessageDTO:
         parts: list[object] = [Bold(message.title)]
         if message.lines:
@@ -127,6 +149,40 @@ class AiogramTelegramMessageRenderer(ITelegramMessageRenderer):
         return RenderedTelegramMessageDTO(text=payload["text"], entities=entities)
 
 
+def _lesson_slot(lesson: Lesson) -> str:
+    slot = f"{_WEEKDAYS[lesson.weekday - 1]} {lesson.time.format_range()}"
+    return f"{slot} — {lesson.subject} ({lesson.type})"
+
+
+def _moved_line(change: LessonChange) -> str:
+    before, after = change.before, change.after
+    return (
+        f"{after.subject} ({after.type}): "
+        f"{_WEEKDAYS[before.weekday - 1]} {before.time.format_range()} → "
+        f"{_WEEKDAYS[after.weekday - 1]} {after.time.format_range()}"
+    )
+
+
+def _changed_line(change: LessonChange) -> str:
+    before, after = change.before, change.after
+    details: list[str] = []
+    if before.subject != after.subject:
+        details.append(f"предмет: {before.subject} → {after.subject}")
+    if before.type != after.type:
+        details.append(f"тип: {before.type} → {after.type}")
+    if before.teacher != after.teacher:
+        details.append(f"преподаватель: {before.teacher or '—'} → {after.teacher or '—'}")
+    if before.is_online != after.is_online:
+        details.append("формат: " + ("онлайн" if after.is_online else "очно"))
+    if before.conference_url != after.conference_url:
+        details.append("ссылка на конференцию обновлена")
+    if before.subgroup != after.subgroup:
+        details.append(
+            f"подгруппа: {before.subgroup or 'вся группа'} → {after.subgroup or 'вся группа'}"
+        )
+    return f"{_lesson_slot(after)}: {', '.join(details)}"
+
+
 def _to_entity(entity: MessageEntity) -> TelegramEntityDTO:
     return TelegramEntityDTO(
         type=str(entity.type),
@@ -14,6 +14,7 @@ from app.app_layer.interfaces.telegram.sender.interface import (
 from app.domain.constants import TELEGRAM_MESSAGE_MAX_LENGTH
 from app.infra.clients.telegram.interface import ITelegramBot
 from app.infra.clients.telegram.message_splitter import split_message
+from app.infra.clients.telegram.rate_limit import TelegramRateLimiter
 from app.infra.retry import RetryPolicy, retry_async
 from app.logging.config import get_logger
 
@@ -21,9 +22,22 @@ logger = get_logger(__name__)
 
 
 class TelegramMessageSender(ITelegramMessageSender):
-    def __init__(self, bot: ITelegramBot, retry_policy: RetryPolicy) -> None:
+    """Отправка через ``ITelegramBot`` с учётом лимитов Bot API.
+
+    Каждый кусок сообщения проходит через ``TelegramRateLimiter``; на
+    ``TelegramRetryAfter`` лимитер ставится на паузу целиком (остальные отправки
+    тоже ждут), а кусок повторяется по ``retry_after``.
+    """
+
+    def __init__(
+        self,
+        bot: ITelegramBot,
+        retry_policy: RetryPolicy,
+        rate_limiter: TelegramRateLimiter | None = None,
+    ) -> None:
         self._bot = bot
         self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
 
     async def send(
         self,
@@ -32,7 +46,7 @@ class TelegramMessageSender(ITelegramMessageSender):
         *,
         reply_markup: TelegramReplyMarkupDTO | None = None,
     ) -> None:
-        chunks = split_message(message, limit=TELEGRAM_MESSAGE_MAX_LENGTH)
+        chunks = list(message.chunks) or split_message(message, limit=TELEGRAM_MESSAGE_MAX_LENGTH)
         aiogram_reply_markup = _to_aiogram_reply_markup(reply_markup)
         logger.info(
             "Telegram message prepared: chat_id=%s length=%s entities=%s chunks=%s",
@@ -60,7 +74,7 @@ class TelegramMessageSender(ITelegramMessageSender):
     ) -> None:
         entities = _to_aiogram_entities(chunk.entities)
 
-        async def _operation() -> None:
+        async def _send() -> None:
             await self._bot.send_message(
                 chat_id,
                 chunk.text,
@@ -68,6 +82,17 @@ class TelegramMessageSender(ITelegramMessageSender):
                 reply_markup=reply_markup,
             )
 
+        async def _operation() -> None:
+            if self._rate_limiter is None:
+                await _send()
+                return
+            async with self._rate_limiter.slot(chat_id):
+                try:
+                    await _send()
+                except TelegramRetryAfter as exc:
+                    self._rate_limiter.pause(exc.retry_after)
+                    raise
+
         def _on_retry(exc: Exception, delay: float, attempt: int) -> None:
             logger.warning(
                 "Telegram send retry %s in %.2fs (%s)",
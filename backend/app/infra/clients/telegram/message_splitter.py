@@ -1,94 +1,144 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from itertools import accumulate
+from operator import itemgetter
+
 from app.app_layer.interfaces.telegram.renderer.dto import (
     RenderedTelegramMessageDTO,
     TelegramEntityDTO,
 )
 from app.domain.constants import TELEGRAM_MESSAGE_MAX_LENGTH
 
+_SEPARATORS = ("\n\n", "\n", " ")
+
 
 def split_message(
     message: RenderedTelegramMessageDTO,
     *,
     limit: int = TELEGRAM_MESSAGE_MAX_LENGTH,
 ) -> list[RenderedTelegramMessageDTO]:
-    if message.length <= limit:
+    """Режет сообщение на куски не длиннее ``limit`` UTF-16 единиц.
+
+    Длина и смещения сущностей в Bot API считаются в UTF-16, поэтому символы вне
+    BMP (эмодзи) занимают две единицы и не разрываются. Предпочтительные места
+    разреза — ``\\n\\n``, ``\\n``, пробел, причём не внутри сущности; если такого
+    нет, кусок режется по лимиту. Границы сущностей индексируются один раз, куски
+    и их сущности собираются за один проход по тексту.
+    """
+    text = message.text
+    units = _utf16_prefix(text)
+    if units[-1] <= limit:
         return [message]
 
+    # Границы сущностей — в индексах символов; смещение внутри суррогатной пары
+    # сдвигается вперёд. Без символов вне BMP смещения совпадают с индексами.
+    if units[-1] == len(text):
+        bounds = [(entity.offset, entity.offset + entity.length) for entity in message.entities]
+    else:
+        bounds = [
+            (bisect_left(units, entity.offset), bisect_left(units, entity.offset + entity.length))
+            for entity in message.entities
+        ]
+    entities = sorted(
+        (
+            (entity_start, entity_end, entity)
+            for (entity_start, entity_end), entity in zip(bounds, message.entities, strict=True)
+        ),
+        key=itemgetter(0),
+    )
+    unsafe = _merge_intervals((start, end) for start, end, _ in entities)
+    unsafe_starts = [start for start, _ in unsafe]
+
     chunks: list[RenderedTelegramMessageDTO] = []
+    active: list[tuple[int, int, TelegramEntityDTO]] = []
+    pending = 0
     start = 0
-    text = message.text
-    entities = message.entities
-
     while start < len(text):
-        max_end = min(start + limit, len(text))
-        if max_end == len(text):
-            chunks.append(
-                RenderedTelegramMessageDTO(
-                    text=text[start:max_end],
-                    entities=_slice_entities(entities, start, max_end),
+        # Самый дальний индекс, при котором кусок укладывается в лимит (≥ 1 символ).
+        max_end = max(bisect_right(units, units[start] + limit) - 1, start + 1)
+        if max_end >= len(text):
+            end = len(text)
+        else:
+            end = _find_split_point(text, unsafe, unsafe_starts, start, max_end)
+
+        # Сущности входят в ``active`` по возрастанию начала и покидают его, когда
+        # кончаются: каждая просматривается только для кусков, которые задевает.
+        while pending < len(entities) and entities[pending][0] < end:
+            active.append(entities[pending])
+            pending += 1
+        active = [item for item in active if item[1] > start]
+        sliced: list[TelegramEntityDTO] = []
+        for entity_start, entity_end, entity in active:
+            if entity_start >= end:
+                continue
+            if start == 0 and entity_end <= end:
+                # Целиком в первом куске — смещения не меняются.
+                sliced.append(entity)
+                continue
+            slice_start = units[max(entity_start, start)]
+            sliced.append(
+                TelegramEntityDTO(
+                    type=entity.type,
+                    offset=slice_start - units[start],
+                    length=units[min(entity_end, end)] - slice_start,
+                    url=entity.url,
+                    language=entity.language,
                 )
             )
-            break
+        chunks.append(RenderedTelegramMessageDTO(text=text[start:end], entities=tuple(sliced)))
+        start = end
+    return chunks
 
-        split_at = _find_split_point(text, entities, start, max_end)
-        if split_at <= start:
-            split_at = max_end
 
-        chunks.append(
-            RenderedTelegramMessageDTO(
-                text=text[start:split_at],
-                entities=_slice_entities(entities, start, split_at),
-            )
-        )
-        start = split_at
+def _utf16_prefix(text: str) -> list[int]:
+    """``units[i]`` — длина ``text[:i]`` в UTF-16 единицах."""
+    if len(text.encode("utf-16-le")) == 2 * len(text):
+        return list(range(len(text) + 1))
+    return [0, *accumulate(2 if ord(char) >= 0x10000 else 1 for char in text)]
 
-    return chunks
+
+def _merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Сущности (по возрастанию начала) → непересекающиеся интервалы, внутри которых
+    резать нельзя."""
+    merged: list[tuple[int, int]] = []
+    for start, end in intervals:
+        if merged and start < merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
 
 
 def _find_split_point(
     text: str,
-    entities: tuple[TelegramEntityDTO, ...],
+    unsafe: list[tuple[int, int]],
+    unsafe_starts: list[int],
     start: int,
     max_end: int,
 ) -> int:
-    for separator in ("\n\n", "\n", " "):
-        idx = text.rfind(separator, start, max_end)
-        while idx != -1:
+    for separator in _SEPARATORS:
+        bound = max_end
+        while True:
+            idx = text.rfind(separator, start, bound)
+            if idx == -1:
+                break
             candidate = idx + len(separator)
-            if candidate > start and _is_boundary_safe(candidate, entities):
+            if candidate <= start:
+                break
+            interval = _containing(unsafe, unsafe_starts, candidate)
+            if interval is None:
                 return candidate
-            idx = text.rfind(separator, start, idx)
+            # Весь интервал сущности пропускаем разом: разделитель ищем левее него.
+            bound = interval[0]
     return max_end
 
 
-def _is_boundary_safe(position: int, entities: tuple[TelegramEntityDTO, ...]) -> bool:
-    for entity in entities:
-        start = entity.offset
-        end = entity.offset + entity.length
-        if start < position < end:
-            return False
-    return True
-
-
-def _slice_entities(
-    entities: tuple[TelegramEntityDTO, ...],
-    chunk_start: int,
-    chunk_end: int,
-) -> tuple[TelegramEntityDTO, ...]:
-    sliced: list[TelegramEntityDTO] = []
-    for entity in entities:
-        entity_start = entity.offset
-        entity_end = entity.offset + entity.length
-        if entity_end <= chunk_start or entity_start >= chunk_end:
-            continue
-        slice_start = max(entity_start, chunk_start)
-        slice_end = min(entity_end, chunk_end)
-        sliced.append(
-            TelegramEntityDTO(
-                type=entity.type,
-                offset=slice_start - chunk_start,
-                length=slice_end - slice_start,
-                url=entity.url,
-                language=entity.language,
-            )
-        )
-    return tuple(sliced)
+def _containing(
+    unsafe: list[tuple[int, int]],
+    unsafe_starts: list[int],
+    position: int,
+) -> tuple[int, int] | None:
+    idx = bisect_left(unsafe_starts, position) - 1
+    if idx >= 0 and position < unsafe[idx][1]:
+        return unsafe[idx]
+    return None
@@ -1,5 +1,17 @@
-from aiogram.exceptions import TelegramUnauthorizedError
+import asyncio
+from collections.abc import Sequence
 
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramNotFound,
+    TelegramUnauthorizedError,
+)
+
+from app.app_layer.interfaces.notifications.notifier.dto import (
+    NotifierDeliveryDTO,
+    NotifierDeliveryResultDTO,
+)
 from app.app_layer.interfaces.notifications.notifier.interface import INotifier
 from app.app_layer.interfaces.telegram.renderer.interface import ITelegramMessageRenderer
 from app.app_layer.interfaces.telegram.sender.interface import (
@@ -8,18 +20,29 @@ from app.app_layer.interfaces.telegram.sender.interface import (
 from app.domain.messages.base import TelegramMessage
 from app.infra.observability.metrics.interface import IMetricsService
 from app.infra.observability.telemetry.tracing import get_tracer
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+# Ошибки, после которых повтор той же доставки не поможет.
+_PERMANENT_ERRORS = (TelegramForbiddenError, TelegramNotFound, TelegramBadRequest)
 
 
 class TelegramNotifier(INotifier):
+    """Рендер + отправка. ``send_many`` раздаёт пачку ограниченному пулу
+    (``max_concurrency``); темп задаёт общий лимитер отправителя."""
+
     def __init__(
         self,
         renderer: ITelegramMessageRenderer,
         sender: ITelegramMessageSender,
         metrics: IMetricsService,
+        max_concurrency: int = 16,
     ) -> None:
         self._renderer = renderer
         self._sender = sender
         self._metrics = metrics
+        self._max_concurrency = max(max_concurrency, 1)
         self._tracer = get_tracer(__name__)
 
     async def send(self, chat_id: int, message: TelegramMessage) -> None:
@@ -35,3 +58,31 @@ class TelegramNotifier(INotifier):
         except Exception:
             self._metrics.observe_telegram_send("error")
             raise
+
+    async def send_many(
+        self,
+        deliveries: Sequence[NotifierDeliveryDTO],
+    ) -> list[NotifierDeliveryResultDTO]:
+        results: list[NotifierDeliveryResultDTO | None] = [None] * len(deliveries)
+        queue = iter(enumerate(deliveries))
+
+        async def _worker() -> None:
+            # Воркеры разбирают общий итератор: каждая доставка достаётся одному.
+            for index, delivery in queue:
+                try:
+                    await self.send(delivery.chat_id, delivery.message)
+                    results[index] = NotifierDeliveryResultDTO(
+                        chat_id=delivery.chat_id, delivered=True
+                    )
+                except Exception as exc:
+                    logger.warning("Telegram delivery to chat %s failed: %s", delivery.chat_id, exc)
+                    results[index] = NotifierDeliveryResultDTO(
+                        chat_id=delivery.chat_id,
+                        delivered=False,
+                        error=str(exc),
+                        retryable=not isinstance(exc, _PERMANENT_ERRORS),
+                    )
+
+        workers = min(self._max_concurrency, len(deliveries))
+        await asyncio.gather(*(_worker() for _ in range(workers)))
+        return [result for result in results if result is not None]
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+
+class TelegramRateLimiter:
+    """Лимиты Bot API на исходящие сообщения, общие на процесс.
+
+    - глобальный token bucket (``messages_per_second``, по умолчанию ~30/с);
+    - на чат: личный — не чаще ``private_chat_interval_seconds``, группа (``chat_id < 0``)
+      — не больше ``group_messages_per_minute`` (выдерживается как равный интервал);
+    - ``pause`` (по ``TelegramRetryAfter``) останавливает весь bucket, а не только
+      одну отправку: флуд-контроль Telegram касается всего бота.
+
+    Каждая отправка (в т.ч. кусок длинного сообщения и повтор) берёт один слот.
+    Служебные запросы без сообщения в чат (``getChat``) берут только глобальный
+    токен через ``acquire``.
+    """
+
+    _PRUNE_THRESHOLD = 10_000
+
+    def __init__(
+        self,
+        *,
+        messages_per_second: float,
+        private_chat_interval_seconds: float,
+        group_messages_per_minute: int,
+    ) -> None:
+        if messages_per_second <= 0:
+            raise ValueError("messages_per_second must be positive.")
+        self._rate = messages_per_second
+        self._capacity = max(messages_per_second, 1.0)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self._private_interval = private_chat_interval_seconds
+        self._group_interval = 60.0 / max(group_messages_per_minute, 1)
+        self._chat_locks: dict[int, asyncio.Lock] = {}
+        self._last_sent: dict[int, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, chat_id: int) -> AsyncIterator[None]:
+        lock = self._chat_locks.setdefault(chat_id, asyncio.Lock())
+        async with lock:
+            interval = self._group_interval if chat_id < 0 else self._private_interval
+            last = self._last_sent.get(chat_id)
+            if last is not None:
+                delay = last + interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await self._take_token()
+            try:
+                yield
+            finally:
+                self._last_sent[chat_id] = time.monotonic()
+        if len(self._last_sent) > self._PRUNE_THRESHOLD:
+            self._prune()
+
+    async def acquire(self) -> None:
+        await self._take_token()
+
+    def pause(self, seconds: float) -> None:
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def _take_token(self) -> None:
+        # Как и в HTTP-лимитере: lock держится во время сна — FIFO без обгонов.
+        async with self._lock:
+            while True:
+                paused_for = self._paused_until - time.monotonic()
+                if paused_for > 0:
+                    await asyncio.sleep(paused_for)
+                    continue
+                self._refill()
+                if self._tokens >= 1:
+                    break
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+    def _prune(self) -> None:
+        horizon = time.monotonic() - max(self._private_interval, self._group_interval)
+        for chat_id, sent_at in list(self._last_sent.items()):
+            lock = self._chat_locks.get(chat_id)
+            if sent_at < horizon and (lock is None or not lock.locked()):
+                del self._last_sent[chat_id]
+                self._chat_locks.pop(chat_id, None)
@@ -0,0 +1,58 @@
+import hashlib
+
+from app.app_layer.interfaces.telegram.renderer.dto import RenderedTelegramMessageDTO
+from app.app_layer.interfaces.telegram.renderer.interface import ITelegramMessageRenderer
+from app.domain.constants import TELEGRAM_MESSAGE_MAX_LENGTH
+from app.domain.messages.base import TelegramMessage
+from app.domain.messages.notification import NotificationMessage
+from app.domain.messages.schedule import ScheduleMessage
+from app.domain.messages.schedule_change import ScheduleChangeMessage
+from app.infra.cache.local.lru import LruTtlCache
+from app.infra.clients.telegram.message_splitter import split_message
+
+# Сообщения, которые одинаковы у всех участников группы/подгруппы.
+_CACHED_MESSAGE_TYPES: tuple[type[TelegramMessage], ...] = (
+    NotificationMessage,
+    ScheduleChangeMessage,
+    ScheduleMessage,
+)
+
+
+class CachingTelegramMessageRenderer(ITelegramMessageRenderer):
+    """Кэширует рендер групповых сообщений вместе с нарезкой на куски.
+
+    Ключ — хэш типа и JSON содержимого сообщения (дата, пары, заголовок): утренняя
+    волна одинаковых расписаний группы рендерится один раз. Персональные сообщения
+    (ошибки, справка, произвольный текст) идут мимо кэша.
+    """
+
+    def __init__(
+        self,
+        inner: ITelegramMessageRenderer,
+        cache: LruTtlCache[bytes, RenderedTelegramMessageDTO],
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    def render(self, message: TelegramMessage) -> RenderedTelegramMessageDTO:
+        if not isinstance(message, _CACHED_MESSAGE_TYPES):
+            return self._inner.render(message)
+        key = _cache_key(message)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        rendered = self._inner.render(message)
+        rendered = RenderedTelegramMessageDTO(
+            text=rendered.text,
+            entities=rendered.entities,
+            chunks=tuple(split_message(rendered, limit=TELEGRAM_MESSAGE_MAX_LENGTH)),
+        )
+        self._cache.set(key, rendered)
+        return rendered
+
+
+def _cache_key(message: TelegramMessage) -> bytes:
+    digest = hashlib.blake2b(type(message).__name__.encode(), digest_size=16)
+    digest.update(b"\0")
+    digest.update(message.model_dump_json().encode())
+    return digest.digest()
@@ -1,6 +1,8 @@
 from app.infra.db.models.account import AccountModel
 from app.infra.db.models.account_settings import AccountSettingsModel
+from app.infra.db.models.broadcast import AdminBroadcastModel
 from app.infra.db.models.notification_log import NotificationLogModel
+from app.infra.db.models.outbox import OutboxMessageModel
 from app.infra.db.models.ssau_identity import SsauIdentityModel
 from app.infra.db.models.ssau_profile import SsauProfileModel
 from app.infra.db.models.telegram_identity import TelegramIdentityModel
@@ -8,7 +10,9 @@ from app.infra.db.models.telegram_identity import TelegramIdentityModel
 __all__ = [
     "AccountModel",
     "AccountSettingsModel",
+    "AdminBroadcastModel",
     "NotificationLogModel",
+    "OutboxMessageModel",
     "SsauIdentityModel",
     "SsauProfileModel",
     "TelegramIdentityModel",
@@ -0,0 +1,17 @@
+from sqlalchemy import Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infra.db.base import BaseTable
+
+
+class AdminBroadcastModel(BaseTable):
+    """Админская рассылка; сами сообщения — строки ``telegram_outbox`` с её ``id``."""
+
+    __tablename__ = "admin_broadcasts"
+
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    total: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Итоговые счётчики; заполняются, когда у рассылки не осталось недоставленных,
+    # и переживают очистку её строк outbox.
+    sent: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    failed: Mapped[int | None] = mapped_column(Integer, nullable=True)
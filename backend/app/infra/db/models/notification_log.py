@@ -13,6 +13,9 @@ from sqlalchemy.orm import Mapped, mapped_column
 from app.infra.db.base import BaseTable
 
 
+# В PostgreSQL таблица секционирована по месяцам lesson_date (PK — id, lesson_date):
+# партиции ведут миграция 20261018_0003 и ensure_partitions. Модель описывает
+# логическую схему; в SQLite это обычная таблица.
 class NotificationLogModel(BaseTable):
     __tablename__ = "notification_log"
     __table_args__ = (
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, SmallInteger, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infra.db.base import BaseTable
+
+
+class OutboxMessageModel(BaseTable):
+    __tablename__ = "telegram_outbox"
+    __table_args__ = (
+        Index(
+            "ix_telegram_outbox_status_priority_available_at",
+            "status",
+            "priority",
+            "available_at",
+        ),
+        Index("ix_telegram_outbox_broadcast_id_status", "broadcast_id", "status"),
+    )
+
+    chat_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    message_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    priority: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+    broadcast_id: Mapped[int | None] = mapped_column(
+        BigInteger,
+        ForeignKey("admin_broadcasts.id", ondelete="CASCADE"),
+        nullable=True,
+    )
@@ -16,6 +16,22 @@ class IMetricsService(ABC):
     def observe_schedule_sync(self, status: str) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def observe_schedule_sync_run(
+        self,
+        *,
+        units: int,
+        fetched: int,
+        skipped: int,
+        failed: int,
+        duration: float,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def observe_outbox_dispatch(self, *, sent: int, retried: int, dead: int) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def observe_worker_error(self, loop: str) -> None:
         raise NotImplementedError
@@ -1,4 +1,4 @@
-from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
 
 from app.infra.observability.metrics.interface import IMetricsService
 
@@ -45,12 +45,30 @@ class MetricsService(IMetricsService):
             ["loop"],
             registry=reg,
         )
+        self._outbox_messages = Counter(
+            "telegram_outbox_messages_total",
+            "Telegram outbox delivery outcomes",
+            ["status"],
+            registry=reg,
+        )
         self._schedule_sync = Counter(
             "schedule_sync_total",
             "Schedule sync attempts",
             ["status"],
             registry=reg,
         )
+        self._schedule_sync_last_run = Gauge(
+            "schedule_sync_last_run",
+            "Stats of the last schedule sync run",
+            ["kind"],
+            registry=reg,
+        )
+        self._schedule_sync_run_duration = Histogram(
+            "schedule_sync_run_duration_seconds",
+            "Schedule sync run wall time",
+            buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800),
+            registry=reg,
+        )
 
     def observe_ssau_request(self, path: str, status: int, duration: float) -> None:
         self._ssau_requests.labels(path=path, status=str(status)).inc()
@@ -63,5 +81,25 @@ class MetricsService(IMetricsService):
     def observe_schedule_sync(self, status: str) -> None:
         self._schedule_sync.labels(status=status).inc()
 
+    def observe_schedule_sync_run(
+        self,
+        *,
+        units: int,
+        fetched: int,
+        skipped: int,
+        failed: int,
+        duration: float,
+    ) -> None:
+        self._schedule_sync_last_run.labels(kind="units").set(units)
+        self._schedule_sync_last_run.labels(kind="fetched").set(fetched)
+        self._schedule_sync_last_run.labels(kind="skipped").set(skipped)
+        self._schedule_sync_last_run.labels(kind="failed").set(failed)
+        self._schedule_sync_run_duration.observe(duration)
+
+    def observe_outbox_dispatch(self, *, sent: int, retried: int, dead: int) -> None:
+        self._outbox_messages.labels(status="sent").inc(sent)
+        self._outbox_messages.labels(status="retried").inc(retried)
+        self._outbox_messages.labels(status="dead").inc(dead)
+
     def observe_worker_error(self, loop: str) -> None:
         self._worker_errors.labels(loop=loop).inc()
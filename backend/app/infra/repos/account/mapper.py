@@ -1,3 +1,5 @@
+from functools import partial
+
 from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
 from app.app_layer.interfaces.security.password_cipher.interface import IPasswordCipher
 from app.domain.entities.account.account import AccountEntity
@@ -6,6 +8,7 @@ from app.domain.entities.account.ssau_identity import SsauIdentityEntity
 from app.domain.entities.account.ssau_profile import SsauProfileEntity
 from app.domain.entities.account.telegram_identity import TelegramIdentityEntity
 from app.domain.value_objects.group_id import GroupId
+from app.domain.value_objects.lazy_secret import LazySecret
 from app.domain.value_objects.subgroup import Subgroup
 from app.domain.value_objects.year_id import YearId
 from app.infra.db.models import (
@@ -51,7 +54,10 @@ def ssau_identity_to_entity(
         updated_at=model.updated_at,
         account_id=model.account_id,
         login=model.login,
-        password=cipher.decrypt(model.encrypted_password),
+        password=LazySecret(
+            partial(cipher.decrypt, model.encrypted_password),
+            ciphertext=model.encrypted_password,
+        ),
     )
 
 
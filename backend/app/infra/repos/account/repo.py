@@ -1,10 +1,15 @@
+import asyncio
+from collections.abc import AsyncIterator
 from typing import TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import Select, event, select
+from sqlalchemy.orm import Session
 
+from app.app_layer.interfaces.cache.account.interface import IAccountViewCache
 from app.app_layer.interfaces.repos.account.dto import (
     AccountSettingsCreateDTO,
     AccountSettingsUpdateDTO,
+    AccountSummaryDTO,
     AccountViewDTO,
     SsauIdentityCreateDTO,
     SsauIdentityUpdateDTO,
@@ -20,6 +25,7 @@ from app.domain.entities.account.account_settings import AccountSettingsEntity
 from app.domain.entities.account.ssau_identity import SsauIdentityEntity
 from app.domain.entities.account.ssau_profile import SsauProfileEntity
 from app.domain.entities.account.telegram_identity import TelegramIdentityEntity
+from app.domain.value_objects.subgroup import Subgroup
 from app.infra.db.models import (
     AccountModel,
     AccountSettingsModel,
@@ -38,108 +44,153 @@ from app.infra.repos.account.mapper import (
 from app.infra.repos.base import BaseSqlAlchemyRepository
 
 _ModelT = TypeVar("_ModelT")
+# Флаг в ``session.info``: транзакция писала в аккаунты, кэш view ей не годится.
+_VIEW_CACHE_BYPASS = "account_view_cache_bypass"
 
 
 class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
-    def __init__(self, password_cipher: IPasswordCipher) -> None:
+    """Аккаунты в БД; ``get_by_chat_id`` читает через кэш view (если передан).
+
+    Каждая запись инвалидирует view аккаунта дважды: сразу и после commit — между
+    ними параллельный читатель мог вернуть в кэш старую копию. Транзакция, которая
+    уже писала, читает view мимо кэша и не кладёт в него незакоммиченное.
+    """
+
+    def __init__(
+        self,
+        password_cipher: IPasswordCipher,
+        view_cache: IAccountViewCache | None = None,
+    ) -> None:
         self._cipher = password_cipher
+        self._view_cache = view_cache
+        self._background: set[asyncio.Task[None]] = set()
 
     # --- составное чтение ---
 
     async def get_by_chat_id(self, chat_id: int) -> AccountViewDTO | None:
-        telegram = await self._session.scalar(
-            select(TelegramIdentityModel).where(TelegramIdentityModel.telegram_chat_id == chat_id)
-        )
-        if telegram is None:
+        use_cache = self._view_cache is not None and not self._session.info.get(_VIEW_CACHE_BYPASS)
+        if use_cache:
+            assert self._view_cache is not None
+            cached = await self._view_cache.get(chat_id)
+            if cached is not None:
+                return cached
+        # Вызывается на каждую команду бота: весь view — одним запросом с JOIN.
+        row = (
+            await self._session.execute(
+                _view_select().where(TelegramIdentityModel.telegram_chat_id == chat_id)
+            )
+        ).first()
+        if row is None:
             return None
-        return await self._load_view(telegram.account_id, telegram=telegram)
+        account, telegram, settings, ssau_identity, ssau_profile = row
+        view = self._to_view(account, telegram, settings, ssau_identity, ssau_profile)
+        if use_cache:
+            assert self._view_cache is not None
+            await self._view_cache.set(view)
+        return view
 
-    async def list_notifiable(self) -> list[AccountViewDTO]:
-        stmt = (
-            select(
-                AccountModel,
-                TelegramIdentityModel,
-                AccountSettingsModel,
-                SsauIdentityModel,
-                SsauProfileModel,
-            )
-            .join(TelegramIdentityModel, TelegramIdentityModel.account_id == AccountModel.id)
-            .join(AccountSettingsModel, AccountSettingsModel.account_id == AccountModel.id)
-            .join(SsauIdentityModel, SsauIdentityModel.account_id == AccountModel.id)
-            .join(SsauProfileModel, SsauProfileModel.ssau_identity_id == SsauIdentityModel.id)
-            .where(AccountSettingsModel.schedule_notifications_enabled.is_(True))
-        )
-        rows = (await self._session.execute(stmt)).all()
-        return [
-            to_account_view(
-                account=account,
-                telegram=telegram,
-                settings=settings,
-                ssau_identity=ssau_identity,
-                ssau_profile=ssau_profile,
-                cipher=self._cipher,
+    async def iter_notifiable(self, batch_size: int) -> AsyncIterator[list[AccountViewDTO]]:
+        after_id: int | None = None
+        while True:
+            stmt = (
+                select(
+                    AccountModel,
+                    TelegramIdentityModel,
+                    AccountSettingsModel,
+                    SsauIdentityModel,
+                    SsauProfileModel,
+                )
+                .join(TelegramIdentityModel, TelegramIdentityModel.account_id == AccountModel.id)
+                .join(AccountSettingsModel, AccountSettingsModel.account_id == AccountModel.id)
+                .join(SsauIdentityModel, SsauIdentityModel.account_id == AccountModel.id)
+                .join(SsauProfileModel, SsauProfileModel.ssau_identity_id == SsauIdentityModel.id)
+                .where(AccountSettingsModel.schedule_notifications_enabled.is_(True))
+                .order_by(AccountModel.id)
+                .limit(batch_size)
             )
-            for account, telegram, settings, ssau_identity, ssau_profile in rows
-        ]
+            if after_id is not None:
+                stmt = stmt.where(AccountModel.id > after_id)
+            rows = (await self._session.execute(stmt)).all()
+            if not rows:
+                return
+            yield [
+                self._to_view(account, telegram, settings, ssau_identity, ssau_profile)
+                for account, telegram, settings, ssau_identity, ssau_profile in rows
+            ]
+            if len(rows) < batch_size:
+                return
+            after_id = rows[-1][0].id
 
-    async def list_all(self) -> list[AccountViewDTO]:
+    async def list_summaries_page(
+        self, after_id: int | None, limit: int
+    ) -> list[AccountSummaryDTO]:
+        # Только нужные колонки: ни ``encrypted_password``, ни целых ORM-объектов.
         stmt = (
             select(
-                AccountModel,
-                TelegramIdentityModel,
-                AccountSettingsModel,
-                SsauIdentityModel,
-                SsauProfileModel,
+                AccountModel.id,
+                TelegramIdentityModel.telegram_chat_id,
+                TelegramIdentityModel.telegram_display_name,
+                AccountModel.created_at,
+                AccountSettingsModel.schedule_notifications_enabled,
+                SsauIdentityModel.id,
+                SsauProfileModel.group_name,
+                SsauProfileModel.user_type,
+                SsauProfileModel.subgroup,
             )
             .join(TelegramIdentityModel, TelegramIdentityModel.account_id == AccountModel.id)
             .join(AccountSettingsModel, AccountSettingsModel.account_id == AccountModel.id)
             .outerjoin(SsauIdentityModel, SsauIdentityModel.account_id == AccountModel.id)
             .outerjoin(SsauProfileModel, SsauProfileModel.ssau_identity_id == SsauIdentityModel.id)
             .order_by(AccountModel.id)
+            .limit(limit)
         )
+        if after_id is not None:
+            stmt = stmt.where(AccountModel.id > after_id)
         rows = (await self._session.execute(stmt)).all()
         return [
-            to_account_view(
-                account=account,
-                telegram=telegram,
-                settings=settings,
-                ssau_identity=ssau_identity,
-                ssau_profile=ssau_profile,
-                cipher=self._cipher,
+            AccountSummaryDTO(
+                account_id=account_id,
+                chat_id=chat_id,
+                display_name=display_name,
+                created_at=created_at,
+                notifications_enabled=notifications_enabled,
+                is_authed=ssau_identity_id is not None,
+                group_name=group_name,
+                user_type=user_type,
+                subgroup=Subgroup.parse(subgroup) if subgroup is not None else None,
             )
-            for account, telegram, settings, ssau_identity, ssau_profile in rows
+            for (
+                account_id,
+                chat_id,
+                display_name,
+                created_at,
+                notifications_enabled,
+                ssau_identity_id,
+                group_name,
+                user_type,
+                subgroup,
+            ) in rows
         ]
 
-    async def _load_view(
+    async def iter_summaries(self, batch_size: int) -> AsyncIterator[list[AccountSummaryDTO]]:
+        after_id: int | None = None
+        while True:
+            page = await self.list_summaries_page(after_id, batch_size)
+            if not page:
+                return
+            yield page
+            if len(page) < batch_size:
+                return
+            after_id = page[-1].account_id
+
+    def _to_view(
         self,
-        account_id: int,
-        *,
-        telegram: TelegramIdentityModel | None = None,
+        account: AccountModel,
+        telegram: TelegramIdentityModel,
+        settings: AccountSettingsModel,
+        ssau_identity: SsauIdentityModel | None,
+        ssau_profile: SsauProfileModel | None,
     ) -> AccountViewDTO:
-        account = await self._session.get(AccountModel, account_id)
-        if account is None:
-            raise RuntimeError(f"Account {account_id} not found.")
-        if telegram is None:
-            telegram = await self._session.scalar(
-                select(TelegramIdentityModel).where(TelegramIdentityModel.account_id == account_id)
-            )
-        if telegram is None:
-            raise RuntimeError(f"Telegram identity for account {account_id} not found.")
-        settings = await self._session.scalar(
-            select(AccountSettingsModel).where(AccountSettingsModel.account_id == account_id)
-        )
-        if settings is None:
-            raise RuntimeError(f"Settings for account {account_id} not found.")
-        ssau_identity = await self._session.scalar(
-            select(SsauIdentityModel).where(SsauIdentityModel.account_id == account_id)
-        )
-        ssau_profile = None
-        if ssau_identity is not None:
-            ssau_profile = await self._session.scalar(
-                select(SsauProfileModel).where(
-                    SsauProfileModel.ssau_identity_id == ssau_identity.id
-                )
-            )
         return to_account_view(
             account=account,
             telegram=telegram,
@@ -171,6 +222,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_view(dto.chat_id)
         return telegram_to_entity(model)
 
     async def update_telegram_identity(
@@ -180,6 +232,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         model.telegram_display_name = dto.display_name
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_view(model.telegram_chat_id)
         return telegram_to_entity(model)
 
     # --- settings ---
@@ -192,6 +245,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_account(model.account_id)
         return settings_to_entity(model)
 
     async def update_settings(self, dto: AccountSettingsUpdateDTO) -> AccountSettingsEntity:
@@ -199,6 +253,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         model.schedule_notifications_enabled = dto.schedule_notifications_enabled
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_account(model.account_id)
         return settings_to_entity(model)
 
     # --- ssau identity ---
@@ -212,6 +267,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_account(model.account_id)
         return ssau_identity_to_entity(model, self._cipher)
 
     async def update_ssau_identity(self, dto: SsauIdentityUpdateDTO) -> SsauIdentityEntity:
@@ -220,6 +276,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         model.encrypted_password = self._cipher.encrypt(dto.password)
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_account(model.account_id)
         return ssau_identity_to_entity(model, self._cipher)
 
     async def delete_ssau_identity(self, account_id: int) -> None:
@@ -235,6 +292,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
             await self._session.delete(profile)
         await self._session.delete(identity)
         await self._session.flush()
+        await self._forget_account(account_id)
 
     # --- ssau profile ---
 
@@ -251,6 +309,7 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_ssau_identity(model.ssau_identity_id)
         return ssau_profile_to_entity(model)
 
     async def update_ssau_profile(self, dto: SsauProfileUpdateDTO) -> SsauProfileEntity:
@@ -263,10 +322,69 @@ class SqlAlchemyAccountRepository(BaseSqlAlchemyRepository, IAccountRepository):
         model.user_type = dto.user_type
         await self._session.flush()
         await self._session.refresh(model)
+        await self._forget_ssau_identity(model.ssau_identity_id)
         return ssau_profile_to_entity(model)
 
+    # --- инвалидация кэша view ---
+
+    async def _forget_account(self, account_id: int) -> None:
+        if self._view_cache is None:
+            return
+        chat_id = await self._session.scalar(
+            select(TelegramIdentityModel.telegram_chat_id).where(
+                TelegramIdentityModel.account_id == account_id
+            )
+        )
+        if chat_id is None:
+            self._session.info[_VIEW_CACHE_BYPASS] = True
+            return
+        await self._forget_view(chat_id)
+
+    async def _forget_ssau_identity(self, ssau_identity_id: int) -> None:
+        if self._view_cache is None:
+            return
+        identity = await self._require(SsauIdentityModel, ssau_identity_id)
+        await self._forget_account(identity.account_id)
+
+    async def _forget_view(self, chat_id: int) -> None:
+        view_cache = self._view_cache
+        if view_cache is None:
+            return
+        self._session.info[_VIEW_CACHE_BYPASS] = True
+        await view_cache.invalidate(chat_id)
+
+        def _after_commit(_: Session) -> None:
+            task = asyncio.get_running_loop().create_task(view_cache.invalidate(chat_id))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+        event.listen(self._session.sync_session, "after_commit", _after_commit, once=True)
+
     async def _require(self, model_type: type[_ModelT], pk: int) -> _ModelT:
         model = await self._session.get(model_type, pk)
         if model is None:
             raise RuntimeError(f"{model_type.__name__} {pk} not found.")
         return model
+
+
+def _view_select() -> Select[
+    AccountModel,
+    TelegramIdentityModel,
+    AccountSettingsModel,
+    SsauIdentityModel,
+    SsauProfileModel,
+]:
+    """Полный view аккаунта: SSAU-часть через LEFT JOIN (её может ещё не быть)."""
+    return (
+        select(
+            AccountModel,
+            TelegramIdentityModel,
+            AccountSettingsModel,
+            SsauIdentityModel,
+            SsauProfileModel,
+        )
+        .join(TelegramIdentityModel, TelegramIdentityModel.account_id == AccountModel.id)
+        .join(AccountSettingsModel, AccountSettingsModel.account_id == AccountModel.id)
+        .outerjoin(SsauIdentityModel, SsauIdentityModel.account_id == AccountModel.id)
+        .outerjoin(SsauProfileModel, SsauProfileModel.ssau_identity_id == SsauIdentityModel.id)
+    )
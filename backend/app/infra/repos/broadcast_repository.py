@@ -0,0 +1,84 @@
+from typing import cast
+
+from sqlalchemy import CursorResult, ScalarSelect, exists, func, select, update
+
+from app.app_layer.interfaces.repos.broadcast.dto import BroadcastDTO, BroadcastProgressDTO
+from app.app_layer.interfaces.repos.broadcast.interface import IBroadcastRepository
+from app.domain.value_objects.outbox_status import OutboxStatusEnum
+from app.infra.db.models import AdminBroadcastModel, OutboxMessageModel
+from app.infra.repos.base import BaseSqlAlchemyRepository
+
+
+class SqlAlchemyBroadcastRepository(BaseSqlAlchemyRepository, IBroadcastRepository):
+    async def create(self, text: str, total: int) -> BroadcastDTO:
+        model = AdminBroadcastModel(text=text, total=total)
+        self._session.add(model)
+        await self._session.flush()
+        return _to_dto(model)
+
+    async def get_progress(self, broadcast_id: int) -> BroadcastProgressDTO | None:
+        model = await self._session.get(AdminBroadcastModel, broadcast_id)
+        if model is None:
+            return None
+        if model.sent is not None:
+            # Рассылка завершена: её строки outbox могли уже удалить очисткой.
+            return BroadcastProgressDTO(
+                broadcast=_to_dto(model),
+                sent=model.sent,
+                failed=model.failed or 0,
+            )
+        # Счётчики — по индексу (broadcast_id, status), без чтения payload.
+        result = await self._session.execute(
+            select(OutboxMessageModel.status, func.count())
+            .where(OutboxMessageModel.broadcast_id == broadcast_id)
+            .group_by(OutboxMessageModel.status)
+        )
+        counts: dict[str, int] = {status: count for status, count in result.all()}
+        return BroadcastProgressDTO(
+            broadcast=_to_dto(model),
+            sent=counts.get(OutboxStatusEnum.SENT.value, 0),
+            failed=counts.get(OutboxStatusEnum.DEAD.value, 0),
+            pending=counts.get(OutboxStatusEnum.PENDING.value, 0)
+            + counts.get(OutboxStatusEnum.PROCESSING.value, 0),
+        )
+
+    async def finalize_finished(self) -> int:
+        active = exists().where(
+            OutboxMessageModel.broadcast_id == AdminBroadcastModel.id,
+            OutboxMessageModel.status.in_(
+                [OutboxStatusEnum.PENDING.value, OutboxStatusEnum.PROCESSING.value]
+            ),
+        )
+        result = cast(
+            CursorResult[tuple[()]],
+            await self._session.execute(
+                update(AdminBroadcastModel)
+                .where(AdminBroadcastModel.sent.is_(None), ~active)
+                .values(
+                    sent=_count_by_status(OutboxStatusEnum.SENT),
+                    failed=_count_by_status(OutboxStatusEnum.DEAD),
+                )
+            ),
+        )
+        return result.rowcount
+
+
+def _count_by_status(status: OutboxStatusEnum) -> ScalarSelect[int]:
+    """Число сообщений рассылки в статусе; коррелирует с обновляемой строкой рассылки."""
+    return (
+        select(func.count())
+        .where(
+            OutboxMessageModel.broadcast_id == AdminBroadcastModel.id,
+            OutboxMessageModel.status == status.value,
+        )
+        .scalar_subquery()
+    )
+
+
+def _to_dto(model: AdminBroadcastModel) -> BroadcastDTO:
+    return BroadcastDTO(
+        id=model.id,
+        text=model.text,
+        total=model.total,
+        created_at=model.created_at,
+    )
@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import Collection, Sequence
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.app_layer.interfaces.repos.notification_log.dto import (
+    NotificationLogKeyDTO,
+    NotificationLogPurgeResultDTO,
+)
+from app.app_layer.interfaces.repos.notification_log.interface import (
+    INotificationLogRepository,
+)
+from app.infra.repos.base import BaseSqlAlchemyRepository
+from app.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class CachedNotificationLogRepository(BaseSqlAlchemyRepository, INotificationLogRepository):
+    """In-process множество отправленных уведомлений по датам занятий поверх журнала.
+
+    Дата прогревается из ``notification_log`` одним запросом при первом обращении,
+    дальше ``filter_unsent`` отвечает из памяти. Отметки добавляются только после
+    commit транзакции, в которой они записаны: откат не оставит в кэше
+    «отправленного», которого нет в БД. Отметки других процессов кэш не видит, но
+    это безопасно: источник истины — ``uq_notification_once``, и повторная попытка
+    отсекается в ``mark_sent_many`` (ON CONFLICT DO NOTHING).
+    """
+
+    def __init__(self, inner: INotificationLogRepository) -> None:
+        self._inner = inner
+        self._sent: dict[date, set[NotificationLogKeyDTO]] = {}
+        self._warm_lock = asyncio.Lock()
+
+    async def filter_unsent(
+        self,
+        keys: Sequence[NotificationLogKeyDTO],
+    ) -> list[NotificationLogKeyDTO]:
+        if not keys:
+            return []
+        await self._warm({key.lesson_date for key in keys})
+        return [key for key in keys if key not in self._sent[key.lesson_date]]
+
+    async def find_sent_on(
+        self,
+        lesson_dates: Collection[date],
+    ) -> set[NotificationLogKeyDTO]:
+        return await self._inner.find_sent_on(lesson_dates)
+
+    async def mark_sent_many(
+        self,
+        keys: Sequence[NotificationLogKeyDTO],
+        sent_at: datetime,
+    ) -> set[NotificationLogKeyDTO]:
+        inserted = await self._inner.mark_sent_many(keys, sent_at)
+        # Конфликтные ключи тоже отправлены (раньше или другим процессом).
+        marked = list(keys)
+
+        def _remember(_: Session) -> None:
+            for key in marked:
+                day = self._sent.get(key.lesson_date)
+                # Непрогретую дату не трогаем: частичное множество выдало бы себя за полное.
+                if day is not None:
+                    day.add(key)
+
+        event.listen(self._session.sync_session, "after_commit", _remember, once=True)
+        return inserted
+
+    async def ensure_partitions(self, since: date, until: date) -> int:
+        return await self._inner.ensure_partitions(since, until)
+
+    async def purge_before(
+        self,
+        cutoff: date,
+        batch_size: int,
+    ) -> NotificationLogPurgeResultDTO:
+        result = await self._inner.purge_before(cutoff, batch_size)
+        for day in [day for day in self._sent if day < cutoff]:
+            del self._sent[day]
+        return result
+
+    async def _warm(self, lesson_dates: set[date]) -> None:
+        if lesson_dates <= self._sent.keys():
+            return
+        async with self._warm_lock:
+            missing = lesson_dates - self._sent.keys()
+            if not missing:
+                return
+            found = await self._inner.find_sent_on(missing)
+            for day in missing:
+                self._sent[day] = set()
+            for key in found:
+                self._sent[key.lesson_date].add(key)
+            # Планировщик смотрит только на сегодня и завтра: прошедшие дни не нужны.
+            horizon = min(lesson_dates) - timedelta(days=1)
+            for day in [day for day in self._sent if day < horizon]:
+                del self._sent[day]
+            logger.info(
+                "Sent-notification cache warmed: dates=%s entries=%s",
+                sorted(day.isoformat() for day in missing),
+                len(found),
+            )
@@ -1,7 +1,14 @@
+from collections.abc import Collection, Sequence
 from datetime import date, datetime
+from typing import cast
 
-from sqlalchemy import select
+from sqlalchemy import CursorResult, delete, select, text, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 
+from app.app_layer.interfaces.repos.notification_log.dto import (
+    NotificationLogKeyDTO,
+    NotificationLogPurgeResultDTO,
+)
 from app.app_layer.interfaces.repos.notification_log.interface import (
     INotificationLogRepository,
 )
@@ -9,39 +16,208 @@ from app.domain.value_objects.notification_type import NotificationTypeEnum
 from app.infra.db.models import NotificationLogModel
 from app.infra.repos.base import BaseSqlAlchemyRepository
 
+_UNIQUE_COLUMNS = ("account_id", "lesson_id", "lesson_date", "notification_type")
+# В PostgreSQL таблица секционирована по месяцам lesson_date (миграция 20261018_0003):
+# партиция notification_log_pYYYYMM хранит [1-е число месяца; 1-е число следующего).
+_PARTITION_PREFIX = "notification_log_p"
+# Ключей в одном запросе: драйверы ограничивают запрос 32767 параметрами (asyncpg,
+# SQLite), а на ключ уходит 4 (SELECT) или 6 (INSERT) параметров.
+_CHUNK_SIZE = 1000
+
 
 class SqlAlchemyNotificationLogRepository(BaseSqlAlchemyRepository, INotificationLogRepository):
-    async def was_sent(
+    async def filter_unsent(
         self,
-        account_id: int,
-        lesson_id: int,
-        lesson_date: date,
-        notification_type: NotificationTypeEnum,
-    ) -> bool:
-        result = await self._session.execute(
-            select(NotificationLogModel.id).where(
-                NotificationLogModel.account_id == account_id,
-                NotificationLogModel.lesson_id == lesson_id,
-                NotificationLogModel.lesson_date == lesson_date,
-                NotificationLogModel.notification_type == notification_type.value,
+        keys: Sequence[NotificationLogKeyDTO],
+    ) -> list[NotificationLogKeyDTO]:
+        if not keys:
+            return []
+        columns = (
+            NotificationLogModel.account_id,
+            NotificationLogModel.lesson_id,
+            NotificationLogModel.lesson_date,
+            NotificationLogModel.notification_type,
+        )
+        unique = list(dict.fromkeys(keys))
+        sent: set[NotificationLogKeyDTO] = set()
+        # Точный ключ (row value по uq_notification_once), а не произведение списков
+        # аккаунтов, дат и занятий: читаются только сами отметки.
+        for offset in range(0, len(unique), _CHUNK_SIZE):
+            result = await self._session.execute(
+                select(*columns).where(
+                    tuple_(*columns).in_(
+                        [
+                            (
+                                key.account_id,
+                                key.lesson_id,
+                                key.lesson_date,
+                                key.notification_type.value,
+                            )
+                            for key in unique[offset : offset + _CHUNK_SIZE]
+                        ]
+                    )
+                )
             )
+            sent.update(_to_key(*row) for row in result.all())
+        return [key for key in keys if key not in sent]
+
+    async def find_sent_on(
+        self,
+        lesson_dates: Collection[date],
+    ) -> set[NotificationLogKeyDTO]:
+        if not lesson_dates:
+            return set()
+        result = await self._session.execute(
+            select(
+                NotificationLogModel.account_id,
+                NotificationLogModel.lesson_id,
+                NotificationLogModel.lesson_date,
+                NotificationLogModel.notification_type,
+            ).where(NotificationLogModel.lesson_date.in_(set(lesson_dates)))
         )
-        return result.scalar_one_or_none() is not None
+        return {_to_key(*row) for row in result.all()}
 
-    async def mark_sent(
+    async def mark_sent_many(
         self,
-        account_id: int,
-        lesson_id: int,
-        lesson_date: date,
-        notification_type: NotificationTypeEnum,
+        keys: Sequence[NotificationLogKeyDTO],
         sent_at: datetime,
-    ) -> None:
-        model = NotificationLogModel(
-            account_id=account_id,
-            lesson_id=lesson_id,
-            lesson_date=lesson_date,
-            notification_type=notification_type.value,
-            sent_at=sent_at,
+    ) -> set[NotificationLogKeyDTO]:
+        if not keys:
+            return set()
+        rows = [
+            {
+                "account_id": key.account_id,
+                "lesson_id": key.lesson_id,
+                "lesson_date": key.lesson_date,
+                "notification_type": key.notification_type.value,
+                "sent_at": sent_at,
+                "created_at": sent_at,
+            }
+            for key in dict.fromkeys(keys)
+        ]
+        inserted: set[NotificationLogKeyDTO] = set()
+        for offset in range(0, len(rows), _CHUNK_SIZE):
+            statement = (
+                self._insert()
+                .values(rows[offset : offset + _CHUNK_SIZE])
+                .on_conflict_do_nothing(index_elements=list(_UNIQUE_COLUMNS))
+                .returning(
+                    NotificationLogModel.account_id,
+                    NotificationLogModel.lesson_id,
+                    NotificationLogModel.lesson_date,
+                    NotificationLogModel.notification_type,
+                )
+            )
+            result = await self._session.execute(statement)
+            inserted.update(_to_key(*row) for row in result.all())
+        return inserted
+
+    async def ensure_partitions(self, since: date, until: date) -> int:
+        if not await self._is_partitioned():
+            return 0
+        existing = set(await self._partition_names())
+        created = 0
+        month = _month_start(since)
+        while month <= until:
+            name = _partition_name(month)
+            if name not in existing:
+                # Имя и границы строятся из дат, а не из ввода: подстановка безопасна.
+                await self._session.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF notification_log "
+                        f"FOR VALUES FROM ('{month.isoformat()}') "
+                        f"TO ('{_next_month(month).isoformat()}')"
+                    )
+                )
+                created += 1
+            month = _next_month(month)
+        return created
+
+    async def purge_before(
+        self,
+        cutoff: date,
+        batch_size: int,
+    ) -> NotificationLogPurgeResultDTO:
+        if await self._is_partitioned():
+            # Партиция уходит, только когда весь её месяц старше отсечки: DROP вместо
+            # DELETE не оставляет мёртвых строк и не раздувает индексы.
+            dropped = 0
+            for name in await self._partition_names():
+                month = _partition_month(name)
+                if month is not None and _next_month(month) <= cutoff:
+                    await self._session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+                    dropped += 1
+            return NotificationLogPurgeResultDTO(dropped_partitions=dropped)
+
+        expired_ids = (
+            select(NotificationLogModel.id)
+            .where(NotificationLogModel.lesson_date < cutoff)
+            .order_by(NotificationLogModel.id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = cast(
+            CursorResult[tuple[()]],
+            await self._session.execute(
+                delete(NotificationLogModel).where(NotificationLogModel.id.in_(expired_ids))
+            ),
+        )
+        deleted = result.rowcount
+        return NotificationLogPurgeResultDTO(deleted_rows=deleted, done=deleted < batch_size)
+
+    async def _is_partitioned(self) -> bool:
+        if self._session.get_bind().dialect.name != "postgresql":
+            return False
+        result = await self._session.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass('notification_log')")
         )
-        self._session.add(model)
-        await self._session.flush()
+        return result.scalar_one_or_none() == "p"
+
+    async def _partition_names(self) -> list[str]:
+        result = await self._session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'notification_log'::regclass"
+            )
+        )
+        return sorted(result.scalars().all())
+
+    def _insert(self) -> postgresql.Insert | sqlite.Insert:
+        # ON CONFLICT есть в обоих диалектах, но конструкция у каждого своя.
+        if self._session.get_bind().dialect.name == "sqlite":
+            return sqlite.insert(NotificationLogModel)
+        return postgresql.insert(NotificationLogModel)
+
+
+def _to_key(
+    account_id: int,
+    lesson_id: int,
+    lesson_date: date,
+    notification_type: str,
+) -> NotificationLogKeyDTO:
+    return NotificationLogKeyDTO(
+        account_id=account_id,
+        lesson_id=lesson_id,
+        lesson_date=lesson_date,
+        notification_type=NotificationTypeEnum(notification_type),
+    )
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _partition_name(month: date) -> str:
+    return f"{_PARTITION_PREFIX}{month:%Y%m}"
+
+
+def _partition_month(name: str) -> date | None:
+    suffix = name.removeprefix(_PARTITION_PREFIX)
+    if suffix == name or len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
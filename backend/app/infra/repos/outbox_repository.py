@@ -0,0 +1,178 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import CursorResult, and_, delete, func, insert, or_, select, update
+
+from app.app_layer.interfaces.repos.outbox.dto import (
+    OutboxEnqueueDTO,
+    OutboxFailureDTO,
+    OutboxMessageDTO,
+)
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
+from app.domain.messages.base import TelegramMessage
+from app.domain.messages.error import ErrorMessage
+from app.domain.messages.info import InfoMessage
+from app.domain.messages.notification import NotificationMessage
+from app.domain.messages.plain import PlainMessage
+from app.domain.messages.schedule import ScheduleMessage
+from app.domain.messages.schedule_change import ScheduleChangeMessage
+from app.domain.value_objects.outbox_status import OutboxStatusEnum
+from app.infra.db.models import AdminBroadcastModel, OutboxMessageModel
+from app.infra.repos.base import BaseSqlAlchemyRepository
+
+# Сообщение хранится как JSON своей модели; тип восстанавливается по имени класса.
+_MESSAGE_TYPES: dict[str, type[TelegramMessage]] = {
+    message_type.__name__: message_type
+    for message_type in (
+        ErrorMessage,
+        InfoMessage,
+        NotificationMessage,
+        PlainMessage,
+        ScheduleMessage,
+        ScheduleChangeMessage,
+    )
+}
+_ERROR_MAX_LENGTH = 512
+
+
+class SqlAlchemyOutboxRepository(BaseSqlAlchemyRepository, IOutboxRepository):
+    async def enqueue(
+        self,
+        messages: Sequence[OutboxEnqueueDTO],
+        available_at: datetime,
+    ) -> None:
+        if not messages:
+            return
+        rows: list[dict[str, object]] = []
+        for item in messages:
+            message_type = type(item.message).__name__
+            if message_type not in _MESSAGE_TYPES:
+                raise ValueError(f"Message type {message_type} cannot be queued.")
+            rows.append(
+                {
+                    "chat_id": item.chat_id,
+                    "message_type": message_type,
+                    "payload": item.message.model_dump_json(),
+                    "status": OutboxStatusEnum.PENDING.value,
+                    "attempts": 0,
+                    "available_at": available_at,
+                    "priority": int(item.priority),
+                    "broadcast_id": item.broadcast_id,
+                }
+            )
+        # executemany одним INSERT: рассылка на всю базу — тысячи строк.
+        await self._session.execute(insert(OutboxMessageModel), rows)
+
+    async def claim(
+        self,
+        now: datetime,
+        limit: int,
+        locked_until: datetime,
+    ) -> list[OutboxMessageDTO]:
+        # SKIP LOCKED: несколько потребителей (и процессов) разбирают очередь, не
+        # блокируя друг друга; SQLite FOR UPDATE просто опускает.
+        result = await self._session.execute(
+            select(OutboxMessageModel)
+            .where(
+                or_(
+                    and_(
+                        OutboxMessageModel.status == OutboxStatusEnum.PENDING.value,
+                        OutboxMessageModel.available_at <= now,
+                    ),
+                    and_(
+                        OutboxMessageModel.status == OutboxStatusEnum.PROCESSING.value,
+                        OutboxMessageModel.locked_until <= now,
+                    ),
+                )
+            )
+            .order_by(
+                OutboxMessageModel.priority,
+                OutboxMessageModel.available_at,
+                OutboxMessageModel.id,
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed: list[OutboxMessageDTO] = []
+        for model in result.scalars().all():
+            message_type = _MESSAGE_TYPES.get(model.message_type)
+            if message_type is None:
+                model.status = OutboxStatusEnum.DEAD.value
+                model.last_error = f"Unknown message type {model.message_type}."
+                continue
+            model.status = OutboxStatusEnum.PROCESSING.value
+            model.locked_until = locked_until
+            model.attempts += 1
+            claimed.append(
+                OutboxMessageDTO(
+                    id=model.id,
+                    chat_id=model.chat_id,
+                    message=message_type.model_validate_json(model.payload),
+                    attempts=model.attempts,
+                )
+            )
+        await self._session.flush()
+        return claimed
+
+    async def mark_sent(self, ids: Sequence[int], sent_at: datetime) -> None:
+        if not ids:
+            return
+        await self._session.execute(
+            update(OutboxMessageModel)
+            .where(OutboxMessageModel.id.in_(ids))
+            .values(
+                status=OutboxStatusEnum.SENT.value,
+                sent_at=sent_at,
+                locked_until=None,
+                last_error=None,
+            )
+        )
+
+    async def mark_failed(self, failures: Sequence[OutboxFailureDTO]) -> None:
+        # Ошибки редки, и у каждой своё время повтора: обновляем построчно.
+        for failure in failures:
+            values: dict[str, object] = {
+                "locked_until": None,
+                "last_error": failure.error[:_ERROR_MAX_LENGTH],
+            }
+            if failure.retry_at is None:
+                values["status"] = OutboxStatusEnum.DEAD.value
+            else:
+                values["status"] = OutboxStatusEnum.PENDING.value
+                values["available_at"] = failure.retry_at
+            await self._session.execute(
+                update(OutboxMessageModel)
+                .where(OutboxMessageModel.id == failure.id)
+                .values(**values)
+            )
+
+    async def purge_finished_before(self, cutoff: datetime, batch_size: int) -> int:
+        # Строки рассылки удаляются только после того, как её итог записан в
+        # admin_broadcasts: иначе прогресс рассылки было бы не из чего посчитать.
+        finalized_broadcasts = select(AdminBroadcastModel.id).where(
+            AdminBroadcastModel.sent.is_not(None)
+        )
+        expired_ids = (
+            select(OutboxMessageModel.id)
+            .where(
+                OutboxMessageModel.status.in_(
+                    [OutboxStatusEnum.SENT.value, OutboxStatusEnum.DEAD.value]
+                ),
+                func.coalesce(OutboxMessageModel.sent_at, OutboxMessageModel.available_at) < cutoff,
+                or_(
+                    OutboxMessageModel.broadcast_id.is_(None),
+                    OutboxMessageModel.broadcast_id.in_(finalized_broadcasts),
+                ),
+            )
+            .order_by(OutboxMessageModel.id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = cast(
+            CursorResult[tuple[()]],
+            await self._session.execute(
+                delete(OutboxMessageModel).where(OutboxMessageModel.id.in_(expired_ids))
+            ),
+        )
+        return result.rowcount
@@ -8,6 +8,24 @@ class SSAUAuthSettings(BaseModel):
 
     cookie_ttl_seconds: int = 7_200
     min_login_interval_seconds: int = 10
+    # Фоновое продление куки: раз в ``refresh_interval_seconds`` логины, которыми
+    # пользовались за ``refresh_active_seconds``, перелогиниваются за
+    # ``refresh_ahead_seconds`` до истечения, по одному через ``refresh_spacing_seconds``.
+    refresh_enabled: bool = True
+    refresh_interval_seconds: float = 30.0
+    refresh_ahead_seconds: int = 600
+    refresh_active_seconds: int = 21_600
+    refresh_spacing_seconds: float = 1.0
+
+
+class SSAURateLimitSettings(BaseModel):
+    """Общий бюджет запросов в СНИУ для всех SSAU-клиентов процесса."""
+
+    model_config = ConfigDict(frozen=True)
+
+    requests_per_second: float = 5.0
+    burst: int = 5
+    max_concurrency_per_host: int = 4
 
 
 class SSAUSettings(BaseModel):
@@ -16,3 +34,4 @@ class SSAUSettings(BaseModel):
     base_url: str = "https://lk.ssau.ru"
     auth: SSAUAuthSettings = Field(default_factory=SSAUAuthSettings)
     retry: RetrySettings = Field(default_factory=RetrySettings)
+    rate_limit: SSAURateLimitSettings = Field(default_factory=SSAURateLimitSettings)
@@ -3,6 +3,24 @@ from pydantic import BaseModel, ConfigDict, Field, SecretStr
 from app.settings.retry import RetrySettings
 
 
+class TelegramDeliverySettings(BaseModel):
+    """Лимиты исходящих сообщений (Bot API: ~30/с на бота, 1/с в чат, 20/мин в группу)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    messages_per_second: float = 30.0
+    private_chat_interval_seconds: float = 1.0
+    group_messages_per_minute: int = 20
+    # Сколько сообщений пачки отправляется параллельно.
+    max_concurrency: int = 16
+    # Сколько чатов админская проверка (getChat) проверяет параллельно; темп — общий bucket.
+    chat_check_max_concurrency: int = 8
+    # Кэш отрендеренных групповых сообщений (расписание, напоминания, изменения):
+    # участники группы получают одинаковый текст. ``0`` отключает кэш.
+    render_cache_max_entries: int = 1024
+    render_cache_ttl_seconds: float = 900.0
+
+
 class TelegramSettings(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -12,3 +30,4 @@ class TelegramSettings(BaseModel):
     # Страница авторизации фронта — бот шлёт сюда ссылку из /auth (?token=…).
     frontend_auth_url: str = "http://localhost:5173/auth"
     retry: RetrySettings = Field(default_factory=RetrySettings)
+    delivery: TelegramDeliverySettings = Field(default_factory=TelegramDeliverySettings)
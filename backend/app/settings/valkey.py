@@ -15,3 +15,28 @@ class ValkeySettings(BaseModel):
     socket_connect_timeout_seconds: float = 5.0
     health_check_interval_seconds: int = 30
     retries: int = 3
+
+    # Жёсткий TTL недели в кэше. Мягкий — интервал воркера синка: после него запись
+    # отдаётся сразу, а обновление идёт в фоне (stale-while-revalidate).
+    schedule_hard_ttl_seconds: int = 172_800
+    # Семестровое расписание группы (собирается из полученных недель).
+    schedule_semester_ttl_seconds: int = 15_552_000
+
+    # Локальный (in-process) уровень кэша расписания перед Valkey; 0 — выключен.
+    local_cache_max_entries: int = 512
+    local_cache_ttl_seconds: float = 300.0
+
+    # Кэш view аккаунта для обработчиков бота: запись в Valkey и локальный уровень
+    # перед ним. Инвалидируется записью аккаунта; TTL — страховка.
+    account_view_cache_enabled: bool = True
+    account_view_ttl_seconds: int = 3600
+    account_view_local_max_entries: int = 4096
+    account_view_local_ttl_seconds: float = 60.0
+
+    # Сколько хранится состояние фоновой проверки Telegram-чатов (админский API).
+    telegram_chats_check_ttl_seconds: int = 86_400
+
+    # Межпроцессная блокировка фетча расписания (одна пара группа/неделя — один запрос).
+    schedule_lock_enabled: bool = True
+    schedule_lock_ttl_seconds: int = 30
+    schedule_lock_poll_interval_seconds: float = 0.2
@@ -5,5 +5,31 @@ class WorkerSettings(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     schedule_fetch_interval_hours: int = 12
-    notification_poll_interval_seconds: int = 60
+    # Как часто пересчитывать таймер уведомлений (смена настроек, новый день);
+    # после синка расписания он пересчитывается сразу.
+    notification_refresh_interval_seconds: int = 300
+    # Сколько пар (группа, неделя) синкается параллельно за один прогон.
+    schedule_sync_concurrency: int = 8
+    # Сколько следующих недель воркер подтягивает заранее (0 — только текущая).
+    schedule_prefetch_weeks: int = 1
+    # Размер пачки, которой воркеры читают аккаунты из БД (keyset по account_id).
+    account_batch_size: int = 500
+    # Потребитель outbox: пауза при пустой очереди, размер пачки, аренда захвата
+    # (после неё неподтверждённое сообщение снова доступно) и политика повторов.
+    outbox_poll_interval_seconds: float = 1.0
+    outbox_batch_size: int = 100
+    outbox_lease_seconds: int = 120
+    outbox_max_attempts: int = 5
+    outbox_retry_base_seconds: int = 10
+    outbox_retry_max_seconds: int = 900
+    # Обслуживание notification_log: раз в сутки создаются партиции вперёд и
+    # удаляются записи старше retention (в PostgreSQL — целыми партициями).
+    notification_log_retention_days: int = 30
+    notification_log_purge_batch_size: int = 5000
+    notification_log_maintenance_interval_hours: int = 24
+    # Доставленные и мёртвые сообщения outbox удаляются через retention; строки
+    # незавершённых рассылок остаются, пока рассылка не дойдёт до конца.
+    outbox_retention_days: int = 7
+    outbox_purge_batch_size: int = 5000
+    outbox_purge_interval_hours: int = 24
     metrics_port: int = 3102
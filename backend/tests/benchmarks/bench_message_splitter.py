@@ -0,0 +1,121 @@
+"""Сравнение нарезки сообщения с прежним алгоритмом (перебор сущностей на каждый кандидат).
+
+Не собирается pytest-ом (имя не ``test_*``). Запуск из ``backend/``:
+
+    poetry run python -m tests.benchmarks.bench_message_splitter
+"""
+
+import timeit
+from functools import partial
+
+from app.app_layer.interfaces.telegram.renderer.dto import (
+    RenderedTelegramMessageDTO,
+    TelegramEntityDTO,
+)
+from app.infra.clients.telegram.message_splitter import split_message
+
+_LIMIT = 4096
+
+
+def _build_message(lines_count: int = 3_000, separator: str = "\n") -> RenderedTelegramMessageDTO:
+    """Расписание/рассылка: у каждой строки жирный заголовок и ссылка.
+
+    С ``separator=" "`` строки сливаются в один абзац, и почти каждый пробел
+    оказывается внутри ссылки — худший случай для поиска места разреза.
+    """
+    parts: list[str] = []
+    entities: list[TelegramEntityDTO] = []
+    offset = 0
+    for index in range(lines_count):
+        title = f"Пара {index}"
+        link = "Открыть конференцию по предмету"
+        line = f"{title} — {link}{separator}"
+        entities.append(TelegramEntityDTO(type="bold", offset=offset, length=len(title)))
+        entities.append(
+            TelegramEntityDTO(
+                type="text_link",
+                offset=offset + len(title) + 3,
+                length=len(link),
+                url=f"https://example.com/{index}",
+            )
+        )
+        parts.append(line)
+        offset += len(line)
+    return RenderedTelegramMessageDTO(text="".join(parts), entities=tuple(entities))
+
+
+def _legacy_split(message: RenderedTelegramMessageDTO) -> list[RenderedTelegramMessageDTO]:
+    text, entities = message.text, message.entities
+    if len(text) <= _LIMIT:
+        return [message]
+
+    def is_safe(position: int) -> bool:
+        return all(
+            not (entity.offset < position < entity.offset + entity.length) for entity in entities
+        )
+
+    def find_split(start: int, max_end: int) -> int:
+        for separator in ("\n\n", "\n", " "):
+            idx = text.rfind(separator, start, max_end)
+            while idx != -1:
+                candidate = idx + len(separator)
+                if candidate > start and is_safe(candidate):
+                    return candidate
+                idx = text.rfind(separator, start, idx)
+        return max_end
+
+    def slice_entities(chunk_start: int, chunk_end: int) -> tuple[TelegramEntityDTO, ...]:
+        sliced: list[TelegramEntityDTO] = []
+        for entity in entities:
+            entity_end = entity.offset + entity.length
+            if entity_end <= chunk_start or entity.offset >= chunk_end:
+                continue
+            slice_start, slice_end = max(entity.offset, chunk_start), min(entity_end, chunk_end)
+            sliced.append(
+                TelegramEntityDTO(
+                    type=entity.type,
+                    offset=slice_start - chunk_start,
+                    length=slice_end - slice_start,
+                    url=entity.url,
+                    language=entity.language,
+                )
+            )
+        return tuple(sliced)
+
+    chunks: list[RenderedTelegramMessageDTO] = []
+    start = 0
+    while start < len(text):
+        max_end = min(start + _LIMIT, len(text))
+        end = max_end if max_end == len(text) else find_split(start, max_end)
+        if end <= start:
+            end = max_end
+        chunks.append(
+            RenderedTelegramMessageDTO(text=text[start:end], entities=slice_entities(start, end))
+        )
+        start = end
+    return chunks
+
+
+def main(number: int = 5) -> None:
+    # Прежний алгоритм квадратичен по длине: время растёт как куски x сущности.
+    for lines_count in (1_000, 10_000):
+        for separator in ("\n", " "):
+            message = _build_message(lines_count, separator)
+            current = split_message(message, limit=_LIMIT)
+            assert current == _legacy_split(message)
+
+            legacy_time = timeit.timeit(partial(_legacy_split, message), number=number)
+            current_time = timeit.timeit(
+                partial(split_message, message, limit=_LIMIT), number=number
+            )
+            print(
+                f"separator={separator!r} length={message.length} "
+                f"entities={len(message.entities)} chunks={len(current)}: "
+                f"legacy={legacy_time / number * 1e3:.2f}ms "
+                f"indexed={current_time / number * 1e3:.2f}ms "
+                f"(x{legacy_time / current_time:.1f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
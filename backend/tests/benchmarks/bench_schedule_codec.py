@@ -0,0 +1,56 @@
+"""Сравнение компактного кодека недели с pydantic JSON.
+
+Не собирается pytest-ом (имя не ``test_*``). Запуск из ``backend/``:
+
+    poetry run python -m tests.benchmarks.bench_schedule_codec
+"""
+
+import timeit
+from datetime import UTC, datetime, time
+
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
+from app.domain.entities.lesson import Lesson
+from app.domain.value_objects.lesson_time import LessonTime
+from app.infra.cache.valkey.schedule_codec import decode_cached_week, encode_cached_week
+
+_SUBJECTS = ["Математический анализ", "Физика", "Программирование", "Английский язык"]
+_TEACHERS = ["Иванов И.И.", "Петров П.П.", "Сидорова А.А."]
+
+
+def _build_week(lessons_count: int = 40) -> CachedWeekDTO:
+    lessons = [
+        Lesson(
+            id=100_000 + index,
+            type="Лекция" if index % 2 else "Практика",
+            subject=_SUBJECTS[index % len(_SUBJECTS)],
+            teacher=_TEACHERS[index % len(_TEACHERS)],
+            weekday=index % 6 + 1,
+            week_numbers=list(range(1 + index % 2, 18, 2)),
+            time=LessonTime(start=time(8 + index % 6, 0), end=time(9 + index % 6, 35)),
+            is_online=index % 5 == 0,
+            conference_url=None,
+            subgroup=index % 3 or None,
+        )
+        for index in range(lessons_count)
+    ]
+    return CachedWeekDTO(fetched_at=datetime.now(UTC), lessons=lessons)
+
+
+def main(number: int = 2_000) -> None:
+    week = _build_week()
+    as_json = week.model_dump_json().encode()
+    as_binary = encode_cached_week(week)
+
+    json_decode = timeit.timeit(lambda: CachedWeekDTO.model_validate_json(as_json), number=number)
+    binary_decode = timeit.timeit(lambda: decode_cached_week(as_binary), number=number)
+
+    print(f"size   json={len(as_json)}B binary={len(as_binary)}B")
+    print(
+        f"decode json={json_decode / number * 1e6:.1f}us "
+        f"binary={binary_decode / number * 1e6:.1f}us "
+        f"(x{json_decode / binary_decode:.1f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
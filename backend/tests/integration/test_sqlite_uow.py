@@ -1,25 +1,67 @@
-from datetime import date
+import asyncio
+from collections.abc import Collection, Sequence
+from datetime import UTC, date, datetime, timedelta
 
 import pytest
 from cryptography.fernet import Fernet
-from sqlalchemy import select
+from sqlalchemy import event, select
 
+from app.app_layer.interfaces.cache.account.interface import IAccountViewCache
+from app.app_layer.interfaces.notifications.notifier.dto import (
+    NotifierDeliveryDTO,
+    NotifierDeliveryResultDTO,
+)
+from app.app_layer.interfaces.notifications.notifier.interface import INotifier
 from app.app_layer.interfaces.repos.account.dto import (
     AccountSettingsCreateDTO,
+    AccountSettingsUpdateDTO,
+    AccountViewDTO,
     SsauIdentityCreateDTO,
     SsauProfileCreateDTO,
     TelegramIdentityCreateDTO,
 )
+from app.app_layer.interfaces.repos.broadcast.enums import BroadcastStatusEnum
+from app.app_layer.interfaces.repos.notification_log.dto import NotificationLogKeyDTO
+from app.app_layer.interfaces.repos.outbox.dto import OutboxEnqueueDTO, OutboxFailureDTO
+from app.app_layer.interfaces.use_cases.dispatch_outbox.dto import DispatchOutboxUseCaseInputDTO
+from app.app_layer.interfaces.use_cases.get_admin_broadcast.dto import (
+    GetAdminBroadcastUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.list_accounts.dto import ListAccountsUseCaseInputDTO
+from app.app_layer.interfaces.use_cases.purge_notification_log.dto import (
+    PurgeNotificationLogUseCaseInputDTO,
+)
+from app.app_layer.interfaces.use_cases.purge_outbox.dto import PurgeOutboxUseCaseInputDTO
+from app.app_layer.interfaces.use_cases.register_user.dto import RegisterUserUseCaseInputDTO
+from app.app_layer.interfaces.use_cases.submit_admin_broadcast.dto import (
+    SubmitAdminBroadcastUseCaseInputDTO,
+)
+from app.app_layer.use_cases.dispatch_outbox import DispatchOutboxUseCase
+from app.app_layer.use_cases.get_admin_broadcast import GetAdminBroadcastUseCase
+from app.app_layer.use_cases.list_accounts import ListAccountsUseCase
+from app.app_layer.use_cases.purge_notification_log import PurgeNotificationLogUseCase
+from app.app_layer.use_cases.purge_outbox import PurgeOutboxUseCase
+from app.app_layer.use_cases.register_user import RegisterUserUseCase
+from app.app_layer.use_cases.submit_admin_broadcast import SubmitAdminBroadcastUseCase
 from app.domain.constants import DEFAULT_SUBGROUP_VALUE
+from app.domain.messages.base import TelegramMessage
+from app.domain.messages.plain import PlainMessage
 from app.domain.value_objects.group_id import GroupId
+from app.domain.value_objects.notification_type import NotificationTypeEnum
 from app.domain.value_objects.subgroup import Subgroup
 from app.domain.value_objects.year_id import YearId
 from app.infra.db import models  # noqa: F401
 from app.infra.db.base import Base
-from app.infra.db.models import SsauIdentityModel
+from app.infra.db.models import NotificationLogModel, OutboxMessageModel, SsauIdentityModel
 from app.infra.db.session import create_engine, create_session_factory
 from app.infra.db.settings import DatabaseEngineSettings
 from app.infra.repos.account.repo import SqlAlchemyAccountRepository
+from app.infra.repos.broadcast_repository import SqlAlchemyBroadcastRepository
+from app.infra.repos.cached_notification_log_repository import (
+    CachedNotificationLogRepository,
+)
+from app.infra.repos.notification_log_repository import SqlAlchemyNotificationLogRepository
+from app.infra.repos.outbox_repository import SqlAlchemyOutboxRepository
 from app.infra.security.password_cipher import FernetPasswordCipher
 from app.infra.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
 
@@ -59,13 +101,13 @@ async def test_sqlite_account_repository_roundtrip(tmp_path) -> None:
 
     async with SqlAlchemyUnitOfWork(session_factory):
         view = await account_repo.get_by_chat_id(100)
-        notifiable = await account_repo.list_notifiable()
+        notifiable = [v async for batch in account_repo.iter_notifiable(100) for v in batch]
 
     assert view is not None
     assert view.is_authed
     assert view.is_provisioned
     assert view.ssau_identity is not None
-    assert view.ssau_identity.password == "secret"
+    assert view.ssau_identity.password.get_secret_value() == "secret"
     assert view.ssau_profile is not None
     assert view.ssau_profile.group_id.value == 755932538
     assert [v.account_id for v in notifiable] == [view.account_id]
@@ -78,3 +120,737 @@ async def test_sqlite_account_repository_roundtrip(tmp_path) -> None:
         assert model.encrypted_password.startswith("enc:")
 
     await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_notification_log_batch_mark_and_filter(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'n.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    account_repo = SqlAlchemyAccountRepository(FernetPasswordCipher(Fernet.generate_key().decode()))
+    log_repo = SqlAlchemyNotificationLogRepository()
+    today = date(2025, 9, 1)
+
+    def _key(account_id: int, lesson_id: int) -> NotificationLogKeyDTO:
+        return NotificationLogKeyDTO(
+            account_id=account_id,
+            lesson_id=lesson_id,
+            lesson_date=today,
+            notification_type=NotificationTypeEnum.BEFORE_START,
+        )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        first = await account_repo.create_account()
+        second = await account_repo.create_account()
+        first_claim = await log_repo.mark_sent_many(
+            [_key(first.id, 10), _key(second.id, 20), _key(first.id, 10)],
+            sent_at=datetime(2025, 9, 1, 5, 50, tzinfo=UTC),
+        )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        # Повторная пометка не падает на uq_notification_once и ничего не «забирает».
+        second_claim = await log_repo.mark_sent_many(
+            [_key(first.id, 10), _key(first.id, 20)],
+            sent_at=datetime(2025, 9, 1, 5, 51, tzinfo=UTC),
+        )
+        unsent = await log_repo.filter_unsent(
+            [_key(first.id, 10), _key(first.id, 20), _key(second.id, 10), _key(second.id, 20)]
+        )
+
+    assert first_claim == {_key(first.id, 10), _key(second.id, 20)}
+    assert second_claim == {_key(first.id, 20)}
+    assert unsent == [_key(second.id, 10)]
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_notification_log_splits_large_batches(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'm.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    account_repo = SqlAlchemyAccountRepository(FernetPasswordCipher(Fernet.generate_key().decode()))
+    log_repo = SqlAlchemyNotificationLogRepository()
+    sent_at = datetime(2025, 9, 1, 5, 50, tzinfo=UTC)
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        account = await account_repo.create_account()
+
+    def _key(lesson_id: int) -> NotificationLogKeyDTO:
+        return NotificationLogKeyDTO(
+            account_id=account.id,
+            lesson_id=lesson_id,
+            lesson_date=date(2025, 9, 1),
+            notification_type=NotificationTypeEnum.AT_START,
+        )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await log_repo.mark_sent_many([_key(lesson_id) for lesson_id in range(0, 2500, 2)], sent_at)
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        async with SqlAlchemyUnitOfWork(session_factory):
+            unsent = await log_repo.filter_unsent([_key(lesson_id) for lesson_id in range(2500)])
+            claimed = await log_repo.mark_sent_many(
+                [_key(lesson_id) for lesson_id in range(2500)], sent_at
+            )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count)
+
+    # 2500 ключей — по три SELECT и INSERT; отмечены только ключи, которых не было.
+    assert sum(statement.startswith("SELECT") for statement in statements) == 3
+    assert sum(statement.startswith("INSERT") for statement in statements) == 3
+    assert unsent == [_key(lesson_id) for lesson_id in range(1, 2500, 2)]
+    assert claimed == {_key(lesson_id) for lesson_id in range(1, 2500, 2)}
+    async with session_factory() as session:
+        rows = (await session.execute(select(NotificationLogModel.id))).scalars().all()
+    assert len(rows) == 2500
+
+    await engine.dispose()
+
+
+class _ScriptedNotifier(INotifier):
+    """Доставляет всё, кроме чатов из ``failing`` (chat_id -> повторяемая ли ошибка)."""
+
+    def __init__(self, failing: dict[int, bool]) -> None:
+        self.failing = failing
+        self.delivered: list[int] = []
+
+    async def send(self, chat_id: int, message: TelegramMessage) -> None:
+        self.delivered.append(chat_id)
+
+    async def send_many(
+        self,
+        deliveries: Sequence[NotifierDeliveryDTO],
+    ) -> list[NotifierDeliveryResultDTO]:
+        results = []
+        for delivery in deliveries:
+            if delivery.chat_id in self.failing:
+                results.append(
+                    NotifierDeliveryResultDTO(
+                        chat_id=delivery.chat_id,
+                        delivered=False,
+                        error="boom",
+                        retryable=self.failing[delivery.chat_id],
+                    )
+                )
+                continue
+            await self.send(delivery.chat_id, delivery.message)
+            results.append(NotifierDeliveryResultDTO(chat_id=delivery.chat_id, delivered=True))
+        return results
+
+
+class _MutableClock:
+    def __init__(self, now: datetime) -> None:
+        self.current = now
+
+    def now(self) -> datetime:
+        return self.current
+
+
+@pytest.mark.asyncio
+async def test_sqlite_outbox_dispatch_acks_retries_and_dead_letters(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'o.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    outbox_repo = SqlAlchemyOutboxRepository()
+    clock = _MutableClock(datetime(2025, 9, 1, 6, 0, tzinfo=UTC))
+    notifier = _ScriptedNotifier(failing={2: True, 3: False})
+    use_case = DispatchOutboxUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        outbox_repo=outbox_repo,
+        notifier=notifier,
+        clock=clock,
+        lease_seconds=60,
+        max_attempts=2,
+        retry_base_seconds=10,
+    )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await outbox_repo.enqueue(
+            [
+                OutboxEnqueueDTO(chat_id=chat_id, message=PlainMessage(text=f"hi {chat_id}"))
+                for chat_id in (1, 2, 3)
+            ],
+            available_at=clock.now(),
+        )
+
+    first = await use_case.execute(DispatchOutboxUseCaseInputDTO(limit=10))
+    assert (first.claimed, first.sent, first.retried, first.dead) == (3, 1, 1, 1)
+    assert notifier.delivered == [1]
+
+    # Повтор ещё не наступил — очередь пуста.
+    assert (await use_case.execute(DispatchOutboxUseCaseInputDTO())).claimed == 0
+
+    clock.current += timedelta(seconds=10)
+    notifier.failing = {2: True}
+    second = await use_case.execute(DispatchOutboxUseCaseInputDTO())
+    assert (second.claimed, second.retried, second.dead) == (1, 0, 1)
+
+    # Захваченное, но неподтверждённое сообщение возвращается после аренды.
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await outbox_repo.enqueue(
+            [OutboxEnqueueDTO(chat_id=4, message=PlainMessage(text="late"))],
+            available_at=clock.now(),
+        )
+    async with SqlAlchemyUnitOfWork(session_factory):
+        lost = await outbox_repo.claim(clock.now(), 10, clock.now() + timedelta(seconds=60))
+    assert [item.chat_id for item in lost] == [4]
+    assert (await use_case.execute(DispatchOutboxUseCaseInputDTO())).claimed == 0
+    clock.current += timedelta(seconds=61)
+    third = await use_case.execute(DispatchOutboxUseCaseInputDTO())
+    assert (third.claimed, third.sent) == (1, 1)
+
+    async with session_factory() as session:
+        rows = (
+            await session.execute(select(OutboxMessageModel).order_by(OutboxMessageModel.chat_id))
+        ).scalars()
+        statuses = {row.chat_id: (row.status, row.attempts) for row in rows}
+    assert statuses == {1: ("sent", 1), 2: ("dead", 2), 3: ("dead", 1), 4: ("sent", 2)}
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_broadcast_is_queued_behind_notifications_and_reports_progress(
+    tmp_path,
+) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'b.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    account_repo = SqlAlchemyAccountRepository(FernetPasswordCipher(Fernet.generate_key().decode()))
+    broadcast_repo = SqlAlchemyBroadcastRepository()
+    outbox_repo = SqlAlchemyOutboxRepository()
+    clock = _MutableClock(datetime(2025, 9, 1, 6, 0, tzinfo=UTC))
+    notifier = _ScriptedNotifier(failing={3: False})
+
+    def uow_factory() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(session_factory)
+
+    async with uow_factory():
+        for chat_id in (1, 2, 3):
+            account = await account_repo.create_account()
+            await account_repo.create_telegram_identity(
+                TelegramIdentityCreateDTO(
+                    account_id=account.id, chat_id=chat_id, display_name=f"user {chat_id}"
+                )
+            )
+            await account_repo.create_settings(
+                AccountSettingsCreateDTO(account_id=account.id, schedule_notifications_enabled=True)
+            )
+
+    submit = SubmitAdminBroadcastUseCase(
+        uow_factory=uow_factory,
+        account_repo=account_repo,
+        broadcast_repo=broadcast_repo,
+        outbox_repo=outbox_repo,
+        clock=clock,
+        account_batch_size=2,
+    )
+    get = GetAdminBroadcastUseCase(uow_factory=uow_factory, broadcast_repo=broadcast_repo)
+    dispatch = DispatchOutboxUseCase(
+        uow_factory=uow_factory,
+        outbox_repo=outbox_repo,
+        notifier=notifier,
+        clock=clock,
+    )
+
+    submitted = await submit.execute(SubmitAdminBroadcastUseCaseInputDTO(text="hello"))
+    assert submitted.total == 3
+    # Уведомление поставлено позже рассылки, но уходит раньше неё.
+    clock.current += timedelta(seconds=1)
+    async with uow_factory():
+        await outbox_repo.enqueue(
+            [OutboxEnqueueDTO(chat_id=100, message=PlainMessage(text="lesson"))],
+            available_at=clock.now(),
+        )
+
+    first = await dispatch.execute(DispatchOutboxUseCaseInputDTO(limit=2))
+    assert first.claimed == 2
+    assert notifier.delivered == [100, 1]
+
+    in_progress = await get.execute(
+        GetAdminBroadcastUseCaseInputDTO(broadcast_id=submitted.broadcast_id)
+    )
+    assert in_progress.progress is not None
+    assert in_progress.progress.status == BroadcastStatusEnum.IN_PROGRESS
+    assert (in_progress.progress.sent, in_progress.progress.pending) == (1, 2)
+
+    await dispatch.execute(DispatchOutboxUseCaseInputDTO(limit=10))
+    done = await get.execute(GetAdminBroadcastUseCaseInputDTO(broadcast_id=submitted.broadcast_id))
+    assert done.progress is not None
+    assert done.progress.status == BroadcastStatusEnum.DONE
+    assert (done.progress.sent, done.progress.failed, done.progress.pending) == (2, 1, 0)
+    assert (await get.execute(GetAdminBroadcastUseCaseInputDTO(broadcast_id=999))).progress is None
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_outbox_purge_keeps_recent_rows_and_broadcast_progress(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'q.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    broadcast_repo = SqlAlchemyBroadcastRepository()
+    outbox_repo = SqlAlchemyOutboxRepository()
+    clock = _MutableClock(datetime(2025, 9, 1, 6, 0, tzinfo=UTC))
+
+    def _message(chat_id: int, broadcast_id: int | None = None) -> OutboxEnqueueDTO:
+        return OutboxEnqueueDTO(
+            chat_id=chat_id,
+            message=PlainMessage(text=f"hi {chat_id}"),
+            broadcast_id=broadcast_id,
+        )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        finished = await broadcast_repo.create(text="done", total=2)
+        running = await broadcast_repo.create(text="running", total=2)
+        # 1 — доставлено, 2 — мёртвое, 3 — ещё ждёт; 10, 11 — завершённая рассылка,
+        # 20, 21 — рассылка, у которой одно сообщение ещё не доставлено.
+        await outbox_repo.enqueue(
+            [
+                _message(1),
+                _message(2),
+                _message(3),
+                _message(10, finished.id),
+                _message(11, finished.id),
+                _message(20, running.id),
+                _message(21, running.id),
+            ],
+            available_at=clock.now(),
+        )
+
+    async def _ids() -> dict[int, int]:
+        async with session_factory() as session:
+            rows = await session.execute(select(OutboxMessageModel.chat_id, OutboxMessageModel.id))
+            return {chat_id: row_id for chat_id, row_id in rows.all()}
+
+    ids = await _ids()
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await outbox_repo.mark_sent([ids[1], ids[10], ids[20]], sent_at=clock.now())
+        await outbox_repo.mark_failed(
+            [
+                OutboxFailureDTO(id=ids[2], error="blocked"),
+                OutboxFailureDTO(id=ids[11], error="blocked"),
+            ]
+        )
+
+    # Доставлено недавно — остаётся.
+    clock.current += timedelta(days=7, hours=12)
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await outbox_repo.enqueue([_message(4)], available_at=clock.now())
+    recent = (await _ids())[4]
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await outbox_repo.mark_sent([recent], sent_at=clock.now())
+
+    clock.current += timedelta(days=1)
+    result = await PurgeOutboxUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        outbox_repo=outbox_repo,
+        broadcast_repo=broadcast_repo,
+        clock=clock,
+    ).execute(PurgeOutboxUseCaseInputDTO(retention_days=7, batch_size=2))
+
+    assert result.cutoff == datetime(2025, 9, 2, 18, 0, tzinfo=UTC)
+    assert result.deleted_rows == 4
+    async with session_factory() as session:
+        remaining = (await session.execute(select(OutboxMessageModel.chat_id))).scalars().all()
+    assert sorted(remaining) == [3, 4, 20, 21]
+    # Строки завершённой рассылки удалены, но её итог сохранён.
+    get = GetAdminBroadcastUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory), broadcast_repo=broadcast_repo
+    )
+    done = (await get.execute(GetAdminBroadcastUseCaseInputDTO(broadcast_id=finished.id))).progress
+    assert done is not None
+    assert (done.sent, done.failed, done.pending) == (1, 1, 0)
+    assert done.status == BroadcastStatusEnum.DONE
+    in_progress = (
+        await get.execute(GetAdminBroadcastUseCaseInputDTO(broadcast_id=running.id))
+    ).progress
+    assert in_progress is not None
+    assert (in_progress.sent, in_progress.pending) == (1, 1)
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_notification_log_purge_deletes_in_batches(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'p.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    account_repo = SqlAlchemyAccountRepository(FernetPasswordCipher(Fernet.generate_key().decode()))
+    log_repo = SqlAlchemyNotificationLogRepository()
+    clock = _MutableClock(datetime(2025, 10, 15, 6, 0, tzinfo=UTC))
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        account = await account_repo.create_account()
+        await log_repo.mark_sent_many(
+            [
+                NotificationLogKeyDTO(
+                    account_id=account.id,
+                    lesson_id=lesson_id,
+                    lesson_date=date(2025, 10, 15) - timedelta(days=days_ago),
+                    notification_type=NotificationTypeEnum.BEFORE_START,
+                )
+                for lesson_id, days_ago in enumerate((0, 1, 29, 30, 31, 45, 60, 90))
+            ],
+            sent_at=clock.now(),
+        )
+
+    use_case = PurgeNotificationLogUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        notification_log_repo=log_repo,
+        clock=clock,
+    )
+    result = await use_case.execute(
+        PurgeNotificationLogUseCaseInputDTO(retention_days=30, batch_size=2)
+    )
+
+    assert result.cutoff == date(2025, 9, 15)
+    assert (result.created_partitions, result.dropped_partitions) == (0, 0)
+    assert result.deleted_rows == 4
+    async with session_factory() as session:
+        remaining = (
+            await session.execute(
+                select(NotificationLogModel.lesson_date).order_by(NotificationLogModel.lesson_date)
+            )
+        ).scalars()
+        assert list(remaining) == [
+            date(2025, 9, 15),
+            date(2025, 9, 16),
+            date(2025, 10, 14),
+            date(2025, 10, 15),
+        ]
+
+    await engine.dispose()
+
+
+class _CountingNotificationLogRepository(SqlAlchemyNotificationLogRepository):
+    def __init__(self) -> None:
+        self.reads = 0
+
+    async def filter_unsent(
+        self,
+        keys: Sequence[NotificationLogKeyDTO],
+    ) -> list[NotificationLogKeyDTO]:
+        self.reads += 1
+        return await super().filter_unsent(keys)
+
+    async def find_sent_on(self, lesson_dates: Collection[date]) -> set[NotificationLogKeyDTO]:
+        self.reads += 1
+        return await super().find_sent_on(lesson_dates)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cached_notification_log_serves_steady_state_from_memory(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'c.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    account_repo = SqlAlchemyAccountRepository(FernetPasswordCipher(Fernet.generate_key().decode()))
+    inner = _CountingNotificationLogRepository()
+    today = date(2025, 9, 1)
+    sent_at = datetime(2025, 9, 1, 5, 50, tzinfo=UTC)
+
+    def _key(account_id: int, lesson_id: int) -> NotificationLogKeyDTO:
+        return NotificationLogKeyDTO(
+            account_id=account_id,
+            lesson_id=lesson_id,
+            lesson_date=today,
+            notification_type=NotificationTypeEnum.BEFORE_START,
+        )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        account = await account_repo.create_account()
+        await inner.mark_sent_many([_key(account.id, 1)], sent_at)
+
+    cached = CachedNotificationLogRepository(inner)
+    candidates = [_key(account.id, 1), _key(account.id, 2), _key(account.id, 3)]
+    async with SqlAlchemyUnitOfWork(session_factory):
+        assert await cached.filter_unsent(candidates) == candidates[1:]
+    assert inner.reads == 1
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await cached.mark_sent_many([_key(account.id, 2)], sent_at)
+
+    # Откаченная отметка не должна попасть в кэш.
+    with pytest.raises(RuntimeError):
+        async with SqlAlchemyUnitOfWork(session_factory):
+            await cached.mark_sent_many([_key(account.id, 3)], sent_at)
+            raise RuntimeError("rollback")
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        assert await cached.filter_unsent(candidates) == [_key(account.id, 3)]
+        assert await cached.filter_unsent(candidates) == [_key(account.id, 3)]
+    assert inner.reads == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_account_view_is_loaded_in_one_query(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'q.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    account_repo = SqlAlchemyAccountRepository(FernetPasswordCipher(Fernet.generate_key().decode()))
+    register = RegisterUserUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        account_repo=account_repo,
+    )
+    await register.execute(RegisterUserUseCaseInputDTO(chat_id=100, display_name="tester"))
+    async with SqlAlchemyUnitOfWork(session_factory):
+        view = await account_repo.get_by_chat_id(100)
+        assert view is not None
+        identity = await account_repo.create_ssau_identity(
+            SsauIdentityCreateDTO(account_id=view.account_id, login="login", password="secret")
+        )
+        await account_repo.create_ssau_profile(
+            SsauProfileCreateDTO(
+                ssau_identity_id=identity.id,
+                group_id=GroupId(value=755932538),
+                year_id=YearId(value=14),
+                group_name="Test",
+                academic_year_start=date(2025, 9, 1),
+                subgroup=Subgroup(value=DEFAULT_SUBGROUP_VALUE),
+                user_type="student",
+            )
+        )
+    await register.execute(RegisterUserUseCaseInputDTO(chat_id=200, display_name="guest"))
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        async with SqlAlchemyUnitOfWork(session_factory):
+            provisioned = await account_repo.get_by_chat_id(100)
+        assert len(statements) == 1
+        assert provisioned is not None and provisioned.is_provisioned
+
+        statements.clear()
+        async with SqlAlchemyUnitOfWork(session_factory):
+            guest = await account_repo.get_by_chat_id(200)
+            missing = await account_repo.get_by_chat_id(300)
+        assert len(statements) == 2
+        assert guest is not None and not guest.is_authed
+        assert missing is None
+
+        statements.clear()
+        result = await register.execute(
+            RegisterUserUseCaseInputDTO(chat_id=100, display_name="tester")
+        )
+        assert len(statements) == 1
+        assert result.account.is_provisioned
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count)
+
+    await engine.dispose()
+
+
+class _DictAccountViewCache(IAccountViewCache):
+    def __init__(self) -> None:
+        self.views: dict[int, AccountViewDTO] = {}
+        self.invalidations = 0
+
+    async def get(self, chat_id: int) -> AccountViewDTO | None:
+        return self.views.get(chat_id)
+
+    async def set(self, view: AccountViewDTO) -> None:
+        self.views[view.chat_id] = view
+
+    async def invalidate(self, chat_id: int) -> None:
+        self.invalidations += 1
+        self.views.pop(chat_id, None)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_account_view_cache_reads_through_and_invalidates_on_write(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'c.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    view_cache = _DictAccountViewCache()
+    account_repo = SqlAlchemyAccountRepository(
+        FernetPasswordCipher(Fernet.generate_key().decode()),
+        view_cache=view_cache,
+    )
+    register = RegisterUserUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        account_repo=account_repo,
+    )
+    await register.execute(RegisterUserUseCaseInputDTO(chat_id=100, display_name="tester"))
+    assert view_cache.views == {}
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        async with SqlAlchemyUnitOfWork(session_factory):
+            first = await account_repo.get_by_chat_id(100)
+        statements.clear()
+        async with SqlAlchemyUnitOfWork(session_factory):
+            second = await account_repo.get_by_chat_id(100)
+        assert statements == []
+        assert first == second
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count)
+
+    assert first is not None and first.settings.schedule_notifications_enabled
+    async with SqlAlchemyUnitOfWork(session_factory):
+        await account_repo.update_settings(
+            AccountSettingsUpdateDTO(id=first.settings.id, schedule_notifications_enabled=False)
+        )
+        inside = await account_repo.get_by_chat_id(100)
+        # Транзакция с записью читает мимо кэша и не кладёт туда незакоммиченное.
+        assert inside is not None and not inside.settings.schedule_notifications_enabled
+        assert 100 not in view_cache.views
+    # Вторая инвалидация — после commit, в фоне.
+    for _ in range(10):
+        if view_cache.invalidations >= 2:
+            break
+        await asyncio.sleep(0)
+    assert view_cache.invalidations >= 2
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        after = await account_repo.get_by_chat_id(100)
+    assert after is not None and not after.settings.schedule_notifications_enabled
+    assert view_cache.views[100] == after
+
+    await engine.dispose()
+
+
+class _CountingPasswordCipher(FernetPasswordCipher):
+    def __init__(self, key: str) -> None:
+        super().__init__(key)
+        self.decrypts = 0
+
+    def decrypt(self, encrypted: str) -> str:
+        self.decrypts += 1
+        return super().decrypt(encrypted)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_account_lists_do_not_decrypt_passwords(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'l.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    cipher = _CountingPasswordCipher(Fernet.generate_key().decode())
+    account_repo = SqlAlchemyAccountRepository(cipher)
+    register = RegisterUserUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        account_repo=account_repo,
+    )
+    for chat_id in (100, 200):
+        await register.execute(RegisterUserUseCaseInputDTO(chat_id=chat_id, display_name="u"))
+    async with SqlAlchemyUnitOfWork(session_factory):
+        view = await account_repo.get_by_chat_id(100)
+        assert view is not None
+        identity = await account_repo.create_ssau_identity(
+            SsauIdentityCreateDTO(account_id=view.account_id, login="login", password="secret")
+        )
+        await account_repo.create_ssau_profile(
+            SsauProfileCreateDTO(
+                ssau_identity_id=identity.id,
+                group_id=GroupId(value=755932538),
+                year_id=YearId(value=14),
+                group_name="Test",
+                academic_year_start=date(2025, 9, 1),
+                subgroup=Subgroup(value=DEFAULT_SUBGROUP_VALUE),
+                user_type="student",
+            )
+        )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        summaries = await account_repo.list_summaries_page(None, 100)
+        notifiable = [v async for batch in account_repo.iter_notifiable(100) for v in batch]
+    assert cipher.decrypts == 0
+
+    assert [(s.chat_id, s.is_authed, s.is_provisioned) for s in summaries] == [
+        (100, True, True),
+        (200, False, False),
+    ]
+    assert summaries[0].group_name == "Test"
+    assert summaries[0].subgroup == Subgroup(value=DEFAULT_SUBGROUP_VALUE)
+    assert notifiable[0].ssau_identity is not None
+    assert notifiable[0].ssau_identity.password.get_secret_value() == "secret"
+    assert notifiable[0].ssau_identity.password.get_secret_value() == "secret"
+    assert cipher.decrypts == 1
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_accounts_are_paged_by_keyset(tmp_path) -> None:
+    engine = create_engine(DatabaseEngineSettings(url=f"sqlite+aiosqlite:///{tmp_path / 'p.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = create_session_factory(engine)
+    account_repo = SqlAlchemyAccountRepository(FernetPasswordCipher(Fernet.generate_key().decode()))
+    register = RegisterUserUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        account_repo=account_repo,
+    )
+    for chat_id in range(100, 105):
+        await register.execute(RegisterUserUseCaseInputDTO(chat_id=chat_id, display_name="u"))
+    async with SqlAlchemyUnitOfWork(session_factory):
+        for chat_id in (100, 102, 104):
+            view = await account_repo.get_by_chat_id(chat_id)
+            assert view is not None
+            identity = await account_repo.create_ssau_identity(
+                SsauIdentityCreateDTO(account_id=view.account_id, login="l", password="p")
+            )
+            await account_repo.create_ssau_profile(
+                SsauProfileCreateDTO(
+                    ssau_identity_id=identity.id,
+                    group_id=GroupId(value=755932538),
+                    year_id=YearId(value=14),
+                    group_name="Test",
+                    academic_year_start=date(2025, 9, 1),
+                    subgroup=Subgroup(value=DEFAULT_SUBGROUP_VALUE),
+                    user_type="student",
+                )
+            )
+
+    async with SqlAlchemyUnitOfWork(session_factory):
+        batches = [
+            [view.chat_id for view in batch] async for batch in account_repo.iter_notifiable(2)
+        ]
+        summary_batches = [
+            [summary.chat_id for summary in batch] async for batch in account_repo.iter_summaries(5)
+        ]
+    assert batches == [[100, 102], [104]]
+    assert summary_batches == [[100, 101, 102, 103, 104]]
+
+    list_accounts = ListAccountsUseCase(
+        uow_factory=lambda: SqlAlchemyUnitOfWork(session_factory),
+        account_repo=account_repo,
+    )
+    pages: list[list[int]] = []
+    cursor: int | None = None
+    while True:
+        page = await list_accounts.execute(ListAccountsUseCaseInputDTO(cursor=cursor, limit=2))
+        pages.append([summary.chat_id for summary in page.accounts])
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert pages == [[100, 101], [102, 103], [104]]
+
+    await engine.dispose()
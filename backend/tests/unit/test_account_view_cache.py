@@ -0,0 +1,128 @@
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from cryptography.fernet import Fernet
+
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.domain.entities.account.account import AccountEntity
+from app.domain.entities.account.account_settings import AccountSettingsEntity
+from app.domain.entities.account.ssau_identity import SsauIdentityEntity
+from app.domain.entities.account.telegram_identity import TelegramIdentityEntity
+from app.domain.value_objects.lazy_secret import LazySecret
+from app.infra.cache.local.account_view_cache import TieredAccountViewCache
+from app.infra.cache.local.lru import LruTtlCache
+from app.infra.cache.valkey.account_view_cache import ValkeyAccountViewCache
+from app.infra.security.password_cipher import FernetPasswordCipher
+
+_CIPHER = FernetPasswordCipher(Fernet.generate_key().decode())
+_NOW = datetime(2025, 9, 1, tzinfo=UTC)
+_VIEW = AccountViewDTO(
+    account=AccountEntity(id=1, created_at=_NOW, updated_at=_NOW),
+    telegram=TelegramIdentityEntity(
+        id=1, created_at=_NOW, updated_at=_NOW, account_id=1, chat_id=100, display_name="tester"
+    ),
+    settings=AccountSettingsEntity(
+        id=1, created_at=_NOW, updated_at=_NOW, account_id=1, schedule_notifications_enabled=True
+    ),
+    ssau_identity=SsauIdentityEntity(
+        id=1, created_at=_NOW, updated_at=_NOW, account_id=1, login="login", password="secret"
+    ),
+    ssau_profile=None,
+)
+
+
+class FakeCacheClient:
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.published: list[tuple[str, str]] = []
+        self.reads = 0
+
+    async def get(self, key: str) -> Any | None:
+        self.reads += 1
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.store[key] = value
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.store.pop(key, None) is not None else 0
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 1
+
+    def __getattr__(self, name: str) -> Any:
+        raise AssertionError(f"Unexpected cache client call: {name}")
+
+
+def _build_valkey(client: FakeCacheClient) -> ValkeyAccountViewCache:
+    return ValkeyAccountViewCache(
+        client=client,  # type: ignore[arg-type]
+        cipher=_CIPHER,
+        ttl_seconds=60,
+    )
+
+
+def _build_tiered(client: FakeCacheClient) -> TieredAccountViewCache:
+    return TieredAccountViewCache(
+        inner=_build_valkey(client),
+        local=LruTtlCache(max_entries=8, ttl_seconds=60),
+        client=client,  # type: ignore[arg-type]
+        channel="account:invalidate",
+    )
+
+
+@pytest.mark.asyncio
+async def test_valkey_view_roundtrip_keeps_password_encrypted() -> None:
+    client = FakeCacheClient()
+    cache = _build_valkey(client)
+
+    await cache.set(_VIEW)
+
+    assert "secret" not in client.store["account:view:100"]
+    assert await cache.get(100) == _VIEW
+    assert await cache.get(200) is None
+
+
+@pytest.mark.asyncio
+async def test_valkey_view_fill_stores_ciphertext_without_decrypting() -> None:
+    client = FakeCacheClient()
+    cache = _build_valkey(client)
+    ciphertext = _CIPHER.encrypt("secret")
+
+    def _decrypt() -> str:
+        raise AssertionError("password must not be decrypted on cache fill")
+
+    assert _VIEW.ssau_identity is not None
+    identity = _VIEW.ssau_identity.model_copy(
+        update={"password": LazySecret(_decrypt, ciphertext=ciphertext)}
+    )
+    await cache.set(_VIEW.model_copy(update={"ssau_identity": identity}))
+
+    assert ciphertext in client.store["account:view:100"]
+    cached = await cache.get(100)
+    assert cached is not None and cached.ssau_identity is not None
+    assert cached.ssau_identity.password.ciphertext == ciphertext
+    assert cached.ssau_identity.password.get_secret_value() == "secret"
+
+
+@pytest.mark.asyncio
+async def test_tiered_view_cache_serves_local_and_broadcasts_invalidation() -> None:
+    client = FakeCacheClient()
+    writer = _build_tiered(client)
+    reader = _build_tiered(client)
+    await writer.set(_VIEW)
+
+    assert await reader.get(100) == _VIEW
+    assert await reader.get(100) == _VIEW
+    assert client.reads == 1
+
+    await writer.invalidate(100)
+    channel, message = client.published[0]
+    writer.handle_invalidation(message)
+    reader.handle_invalidation(message)
+
+    assert channel == "account:invalidate"
+    assert await reader.get(100) is None
+    assert await writer.get(100) is None
@@ -1,11 +1,18 @@
 import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 
+from app.app_layer.interfaces.cache.telegram_chats_check.dto import TelegramChatsCheckJobDTO
+from app.app_layer.interfaces.cache.telegram_chats_check.enums import (
+    TelegramChatsCheckJobStatusEnum,
+)
 from app.app_layer.interfaces.telegram.chat_checker.dto import TelegramChatCheckResultDTO
 from app.app_layer.interfaces.telegram.chat_checker.enums import TelegramChatCheckStatusEnum
 from app.app_layer.interfaces.use_cases.check_telegram_chats.dto import (
     CheckTelegramChatsUseCaseInputDTO,
 )
 from app.app_layer.use_cases.check_telegram_chats import CheckTelegramChatsUseCase
+from app.app_layer.use_cases.start_telegram_chats_check import StartTelegramChatsCheckUseCase
 
 
 class FakeAccount:
@@ -16,11 +23,12 @@ class FakeAccount:
 class FakeAccountRepository:
     def __init__(self, chat_ids: list[int]) -> None:
         self._chat_ids = chat_ids
-        self.list_all_called = False
+        self.iter_summaries_called = False
 
-    async def list_all(self) -> list[FakeAccount]:
-        self.list_all_called = True
-        return [FakeAccount(chat_id) for chat_id in self._chat_ids]
+    async def iter_summaries(self, batch_size: int) -> AsyncIterator[list[FakeAccount]]:
+        self.iter_summaries_called = True
+        for start in range(0, len(self._chat_ids), batch_size):
+            yield [FakeAccount(chat_id) for chat_id in self._chat_ids[start : start + batch_size]]
 
 
 class FakeTelegramChatChecker:
@@ -35,6 +43,26 @@ class FakeTelegramChatChecker:
             status=self._statuses.get(chat_id, TelegramChatCheckStatusEnum.REACHABLE),
         )
 
+    async def check_many(self, chat_ids: list[int]) -> list[TelegramChatCheckResultDTO]:
+        return [await self.check(chat_id) for chat_id in chat_ids]
+
+
+class FakeJobStore:
+    def __init__(self) -> None:
+        self.history: list[TelegramChatsCheckJobDTO] = []
+
+    async def save(self, job: TelegramChatsCheckJobDTO) -> None:
+        self.history.append(job)
+
+    async def get(self, job_id: str) -> TelegramChatsCheckJobDTO | None:
+        jobs = [job for job in self.history if job.job_id == job_id]
+        return jobs[-1] if jobs else None
+
+
+class FixedClock:
+    def now(self) -> datetime:
+        return datetime(2025, 9, 1, tzinfo=UTC)
+
 
 class FakeUnitOfWork:
     async def __aenter__(self) -> None:
@@ -67,7 +95,7 @@ def test_check_telegram_chats_deduplicates_input_and_builds_summary() -> None:
         result = await use_case.execute(CheckTelegramChatsUseCaseInputDTO(chat_ids=[1, 2, 2, 3, 4]))
 
         assert checker.checked == [1, 2, 3, 4]
-        assert account_repo.list_all_called is False
+        assert account_repo.iter_summaries_called is False
         assert result.total == 4
         assert result.reachable == 1
         assert result.not_found == 1
@@ -86,14 +114,49 @@ def test_check_telegram_chats_uses_known_accounts_when_input_is_missing() -> Non
             uow_factory=_uow_factory,
             account_repo=account_repo,
             chat_checker=checker,
+            account_batch_size=2,
         )
 
         result = await use_case.execute(CheckTelegramChatsUseCaseInputDTO())
 
-        assert account_repo.list_all_called is True
+        assert account_repo.iter_summaries_called is True
         assert checker.checked == [10, 20]
         assert result.total == 2
         assert result.reachable == 2
         assert result.skipped == 1
 
     asyncio.run(_run())
+
+
+def test_start_telegram_chats_check_returns_job_and_records_progress() -> None:
+    async def _run() -> None:
+        store = FakeJobStore()
+        use_case = StartTelegramChatsCheckUseCase(
+            uow_factory=_uow_factory,
+            account_repo=FakeAccountRepository(chat_ids=[]),
+            chat_checker=FakeTelegramChatChecker(
+                statuses={2: TelegramChatCheckStatusEnum.FORBIDDEN}
+            ),
+            job_store=store,
+            clock=FixedClock(),
+            progress_batch_size=2,
+        )
+
+        started = await use_case.execute(
+            CheckTelegramChatsUseCaseInputDTO(chat_ids=[1, 2, 2, 3, 4, 5])
+        )
+        running = await store.get(started.job_id)
+        assert running is not None and running.status == TelegramChatsCheckJobStatusEnum.RUNNING
+        assert (started.total, started.skipped) == (5, 1)
+
+        for _ in range(20):
+            job = await store.get(started.job_id)
+            if job is not None and job.status != TelegramChatsCheckJobStatusEnum.RUNNING:
+                break
+            await asyncio.sleep(0)
+
+        assert job is not None and job.status == TelegramChatsCheckJobStatusEnum.DONE
+        assert [result.chat_id for result in job.checked] == [1, 2, 3, 4, 5]
+        assert [len(saved.checked) for saved in store.history] == [0, 2, 4, 5]
+
+    asyncio.run(_run())
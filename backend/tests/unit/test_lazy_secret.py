@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+from app.domain.value_objects.lazy_secret import LazySecret
+
+
+class _Holder(BaseModel):
+    password: LazySecret
+
+
+def test_lazy_secret_resolves_once_on_access() -> None:
+    calls: list[str] = []
+
+    def _decrypt() -> str:
+        calls.append("decrypt")
+        return "secret"
+
+    holder = _Holder(password=LazySecret(_decrypt))
+
+    assert calls == []
+    assert "secret" not in repr(holder)
+    assert holder.password.get_secret_value() == "secret"
+    assert holder.password.get_secret_value() == "secret"
+    assert calls == ["decrypt"]
+
+
+def test_lazy_secret_validates_from_str_and_dumps_plain_json() -> None:
+    holder = _Holder.model_validate({"password": "secret"})
+
+    assert holder.password.is_resolved
+    assert holder == _Holder(password=LazySecret(lambda: "secret"))
+    assert holder.model_dump(mode="json") == {"password": "secret"}
+    assert _Holder.model_validate_json('{"password":"secret"}') == holder
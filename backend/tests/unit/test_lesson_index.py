@@ -0,0 +1,72 @@
+from datetime import time
+
+from app.domain.entities.lesson import Lesson
+from app.domain.services.lesson_index import WeekdayLessonIndex
+from app.domain.value_objects.lesson_time import LessonTime
+from app.domain.value_objects.subgroup import Subgroup
+
+
+def _lesson(
+    lesson_id: int,
+    *,
+    weekday: int = 1,
+    start: time = time(8, 0),
+    weeks: list[int] | None = None,
+    subgroup: int | None = None,
+) -> Lesson:
+    return Lesson(
+        id=lesson_id,
+        type="Лекция",
+        subject=f"Subject {lesson_id}",
+        teacher=None,
+        weekday=weekday,
+        week_numbers=weeks or [1, 2],
+        time=LessonTime(start=start, end=time(start.hour + 1, 30)),
+        is_online=False,
+        conference_url=None,
+        subgroup=subgroup,
+    )
+
+
+def test_lessons_on_returns_day_lessons_sorted_by_start() -> None:
+    index = WeekdayLessonIndex(
+        [
+            _lesson(1, start=time(13, 0)),
+            _lesson(2, start=time(8, 0)),
+            _lesson(3, weekday=2),
+            _lesson(4, weeks=[2]),
+        ]
+    )
+
+    lessons = index.lessons_on(1, 1, Subgroup.all())
+
+    assert [lesson.id for lesson in lessons] == [2, 1]
+
+
+def test_lessons_on_filters_by_subgroup() -> None:
+    index = WeekdayLessonIndex(
+        [
+            _lesson(1, start=time(8, 0)),
+            _lesson(2, start=time(9, 45), subgroup=1),
+            _lesson(3, start=time(11, 30), subgroup=2),
+        ]
+    )
+
+    assert [item.id for item in index.lessons_on(1, 1, Subgroup.parse("1"))] == [1, 2]
+    assert [item.id for item in index.lessons_on(1, 1, Subgroup.parse("2"))] == [1, 3]
+    assert [item.id for item in index.lessons_on(1, 1, Subgroup.all())] == [1, 2, 3]
+    assert index.lessons_on(3, 1, Subgroup.all()) == []
+
+
+def test_lessons_on_keeps_subgroup_zero_apart_from_common_lessons() -> None:
+    index = WeekdayLessonIndex(
+        [
+            _lesson(1, start=time(8, 0)),
+            _lesson(2, start=time(9, 45), subgroup=0),
+            _lesson(3, start=time(11, 30), subgroup=1),
+        ]
+    )
+
+    assert [item.id for item in index.lessons_on(1, 1, Subgroup.parse("1"))] == [1, 3]
+    assert [item.id for item in index.lessons_on(1, 1, Subgroup.parse("2"))] == [1]
+    assert [item.id for item in index.lessons_on(1, 1, Subgroup.all())] == [1, 2, 3]
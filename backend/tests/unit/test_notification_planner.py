@@ -1,23 +1,34 @@
 import asyncio
-from datetime import UTC, date, datetime, time
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time, timedelta
 
 import pytest
 
-from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
-from app.app_layer.interfaces.notifications.notifier.interface import INotifier
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO, ScheduleGroupKeyDTO
+from app.app_layer.interfaces.notifications.lesson_notification.dto import (
+    LessonNotificationDTO,
+    ScheduledNotificationDTO,
+)
 from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.repos.notification_log.dto import NotificationLogKeyDTO
+from app.app_layer.interfaces.repos.outbox.dto import (
+    OutboxEnqueueDTO,
+    OutboxFailureDTO,
+    OutboxMessageDTO,
+)
+from app.app_layer.interfaces.repos.outbox.interface import IOutboxRepository
 from app.app_layer.interfaces.services.notifications.notification_planner.dto import (
-    NotificationPlannerCollectDueInputDTO,
-    NotificationPlannerMarkSentInputDTO,
+    NotificationPlannerCollectUpcomingInputDTO,
 )
 from app.app_layer.interfaces.services.notifications.notification_service.dto import (
-    NotificationServiceInputDTO,
+    NotificationServiceSendInputDTO,
 )
 from app.app_layer.interfaces.services.schedule.week_calculator.dto import (
     WeekCalculatorServiceInputDTO,
 )
 from app.app_layer.services.notifications.notification_planner import NotificationPlanner
 from app.app_layer.services.notifications.notification_service import NotificationService
+from app.app_layer.services.notifications.notification_timer import NotificationTimer
 from app.app_layer.services.schedule.week_calculator import AcademicWeekCalculator
 from app.domain.constants import DEFAULT_SUBGROUP_VALUE
 from app.domain.entities.account.account import AccountEntity
@@ -26,7 +37,6 @@ from app.domain.entities.account.ssau_identity import SsauIdentityEntity
 from app.domain.entities.account.ssau_profile import SsauProfileEntity
 from app.domain.entities.account.telegram_identity import TelegramIdentityEntity
 from app.domain.entities.lesson import Lesson
-from app.domain.messages.base import TelegramMessage
 from app.domain.messages.notification import NotificationMessage
 from app.domain.value_objects.group_id import GroupId
 from app.domain.value_objects.lesson_time import LessonTime
@@ -81,37 +91,44 @@ def _make_account(account_id: int = 1, chat_id: int = 111) -> AccountViewDTO:
 
 class FakeScheduleCacheStore:
     def __init__(self) -> None:
-        self._store: dict[tuple[int, int], CachedWeekDTO] = {}
+        self._store: dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO] = {}
+
+    async def get(self, key: ScheduleGroupKeyDTO, week_number: int) -> CachedWeekDTO | None:
+        return self._store.get((key, week_number))
+
+    async def get_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        return {request: self._store[request] for request in requests if request in self._store}
+
+    async def set(self, key: ScheduleGroupKeyDTO, week_number: int, week: CachedWeekDTO) -> None:
+        self._store[(key, week_number)] = week
 
-    async def get(self, account_id: int, week_number: int) -> CachedWeekDTO | None:
-        return self._store.get((account_id, week_number))
 
-    async def set(self, account_id: int, week_number: int, week: CachedWeekDTO) -> None:
-        self._store[(account_id, week_number)] = week
+def _group_key(account: AccountViewDTO) -> ScheduleGroupKeyDTO:
+    assert account.ssau_profile is not None
+    return ScheduleGroupKeyDTO.from_profile(account.ssau_profile)
 
 
 class FakeNotificationLogRepository:
     def __init__(self) -> None:
-        self._sent: set[tuple[int, int, date, NotificationTypeEnum]] = set()
+        self._sent: set[NotificationLogKeyDTO] = set()
 
-    async def was_sent(
+    async def filter_unsent(
         self,
-        account_id: int,
-        lesson_id: int,
-        lesson_date: date,
-        notification_type: NotificationTypeEnum,
-    ) -> bool:
-        return (account_id, lesson_id, lesson_date, notification_type) in self._sent
-
-    async def mark_sent(
+        keys: Sequence[NotificationLogKeyDTO],
+    ) -> list[NotificationLogKeyDTO]:
+        return [key for key in keys if key not in self._sent]
+
+    async def mark_sent_many(
         self,
-        account_id: int,
-        lesson_id: int,
-        lesson_date: date,
-        notification_type: NotificationTypeEnum,
+        keys: Sequence[NotificationLogKeyDTO],
         sent_at: datetime,
-    ) -> None:
-        self._sent.add((account_id, lesson_id, lesson_date, notification_type))
+    ) -> set[NotificationLogKeyDTO]:
+        inserted = set(keys) - self._sent
+        self._sent |= inserted
+        return inserted
 
 
 class FakeClock:
@@ -122,12 +139,33 @@ class FakeClock:
         return self._now
 
 
-class FakeNotifier(INotifier):
+class FakeOutboxRepository(IOutboxRepository):
     def __init__(self) -> None:
-        self.sent: list[tuple[int, TelegramMessage]] = []
+        self.queued: list[OutboxEnqueueDTO] = []
+
+    async def enqueue(
+        self,
+        messages: Sequence[OutboxEnqueueDTO],
+        available_at: datetime,
+    ) -> None:
+        self.queued.extend(messages)
+
+    async def claim(
+        self,
+        now: datetime,
+        limit: int,
+        locked_until: datetime,
+    ) -> list[OutboxMessageDTO]:
+        return []
+
+    async def mark_sent(self, ids: Sequence[int], sent_at: datetime) -> None:
+        return None
+
+    async def mark_failed(self, failures: Sequence[OutboxFailureDTO]) -> None:
+        return None
 
-    async def send(self, chat_id: int, message: TelegramMessage) -> None:
-        self.sent.append((chat_id, message))
+    async def purge_finished_before(self, cutoff: datetime, batch_size: int) -> int:
+        return 0
 
 
 def _week_number(week_calculator: AcademicWeekCalculator, target: date) -> int:
@@ -150,7 +188,7 @@ def _build_planner(
     )
 
 
-def test_notification_service_sends_due_lesson_and_marks_it_sent() -> None:
+def test_notification_service_queues_fired_lesson_and_marks_it_sent() -> None:
     async def _run() -> None:
         week_calculator = AcademicWeekCalculator()
         cache_store = FakeScheduleCacheStore()
@@ -174,134 +212,167 @@ def test_notification_service_sends_due_lesson_and_marks_it_sent() -> None:
             subgroup=None,
         )
         await cache_store.set(
-            account.account_id,
+            _group_key(account),
             week_number,
             CachedWeekDTO(fetched_at=now_utc, lessons=[lesson]),
         )
 
-        notifier = FakeNotifier()
+        outbox = FakeOutboxRepository()
         service = NotificationService(
             planner=planner,
-            notifier=notifier,
+            outbox_repo=outbox,
             clock=FakeClock(now_utc),
         )
 
-        result = await service.process_user(NotificationServiceInputDTO(account=account))
+        upcoming = await planner.collect_upcoming(
+            NotificationPlannerCollectUpcomingInputDTO(accounts=[account], now=now_utc, days=1)
+        )
+        fired = [
+            scheduled.notification
+            for scheduled in upcoming.plans[0].notifications
+            if scheduled.fire_at <= now_utc
+        ]
+        result = await service.send_notifications(
+            NotificationServiceSendInputDTO(notifications=fired)
+        )
 
         assert result.sent_count == 1
-        assert len(notifier.sent) == 1
-        chat_id, message = notifier.sent[0]
-        assert chat_id == account.chat_id
+        assert len(outbox.queued) == 1
+        queued = outbox.queued[0]
+        message = queued.message
+        assert queued.chat_id == account.chat_id
         assert isinstance(message, NotificationMessage)
         assert message.title == "Напоминание"
         assert message.lesson.id == lesson.id
         assert message.lesson_start.date() == now_local.date()
 
-        second_result = await service.process_user(NotificationServiceInputDTO(account=account))
+        second_result = await service.send_notifications(
+            NotificationServiceSendInputDTO(notifications=fired)
+        )
 
         assert second_result.sent_count == 0
-        assert len(notifier.sent) == 1
+        assert len(outbox.queued) == 1
 
     asyncio.run(_run())
 
 
-@pytest.mark.asyncio
-async def test_collect_due_and_mark_sent() -> None:
-    week_calculator = AcademicWeekCalculator()
-    cache_store = FakeScheduleCacheStore()
-    notification_log = FakeNotificationLogRepository()
-    planner = _build_planner(week_calculator, cache_store, notification_log)
-    account = _make_account()
+_SAMARA = Timezone(value="Europe/Samara").tzinfo()
 
-    now_utc = datetime(2025, 9, 1, 5, 50, tzinfo=UTC)
-    now_local = now_utc.astimezone(Timezone(value="Europe/Samara").tzinfo())
-    week_number = _week_number(week_calculator, now_local.date())
-    lesson = Lesson(
-        id=10,
+
+def _timer_lesson(lesson_id: int, weekday: int, week_number: int, start: time) -> Lesson:
+    return Lesson(
+        id=lesson_id,
         type="Лекция",
         subject="Math",
         teacher="Ivanov",
-        weekday=now_local.isoweekday(),
+        weekday=weekday,
         week_numbers=[week_number],
-        time=LessonTime(start=time(10, 0), end=time(11, 0)),
+        time=LessonTime(start=start, end=time(start.hour + 1, 35)),
         is_online=False,
         conference_url=None,
         subgroup=None,
     )
-    await cache_store.set(
-        account.account_id, week_number, CachedWeekDTO(fetched_at=now_utc, lessons=[lesson])
-    )
-    due = (
-        await planner.collect_due(
-            NotificationPlannerCollectDueInputDTO(account=account, now=now_utc)
-        )
-    ).notifications
-    assert len(due) == 1
-    assert due[0].notification_type == NotificationTypeEnum.BEFORE_START
-
-    await planner.mark_sent(
-        NotificationPlannerMarkSentInputDTO(notification=due[0], sent_at=now_utc)
-    )
-    due_again = (
-        await planner.collect_due(
-            NotificationPlannerCollectDueInputDTO(account=account, now=now_utc)
-        )
-    ).notifications
-    assert due_again == []
 
 
 @pytest.mark.asyncio
-async def test_collect_due_sends_start_notification_once() -> None:
+async def test_collect_upcoming_plans_exact_fire_times() -> None:
     week_calculator = AcademicWeekCalculator()
     cache_store = FakeScheduleCacheStore()
-    notification_log = FakeNotificationLogRepository()
-    planner = _build_planner(week_calculator, cache_store, notification_log)
+    planner = _build_planner(week_calculator, cache_store, FakeNotificationLogRepository())
     account = _make_account()
+    now = datetime(2025, 9, 1, 8, 30, tzinfo=_SAMARA)
+    week_number = _week_number(week_calculator, now.date())
+    await cache_store.set(
+        _group_key(account),
+        week_number,
+        CachedWeekDTO(
+            fetched_at=now,
+            lessons=[
+                _timer_lesson(1, now.isoweekday(), week_number, time(8, 0)),
+                _timer_lesson(2, now.isoweekday(), week_number, time(10, 0)),
+                _timer_lesson(3, now.isoweekday() + 1, week_number, time(9, 45)),
+            ],
+        ),
+    )
 
-    pre_start_utc = datetime(2025, 9, 1, 5, 50, tzinfo=UTC)
-    pre_start_local = pre_start_utc.astimezone(Timezone(value="Europe/Samara").tzinfo())
-    week_number = _week_number(week_calculator, pre_start_local.date())
-    lesson = Lesson(
-        id=10,
-        type="Лекция",
-        subject="Math",
-        teacher="Ivanov",
-        weekday=pre_start_local.isoweekday(),
-        week_numbers=[week_number],
-        time=LessonTime(start=time(10, 0), end=time(11, 0)),
-        is_online=False,
-        conference_url=None,
-        subgroup=None,
+    result = await planner.collect_upcoming(
+        NotificationPlannerCollectUpcomingInputDTO(accounts=[account], now=now)
     )
-    await cache_store.set(
-        account.account_id, week_number, CachedWeekDTO(fetched_at=pre_start_utc, lessons=[lesson])
+
+    (plan,) = result.plans
+    fired = [
+        (item.notification.lesson.id, item.notification.notification_type, item.fire_at)
+        for item in plan.notifications
+    ]
+    assert fired == [
+        (1, NotificationTypeEnum.AT_START, datetime(2025, 9, 1, 8, 0, tzinfo=_SAMARA)),
+        (2, NotificationTypeEnum.BEFORE_START, datetime(2025, 9, 1, 9, 45, tzinfo=_SAMARA)),
+        (2, NotificationTypeEnum.AT_START, datetime(2025, 9, 1, 10, 0, tzinfo=_SAMARA)),
+        (3, NotificationTypeEnum.BEFORE_START, datetime(2025, 9, 2, 9, 30, tzinfo=_SAMARA)),
+        (3, NotificationTypeEnum.AT_START, datetime(2025, 9, 2, 9, 45, tzinfo=_SAMARA)),
+    ]
+
+    again = await planner.collect_upcoming(
+        NotificationPlannerCollectUpcomingInputDTO(accounts=[account], now=now)
     )
-    before_start_due = (
-        await planner.collect_due(
-            NotificationPlannerCollectDueInputDTO(account=account, now=pre_start_utc)
-        )
-    ).notifications
-    assert len(before_start_due) == 1
-    assert before_start_due[0].notification_type == NotificationTypeEnum.BEFORE_START
-    await planner.mark_sent(
-        NotificationPlannerMarkSentInputDTO(notification=before_start_due[0], sent_at=pre_start_utc)
+    assert again.plans[0].fingerprint == plan.fingerprint
+
+
+def _scheduled(account_id: int, lesson_id: int, fire_at: datetime) -> ScheduledNotificationDTO:
+    week_lesson = _timer_lesson(lesson_id, 1, 1, time(10, 0))
+    return ScheduledNotificationDTO(
+        fire_at=fire_at,
+        expires_at=fire_at + timedelta(minutes=15),
+        notification=LessonNotificationDTO(
+            account=_make_account(account_id),
+            lesson=week_lesson,
+            lesson_start=fire_at,
+            notification_type=NotificationTypeEnum.AT_START,
+        ),
     )
 
-    lesson_start_utc = datetime(2025, 9, 1, 6, 0, tzinfo=UTC)
-    at_start_due = (
-        await planner.collect_due(
-            NotificationPlannerCollectDueInputDTO(account=account, now=lesson_start_utc)
-        )
-    ).notifications
-    assert len(at_start_due) == 1
-    assert at_start_due[0].notification_type == NotificationTypeEnum.AT_START
 
-    await planner.mark_sent(
-        NotificationPlannerMarkSentInputDTO(notification=at_start_due[0], sent_at=lesson_start_utc)
-    )
-    at_start_due_again = (
-        await planner.collect_due(
-            NotificationPlannerCollectDueInputDTO(account=account, now=lesson_start_utc)
-        )
-    ).notifications
-    assert at_start_due_again == []
+def test_timer_fires_in_order_and_drops_replaced_entries() -> None:
+    timer = NotificationTimer()
+    base = datetime(2025, 9, 1, 6, 0, tzinfo=UTC)
+    timer.replace_account(1, "a", [_scheduled(1, 10, base + timedelta(minutes=5))])
+    timer.replace_account(2, "b", [_scheduled(2, 20, base + timedelta(minutes=1))])
+    timer.replace_account(1, "a2", [_scheduled(1, 11, base + timedelta(minutes=3))])
+
+    assert timer.next_fire_at() == base + timedelta(minutes=1)
+    assert timer.pop_due(base) == []
+
+    due = timer.pop_due(base + timedelta(minutes=10))
+
+    assert [item.notification.lesson.id for item in due] == [20, 11]
+    assert timer.next_fire_at() is None
+
+
+def test_timer_requeues_failed_batch_until_it_expires() -> None:
+    timer = NotificationTimer()
+    base = datetime(2025, 9, 1, 6, 0, tzinfo=UTC)
+    timer.replace_account(1, "a", [_scheduled(1, 10, base)])
+    timer.replace_account(2, "b", [_scheduled(2, 20, base)])
+
+    due = timer.pop_due(base)
+    timer.retain_accounts({1})
+    timer.requeue(due, retry_at=base + timedelta(minutes=1))
+
+    assert timer.pop_due(base + timedelta(seconds=30)) == []
+    retried = timer.pop_due(base + timedelta(minutes=1))
+    assert [item.notification.lesson.id for item in retried] == [10]
+
+    timer.requeue(retried, retry_at=base + timedelta(minutes=20))
+    assert timer.pop_due(base + timedelta(minutes=20)) == []
+
+
+def test_timer_skips_expired_and_retained_out_accounts() -> None:
+    timer = NotificationTimer()
+    base = datetime(2025, 9, 1, 6, 0, tzinfo=UTC)
+    timer.replace_account(1, "a", [_scheduled(1, 10, base)])
+    timer.replace_account(2, "b", [_scheduled(2, 20, base + timedelta(minutes=30))])
+    timer.retain_accounts({1})
+
+    assert timer.pop_due(base + timedelta(hours=1)) == []
+    assert timer.fingerprint(2) is None
+    assert len(timer) == 0
@@ -0,0 +1,61 @@
+from datetime import UTC, datetime, time
+
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO
+from app.domain.entities.lesson import Lesson
+from app.domain.value_objects.lesson_time import LessonTime
+from app.infra.cache.valkey.schedule_codec import MAGIC, decode_cached_week, encode_cached_week
+
+
+def _lesson(lesson_id: int, *, start: time = time(8, 0), subgroup: int | None = None) -> Lesson:
+    return Lesson(
+        id=lesson_id,
+        type="Лекция",
+        subject="Математический анализ",
+        teacher="Иванов И.И." if lesson_id % 2 else None,
+        weekday=lesson_id % 6 + 1,
+        week_numbers=[1, 3, 5, 17],
+        time=LessonTime(start=start, end=time(9, 35)),
+        is_online=lesson_id % 3 == 0,
+        conference_url="https://bbb.ssau.ru/room" if lesson_id % 3 == 0 else None,
+        subgroup=subgroup,
+    )
+
+
+def _week(*lessons: Lesson) -> CachedWeekDTO:
+    return CachedWeekDTO(
+        fetched_at=datetime(2025, 9, 1, 6, 30, 12, 345, tzinfo=UTC), lessons=list(lessons)
+    )
+
+
+def test_binary_round_trip_preserves_week() -> None:
+    week = _week(_lesson(1), _lesson(2, subgroup=2), _lesson(3, subgroup=1))
+
+    raw = encode_cached_week(week)
+
+    assert raw.startswith(MAGIC)
+    assert decode_cached_week(raw) == week
+    assert len(raw) < len(week.model_dump_json().encode())
+
+
+def test_legacy_json_entries_are_still_readable() -> None:
+    week = _week(_lesson(1))
+
+    assert decode_cached_week(week.model_dump_json().encode()) == week
+
+
+def test_falls_back_to_json_when_week_is_not_compactable() -> None:
+    week = _week(_lesson(1, start=time(8, 0, 30)))
+
+    raw = encode_cached_week(week)
+
+    assert not raw.startswith(MAGIC)
+    assert decode_cached_week(raw) == week
+
+
+def test_binary_entry_carries_content_hash() -> None:
+    week = _week(_lesson(1), _lesson(2))
+
+    decoded = decode_cached_week(encode_cached_week(week))
+
+    assert decoded.content_hash == week.content_hash
+    assert decoded.content_hash == _week(_lesson(2), _lesson(1)).content_hash
@@ -0,0 +1,64 @@
+from datetime import time
+
+from app.domain.entities.lesson import Lesson
+from app.domain.services.schedule_diff import diff_week_lessons, lessons_content_hash
+from app.domain.value_objects.lesson_time import LessonTime
+from app.domain.value_objects.subgroup import Subgroup
+
+
+def _lesson(
+    lesson_id: int,
+    *,
+    weeks: list[int] | None = None,
+    weekday: int = 1,
+    start: time = time(8, 0),
+    teacher: str | None = "Иванов И.И.",
+    subgroup: int | None = None,
+) -> Lesson:
+    return Lesson(
+        id=lesson_id,
+        type="Лекция",
+        subject=f"Предмет {lesson_id}",
+        teacher=teacher,
+        weekday=weekday,
+        week_numbers=weeks or [1, 2],
+        time=LessonTime(start=start, end=time(start.hour + 1, 35)),
+        is_online=False,
+        conference_url=None,
+        subgroup=subgroup,
+    )
+
+
+def test_content_hash_ignores_lesson_and_week_order() -> None:
+    first = [_lesson(1, weeks=[1, 3]), _lesson(2)]
+    second = [_lesson(2), _lesson(1, weeks=[3, 1])]
+
+    assert lessons_content_hash(first) == lessons_content_hash(second)
+    assert lessons_content_hash(first) != lessons_content_hash([_lesson(1, weeks=[1, 3])])
+
+
+def test_diff_classifies_changes() -> None:
+    previous = [_lesson(1), _lesson(2), _lesson(3), _lesson(4)]
+    current = [
+        _lesson(1, weekday=3, start=time(10, 0)),
+        _lesson(2, teacher="Петров П.П."),
+        _lesson(4, weeks=[1, 2, 5]),
+        _lesson(5),
+    ]
+
+    diff = diff_week_lessons(previous, current, week_number=1)
+
+    assert [lesson.id for lesson in diff.added] == [5]
+    assert [lesson.id for lesson in diff.removed] == [3]
+    assert [change.after.weekday for change in diff.moved] == [3]
+    assert [change.after.teacher for change in diff.changed] == ["Петров П.П."]
+
+
+def test_diff_for_subgroup_hides_other_subgroup() -> None:
+    diff = diff_week_lessons([], [_lesson(1, subgroup=1), _lesson(2, subgroup=2)], 1)
+
+    visible = diff.for_subgroup(Subgroup.parse(1))
+
+    assert [lesson.id for lesson in visible.added] == [1]
+    assert diff.for_subgroup(Subgroup.all()) == diff
+    assert diff_week_lessons([_lesson(1)], [_lesson(1)], 1).is_empty
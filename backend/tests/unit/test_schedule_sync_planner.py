@@ -0,0 +1,125 @@
+from datetime import UTC, date, datetime
+
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.dto import (
+    ScheduleSyncPlanInputDTO,
+)
+from app.app_layer.services.schedule.schedule_sync_planner import ScheduleSyncPlanner
+from app.app_layer.services.schedule.week_calculator import AcademicWeekCalculator
+from app.domain.entities.account.account import AccountEntity
+from app.domain.entities.account.account_settings import AccountSettingsEntity
+from app.domain.entities.account.ssau_identity import SsauIdentityEntity
+from app.domain.entities.account.ssau_profile import SsauProfileEntity
+from app.domain.entities.account.telegram_identity import TelegramIdentityEntity
+from app.domain.value_objects.group_id import GroupId
+from app.domain.value_objects.subgroup import Subgroup
+from app.domain.value_objects.year_id import YearId
+
+_NOW = datetime(2025, 9, 1, 6, 0, tzinfo=UTC)
+
+
+def _make_account(
+    account_id: int,
+    *,
+    group_id: int = 755932538,
+    with_profile: bool = True,
+) -> AccountViewDTO:
+    profile = None
+    if with_profile:
+        profile = SsauProfileEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            ssau_identity_id=account_id,
+            group_id=GroupId(value=group_id),
+            year_id=YearId(value=14),
+            group_name="Test",
+            academic_year_start=date(2025, 9, 1),
+            subgroup=Subgroup.parse("all"),
+            user_type="student",
+        )
+    return AccountViewDTO(
+        account=AccountEntity(id=account_id, created_at=_NOW, updated_at=_NOW),
+        telegram=TelegramIdentityEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            account_id=account_id,
+            chat_id=1000 + account_id,
+            display_name=f"user-{account_id}",
+        ),
+        settings=AccountSettingsEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            account_id=account_id,
+            schedule_notifications_enabled=True,
+        ),
+        ssau_identity=SsauIdentityEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            account_id=account_id,
+            login=f"login-{account_id}",
+            password="pass",
+        ),
+        ssau_profile=profile,
+    )
+
+
+def test_plan_collapses_group_into_single_unit_with_limited_holders() -> None:
+    planner = ScheduleSyncPlanner(AcademicWeekCalculator(), max_holders=2)
+    accounts = [_make_account(account_id) for account_id in (3, 1, 2)]
+
+    plan = planner.plan(ScheduleSyncPlanInputDTO(accounts=accounts, today=date(2025, 9, 2)))
+
+    assert len(plan.units) == 1
+    unit = plan.units[0]
+    assert (unit.key.group_id, unit.week_number) == (755932538, 1)
+    assert [holder.account_id for holder in unit.holders] == [1, 2]
+    assert plan.skipped_accounts == 0
+
+
+def test_plan_adds_next_week_on_boundary_and_skips_accounts_without_profile() -> None:
+    planner = ScheduleSyncPlanner(AcademicWeekCalculator())
+    accounts = [
+        _make_account(1),
+        _make_account(2, group_id=111),
+        _make_account(3, with_profile=False),
+    ]
+
+    # 2025-09-07 — воскресенье первой недели, завтра начинается вторая.
+    plan = planner.plan(ScheduleSyncPlanInputDTO(accounts=accounts, today=date(2025, 9, 7)))
+
+    assert sorted((unit.key.group_id, unit.week_number) for unit in plan.units) == [
+        (111, 1),
+        (111, 2),
+        (755932538, 1),
+        (755932538, 2),
+    ]
+    assert plan.skipped_accounts == 1
+
+
+def test_plan_in_batches_matches_single_pass() -> None:
+    planner = ScheduleSyncPlanner(AcademicWeekCalculator(), max_holders=2)
+    accounts = [
+        _make_account(1),
+        _make_account(2, group_id=111),
+        _make_account(3),
+        _make_account(4, with_profile=False),
+        _make_account(5),
+    ]
+    today = date(2025, 9, 2)
+
+    single = planner.plan(ScheduleSyncPlanInputDTO(accounts=accounts, today=today))
+    batched = planner.plan(ScheduleSyncPlanInputDTO(accounts=[], today=today))
+    for start in range(0, len(accounts), 2):
+        batched = planner.plan(
+            ScheduleSyncPlanInputDTO(
+                accounts=accounts[start : start + 2], today=today, previous=batched
+            )
+        )
+
+    assert batched == single
+    assert [holder.account_id for holder in batched.units[0].holders] == [1, 3]
+    assert batched.skipped_accounts == 1
@@ -0,0 +1,543 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, time, timedelta
+
+import pytest
+
+from app.app_layer.interfaces.cache.schedule.dto import (
+    CachedSemesterDTO,
+    CachedWeekDTO,
+    ScheduleGroupKeyDTO,
+)
+from app.app_layer.interfaces.repos.account.dto import AccountViewDTO
+from app.app_layer.interfaces.repos.outbox.dto import OutboxEnqueueDTO
+from app.app_layer.interfaces.services.notifications.schedule_change.dto import (
+    ScheduleChangeNotifyInputDTO,
+)
+from app.app_layer.interfaces.services.schedule.schedule_sync.dto import (
+    ScheduleSyncForUserInputDTO,
+    ScheduleSyncIfStaleInputDTO,
+    ScheduleSyncTakeChangesInputDTO,
+    ScheduleSyncUnitInputDTO,
+)
+from app.app_layer.interfaces.services.schedule.schedule_sync_planner.dto import (
+    ScheduleSyncUnitDTO,
+)
+from app.app_layer.services.notifications.schedule_change_notification import (
+    ScheduleChangeNotificationService,
+)
+from app.app_layer.services.schedule.schedule_sync import ScheduleSyncService
+from app.app_layer.services.schedule.week_calculator import AcademicWeekCalculator
+from app.domain.entities.account.account import AccountEntity
+from app.domain.entities.account.account_settings import AccountSettingsEntity
+from app.domain.entities.account.ssau_identity import SsauIdentityEntity
+from app.domain.entities.account.ssau_profile import SsauProfileEntity
+from app.domain.entities.account.telegram_identity import TelegramIdentityEntity
+from app.domain.entities.lesson import Lesson
+from app.domain.messages.schedule_change import ScheduleChangeMessage
+from app.domain.value_objects.group_id import GroupId
+from app.domain.value_objects.lesson_time import LessonTime
+from app.domain.value_objects.outbox_priority import OutboxPriorityEnum
+from app.domain.value_objects.subgroup import Subgroup
+from app.domain.value_objects.year_id import YearId
+
+_NOW = datetime(2025, 9, 1, 6, 0, tzinfo=UTC)
+
+
+def _make_account(
+    account_id: int,
+    *,
+    group_id: int = 755932538,
+    subgroup: str = "all",
+) -> AccountViewDTO:
+    return AccountViewDTO(
+        account=AccountEntity(id=account_id, created_at=_NOW, updated_at=_NOW),
+        telegram=TelegramIdentityEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            account_id=account_id,
+            chat_id=1000 + account_id,
+            display_name=f"user-{account_id}",
+        ),
+        settings=AccountSettingsEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            account_id=account_id,
+            schedule_notifications_enabled=True,
+        ),
+        ssau_identity=SsauIdentityEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            account_id=account_id,
+            login=f"login-{account_id}",
+            password="pass",
+        ),
+        ssau_profile=SsauProfileEntity(
+            id=account_id,
+            created_at=_NOW,
+            updated_at=_NOW,
+            ssau_identity_id=account_id,
+            group_id=GroupId(value=group_id),
+            year_id=YearId(value=14),
+            group_name="Test",
+            academic_year_start=date(2025, 9, 1),
+            subgroup=Subgroup.parse(subgroup),
+            user_type="student",
+        ),
+    )
+
+
+class FakeScheduleCacheStore:
+    def __init__(self) -> None:
+        self.store: dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO] = {}
+        self.writes = 0
+        self.touches = 0
+
+    async def get(self, key: ScheduleGroupKeyDTO, week_number: int) -> CachedWeekDTO | None:
+        return self.store.get((key, week_number))
+
+    async def get_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        return {request: self.store[request] for request in requests if request in self.store}
+
+    async def set(self, key: ScheduleGroupKeyDTO, week_number: int, week: CachedWeekDTO) -> None:
+        self.writes += 1
+        self.store[(key, week_number)] = week
+
+    async def touch(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        fetched_at: datetime,
+    ) -> bool:
+        week = self.store.get((key, week_number))
+        if week is None:
+            return False
+        self.touches += 1
+        self.store[(key, week_number)] = week.model_copy(update={"fetched_at": fetched_at})
+        return True
+
+
+class FakeScheduleChangeStore:
+    def __init__(self) -> None:
+        self.store: dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO] = {}
+
+    async def record(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        baseline: CachedWeekDTO,
+    ) -> None:
+        self.store.setdefault((key, week_number), baseline)
+
+    async def restore(
+        self,
+        key: ScheduleGroupKeyDTO,
+        week_number: int,
+        baseline: CachedWeekDTO,
+    ) -> None:
+        self.store[(key, week_number)] = baseline
+
+    async def pop_many(
+        self,
+        requests: Sequence[tuple[ScheduleGroupKeyDTO, int]],
+    ) -> dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO]:
+        return {request: self.store.pop(request) for request in requests if request in self.store}
+
+
+class FakeSsauApiClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int, int]] = []
+        self.teacher = "Ivanov"
+
+    async def fetch_week_schedule(
+        self,
+        *,
+        login: str,
+        password: str,
+        group_id: int,
+        year_id: int,
+        user_type: str,
+        week_number: int,
+    ) -> list[Lesson]:
+        self.calls.append((login, group_id, week_number))
+        return [
+            Lesson(
+                id=group_id,
+                type="Лекция",
+                subject="Math",
+                teacher=self.teacher,
+                weekday=1,
+                week_numbers=[week_number],
+                time=LessonTime(start=time(10, 0), end=time(11, 0)),
+                is_online=False,
+                conference_url=None,
+                subgroup=None,
+            )
+        ]
+
+
+class FakeClock:
+    def now(self) -> datetime:
+        return _NOW
+
+
+def _build_service(
+    provider: FakeSsauApiClient,
+    cache_store: FakeScheduleCacheStore,
+    change_store: FakeScheduleChangeStore | None = None,
+) -> ScheduleSyncService:
+    return ScheduleSyncService(
+        provider=provider,
+        clock=FakeClock(),
+        week_calculator=AcademicWeekCalculator(),
+        cache_store=cache_store,
+        change_store=change_store,
+        soft_ttl_seconds=3600,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_if_stale_shares_cache_entry_within_group() -> None:
+    provider = FakeSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = _build_service(provider, cache_store)
+
+    first = await service.sync_if_stale(
+        ScheduleSyncIfStaleInputDTO(account=_make_account(1, subgroup="1"), target_date=_NOW.date())
+    )
+    second = await service.sync_if_stale(
+        ScheduleSyncIfStaleInputDTO(account=_make_account(2, subgroup="2"), target_date=_NOW.date())
+    )
+
+    assert provider.calls == [("login-1", 755932538, 1)]
+    assert second.cache == first.cache
+    assert len(cache_store.store) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_if_stale_keeps_groups_apart() -> None:
+    provider = FakeSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = _build_service(provider, cache_store)
+
+    await service.sync_if_stale(
+        ScheduleSyncIfStaleInputDTO(account=_make_account(1), target_date=_NOW.date())
+    )
+    other = await service.sync_if_stale(
+        ScheduleSyncIfStaleInputDTO(account=_make_account(2, group_id=111), target_date=_NOW.date())
+    )
+
+    assert [call[1] for call in provider.calls] == [755932538, 111]
+    assert [lesson.id for lesson in other.cache.lessons] == [111]
+
+
+class FlakySsauApiClient(FakeSsauApiClient):
+    def __init__(self, failing_logins: set[str]) -> None:
+        super().__init__()
+        self._failing_logins = failing_logins
+
+    async def fetch_week_schedule(
+        self,
+        *,
+        login: str,
+        password: str,
+        group_id: int,
+        year_id: int,
+        user_type: str,
+        week_number: int,
+    ) -> list[Lesson]:
+        if login in self._failing_logins:
+            self.calls.append((login, group_id, week_number))
+            raise RuntimeError("SSAU login failed.")
+        return await super().fetch_week_schedule(
+            login=login,
+            password=password,
+            group_id=group_id,
+            year_id=year_id,
+            user_type=user_type,
+            week_number=week_number,
+        )
+
+
+@pytest.mark.asyncio
+async def test_sync_unit_falls_back_to_next_holder() -> None:
+    provider = FlakySsauApiClient(failing_logins={"login-1"})
+    cache_store = FakeScheduleCacheStore()
+    service = _build_service(provider, cache_store)
+    holders = [_make_account(1), _make_account(2)]
+    profile = holders[0].ssau_profile
+    assert profile is not None
+    key = ScheduleGroupKeyDTO.from_profile(profile)
+
+    result = await service.sync_unit(
+        ScheduleSyncUnitInputDTO(
+            unit=ScheduleSyncUnitDTO(key=key, week_number=3, holders=holders),
+        )
+    )
+
+    assert [call[0] for call in provider.calls] == ["login-1", "login-2"]
+    assert cache_store.store[(key, 3)] == result.cache
+
+
+class SlowSsauApiClient(FakeSsauApiClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def fetch_week_schedule(
+        self,
+        *,
+        login: str,
+        password: str,
+        group_id: int,
+        year_id: int,
+        user_type: str,
+        week_number: int,
+    ) -> list[Lesson]:
+        await self.release.wait()
+        return await super().fetch_week_schedule(
+            login=login,
+            password=password,
+            group_id=group_id,
+            year_id=year_id,
+            user_type=user_type,
+            week_number=week_number,
+        )
+
+
+class FakeDistributedLock:
+    def __init__(self) -> None:
+        self.held: dict[str, str] = {}
+
+    async def acquire(self, name: str, ttl_seconds: int) -> str | None:
+        if name in self.held:
+            return None
+        self.held[name] = "token"
+        return "token"
+
+    async def release(self, name: str, token: str) -> None:
+        if self.held.get(name) == token:
+            del self.held[name]
+
+
+@pytest.mark.asyncio
+async def test_sync_if_stale_coalesces_concurrent_misses() -> None:
+    provider = SlowSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = _build_service(provider, cache_store)
+
+    calls = [
+        asyncio.create_task(
+            service.sync_if_stale(
+                ScheduleSyncIfStaleInputDTO(
+                    account=_make_account(account_id), target_date=_NOW.date()
+                )
+            )
+        )
+        for account_id in range(1, 6)
+    ]
+    await asyncio.sleep(0)
+    provider.release.set()
+    results = await asyncio.gather(*calls)
+
+    assert len(provider.calls) == 1
+    assert all(result.cache == results[0].cache for result in results)
+
+
+@pytest.mark.asyncio
+async def test_sync_if_stale_waits_for_lock_owner_in_other_process() -> None:
+    provider = FakeSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    lock = FakeDistributedLock()
+    service = ScheduleSyncService(
+        provider=provider,
+        clock=FakeClock(),
+        week_calculator=AcademicWeekCalculator(),
+        cache_store=cache_store,
+        lock=lock,
+        lock_poll_interval_seconds=0.01,
+    )
+    account = _make_account(1)
+    profile = account.ssau_profile
+    assert profile is not None
+    key = ScheduleGroupKeyDTO.from_profile(profile)
+    lock.held["schedule-sync:14:755932538:student:1"] = "other-process"
+    pending = asyncio.create_task(
+        service.sync_if_stale(ScheduleSyncIfStaleInputDTO(account=account, target_date=_NOW.date()))
+    )
+    await asyncio.sleep(0.02)
+
+    written = CachedWeekDTO(fetched_at=_NOW, lessons=[])
+    cache_store.store[(key, 1)] = written
+    result = await pending
+
+    assert provider.calls == []
+    assert result.cache == written
+
+
+@pytest.mark.asyncio
+async def test_sync_if_stale_serves_soft_expired_entry_and_refreshes_in_background() -> None:
+    provider = SlowSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = ScheduleSyncService(
+        provider=provider,
+        clock=FakeClock(),
+        week_calculator=AcademicWeekCalculator(),
+        cache_store=cache_store,
+        soft_ttl_seconds=3600,
+    )
+    account = _make_account(1)
+    profile = account.ssau_profile
+    assert profile is not None
+    key = ScheduleGroupKeyDTO.from_profile(profile)
+    stale = CachedWeekDTO(fetched_at=_NOW - timedelta(hours=2), lessons=[])
+    cache_store.store[(key, 1)] = stale
+
+    result = await service.sync_if_stale(
+        ScheduleSyncIfStaleInputDTO(account=account, target_date=_NOW.date())
+    )
+
+    assert result.cache == stale
+    provider.release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert len(provider.calls) == 1
+    assert cache_store.store[(key, 1)].fetched_at == _NOW
+
+
+class FakeSemesterStore:
+    def __init__(self) -> None:
+        self.store: dict[ScheduleGroupKeyDTO, CachedSemesterDTO] = {}
+
+    async def get(self, key: ScheduleGroupKeyDTO) -> CachedSemesterDTO | None:
+        return self.store.get(key)
+
+    async def set(self, key: ScheduleGroupKeyDTO, semester: CachedSemesterDTO) -> None:
+        self.store[key] = semester
+
+
+@pytest.mark.asyncio
+async def test_sync_if_stale_materializes_known_week_from_semester() -> None:
+    provider = FakeSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = ScheduleSyncService(
+        provider=provider,
+        clock=FakeClock(),
+        week_calculator=AcademicWeekCalculator(),
+        cache_store=cache_store,
+        semester_store=FakeSemesterStore(),
+    )
+    account = _make_account(1)
+
+    fetched = await service.sync_for_user(
+        ScheduleSyncForUserInputDTO(account=account, target_date=_NOW.date())
+    )
+    cache_store.store.clear()
+    result = await service.sync_if_stale(
+        ScheduleSyncIfStaleInputDTO(account=account, target_date=_NOW.date())
+    )
+
+    assert len(provider.calls) == 1
+    assert result.cache == fetched.cache
+    assert len(cache_store.store) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_unit_only_touches_unchanged_week() -> None:
+    provider = FakeSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = _build_service(provider, cache_store)
+    key = ScheduleGroupKeyDTO(year_id=14, group_id=755932538, user_type="student")
+    unit = ScheduleSyncUnitDTO(key=key, week_number=1, holders=[_make_account(1)])
+
+    first = await service.sync_unit(ScheduleSyncUnitInputDTO(unit=unit))
+    second = await service.sync_unit(ScheduleSyncUnitInputDTO(unit=unit))
+
+    assert len(provider.calls) == 2
+    assert (first.unchanged, second.unchanged) == (False, True)
+    assert (cache_store.writes, cache_store.touches) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_sync_unit_records_changes_against_previous_week() -> None:
+    provider = FakeSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = _build_service(provider, cache_store, FakeScheduleChangeStore())
+    key = ScheduleGroupKeyDTO(year_id=14, group_id=755932538, user_type="student")
+    unit = ScheduleSyncUnitDTO(key=key, week_number=1, holders=[_make_account(1)])
+    take = ScheduleSyncTakeChangesInputDTO(requests=[(key, 1)])
+
+    await service.sync_unit(ScheduleSyncUnitInputDTO(unit=unit))
+    assert (await service.take_changes(take)).changes == []
+    provider.teacher = "Petrov"
+    result = await service.sync_unit(ScheduleSyncUnitInputDTO(unit=unit))
+
+    assert result.unchanged is False
+    assert cache_store.writes == 2
+    pending = (await service.take_changes(take)).changes
+    assert [(item.key, item.week_number) for item in pending] == [(key, 1)]
+    assert [change.after.teacher for change in pending[0].changes.changed] == ["Petrov"]
+    assert (await service.take_changes(take)).changes == []
+
+
+class FakeOutbox:
+    def __init__(self) -> None:
+        self.queued: list[OutboxEnqueueDTO] = []
+
+    async def enqueue(self, messages: Sequence[OutboxEnqueueDTO], available_at: datetime) -> None:
+        self.queued.extend(messages)
+
+
+@pytest.mark.asyncio
+async def test_change_found_by_background_refresh_is_queued_for_recipients() -> None:
+    provider = FakeSsauApiClient()
+    cache_store = FakeScheduleCacheStore()
+    service = _build_service(provider, cache_store, FakeScheduleChangeStore())
+    account = _make_account(1)
+    key = ScheduleGroupKeyDTO(year_id=14, group_id=755932538, user_type="student")
+    unit = ScheduleSyncUnitDTO(key=key, week_number=1, holders=[account])
+    await service.sync_unit(ScheduleSyncUnitInputDTO(unit=unit))
+    cache_store.store[(key, 1)] = cache_store.store[(key, 1)].model_copy(
+        update={"fetched_at": _NOW - timedelta(hours=2)}
+    )
+
+    # Изменение замечает фоновое обновление бота, а не воркер.
+    provider.teacher = "Petrov"
+    await service.sync_if_stale(
+        ScheduleSyncIfStaleInputDTO(account=account, target_date=_NOW.date())
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert cache_store.store[(key, 1)].lessons[0].teacher == "Petrov"
+    result = await service.sync_unit(ScheduleSyncUnitInputDTO(unit=unit))
+    assert result.unchanged is True
+
+    pending = (
+        await service.take_changes(ScheduleSyncTakeChangesInputDTO(requests=[(key, 1)]))
+    ).changes
+    outbox = FakeOutbox()
+    service_notifier = ScheduleChangeNotificationService(
+        outbox_repo=outbox,  # type: ignore[arg-type]
+        clock=FakeClock(),
+    )
+    sent = await service_notifier.notify(
+        ScheduleChangeNotifyInputDTO(
+            weeks={item.week_number: item.changes for item in pending},
+            recipients=[account],
+        )
+    )
+
+    assert sent.sent_count == 1
+    queued = outbox.queued[0]
+    assert (queued.chat_id, queued.priority) == (account.chat_id, OutboxPriorityEnum.NOTIFICATION)
+    message = queued.message
+    assert isinstance(message, ScheduleChangeMessage)
+    assert [change.after.teacher for change in message.weeks[1].changed] == ["Petrov"]
+    # В outbox сообщение лежит JSON-ом и должно читаться обратно без потерь.
+    assert ScheduleChangeMessage.model_validate_json(message.model_dump_json()) == message
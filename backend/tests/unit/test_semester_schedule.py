@@ -0,0 +1,39 @@
+from datetime import time
+
+from app.domain.entities.lesson import Lesson
+from app.domain.services.semester_schedule import lessons_in_week, merge_week_lessons
+from app.domain.value_objects.lesson_time import LessonTime
+
+
+def _lesson(lesson_id: int, weeks: list[int], subject: str = "Math") -> Lesson:
+    return Lesson(
+        id=lesson_id,
+        type="Лекция",
+        subject=subject,
+        teacher=None,
+        weekday=1,
+        week_numbers=weeks,
+        time=LessonTime(start=time(8, 0), end=time(9, 35)),
+        is_online=False,
+        conference_url=None,
+        subgroup=None,
+    )
+
+
+def test_merge_replaces_fetched_lessons_and_drops_cancelled_week() -> None:
+    semester = [_lesson(1, [1, 3, 5]), _lesson(2, [3]), _lesson(3, [1, 5])]
+
+    merged = merge_week_lessons(semester, 3, [_lesson(1, [1, 3, 5, 7], subject="Physics")])
+
+    by_id = {lesson.id: lesson for lesson in merged}
+    assert set(by_id) == {1, 3}
+    assert by_id[1].subject == "Physics"
+    assert by_id[1].week_numbers == [1, 3, 5, 7]
+    assert [lesson.id for lesson in lessons_in_week(merged, 5)] == [3, 1]
+
+
+def test_merge_removes_week_from_lessons_missing_in_response() -> None:
+    merged = merge_week_lessons([_lesson(1, [1, 2])], 2, [])
+
+    assert [lesson.week_numbers for lesson in merged] == [[1]]
+    assert lessons_in_week(merged, 2) == []
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.app_layer.interfaces.time.clock.interface import IClock
+from app.infra.clients.ssau.api.session_cache import AuthSessionCache
+from app.infra.clients.ssau.settings import AuthCacheSettings
+
+
+class _MutableClock(IClock):
+    def __init__(self, current: datetime) -> None:
+        self.current = current
+
+    def now(self) -> datetime:
+        return self.current
+
+
+class _FakeLogin:
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.failing = failing or set()
+        self.calls: list[str] = []
+
+    async def __call__(self, login: str, password: str) -> str:
+        self.calls.append(login)
+        if login in self.failing:
+            raise RuntimeError("login failed")
+        return f"{login}-cookie-{len(self.calls)}"
+
+
+def _cache(clock: IClock) -> AuthSessionCache:
+    return AuthSessionCache(
+        settings=AuthCacheSettings(
+            ttl_seconds=100,
+            min_login_interval_seconds=0,
+            refresh_ahead_seconds=10,
+            refresh_active_seconds=50,
+            refresh_spacing_seconds=0,
+        ),
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_expiring_renews_only_active_logins_before_expiry() -> None:
+    start = datetime(2025, 9, 1, 8, 0, tzinfo=UTC)
+    clock = _MutableClock(start)
+    cache = _cache(clock)
+    login_func = _FakeLogin()
+
+    await cache.get_or_refresh("idle", "secret", login_func)
+    await cache.get_or_refresh("active", "secret", login_func)
+    clock.current = start + timedelta(seconds=60)
+    await cache.get_or_refresh("active", "secret", login_func)
+    assert login_func.calls == ["idle", "active"]
+
+    # До окна продления ещё далеко — ничего не делаем.
+    assert await cache.refresh_expiring() == 0
+
+    clock.current = start + timedelta(seconds=91)
+    assert await cache.refresh_expiring() == 1
+    assert login_func.calls == ["idle", "active", "active"]
+
+    # Старая кука истекла бы в 100 с, но запрос берёт продлённую без входа.
+    clock.current = start + timedelta(seconds=101)
+    assert await cache.get_or_refresh("active", "secret", login_func) == "active-cookie-3"
+    assert await cache.get_or_refresh("idle", "secret", login_func) == "idle-cookie-4"
+    assert login_func.calls == ["idle", "active", "active", "idle"]
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_cookie_and_stops_refreshing_login() -> None:
+    start = datetime(2025, 9, 1, 8, 0, tzinfo=UTC)
+    clock = _MutableClock(start)
+    cache = _cache(clock)
+    login_func = _FakeLogin()
+
+    cookie = await cache.get_or_refresh("user", "secret", login_func)
+    clock.current = start + timedelta(seconds=60)
+    await cache.get_or_refresh("user", "secret", login_func)
+    login_func.failing = {"user"}
+    clock.current = start + timedelta(seconds=95)
+
+    assert await cache.refresh_expiring() == 0
+    assert await cache.refresh_expiring() == 0
+    assert login_func.calls == ["user", "user"]
+    assert await cache.get_or_refresh("user", "secret", login_func) == cookie
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_does_not_block_other_logins() -> None:
+    start = datetime(2025, 9, 1, 8, 0, tzinfo=UTC)
+    clock = _MutableClock(start)
+    cache = _cache(clock)
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def slow_login(login: str, password: str) -> str:
+        started.set()
+        await release.wait()
+        return f"{login}-renewed"
+
+    await cache.get_or_refresh("slow", "secret", _FakeLogin())
+    clock.current = start + timedelta(seconds=60)
+    await cache.get_or_refresh("slow", "secret", slow_login)
+    clock.current = start + timedelta(seconds=91)
+
+    refresh = asyncio.create_task(cache.refresh_expiring())
+    await started.wait()
+    # Пока СНИУ отвечает на фоновый вход, другой пользователь входит без ожидания.
+    other = await asyncio.wait_for(cache.get_or_refresh("other", "secret", _FakeLogin()), 1)
+    assert other == "other-cookie-1"
+
+    release.set()
+    assert await refresh == 1
+    assert await cache.get_or_refresh("slow", "secret", _FakeLogin()) == "slow-renewed"
+
+
+@pytest.mark.asyncio
+async def test_idle_logins_are_forgotten() -> None:
+    start = datetime(2025, 9, 1, 8, 0, tzinfo=UTC)
+    clock = _MutableClock(start)
+    cache = _cache(clock)
+    login_func = _FakeLogin()
+
+    await cache.get_or_refresh("idle", "secret", login_func)
+    clock.current = start + timedelta(seconds=101)
+    assert await cache.refresh_expiring() == 0
+
+    # Кука истекла, логином не пользовались: от него не остаётся следов в памяти.
+    assert "idle" not in cache._credentials
+    assert "idle" not in cache._last_used_at
+    assert "idle" not in cache._last_login_at
+    assert "idle" not in cache._entries
+    assert "idle" not in cache._locks
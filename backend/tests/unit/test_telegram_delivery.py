@@ -0,0 +1,136 @@
+import asyncio
+import time
+
+import pytest
+
+from app.app_layer.interfaces.notifications.notifier.dto import NotifierDeliveryDTO
+from app.app_layer.interfaces.telegram.chat_checker.enums import TelegramChatCheckStatusEnum
+from app.app_layer.interfaces.telegram.renderer.dto import RenderedTelegramMessageDTO
+from app.app_layer.interfaces.telegram.sender.dto import TelegramReplyMarkupDTO
+from app.domain.messages.plain import PlainMessage
+from app.infra.clients.telegram.chat_checker import TelegramChatChecker
+from app.infra.clients.telegram.message_renderer import AiogramTelegramMessageRenderer
+from app.infra.clients.telegram.notifier import TelegramNotifier
+from app.infra.clients.telegram.rate_limit import TelegramRateLimiter
+from app.infra.retry import RetryPolicy
+
+
+class _NullMetrics:
+    def observe_telegram_send(self, status: str) -> None:
+        return None
+
+
+class _SlowSender:
+    def __init__(self, failing_chats: set[int]) -> None:
+        self.failing_chats = failing_chats
+        self.in_flight = 0
+        self.peak = 0
+
+    async def send(
+        self,
+        chat_id: int,
+        message: RenderedTelegramMessageDTO,
+        *,
+        reply_markup: TelegramReplyMarkupDTO | None = None,
+    ) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if chat_id in self.failing_chats:
+            raise RuntimeError("chat not found")
+
+
+def _limiter(*, interval: float = 0.0) -> TelegramRateLimiter:
+    return TelegramRateLimiter(
+        messages_per_second=1000,
+        private_chat_interval_seconds=interval,
+        group_messages_per_minute=60_000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pause_blocks_every_chat() -> None:
+    limiter = _limiter()
+    limiter.pause(0.1)
+    started = time.monotonic()
+
+    async def _send(chat_id: int) -> float:
+        async with limiter.slot(chat_id):
+            return time.monotonic() - started
+
+    delays = await asyncio.gather(_send(1), _send(2))
+
+    assert min(delays) >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_messages_to_one_chat_are_spaced() -> None:
+    limiter = _limiter(interval=0.05)
+    stamps: list[float] = []
+
+    async def _send() -> None:
+        async with limiter.slot(1):
+            stamps.append(time.monotonic())
+
+    await asyncio.gather(_send(), _send(), _send())
+
+    assert stamps[2] - stamps[0] >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_send_many_runs_bounded_pool_and_reports_failures() -> None:
+    sender = _SlowSender(failing_chats={3})
+    notifier = TelegramNotifier(
+        renderer=AiogramTelegramMessageRenderer(),
+        sender=sender,
+        metrics=_NullMetrics(),  # type: ignore[arg-type]
+        max_concurrency=4,
+    )
+
+    results = await notifier.send_many(
+        [
+            NotifierDeliveryDTO(chat_id=chat_id, message=PlainMessage(text="hi"))
+            for chat_id in range(10)
+        ]
+    )
+
+    assert [result.chat_id for result in results] == list(range(10))
+    assert [result.chat_id for result in results if not result.delivered] == [3]
+    assert sender.peak == 4
+
+
+class _SlowBot:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_chat(self, chat_id: int) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_check_many_runs_bounded_pool_within_shared_rate() -> None:
+    bot = _SlowBot()
+    checker = TelegramChatChecker(
+        bot=bot,  # type: ignore[arg-type]
+        retry_policy=RetryPolicy(max_attempts=1),
+        rate_limiter=TelegramRateLimiter(
+            messages_per_second=200,
+            private_chat_interval_seconds=0.0,
+            group_messages_per_minute=60_000,
+        ),
+        max_concurrency=4,
+    )
+    started = time.monotonic()
+
+    results = await checker.check_many(list(range(1, 401)))
+
+    assert [result.chat_id for result in results] == list(range(1, 401))
+    assert all(result.status == TelegramChatCheckStatusEnum.REACHABLE for result in results)
+    assert bot.peak == 4
+    # 400 запросов при 200/с и запасе в 200 токенов — не быстрее ~1 с.
+    assert time.monotonic() - started >= 0.9
@@ -1,15 +1,22 @@
+from dataclasses import replace
 from datetime import date, time
 
+from aiogram.utils.formatting import Bold, Text
+
 from app.app_layer.interfaces.telegram.renderer.dto import (
     RenderedTelegramMessageDTO,
     TelegramEntityDTO,
 )
+from app.app_layer.interfaces.telegram.renderer.interface import ITelegramMessageRenderer
 from app.domain.entities.lesson import Lesson
+from app.domain.messages.base import TelegramMessage
 from app.domain.messages.info import InfoMessage
 from app.domain.messages.schedule import ScheduleMessage
 from app.domain.value_objects.lesson_time import LessonTime
+from app.infra.cache.local.lru import LruTtlCache
 from app.infra.clients.telegram.message_renderer import AiogramTelegramMessageRenderer
 from app.infra.clients.telegram.message_splitter import split_message
+from app.infra.clients.telegram.render_cache import CachingTelegramMessageRenderer
 
 
 def test_renderer_schedule_formatting() -> None:
@@ -65,6 +72,48 @@ def test_split_message_slices_entities() -> None:
     assert chunks[1].entities[0].length == 5
 
 
+def _entity_text(chunk: RenderedTelegramMessageDTO, entity: TelegramEntityDTO) -> str:
+    # Смещения Bot API — в UTF-16 единицах.
+    encoded = chunk.text.encode("utf-16-le")
+    return encoded[entity.offset * 2 : (entity.offset + entity.length) * 2].decode("utf-16-le")
+
+
+def test_split_message_counts_utf16_units_and_keeps_surrogate_pairs() -> None:
+    text = "😀" * 30
+    message = RenderedTelegramMessageDTO(text=text)
+
+    chunks = split_message(message, limit=10)
+
+    assert [len(chunk.text) for chunk in chunks] == [5] * 6
+    assert "".join(chunk.text for chunk in chunks) == text
+
+
+def test_split_message_maps_entity_offsets_after_emoji() -> None:
+    rendered = AiogramTelegramMessageRenderer()._as_rendered(
+        Text("🎓 ", Bold("первый"), " 📚 ", Bold("второй"), "\n", "🧪 ", Bold("третий"))
+    )
+
+    chunks = split_message(rendered, limit=16)
+
+    assert len(chunks) == 2
+    assert "".join(chunk.text for chunk in chunks) == rendered.text
+    assert [_entity_text(chunk, entity) for chunk in chunks for entity in chunk.entities] == [
+        "первый",
+        "второй",
+        "третий",
+    ]
+
+
+def test_split_message_skips_separators_inside_entities() -> None:
+    link = TelegramEntityDTO(type="text_link", offset=4, length=19, url="https://example.com")
+    message = RenderedTelegramMessageDTO(text="aaa Открыть конференцию", entities=(link,))
+
+    chunks = split_message(message, limit=20)
+
+    assert [chunk.text for chunk in chunks] == ["aaa ", "Открыть конференцию"]
+    assert chunks[1].entities == (replace(link, offset=0),)
+
+
 def test_renderer_preserves_special_chars() -> None:
     message = InfoMessage(
         title="Символы",
@@ -74,3 +123,48 @@ def test_renderer_preserves_special_chars() -> None:
     rendered = AiogramTelegramMessageRenderer().render(message)
 
     assert "<tag> & _ * [ ] ( )" in rendered.text
+
+
+class _CountingRenderer(ITelegramMessageRenderer):
+    def __init__(self) -> None:
+        self.inner = AiogramTelegramMessageRenderer()
+        self.calls = 0
+
+    def render(self, message: TelegramMessage) -> RenderedTelegramMessageDTO:
+        self.calls += 1
+        return self.inner.render(message)
+
+
+def test_caching_renderer_reuses_group_schedule_and_skips_personal_messages() -> None:
+    counting = _CountingRenderer()
+    renderer = CachingTelegramMessageRenderer(
+        counting, LruTtlCache(max_entries=16, ttl_seconds=60.0)
+    )
+    lesson = Lesson(
+        id=1,
+        type="Лекция",
+        subject="Алгоритмы",
+        teacher=None,
+        weekday=1,
+        week_numbers=[1],
+        time=LessonTime(start=time(9, 0), end=time(10, 30)),
+        is_online=False,
+        conference_url=None,
+        subgroup=None,
+    )
+
+    def schedule(day: date) -> ScheduleMessage:
+        return ScheduleMessage(title="Сегодня", date=day, lessons=[lesson])
+
+    first = renderer.render(schedule(date(2025, 9, 1)))
+    second = renderer.render(schedule(date(2025, 9, 1)))
+    other_day = renderer.render(schedule(date(2025, 9, 2)))
+    info = InfoMessage(title="Справка", lines=["a"])
+    renderer.render(info)
+    renderer.render(info)
+
+    assert second is first
+    assert first == counting.inner.render(schedule(date(2025, 9, 1)))
+    assert [chunk.text for chunk in first.chunks] == [first.text]
+    assert other_day.text != first.text
+    assert counting.calls == 4
@@ -0,0 +1,92 @@
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from app.app_layer.interfaces.cache.schedule.dto import CachedWeekDTO, ScheduleGroupKeyDTO
+from app.infra.cache.local.lru import LruTtlCache
+from app.infra.cache.local.schedule_cache import TieredScheduleCacheStore
+
+_KEY = ScheduleGroupKeyDTO(year_id=14, group_id=755932538, user_type="student")
+_WEEK = CachedWeekDTO(fetched_at=datetime(2025, 9, 1, tzinfo=UTC), lessons=[])
+
+
+class CountingScheduleCacheStore:
+    def __init__(self) -> None:
+        self.store: dict[tuple[ScheduleGroupKeyDTO, int], CachedWeekDTO] = {}
+        self.reads = 0
+
+    async def get(self, key: ScheduleGroupKeyDTO, week_number: int) -> CachedWeekDTO | None:
+        self.reads += 1
+        return self.store.get((key, week_number))
+
+    async def set(self, key: ScheduleGroupKeyDTO, week_number: int, week: CachedWeekDTO) -> None:
+        self.store[(key, week_number)] = week
+
+
+class FakeCacheClient:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str]] = []
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 1
+
+    def __getattr__(self, name: str) -> Any:
+        raise AssertionError(f"Unexpected cache client call: {name}")
+
+
+def _build_store(
+    inner: CountingScheduleCacheStore,
+    client: FakeCacheClient,
+) -> TieredScheduleCacheStore:
+    return TieredScheduleCacheStore(
+        inner=inner,
+        local=LruTtlCache(max_entries=8, ttl_seconds=60),
+        client=client,  # type: ignore[arg-type]
+        channel="schedule:invalidate",
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_hit_local_tier() -> None:
+    inner = CountingScheduleCacheStore()
+    inner.store[(_KEY, 1)] = _WEEK
+    store = _build_store(inner, FakeCacheClient())
+
+    first = await store.get(_KEY, 1)
+    second = await store.get(_KEY, 1)
+
+    assert first is second
+    assert inner.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_foreign_invalidation_evicts_local_copy() -> None:
+    inner = CountingScheduleCacheStore()
+    writer_client = FakeCacheClient()
+    writer = _build_store(inner, writer_client)
+    reader = _build_store(inner, FakeCacheClient())
+    inner.store[(_KEY, 1)] = _WEEK
+    await reader.get(_KEY, 1)
+
+    await writer.set(_KEY, 1, _WEEK)
+    channel, message = writer_client.published[0]
+    writer.handle_invalidation(message)
+    reader.handle_invalidation(message)
+    await writer.get(_KEY, 1)
+    await reader.get(_KEY, 1)
+
+    assert channel == "schedule:invalidate"
+    assert inner.reads == 2
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    cache: LruTtlCache[str, int] = LruTtlCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)